@@ -0,0 +1,29 @@
+"""add_daily_generation_started_at
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 일일 태스크 생성 시작 시각 (중단된 워커가 남긴 GENERATING 상태 판별용)
+    op.add_column(
+        'weekly_tasks',
+        sa.Column('daily_generation_started_at', sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('weekly_tasks', 'daily_generation_started_at')
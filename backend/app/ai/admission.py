@@ -0,0 +1,221 @@
+"""Admission control for roadmap generation.
+
+동시에 실행되는 로드맵 생성 수를 제한하여 LLM 스레드 풀이 포화되면서
+모든 생성이 함께 느려지는 것을 막습니다.
+- 전역 동시 실행 상한 (settings.generation_max_concurrent)
+- 상한을 넘으면 제한된 크기의 FIFO 대기열에서 순서대로 대기 (settings.generation_queue_size)
+- 대기열도 가득 차면 즉시 거절 (GenerationQueueFull, 예상 대기 시간을 retry_after로 제공)
+
+대기 중인 SSE 클라이언트에는 순번과 예상 대기 시간을 queued 이벤트로 보냅니다.
+예상 시간은 최근 생성 소요 시간의 지수 이동 평균으로 계산합니다.
+모든 메서드는 이벤트 루프에서만 호출합니다 (단일 프로세스 기준).
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import AsyncIterator, Deque, Optional
+
+from app.ai.cancellation import CancellationToken
+from app.config import settings
+from app.core import metrics
+
+logger = logging.getLogger(__name__)
+
+GENERATION_ACTIVE = metrics.gauge("generation_active", "Roadmap generations currently running")
+GENERATION_QUEUED = metrics.gauge("generation_queued", "Roadmap generations waiting for a slot")
+GENERATION_REJECTED = metrics.counter(
+    "generation_rejected_total", "Roadmap generations refused because the queue was full"
+)
+GENERATION_WAIT_SECONDS = metrics.counter(
+    "generation_wait_seconds_total", "Total time generations spent waiting in the queue"
+)
+
+_POLL_SECONDS = 1.0
+
+
+class GenerationQueueFull(Exception):
+    """Raised when both the running slots and the wait queue are full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"generation queue full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    """A place in the generation queue, then a running slot until released."""
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self.granted = asyncio.Event()
+        self.enqueued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self._released = False
+
+    @property
+    def position(self) -> int:
+        """1-based position in the queue (0 once running)."""
+        return self._controller.position(self)
+
+    async def wait(
+        self, cancel_token: Optional[CancellationToken] = None
+    ) -> AsyncIterator[dict]:
+        """Wait for a slot, yielding queue status whenever the position changes.
+
+        Yields:
+            dict: {"position": 순번, "estimated_wait_seconds": 예상 대기 시간}
+        """
+        last = None
+        try:
+            while not self.granted.is_set():
+                position = self.position
+                if position != last:
+                    last = position
+                    yield {
+                        "position": position,
+                        "estimated_wait_seconds": self._controller.estimated_wait(position),
+                    }
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                try:
+                    await asyncio.wait_for(self._controller.changed_event().wait(), timeout=_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self.release()
+            raise
+
+    async def acquire(self, cancel_token: Optional[CancellationToken] = None) -> None:
+        """Wait for a slot without status updates."""
+        async for _ in self.wait(cancel_token):
+            pass
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._controller._release(self)
+
+    async def __aenter__(self) -> "AdmissionTicket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.release()
+
+
+class AdmissionController:
+    """Global concurrency cap with a bounded FIFO wait queue."""
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        initial_duration: float = 60.0,
+    ):
+        self._max_concurrent = max_concurrent
+        self._max_queue = max_queue
+        self.active = 0
+        self._queue: Deque[AdmissionTicket] = deque()
+        self._changed = asyncio.Event()
+        # 생성 1건의 평균 소요 시간 (초, 지수 이동 평균)
+        self.average_duration = initial_duration
+
+    @property
+    def max_concurrent(self) -> int:
+        return max(1, self._max_concurrent or settings.generation_max_concurrent)
+
+    @property
+    def max_queue(self) -> int:
+        return self._max_queue if self._max_queue is not None else settings.generation_queue_size
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def changed_event(self) -> asyncio.Event:
+        return self._changed
+
+    def check(self) -> None:
+        """Refuse now if enter() would, without taking a slot or queue place.
+
+        스트리밍 응답은 본문이 시작된 뒤에야 enter()를 호출하므로, 응답을 열기 전에
+        이 검사로 503을 돌려줍니다 (슬롯을 미리 잡지 않아 연결이 끊겨도 새지 않음).
+
+        Raises:
+            GenerationQueueFull: 실행 슬롯과 대기열이 모두 찬 경우
+        """
+        if self.active < self.max_concurrent and not self._queue:
+            return
+        if len(self._queue) < self.max_queue:
+            return
+        GENERATION_REJECTED.inc()
+        retry_after = max(1, math.ceil(self.estimated_wait(len(self._queue) + 1)))
+        raise GenerationQueueFull(retry_after)
+
+    def enter(self) -> AdmissionTicket:
+        """Take a running slot or a place in the queue.
+
+        Raises:
+            GenerationQueueFull: 실행 슬롯과 대기열이 모두 찬 경우
+        """
+        self.check()
+        ticket = AdmissionTicket(self)
+        if self.active < self.max_concurrent and not self._queue:
+            self._grant(ticket)
+        else:
+            self._queue.append(ticket)
+            logger.info(f"[Admission] Generation queued at position {len(self._queue)}")
+        self._update_gauges()
+        return ticket
+
+    def position(self, ticket: AdmissionTicket) -> int:
+        try:
+            return self._queue.index(ticket) + 1
+        except ValueError:
+            return 0
+
+    def estimated_wait(self, position: int) -> int:
+        """Rough seconds until the given queue position starts running."""
+        if position <= 0:
+            return 0
+        rounds = math.ceil(position / self.max_concurrent)
+        return math.ceil(rounds * self.average_duration)
+
+    def _grant(self, ticket: AdmissionTicket) -> None:
+        self.active += 1
+        ticket.started_at = time.monotonic()
+        GENERATION_WAIT_SECONDS.inc(ticket.started_at - ticket.enqueued_at)
+        ticket.granted.set()
+
+    def _release(self, ticket: AdmissionTicket) -> None:
+        if ticket.granted.is_set():
+            self.active -= 1
+            duration = time.monotonic() - ticket.started_at
+            self.average_duration = 0.8 * self.average_duration + 0.2 * duration
+        elif ticket in self._queue:
+            # 대기 중 취소 (연결 끊김 등)
+            self._queue.remove(ticket)
+
+        while self._queue and self.active < self.max_concurrent:
+            self._grant(self._queue.popleft())
+        self._update_gauges()
+        self._notify()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _update_gauges(self) -> None:
+        GENERATION_ACTIVE.set(self.active)
+        GENERATION_QUEUED.set(len(self._queue))
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController()
+    return _controller
@@ -0,0 +1,220 @@
+"""Batch LLM request backends (Message Batches API and a local stand-in).
+
+지연 시간보다 비용과 처리량이 중요한 백그라운드 미리 생성을 위해, 여러 LLM 요청을 하나의
+배치로 제출하고 완료될 때까지 폴링한 뒤 결과를 가져옵니다
+(app.services.batch_generation_service, scripts/run_batch_generation.py).
+
+- AnthropicBatchBackend: Anthropic Message Batches API (messages.batches)
+- LocalBatchBackend: 파일 기반 대체 구현. 배치마다 디렉터리에 requests.jsonl을 쓰고,
+  responder가 각 요청을 처리해 results.jsonl을 씁니다. 테스트에서는 가짜 responder로
+  네트워크 없이 전체 파이프라인을 실행합니다.
+
+요청 본문은 app.ai.llm.build_batch_params로 만들고, 응답 텍스트는 parse_batch_text로 해석합니다.
+custom_id는 배치 안에서 고유해야 합니다 (영문자, 숫자, _, - 최대 64자).
+"""
+import json
+import logging
+import os
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+Responder = Callable[[Dict[str, Any]], str]
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    params: Dict[str, Any]
+
+
+@dataclass
+class BatchResult:
+    custom_id: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and self.text is not None
+
+
+class BatchBackend(ABC):
+    """Submit a batch, check whether it has ended, fetch its results."""
+
+    name = "base"
+
+    @abstractmethod
+    def submit(self, requests: List[BatchRequest]) -> str:
+        """Submit requests as one batch and return its id."""
+
+    @abstractmethod
+    def is_done(self, batch_id: str) -> bool:
+        """Whether the batch has ended (results are available)."""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> Dict[str, BatchResult]:
+        """Results of an ended batch by custom_id."""
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API."""
+
+    name = "anthropic"
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            import anthropic
+
+            self._client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        return self._client
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        batch = self.client.messages.batches.create(
+            requests=[{"custom_id": r.custom_id, "params": r.params} for r in requests]
+        )
+        return batch.id
+
+    def is_done(self, batch_id: str) -> bool:
+        return self.client.messages.batches.retrieve(batch_id).processing_status == "ended"
+
+    def results(self, batch_id: str) -> Dict[str, BatchResult]:
+        results = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                text = "".join(
+                    block.text for block in result.message.content if block.type == "text"
+                )
+                results[entry.custom_id] = BatchResult(entry.custom_id, text=text)
+            else:
+                # errored / canceled / expired
+                error = getattr(getattr(result, "error", None), "error", None)
+                message = getattr(error, "message", None)
+                results[entry.custom_id] = BatchResult(
+                    entry.custom_id, error=f"{result.type}: {message}" if message else result.type
+                )
+        return results
+
+
+class LocalBatchBackend(BatchBackend):
+    """File-based stand-in for the batch API.
+
+    {directory}/{batch_id}/requests.jsonl → results.jsonl
+    responder가 있으면 is_done()을 처음 호출할 때 배치를 처리합니다 (서버 측 처리를 흉내 냄).
+    responder가 없으면 다른 프로세스가 results.jsonl을 쓸 때까지 진행 중으로 봅니다.
+    """
+
+    name = "local"
+
+    def __init__(self, directory: Optional[str] = None, responder: Optional[Responder] = None):
+        self.directory = Path(directory or settings.llm_batch_local_dir)
+        self.responder = responder
+
+    def _batch_dir(self, batch_id: str) -> Path:
+        return self.directory / batch_id
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        batch_id = f"local_{uuid.uuid4().hex}"
+        batch_dir = self._batch_dir(batch_id)
+        batch_dir.mkdir(parents=True)
+        with open(batch_dir / "requests.jsonl", "w", encoding="utf-8") as f:
+            for request in requests:
+                f.write(json.dumps(
+                    {"custom_id": request.custom_id, "params": request.params}, ensure_ascii=False
+                ) + "\n")
+        return batch_id
+
+    def is_done(self, batch_id: str) -> bool:
+        if (self._batch_dir(batch_id) / "results.jsonl").exists():
+            return True
+        if self.responder is None:
+            return False
+        self.process(batch_id)
+        return True
+
+    def process(self, batch_id: str) -> None:
+        """Answer every request in the batch with the responder."""
+        batch_dir = self._batch_dir(batch_id)
+        lines = []
+        with open(batch_dir / "requests.jsonl", encoding="utf-8") as f:
+            for line in f:
+                request = json.loads(line)
+                try:
+                    entry = {"custom_id": request["custom_id"], "text": self.responder(request["params"])}
+                except Exception as e:
+                    entry = {"custom_id": request["custom_id"], "error": f"errored: {e}"}
+                lines.append(json.dumps(entry, ensure_ascii=False))
+        # 부분 결과가 완료로 보이지 않도록 임시 파일에 쓴 뒤 교체
+        tmp = batch_dir / "results.jsonl.tmp"
+        tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(tmp, batch_dir / "results.jsonl")
+
+    def results(self, batch_id: str) -> Dict[str, BatchResult]:
+        results = {}
+        with open(self._batch_dir(batch_id) / "results.jsonl", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    results[entry["custom_id"]] = BatchResult(
+                        entry["custom_id"], text=entry.get("text"), error=entry.get("error")
+                    )
+        return results
+
+
+def anthropic_responder(params: Dict[str, Any]) -> str:
+    """Answer a local batch request with a regular Messages API call (배치 API 없이 개발용)."""
+    import anthropic
+
+    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    message = client.messages.create(**params)
+    return "".join(block.text for block in message.content if block.type == "text")
+
+
+def get_batch_backend(name: Optional[str] = None) -> BatchBackend:
+    name = name or settings.llm_batch_backend
+    if name == "local":
+        return LocalBatchBackend(responder=anthropic_responder)
+    return AnthropicBatchBackend()
+
+
+def run_batch(
+    backend: BatchBackend,
+    requests: List[BatchRequest],
+    poll_interval: Optional[float] = None,
+    timeout: Optional[float] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Dict[str, BatchResult]:
+    """Submit requests as one batch and block until its results are available.
+
+    Raises:
+        TimeoutError: timeout 안에 배치가 끝나지 않은 경우
+    """
+    if not requests:
+        return {}
+    poll_interval = settings.llm_batch_poll_seconds if poll_interval is None else poll_interval
+    timeout = settings.llm_batch_timeout_seconds if timeout is None else timeout
+
+    batch_id = backend.submit(requests)
+    logger.info(f"[Batch] Submitted {len(requests)} requests as {batch_id} ({backend.name})")
+    deadline = time.monotonic() + timeout
+    while not backend.is_done(batch_id):
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"batch {batch_id} did not finish within {timeout}s")
+        sleep(poll_interval)
+
+    results = backend.results(batch_id)
+    failed = sum(1 for r in results.values() if not r.succeeded)
+    logger.info(f"[Batch] {batch_id} ended: {len(results) - failed} succeeded, {failed} failed")
+    return results
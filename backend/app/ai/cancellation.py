@@ -0,0 +1,47 @@
+"""Cooperative cancellation for LLM work running in executor threads.
+
+SSE 클라이언트 연결이 끊기면 진행 중인 LLM 호출을 중단하기 위해 사용합니다.
+LLM 호출은 스레드 풀에서 실행되므로 asyncio 취소가 전파되지 않습니다.
+대신 호출 측이 토큰을 넘기고, LLM 유틸리티가 스트리밍 청크마다 토큰을 확인합니다.
+"""
+import threading
+from typing import Optional
+
+
+class GenerationCancelled(BaseException):
+    """Raised when a cancellation token is triggered.
+
+    asyncio.CancelledError와 같이 BaseException을 상속하여,
+    노드/서비스의 `except Exception` 폴백이 취소를 삼키지 않도록 합니다.
+    """
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag shared between the event loop and workers."""
+
+    def __init__(self, parent: Optional["CancellationToken"] = None):
+        self._event = threading.Event()
+        self._parent = parent
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        return self._parent is not None and self._parent.cancelled
+
+    def child(self) -> "CancellationToken":
+        """Create a token cancelled together with this one, but cancellable on its own."""
+        return CancellationToken(parent=self)
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation. Subsequent checks raise GenerationCancelled."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._parent is not None:
+            self._parent.raise_if_cancelled()
+        if self._event.is_set():
+            raise GenerationCancelled(self.reason)
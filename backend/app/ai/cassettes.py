@@ -0,0 +1,364 @@
+"""Record/replay cassettes for LLM calls.
+
+settings.llm_backend로 선택합니다 (app.ai.llm._family_llm).
+- record: 실제 API를 호출하면서 요청/응답 쌍을 카세트에 기록
+- replay: API를 호출하지 않고 기록된 응답을 돌려줌 (기록된 지연 재현은 llm_cassette_replay_latency)
+
+카세트는 settings.llm_cassette_dir 아래 패밀리별 JSONL 파일({family}.jsonl)이며, 항목마다
+프롬프트 패밀리, 응답 모드(json/compact/tool/stream), 입력(system/user), 원본 출력,
+토큰 수, 지연 시간을 담습니다. 항목 키는 모드와 입력의 해시이므로 프롬프트 템플릿이 바뀌면
+새 키가 되어 재생 시 CassetteMiss가 발생합니다 (다시 기록 필요).
+
+summarize()는 패밀리별 입력/출력 토큰, 현재 파서 기준 파싱 성공률, 지연 분포를 집계합니다.
+프롬프트 변경 전후의 카세트를 비교하려면 scripts/benchmark_prompt_families.py를 사용합니다.
+"""
+import hashlib
+import json
+import logging
+import statistics
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from app.ai import output_schemas
+from app.ai.tokens import estimate_tokens
+from app.config import settings
+from app.core import metrics
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_CALLS = metrics.counter(
+    "llm_cassette_calls_total", "Cassette record/replay calls", ("family", "outcome")
+)  # outcome: recorded / replayed / miss
+
+_CHUNK_CHARS = 16
+
+
+class CassetteMiss(LookupError):
+    """No recorded response for this request (prompt changed or never recorded)."""
+
+
+@dataclass
+class CassetteEntry:
+    key: str
+    family: str
+    mode: str  # json / compact / tool / stream
+    schema: Optional[str]
+    compact: bool
+    system: str
+    user: str
+    output: str  # 응답 텍스트 (tool 모드는 tool 입력 JSON)
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    latency_seconds: float = 0.0
+    first_token_seconds: Optional[float] = None
+    stop_reason: Optional[str] = None
+    model: Optional[str] = None
+    recorded_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+
+def request_key(mode: str, schema: Optional[str], system: str, user: str) -> str:
+    payload = json.dumps([mode, schema, system, user], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def split_messages(messages: list) -> Tuple[str, str]:
+    """(system, user) text of messages built by app.ai.llm.build_messages."""
+    system, user = [], []
+    for message in messages:
+        content = message.content
+        if isinstance(content, list):
+            content = "".join(block.get("text", "") for block in content if isinstance(block, dict))
+        (system if message.type == "system" else user).append(content)
+    return "\n".join(system), "\n".join(user)
+
+
+class CassetteStore:
+    """Family-partitioned JSONL cassette files with an in-memory key index."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, CassetteEntry]] = None
+
+    def _load(self) -> Dict[str, CassetteEntry]:
+        if self._index is None:
+            self._index = {}
+            for path in sorted(self.directory.glob("*.jsonl")):
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            entry = CassetteEntry(**json.loads(line))
+                            self._index[entry.key] = entry  # 같은 키는 마지막 기록 사용
+        return self._index
+
+    def get(self, key: str) -> Optional[CassetteEntry]:
+        with self._lock:
+            return self._load().get(key)
+
+    def record(self, entry: CassetteEntry) -> None:
+        with self._lock:
+            self._load()[entry.key] = entry
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / f"{entry.family}.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+
+    def entries(self, family: Optional[str] = None) -> List[CassetteEntry]:
+        with self._lock:
+            return [e for e in self._load().values() if family is None or e.family == family]
+
+
+@lru_cache(maxsize=8)
+def get_cassette_store(directory: Optional[str] = None) -> CassetteStore:
+    return CassetteStore(directory or settings.llm_cassette_dir)
+
+
+# ==================== Chat Models ====================
+
+def _mode(tool_schema: Optional[Type[BaseModel]], compact: bool, streaming: bool) -> str:
+    if tool_schema is not None:
+        return "tool"
+    if streaming:
+        return "stream"
+    return "compact" if compact else "json"
+
+
+class RecordingChatModel:
+    """Wraps a real chat model and records every response."""
+
+    def __init__(
+        self,
+        llm,
+        store: CassetteStore,
+        family: str,
+        schema: Optional[Type[BaseModel]] = None,
+        compact: bool = False,
+        tool: bool = False,
+    ):
+        self.llm = llm
+        self.store = store
+        self.family = family
+        self.schema = schema
+        self.compact = compact
+        self.tool = tool
+
+    def bind_tools(self, tools: list, tool_choice: Optional[str] = None) -> "RecordingChatModel":
+        return RecordingChatModel(
+            self.llm.bind_tools(tools, tool_choice=tool_choice), self.store, self.family, tools[0], tool=True
+        )
+
+    def invoke(self, messages: list):
+        started = time.monotonic()
+        response = self.llm.invoke(messages)
+        latency = time.monotonic() - started
+
+        output = response.content if isinstance(response.content, str) else ""
+        if self.tool:
+            invalid = getattr(response, "invalid_tool_calls", None)
+            if response.tool_calls:
+                output = json.dumps(response.tool_calls[0]["args"], ensure_ascii=False)
+            elif invalid:
+                output = invalid[0].get("args") or ""
+        metadata = getattr(response, "response_metadata", None) or {}
+        usage = metadata.get("usage") or {}
+        self._record(
+            messages, output, latency, None, streaming=False,
+            usage=usage, stop_reason=metadata.get("stop_reason"), model=metadata.get("model"),
+        )
+        return response
+
+    def stream(self, messages: list) -> Iterator:
+        started = time.monotonic()
+        first_token = None
+        parts = []
+        usage: Dict[str, int] = {}
+        for chunk in self.llm.stream(messages):
+            if first_token is None:
+                first_token = time.monotonic() - started
+            if isinstance(chunk.content, str):
+                parts.append(chunk.content)
+            for name, value in (getattr(chunk, "usage_metadata", None) or {}).items():
+                if isinstance(value, int):
+                    usage[name] = usage.get(name, 0) + value
+            yield chunk
+        # 끝까지 소비된 스트림만 기록 (취소된 스트림은 출력이 불완전)
+        self._record(
+            messages, "".join(parts), time.monotonic() - started, first_token, streaming=True, usage=usage
+        )
+
+    def _record(
+        self,
+        messages: list,
+        output: str,
+        latency: float,
+        first_token: Optional[float],
+        streaming: bool,
+        usage: Dict[str, Any],
+        stop_reason: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        system, user = split_messages(messages)
+        mode = _mode(self.schema if self.tool else None, self.compact, streaming)
+        schema = self.schema.__name__ if self.schema is not None else None
+        self.store.record(CassetteEntry(
+            key=request_key(mode, schema, system, user),
+            family=self.family,
+            mode=mode,
+            schema=schema,
+            compact=self.compact,
+            system=system,
+            user=user,
+            output=output,
+            input_tokens=usage.get("input_tokens") or estimate_tokens(system + user),
+            output_tokens=usage.get("output_tokens") or estimate_tokens(output),
+            cache_read_tokens=usage.get("cache_read_input_tokens") or 0,
+            cache_write_tokens=usage.get("cache_creation_input_tokens") or 0,
+            latency_seconds=round(latency, 4),
+            first_token_seconds=round(first_token, 4) if first_token is not None else None,
+            stop_reason=stop_reason,
+            model=model,
+        ))
+        CASSETTE_CALLS.inc(family=self.family, outcome="recorded")
+
+
+class ReplayChatModel:
+    """Serves recorded responses without calling the API."""
+
+    def __init__(
+        self,
+        store: CassetteStore,
+        family: str,
+        schema: Optional[Type[BaseModel]] = None,
+        compact: bool = False,
+        tool: bool = False,
+    ):
+        self.store = store
+        self.family = family
+        self.schema = schema
+        self.compact = compact
+        self.tool = tool
+
+    def bind_tools(self, tools: list, tool_choice: Optional[str] = None) -> "ReplayChatModel":
+        return ReplayChatModel(self.store, self.family, tools[0], tool=True)
+
+    def invoke(self, messages: list):
+        from langchain_core.messages import AIMessage
+
+        entry = self._lookup(messages, streaming=False)
+        _replay_sleep(entry.latency_seconds)
+        metadata = {
+            "stop_reason": entry.stop_reason,
+            "usage": {
+                "input_tokens": entry.input_tokens,
+                "output_tokens": entry.output_tokens,
+                "cache_read_input_tokens": entry.cache_read_tokens,
+                "cache_creation_input_tokens": entry.cache_write_tokens,
+            },
+        }
+        if not self.tool:
+            return AIMessage(content=entry.output, response_metadata=metadata)
+        call = {"name": self.schema.__name__, "id": "cassette_tool_call"}
+        try:
+            args = json.loads(entry.output)
+        except ValueError:
+            args = None
+        if isinstance(args, dict):
+            return AIMessage(content="", response_metadata=metadata, tool_calls=[{**call, "args": args}])
+        return AIMessage(
+            content="", response_metadata=metadata,
+            invalid_tool_calls=[{**call, "args": entry.output, "error": "recorded invalid tool input"}],
+        )
+
+    def stream(self, messages: list) -> Iterator:
+        from langchain_core.messages import AIMessageChunk
+
+        entry = self._lookup(messages, streaming=True)
+        first_token = entry.first_token_seconds or 0.0
+        chunks = [entry.output[i:i + _CHUNK_CHARS] for i in range(0, len(entry.output), _CHUNK_CHARS)]
+        per_chunk = max(entry.latency_seconds - first_token, 0.0) / max(len(chunks), 1)
+        _replay_sleep(first_token)
+        for chunk in chunks:
+            yield AIMessageChunk(content=chunk)
+            _replay_sleep(per_chunk)
+
+    def _lookup(self, messages: list, streaming: bool) -> CassetteEntry:
+        system, user = split_messages(messages)
+        mode = _mode(self.schema if self.tool else None, self.compact, streaming)
+        schema = self.schema.__name__ if self.schema is not None else None
+        entry = self.store.get(request_key(mode, schema, system, user))
+        if entry is None:
+            CASSETTE_CALLS.inc(family=self.family, outcome="miss")
+            logger.warning(f"[Cassette] No recording for {self.family}/{mode} request")
+            raise CassetteMiss(f"no cassette entry for {self.family}/{mode} request")
+        CASSETTE_CALLS.inc(family=self.family, outcome="replayed")
+        return entry
+
+
+def _replay_sleep(seconds: float) -> None:
+    if settings.llm_cassette_replay_latency and seconds > 0:
+        time.sleep(seconds)
+
+
+def cassette_llm(llm, family: str, schema: Optional[Type[BaseModel]] = None, compact: bool = False):
+    """Chat model for settings.llm_backend "record" (llm 필요) or "replay" (llm 무시)."""
+    store = get_cassette_store()
+    if settings.llm_backend == "replay":
+        return ReplayChatModel(store, family, schema, compact)
+    return RecordingChatModel(llm, store, family, schema, compact)
+
+
+# ==================== Benchmark ====================
+
+def parses(entry: CassetteEntry) -> bool:
+    """Whether the recorded output parses and validates with the current parsers."""
+    from app.ai.compact import get_compact_format
+    from app.ai.llm import parse_json_response
+
+    schema = getattr(output_schemas, entry.schema, None) if entry.schema else None
+    try:
+        data = json.loads(entry.output) if entry.mode == "tool" else parse_json_response(entry.output)
+        if entry.compact:
+            data = get_compact_format(schema).expand(data)
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            schema.model_validate(data)
+        return isinstance(data, dict)
+    except (ValueError, AttributeError):
+        return False
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def summarize(entries: List[CassetteEntry]) -> Dict[str, dict]:
+    """Per-family token, parse-success and latency summary of cassette entries."""
+    by_family: Dict[str, List[CassetteEntry]] = {}
+    for entry in entries:
+        by_family.setdefault(entry.family, []).append(entry)
+
+    report = {}
+    for family, group in sorted(by_family.items()):
+        latencies = [e.latency_seconds for e in group]
+        first_tokens = [e.first_token_seconds for e in group if e.first_token_seconds is not None]
+        report[family] = {
+            "calls": len(group),
+            "input_tokens_avg": round(statistics.mean(e.input_tokens for e in group), 1),
+            "output_tokens_avg": round(statistics.mean(e.output_tokens for e in group), 1),
+            "cache_read_tokens_avg": round(statistics.mean(e.cache_read_tokens for e in group), 1),
+            "parse_success_rate": round(sum(parses(e) for e in group) / len(group), 4),
+            "latency_p50": round(_percentile(latencies, 0.5), 3),
+            "latency_p95": round(_percentile(latencies, 0.95), 3),
+            "first_token_p50": round(_percentile(first_tokens, 0.5), 3) if first_tokens else None,
+        }
+    return report
@@ -0,0 +1,186 @@
+"""Compact output formats - positional arrays instead of verbose JSON keys.
+
+출력 토큰이 생성 지연의 대부분을 차지하므로, 긴 키(question_text, correct_answer, ...)가
+문항마다 반복되는 패밀리는 축약 형식으로 응답을 받을 수 있습니다.
+- 프롬프트: 기존 지침/예시(캐시되는 system 블록)는 그대로 두고, user 블록 끝에
+  축약 형식 지시를 덧붙입니다.
+- 디코더: 축약 응답을 기존 dict 형태로 펼쳐서 반환하므로 _save_daily_tasks 등
+  호출 측은 바뀌지 않습니다.
+
+축약 형식은 응답 스키마(output_schemas) 단위로 정의하고, 패밀리별로
+settings.llm_families의 "compact": true로 켭니다 (기본 꺼짐).
+    LLM_FAMILIES='{"questions": {"compact": true}}'
+같은 패밀리라도 축약 형식이 없는 스키마(예: ReviewQuestionsOutput)는 기존 형식을 씁니다.
+구조화 출력(tool calling) 모드에서는 스키마 검증을 위해 기존 형식을 사용합니다.
+"""
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from app.ai.output_schemas import CurriculumOutput, DailyTasksOutput, QuestionsOutput
+
+QUESTION_TYPE_CODES = {
+    "M": "MULTIPLE_CHOICE",
+    "S": "SHORT_ANSWER",
+    "E": "ESSAY",
+}
+_QUESTION_TYPE_KEYS = {v: k for k, v in QUESTION_TYPE_CODES.items()}
+
+
+class CompactFormatError(ValueError):
+    """Compact response does not match the expected layout."""
+
+
+def _rows(data: Any, key: str) -> List[list]:
+    if not isinstance(data, dict) or not isinstance(data.get(key), list):
+        raise CompactFormatError(f"missing '{key}' array")
+    rows = data[key]
+    for row in rows:
+        if not isinstance(row, list):
+            raise CompactFormatError(f"'{key}' rows must be arrays")
+    return rows
+
+
+def _at(row: list, index: int, default: Any = None) -> Any:
+    return row[index] if index < len(row) else default
+
+
+# ---------------------------------------------------------------- questions
+QUESTIONS_INSTRUCTIONS = """
+
+<compact_output>
+출력 형식 변경: 위 output_format 대신 아래 축약 형식으로만 응답하세요 (내용 기준은 동일).
+{"q": [[유형, 문제, 선택지, 정답, 힌트, 해설], ...]}
+- 유형: "M"(객관식), "S"(단답식), "E"(서술형)
+- 선택지: 객관식은 4개 배열, 그 외 null
+- 정답: 객관식은 0-based 인덱스 문자열
+예: {"q": [["M", "[리스트] 수정 가능한 자료형은?", ["tuple", "list", "str", "int"], "1", "mutability", "list만 mutable"]]}
+</compact_output>"""
+
+
+def expand_questions(data: Any) -> dict:
+    questions = []
+    for row in _rows(data, "q"):
+        code = _at(row, 0)
+        if code not in QUESTION_TYPE_CODES or len(row) < 4:
+            raise CompactFormatError(f"invalid question row: {row!r:.80}")
+        question = {
+            "question_type": QUESTION_TYPE_CODES[code],
+            "question_text": row[1],
+            "correct_answer": str(row[3]),
+            "hint": _at(row, 4),
+            "explanation": _at(row, 5),
+        }
+        if row[2] is not None:
+            question["choices"] = row[2]
+        questions.append(question)
+    return {"questions": questions}
+
+
+def compact_questions(data: dict) -> dict:
+    return {"q": [
+        [
+            _QUESTION_TYPE_KEYS.get(q.get("question_type"), "S"),
+            q.get("question_text"),
+            q.get("choices"),
+            q.get("correct_answer"),
+            q.get("hint"),
+            q.get("explanation"),
+        ]
+        for q in data.get("questions", [])
+    ]}
+
+
+# -------------------------------------------------------------------- daily
+DAILY_INSTRUCTIONS = """
+
+<compact_output>
+출력 형식 변경: 위 output_format 대신 아래 축약 형식으로만 응답하세요 (내용 기준은 동일).
+{"d": [[일차, 목표 제목, 목표 설명, [[태스크 제목, 태스크 설명], ...]], ...]}
+예: {"d": [[1, "변수와 데이터 타입 이해", "30분-1시간 내 달성", [["변수 개념 학습 (30분)", "예제 따라 하기"]]]]}
+</compact_output>"""
+
+
+def expand_daily(data: Any) -> dict:
+    days = []
+    for row in _rows(data, "d"):
+        if len(row) < 4 or not isinstance(row[3], list):
+            raise CompactFormatError(f"invalid day row: {row!r:.80}")
+        days.append({
+            "day_number": row[0],
+            "goal": {"title": row[1], "description": row[2]},
+            "tasks": [
+                {"title": _at(task, 0), "description": _at(task, 1, "")}
+                for task in row[3]
+                if isinstance(task, list)
+            ],
+        })
+    return {"days": days}
+
+
+def compact_daily(data: dict) -> dict:
+    return {"d": [
+        [
+            day.get("day_number"),
+            (day.get("goal") or {}).get("title"),
+            (day.get("goal") or {}).get("description"),
+            [[t.get("title"), t.get("description")] for t in day.get("tasks", [])],
+        ]
+        for day in data.get("days", [])
+    ]}
+
+
+# --------------------------------------------------------------- curriculum
+CURRICULUM_INSTRUCTIONS = """
+
+<compact_output>
+출력 형식 변경: 위 output_format 대신 아래 축약 형식으로만 응답하세요 (내용 기준은 동일).
+{"c": [[일차, 학습 주제, [핵심 포인트, ...], 난이도], ...]}
+예: {"c": [[1, "8품사 개념과 문장의 기본 구조", ["명사", "동사"], "기초"]]}
+</compact_output>"""
+
+
+def expand_curriculum(data: Any) -> dict:
+    days = []
+    for row in _rows(data, "c"):
+        if len(row) < 3:
+            raise CompactFormatError(f"invalid curriculum row: {row!r:.80}")
+        days.append({
+            "day": row[0],
+            "topic": row[1],
+            "focus": row[2] if isinstance(row[2], list) else [row[2]],
+            "difficulty": _at(row, 3, "기초"),
+        })
+    return {"daily_curriculum": days}
+
+
+def compact_curriculum(data: dict) -> dict:
+    return {"c": [
+        [d.get("day"), d.get("topic"), d.get("focus"), d.get("difficulty")]
+        for d in data.get("daily_curriculum", [])
+    ]}
+
+
+class CompactFormat:
+    """Prompt suffix plus encoder/decoder for one response schema's compact layout."""
+
+    def __init__(
+        self,
+        instructions: str,
+        expand: Callable[[Any], dict],
+        compact: Callable[[dict], dict],
+    ):
+        self.instructions = instructions
+        self.expand = expand
+        self.compact = compact
+
+
+COMPACT_FORMATS: Dict[Type[BaseModel], CompactFormat] = {
+    QuestionsOutput: CompactFormat(QUESTIONS_INSTRUCTIONS, expand_questions, compact_questions),
+    DailyTasksOutput: CompactFormat(DAILY_INSTRUCTIONS, expand_daily, compact_daily),
+    CurriculumOutput: CompactFormat(CURRICULUM_INSTRUCTIONS, expand_curriculum, compact_curriculum),
+}
+
+
+def get_compact_format(schema: Optional[Type[BaseModel]]) -> Optional[CompactFormat]:
+    return COMPACT_FORMATS.get(schema) if schema is not None else None
@@ -0,0 +1,256 @@
+"""Deterministic fake LLM backend for load tests and benchmarks.
+
+settings.llm_backend="fake"이면 app.ai.llm이 ChatAnthropic 대신 FakeChatModel을 사용합니다.
+llm.py의 나머지 경로(single-flight, 재시도/서킷 브레이커, 축약 출력, 구조화 출력 복구,
+스트리밍 취소, 지표)는 그대로 실행되므로 토큰 비용 없이 생성 경로 전체를 부하 테스트할 수 있습니다.
+
+응답:
+- 호출 측이 넘긴 응답 스키마(output_schemas)를 따라 스키마에 맞는 값을 만듭니다.
+  스키마가 없는 스트리밍 호출은 패밀리별 기본 스키마(STREAM_SCHEMAS)를 씁니다.
+- 내용은 (seed, 프롬프트) 해시로 정해지므로 같은 프롬프트에는 항상 같은 응답을 돌려줍니다.
+- 월 목표 개수는 프롬프트의 "학습 기간: N개월"을 따릅니다.
+- 기본값이 있는 bool/Literal 필드는 기본값을 씁니다 (로드맵 수정, 추가 질문 등 부작용 방지).
+
+지연/장애 주입 (settings.fake_llm_*):
+- 첫 토큰까지 지연: 중앙값과 p99로 정한 로그정규 분포 (꼬리 지연 재현)
+- 출력 속도: 초당 토큰 수 (app.ai.tokens.estimate_tokens 기준)
+- failure_rate: 일시적 오류(TimeoutError) - 재시도, 서킷 브레이커 경로
+- truncation_rate: max_tokens 도달처럼 출력이 중간에 잘림 - 파싱 실패, 부분 복구, 폴백 경로
+지연/장애 추첨은 프로세스 전역 난수열(seed 고정)을 쓰므로 단일 스레드 실행에서는 재현됩니다.
+"""
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from typing import (
+    TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Type, Union, get_args, get_origin,
+)
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from app.ai import output_schemas
+from app.ai.tokens import estimate_tokens
+from app.config import settings
+
+if TYPE_CHECKING:
+    from app.ai.compact import CompactFormat
+
+# 스키마 없이 호출되는 스트리밍 패밀리의 응답 형식 (roadmap_stream, feedback_node)
+STREAM_SCHEMAS: Dict[str, Type[BaseModel]] = {
+    "title": output_schemas.RoadmapTitleOutput,
+    "month": output_schemas.MonthGoalOutput,
+    "weeks": output_schemas.MonthWeeksOutput,
+    "feedback": output_schemas.FeedbackAnalysisOutput,
+}
+
+# 배열 필드별 항목 수 (없으면 3)
+LIST_LENGTHS = {
+    "days": 7,
+    "daily_curriculum": 7,
+    "weeks": 4,
+    "questions": 5,
+    "review_questions": 3,
+    "choices": 4,
+    "tasks": 2,
+    "followup_questions": 0,
+}
+# 월 단위 배열은 프롬프트의 학습 기간만큼
+MONTH_LISTS = ("monthly_goals", "weekly_tasks")
+
+# 배열 안에서의 위치(1부터)를 값으로 쓰는 번호 필드
+NUMBERED_FIELDS = ("month_number", "week_number", "day_number", "day")
+
+_MONTHS = re.compile(r"학습 기간:\s*(\d+)\s*개월")
+_CHUNK_CHARS = 16
+
+_rng = random.Random(settings.fake_llm_seed)
+_rng_lock = threading.Lock()
+
+
+class FakeLLMTimeout(TimeoutError):
+    """Injected transient upstream failure (retried like a real timeout)."""
+
+
+def reseed(seed: Optional[int] = None) -> None:
+    """Reset the latency/failure sequence (테스트, 벤치마크 반복 실행용)."""
+    with _rng_lock:
+        _rng.seed(settings.fake_llm_seed if seed is None else seed)
+
+
+# ==================== Response Content ====================
+
+def fake_output(schema: Type[BaseModel], prompt: str = "") -> Dict[str, Any]:
+    """Schema-valid response for prompt (same prompt → same response)."""
+    digest = hashlib.sha256(f"{settings.fake_llm_seed}:{prompt}".encode("utf-8")).hexdigest()
+    rng = random.Random(digest)
+    match = _MONTHS.search(prompt)
+    months = int(match.group(1)) if match else 3
+    return _model_value(schema, rng, 1, months)
+
+
+def _model_value(model: Type[BaseModel], rng: random.Random, index: int, months: int) -> Dict[str, Any]:
+    data = {
+        name: _value(name, field.annotation, field, rng, index, months)
+        for name, field in model.model_fields.items()
+    }
+    if "question_type" in data:
+        # 객관식만 보기와 인덱스 정답을 가짐
+        if data["question_type"] == "MULTIPLE_CHOICE":
+            data["choices"] = [f"보기 {i + 1}" for i in range(4)]
+            data["correct_answer"] = str(rng.randrange(4))
+        else:
+            data.pop("choices", None)
+    return data
+
+
+def _value(
+    name: str,
+    annotation: Any,
+    field: Optional[FieldInfo],
+    rng: random.Random,
+    index: int,
+    months: int,
+) -> Any:
+    has_default = field is not None and not field.is_required()
+    origin = get_origin(annotation)
+    if origin is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        origin = get_origin(annotation)
+
+    if origin is Literal:
+        return field.default if has_default else rng.choice(get_args(annotation))
+    if origin in (list, List):
+        (item,) = get_args(annotation)
+        count = months if name in MONTH_LISTS else LIST_LENGTHS.get(name, 3)
+        return [_value(name, item, None, rng, i + 1, months) for i in range(count)]
+    if origin in (dict, Dict):
+        return {}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_value(annotation, rng, index, months)
+    if annotation is bool:
+        return field.default if has_default else rng.random() < 0.5
+    if annotation is int:
+        if name in NUMBERED_FIELDS:
+            return index
+        metadata = field.metadata if field is not None else []
+        low = next((m.ge for m in metadata if getattr(m, "ge", None) is not None), 0)
+        high = next((m.le for m in metadata if getattr(m, "le", None) is not None), 100)
+        return rng.randint(low, high)
+    return f"{name} {index} ({rng.randrange(1000):03d})"
+
+
+# ==================== Chat Model ====================
+
+class FakeChatModel:
+    """The subset of ChatAnthropic used by app.ai.llm (invoke, stream, bind_tools)."""
+
+    def __init__(
+        self,
+        family: str = "unknown",
+        schema: Optional[Type[BaseModel]] = None,
+        compact: Optional["CompactFormat"] = None,
+        tool: bool = False,
+    ):
+        self.family = family
+        self.schema = schema or STREAM_SCHEMAS.get(family, output_schemas.RoadmapTitleOutput)
+        self.compact = compact
+        self.tool = tool
+
+    def bind_tools(self, tools: list, tool_choice: Optional[str] = None) -> "FakeChatModel":
+        return FakeChatModel(self.family, tools[0], tool=True)
+
+    def invoke(self, messages: list):
+        from langchain_core.messages import AIMessage
+
+        prompt = _prompt_text(messages)
+        data = self._data(prompt)
+        text = json.dumps(data, ensure_ascii=False)
+        truncated = _draw() < settings.fake_llm_truncation_rate
+        if truncated:
+            text = _truncate(text, prompt)
+
+        _sleep(_first_token_delay())
+        if _draw() < settings.fake_llm_failure_rate:
+            raise FakeLLMTimeout(f"fake LLM: injected timeout (family={self.family})")
+        _sleep(_output_seconds(text))
+
+        metadata = {
+            "stop_reason": "max_tokens" if truncated else ("tool_use" if self.tool else "end_turn"),
+            "usage": {"input_tokens": estimate_tokens(prompt), "output_tokens": estimate_tokens(text)},
+        }
+        if not self.tool:
+            return AIMessage(content=text, response_metadata=metadata)
+        call = {"name": self.schema.__name__, "id": "fake_tool_call"}
+        if truncated:
+            return AIMessage(
+                content="", response_metadata=metadata,
+                invalid_tool_calls=[{**call, "args": text, "error": "truncated"}],
+            )
+        return AIMessage(content="", response_metadata=metadata, tool_calls=[{**call, "args": data}])
+
+    def stream(self, messages: list) -> Iterator:
+        from langchain_core.messages import AIMessageChunk
+
+        prompt = _prompt_text(messages)
+        text = json.dumps(self._data(prompt), ensure_ascii=False)
+        if _draw() < settings.fake_llm_truncation_rate:
+            text = _truncate(text, prompt)
+
+        _sleep(_first_token_delay())
+        if _draw() < settings.fake_llm_failure_rate:
+            raise FakeLLMTimeout(f"fake LLM: injected timeout (family={self.family})")
+        for start in range(0, len(text), _CHUNK_CHARS):
+            chunk = text[start:start + _CHUNK_CHARS]
+            yield AIMessageChunk(content=chunk)
+            _sleep(_output_seconds(chunk))
+
+    def _data(self, prompt: str) -> Dict[str, Any]:
+        data = fake_output(self.schema, prompt)
+        return self.compact.compact(data) if self.compact is not None else data
+
+
+def _prompt_text(messages: list) -> str:
+    parts = []
+    for message in messages:
+        content = message.content
+        if isinstance(content, list):
+            content = "".join(block.get("text", "") for block in content if isinstance(block, dict))
+        parts.append(content)
+    return "\n".join(parts)
+
+
+def _truncate(text: str, prompt: str) -> str:
+    cut = random.Random(prompt).uniform(0.3, 0.9)
+    return text[:max(1, int(len(text) * cut))]
+
+
+# ==================== Latency ====================
+
+def _draw() -> float:
+    with _rng_lock:
+        return _rng.random()
+
+
+def _first_token_delay() -> float:
+    """Seconds until the first token (lognormal from the median and p99)."""
+    median = settings.fake_llm_latency_median_ms / 1000
+    p99 = settings.fake_llm_latency_p99_ms / 1000
+    if median <= 0:
+        return 0.0
+    sigma = math.log(p99 / median) / 2.3263 if p99 > median else 0.0
+    with _rng_lock:
+        return median * math.exp(sigma * _rng.gauss(0.0, 1.0))
+
+
+def _output_seconds(text: str) -> float:
+    rate = settings.fake_llm_tokens_per_second
+    return estimate_tokens(text) / rate if rate > 0 else 0.0
+
+
+def _sleep(seconds: float) -> None:
+    if seconds > 0:
+        time.sleep(seconds)
@@ -0,0 +1,191 @@
+"""Token-budgeted roadmap context for feedback chat.
+
+피드백 메시지마다 로드맵 전체를 보내지 않고, 메시지가 가리키는 월/주만 상세히 포함합니다.
+1. 범위 파악: "2개월차", "3주차", "2개월차 3주차", "첫 달", "마지막 주", 주차 제목의 고유 단어
+   - 현재 메시지에 언급이 없으면 직전 사용자 메시지의 범위를 이어받음 ("그 주를 더 쉽게")
+   - "전체", "전반적으로" 등이나 아무 언급이 없으면 전체 범위
+2. 조립: 범위 안의 월은 상세, 나머지 월은 제목 한 줄 (format_roadmap_compact)
+3. 예산: settings.feedback_context_token_budget을 넘으면 대화 기록, 설명 길이,
+   주차 상세를 단계적으로 줄임 (토큰 수는 app.ai.tokens 추정치)
+"""
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Tuple
+
+from app.ai.prompts.feedback_prompts import format_recent_messages, format_roadmap_compact
+from app.ai.tokens import estimate_tokens
+from app.config import settings
+from app.core import metrics
+
+logger = logging.getLogger(__name__)
+
+WEEKS_PER_MONTH = 4
+
+FEEDBACK_CONTEXT_TOKENS_SAVED = metrics.counter(
+    "feedback_context_tokens_saved_total",
+    "Estimated input tokens saved by focused feedback context",
+)
+
+_MONTH_REF = re.compile(r"(\d+)\s*(?:개월|월|달)\s*차|(\d+)\s*번째\s*달")
+_WEEK_REF = re.compile(r"(\d+)\s*주\s*차|(\d+)\s*번째\s*주")
+_FIRST_MONTH = re.compile(r"첫\s*(?:번째\s*|째\s*)?달")
+_LAST_MONTH = re.compile(r"마지막\s*달")
+_FIRST_WEEK = re.compile(r"첫\s*(?:번째\s*|째\s*)?주(?!제)")
+_LAST_WEEK = re.compile(r"마지막\s*주(?!제)")
+_GLOBAL = re.compile(r"전체|전반|모든|전부|처음부터|통째로")
+_WORD = re.compile(r"[가-힣A-Za-z0-9+#.]{2,}")
+# 제목 매칭에서 무시할 흔한 단어
+_STOPWORDS = {"학습", "기초", "심화", "이해", "실습", "복습", "너무", "어려워요", "쉬워요", "내용", "주차", "개월차"}
+
+# 예산 초과 시 차례로 적용하는 축소 단계
+_LEVELS = [
+    {"history": 5, "month_desc": 100, "week_desc": 80, "skeleton_focus": False},
+    {"history": 3, "month_desc": 100, "week_desc": 80, "skeleton_focus": False},
+    {"history": 3, "month_desc": 60, "week_desc": 40, "skeleton_focus": False},
+    {"history": 3, "month_desc": 60, "week_desc": 0, "skeleton_focus": False},
+    {"history": 1, "month_desc": 60, "week_desc": 0, "skeleton_focus": False},
+    {"history": 1, "month_desc": 60, "week_desc": 0, "skeleton_focus": True},
+]
+
+
+@dataclass
+class FeedbackScope:
+    """Months/weeks a feedback message refers to."""
+
+    months: Set[int] = field(default_factory=set)
+    weeks: Set[Tuple[int, int]] = field(default_factory=set)
+    whole: bool = False
+
+    def empty(self) -> bool:
+        return not self.whole and not self.months and not self.weeks
+
+
+@dataclass
+class FeedbackContext:
+    roadmap_json: str
+    recent_messages: str
+    scope: FeedbackScope
+    full_tokens: int
+    tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return max(self.full_tokens - self.tokens, 0)
+
+
+def find_scope(message: str, roadmap_data: dict) -> FeedbackScope:
+    """Work out which months and weeks a message refers to."""
+    scope = FeedbackScope()
+    duration = len(roadmap_data.get("monthly_goals", [])) or roadmap_data.get("duration_months", 0)
+    if _GLOBAL.search(message):
+        scope.whole = True
+        return scope
+
+    months = []  # (위치, 월)
+    for match in _MONTH_REF.finditer(message):
+        months.append((match.end(), int(match.group(1) or match.group(2))))
+    for match in _FIRST_MONTH.finditer(message):
+        months.append((match.end(), 1))
+    for match in _LAST_MONTH.finditer(message):
+        months.append((match.end(), duration))
+
+    weeks = []  # (위치, 주)
+    for match in _WEEK_REF.finditer(message):
+        weeks.append((match.start(), int(match.group(1) or match.group(2))))
+    for match in _FIRST_WEEK.finditer(message):
+        weeks.append((match.start(), 1))
+    for match in _LAST_WEEK.finditer(message):
+        weeks.append((match.start(), WEEKS_PER_MONTH))
+
+    valid_months = {m for _, m in months if 1 <= m <= duration}
+    scope.months |= valid_months
+    for start, week in weeks:
+        # "2개월차 3주차"처럼 바로 앞에 월이 있으면 그 월의 주차
+        owner = next((m for end, m in months if 0 <= start - end <= 3 and m in valid_months), None)
+        if owner is not None and 1 <= week <= WEEKS_PER_MONTH:
+            scope.weeks.add((owner, week))
+        elif week > WEEKS_PER_MONTH:
+            # 로드맵 전체 기준 주차 (5주차 = 2개월차 1주차)
+            month, week_in_month = (week - 1) // WEEKS_PER_MONTH + 1, (week - 1) % WEEKS_PER_MONTH + 1
+            if month <= duration:
+                scope.weeks.add((month, week_in_month))
+        elif len(valid_months) == 1:
+            scope.weeks.add((next(iter(valid_months)), week))
+        elif week >= 1:
+            # 어느 월인지 모호하면 모든 월의 해당 주차
+            scope.weeks |= {(m, week) for m in range(1, duration + 1)}
+
+    if scope.empty():
+        scope.weeks |= _match_titles(message, roadmap_data)
+    return scope
+
+
+def _match_titles(message: str, roadmap_data: dict) -> Set[Tuple[int, int]]:
+    """Weeks whose titles share a distinctive word with the message."""
+    words = {w for w in _WORD.findall(message) if w not in _STOPWORDS}
+    if not words:
+        return set()
+    titles = [
+        ((wt.get("month_number"), w.get("week_number")), w.get("title", ""))
+        for wt in roadmap_data.get("weekly_tasks", [])
+        for w in wt.get("weeks", [])
+    ]
+    matched = set()
+    for word in words:
+        hits = [key for key, title in titles if word in title]
+        if 0 < len(hits) <= 2:  # 여러 주차에 공통인 단어는 범위를 좁히지 못함
+            matched.update(hits)
+    return matched
+
+
+def build_feedback_context(
+    user_message: str,
+    roadmap_data: dict,
+    messages: List[dict],
+    budget: Optional[int] = None,
+) -> FeedbackContext:
+    """Assemble roadmap and chat-history context within a token budget."""
+    budget = budget or settings.feedback_context_token_budget
+    scope = find_scope(user_message, roadmap_data)
+    if scope.empty():
+        # 후속 질문 ("그 주를 더 쉽게")은 직전 사용자 메시지의 범위를 이어받음
+        # 호출 측은 현재 메시지를 기록에 먼저 추가하므로 마지막 사용자 메시지가 현재 턴이면 건너뜀
+        user_turns = [m.get("content", "") for m in messages if m.get("role") == "user"]
+        if user_turns and user_turns[-1] == user_message:
+            user_turns.pop()
+        previous = user_turns[-1] if user_turns else ""
+        scope = find_scope(previous, roadmap_data) if previous else scope
+    if scope.empty():
+        scope.whole = True
+
+    full_tokens = estimate_tokens(format_roadmap_compact(roadmap_data)) + estimate_tokens(
+        format_recent_messages(messages, limit=5)
+    )
+
+    for level in _LEVELS:
+        if scope.whole:
+            detail_months = set() if level["skeleton_focus"] else None
+        else:
+            detail_months = set() if level["skeleton_focus"] else scope.months
+        roadmap_json = format_roadmap_compact(
+            roadmap_data,
+            detail_months=detail_months,
+            detail_weeks=scope.weeks,
+            month_desc_limit=level["month_desc"],
+            week_desc_limit=level["week_desc"],
+        )
+        recent = format_recent_messages(messages, limit=level["history"])
+        tokens = estimate_tokens(roadmap_json) + estimate_tokens(recent)
+        if tokens <= budget:
+            break
+
+    context = FeedbackContext(roadmap_json, recent, scope, full_tokens, tokens)
+    FEEDBACK_CONTEXT_TOKENS_SAVED.inc(context.saved_tokens)
+    logger.info(
+        f"[Feedback] context ~{tokens} tokens (full ~{full_tokens}, saved ~{context.saved_tokens}, "
+        f"budget {budget}, months={sorted(scope.months)}, weeks={sorted(scope.weeks)}, whole={scope.whole})"
+    )
+    if tokens > budget:
+        logger.warning(f"[Feedback] context still over budget after reduction ({tokens} > {budget})")
+    return context
@@ -1,18 +1,72 @@
 """Feedback analysis and roadmap modification logic."""
+import copy
 import logging
-from typing import List, Optional
+from concurrent.futures import Executor
+from typing import AsyncGenerator, Dict, List, Optional
 
-from app.ai.llm import invoke_llm_json, DEFAULT_ANALYTICAL_TEMP
+from app.ai.cancellation import CancellationToken
+from app.ai.feedback_context import build_feedback_context
+from app.ai.json_stream import IncrementalJSONParser
+from app.ai.llm import (
+    LLM_CALLS,
+    LLM_INVALID_OUTPUTS,
+    LLM_PARSE_FAILURES,
+    astream_llm_text,
+    invoke_llm_json,
+    record_fallback,
+)
+from app.ai.output_schemas import FeedbackAnalysisOutput
+from app.ai.prompt_families import PromptFamily
 from app.ai.prompts.feedback_prompts import (
     FEEDBACK_ANALYSIS_PROMPT,
-    format_roadmap_compact,
-    format_recent_messages,
     build_interview_section,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def build_feedback_prompt(
+    user_message: str,
+    roadmap_data: dict,
+    messages: List[dict],
+    interview_context: Optional[dict] = None,
+) -> str:
+    """피드백 분석 프롬프트를 구성합니다."""
+    # 메시지가 가리키는 월/주만 상세히, 토큰 예산 내로
+    context = build_feedback_context(user_message, roadmap_data, messages)
+    interview_section = build_interview_section(interview_context)
+
+    return FEEDBACK_ANALYSIS_PROMPT.format(
+        roadmap_json=context.roadmap_json,
+        interview_section=interview_section,
+        recent_messages=context.recent_messages,
+        user_message=user_message,
+    )
+
+
+def _normalize_result(result: dict) -> dict:
+    """결과 검증 및 기본값 설정."""
+    return {
+        "response": result.get("response", "피드백을 반영했습니다."),
+        "modification_type": result.get("modification_type", "none"),
+        "modifications": {
+            "monthly_goals": result.get("modifications", {}).get("monthly_goals", []),
+            "weekly_tasks": result.get("modifications", {}).get("weekly_tasks", []),
+        }
+    }
+
+
+# 폴백 응답
+FALLBACK_RESULT = {
+    "response": "죄송합니다. 피드백 처리 중 문제가 발생했어요. 다시 한번 말씀해주시겠어요?",
+    "modification_type": "none",
+    "modifications": {
+        "monthly_goals": [],
+        "weekly_tasks": [],
+    }
+}
+
+
 def analyze_and_modify_roadmap(
     user_message: str,
     roadmap_data: dict,
@@ -37,43 +91,69 @@ def analyze_and_modify_roadmap(
             }
         }
     """
-    # 프롬프트 구성
-    roadmap_json = format_roadmap_compact(roadmap_data)
-    recent_messages = format_recent_messages(messages, limit=5)
-    interview_section = build_interview_section(interview_context)
-
-    prompt = FEEDBACK_ANALYSIS_PROMPT.format(
-        roadmap_json=roadmap_json,
-        interview_section=interview_section,
-        recent_messages=recent_messages,
-        user_message=user_message,
-    )
+    prompt = build_feedback_prompt(user_message, roadmap_data, messages, interview_context)
 
     try:
-        # LLM 호출 (분석적 온도 사용)
-        result = invoke_llm_json(prompt, temperature=DEFAULT_ANALYTICAL_TEMP)
+        # LLM 호출 (FEEDBACK 패밀리 기본값인 분석적 온도 사용)
+        result = invoke_llm_json(
+            prompt,
+            family=PromptFamily.FEEDBACK, schema=FeedbackAnalysisOutput,
+        )
+        return _normalize_result(result)
 
-        # 결과 검증 및 기본값 설정
-        return {
-            "response": result.get("response", "피드백을 반영했습니다."),
-            "modification_type": result.get("modification_type", "none"),
-            "modifications": {
-                "monthly_goals": result.get("modifications", {}).get("monthly_goals", []),
-                "weekly_tasks": result.get("modifications", {}).get("weekly_tasks", []),
-            }
-        }
+    except Exception as e:
+        logger.error(f"Failed to analyze feedback: {e}")
+        record_fallback(PromptFamily.FEEDBACK)
+        return copy.deepcopy(FALLBACK_RESULT)
+
+
+async def stream_feedback_analysis(
+    user_message: str,
+    roadmap_data: dict,
+    messages: List[dict],
+    interview_context: Optional[dict] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncGenerator[dict, None]:
+    """Stream the feedback reply, then the structured result.
 
+    출력 형식에서 "response"가 가장 먼저 나오므로, 토큰이 들어올 때마다
+    IncrementalJSONParser로 지금까지의 응답 문장을 읽어 response_delta로 보내고,
+    응답이 완성되면 검증된 전체 결과를 analysis_ready로 보냅니다 (실패 시 폴백).
+
+    Yields:
+        dict: {"type": "response_delta", "data": {"delta": str, "text": str}}
+              {"type": "analysis_ready", "data": analyze_and_modify_roadmap과 같은 형태}
+    """
+    prompt = build_feedback_prompt(user_message, roadmap_data, messages, interview_context)
+    parser = IncrementalJSONParser()
+    sent = ""
+    label = PromptFamily.FEEDBACK.value
+    LLM_CALLS.inc(family=label, mode="stream")
+    try:
+        async for text in astream_llm_text(
+            prompt, cancel_token=cancel_token, executor=executor, family=PromptFamily.FEEDBACK
+        ):
+            parser.feed(text)
+            reply = (parser.partial() or {}).get("response")
+            if isinstance(reply, str) and reply != sent:
+                delta = reply[len(sent):] if reply.startswith(sent) else reply
+                sent = reply
+                yield {"type": "response_delta", "data": {"delta": delta, "text": reply}}
+        try:
+            output = FeedbackAnalysisOutput.model_validate(parser.result())
+        except ValueError:  # JSON 파싱 실패와 스키마 검증 실패(ValidationError) 모두
+            LLM_PARSE_FAILURES.inc(family=label, mode="stream")
+            LLM_INVALID_OUTPUTS.inc(family=label, mode="stream")
+            logger.warning(f"[AI] Failed to parse stream JSON response (family={label})")
+            raise
+        result = _normalize_result(output.model_dump(exclude_none=True))
     except Exception as e:
         logger.error(f"Failed to analyze feedback: {e}")
-        # 폴백 응답
-        return {
-            "response": "죄송합니다. 피드백 처리 중 문제가 발생했어요. 다시 한번 말씀해주시겠어요?",
-            "modification_type": "none",
-            "modifications": {
-                "monthly_goals": [],
-                "weekly_tasks": [],
-            }
-        }
+        record_fallback(PromptFamily.FEEDBACK)
+        result = copy.deepcopy(FALLBACK_RESULT)
+
+    yield {"type": "analysis_ready", "data": result}
 
 
 def apply_modifications(roadmap_data: dict, modifications: dict) -> dict:
@@ -140,3 +220,67 @@ def apply_modifications(roadmap_data: dict, modifications: dict) -> dict:
         updated["weekly_tasks"] = updated_weekly_tasks
 
     return updated
+
+
+def find_stale_weeks(before: dict, after: dict, modifications: dict) -> Dict[int, List[int]]:
+    """수정 diff에서 월 목표와 맞지 않게 된 주차를 찾습니다.
+
+    월 목표(title/description)가 실제로 바뀐 월에서, 같은 수정으로 함께 바뀌지 않은
+    주차는 이전 목표 기준으로 작성된 것이므로 재생성 대상입니다.
+
+    Args:
+        before: 수정 전 로드맵 데이터
+        after: apply_modifications 결과
+        modifications: AI가 생성한 수정 사항
+
+    Returns:
+        dict: {월 번호: [재생성할 주 번호, ...]}
+    """
+    old_goals = {g.get("month_number"): g for g in before.get("monthly_goals", [])}
+    edited_weeks = {
+        (w.get("month_number"), w.get("week_number"))
+        for w in modifications.get("weekly_tasks") or []
+    }
+    stale = {}
+    for goal in after.get("monthly_goals", []):
+        month_num = goal.get("month_number")
+        old = old_goals.get(month_num, {})
+        if (goal.get("title"), goal.get("description")) == (old.get("title"), old.get("description")):
+            continue
+        month_tasks = next(
+            (mt for mt in after.get("weekly_tasks", []) if mt.get("month_number") == month_num),
+            {"weeks": []},
+        )
+        week_numbers = [w.get("week_number") for w in month_tasks.get("weeks", [])] or [1, 2, 3, 4]
+        weeks = [n for n in week_numbers if (month_num, n) not in edited_weeks]
+        if weeks:
+            stale[month_num] = weeks
+    return stale
+
+
+def merge_regenerated_weeks(
+    weekly_tasks: List[dict],
+    month_number: int,
+    weeks: List[dict],
+    stale: List[int],
+) -> List[dict]:
+    """재생성된 주차 중 stale 주차만 기존 주간 과제에 반영합니다."""
+    regenerated = {w.get("week_number"): w for w in weeks}
+    merged = []
+    found = False
+    for month_tasks in weekly_tasks:
+        if month_tasks.get("month_number") != month_number:
+            merged.append(month_tasks)
+            continue
+        found = True
+        merged.append({
+            "month_number": month_number,
+            "weeks": [
+                regenerated.get(w.get("week_number"), w) if w.get("week_number") in stale else w
+                for w in month_tasks.get("weeks", [])
+            ],
+        })
+    if not found:
+        merged.append({"month_number": month_number, "weeks": weeks})
+        merged.sort(key=lambda mt: mt.get("month_number", 0))
+    return merged
@@ -1,16 +1,21 @@
-"""LangGraph workflow for SMART-based interview."""
+"""LangGraph workflow for SMART-based interview.
+
+컴파일된 그래프는 상태를 갖지 않으므로 한 번만 만들어 요청 간에 공유합니다.
+"""
 import asyncio
 import uuid
-from concurrent.futures import ThreadPoolExecutor
-
-from langgraph.graph import StateGraph, END
+from functools import lru_cache
+from typing import Optional
 
 from app.ai.interview_state import InterviewState
 from app.ai.nodes.interview_nodes import question_generator, answer_analyzer
+from app.ai.scheduler import LLMPriority, llm_executor
 
 
 def create_question_graph():
     """Create LangGraph workflow for generating questions."""
+    from langgraph.graph import StateGraph, END
+
     workflow = StateGraph(InterviewState)
     workflow.add_node("question_generator", question_generator)
     workflow.set_entry_point("question_generator")
@@ -20,6 +25,8 @@ def create_question_graph():
 
 def create_analysis_graph():
     """Create LangGraph workflow for analyzing answers."""
+    from langgraph.graph import StateGraph, END
+
     workflow = StateGraph(InterviewState)
     workflow.add_node("answer_analyzer", answer_analyzer)
     workflow.set_entry_point("answer_analyzer")
@@ -27,16 +34,29 @@ def create_analysis_graph():
     return workflow.compile()
 
 
-# Thread pool for running sync graph in async context
-_executor = ThreadPoolExecutor(max_workers=4)
+@lru_cache(maxsize=None)
+def get_question_graph():
+    """Shared compiled question graph (built on first use)."""
+    return create_question_graph()
+
 
+@lru_cache(maxsize=None)
+def get_analysis_graph():
+    """Shared compiled analysis graph (built on first use)."""
+    return create_analysis_graph()
 
-async def generate_questions(topic: str, duration_months: int) -> dict:
+
+async def generate_questions(
+    topic: str,
+    duration_months: int,
+    user_id: Optional[str] = None,
+) -> dict:
     """Generate SMART interview questions.
 
     Args:
         topic: Learning topic
         duration_months: Duration in months
+        user_id: User ID (LLM 스케줄러의 사용자별 공정 큐잉에 사용)
 
     Returns:
         Dict with session_id, questions, and round
@@ -55,11 +75,11 @@ async def generate_questions(topic: str, duration_months: int) -> dict:
         "error_message": None,
     }
 
-    graph = create_question_graph()
+    graph = get_question_graph()
 
     loop = asyncio.get_event_loop()
     final_state = await loop.run_in_executor(
-        _executor,
+        llm_executor(LLMPriority.INTERACTIVE, user_id),
         graph.invoke,
         initial_state
     )
@@ -79,6 +99,7 @@ async def analyze_answers(
     questions: list,
     answers: list,
     current_round: int,
+    user_id: Optional[str] = None,
 ) -> dict:
     """Analyze interview answers and determine next steps.
 
@@ -89,6 +110,7 @@ async def analyze_answers(
         questions: Current questions
         answers: All answers so far
         current_round: Current interview round
+        user_id: User ID (LLM 스케줄러의 사용자별 공정 큐잉에 사용)
 
     Returns:
         Dict with status, followup_questions (if needed), and interview_context
@@ -105,11 +127,11 @@ async def analyze_answers(
         "error_message": None,
     }
 
-    graph = create_analysis_graph()
+    graph = get_analysis_graph()
 
     loop = asyncio.get_event_loop()
     final_state = await loop.run_in_executor(
-        _executor,
+        llm_executor(LLMPriority.INTERACTIVE, user_id),
         graph.invoke,
         initial_state
     )
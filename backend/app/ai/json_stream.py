@@ -0,0 +1,168 @@
+"""Incremental JSON parsing for streamed LLM output.
+
+LLM 토큰 스트림을 받아 JSON 응답을 점진적으로 해석합니다.
+- 지정한 배열 키(예: "weeks")의 객체가 완성되는 즉시 반환
+- 아직 닫히지 않은 문서를 보정하여 현재까지의 부분 결과 제공
+
+응답 앞뒤의 마크다운 코드 블록(```json)이나 설명 문장은 첫 번째 '{' 이전이므로 무시됩니다.
+"""
+import json
+from typing import List, Optional, Tuple
+
+from app.ai.llm import parse_json_response
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONParser:
+    """Scan a JSON document chunk by chunk.
+
+    Usage:
+        parser = IncrementalJSONParser(array_key="weeks")
+        for text in token_stream:
+            for week in parser.feed(text):
+                ...  # 완성된 주차 객체
+        result = parser.result()
+    """
+
+    def __init__(self, array_key: Optional[str] = None):
+        self.array_key = array_key
+        self.buffer = ""
+        self._pos = 0
+        self._root_start: Optional[int] = None
+        self._root_closed = False
+
+        # 스캐너 상태
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._current_key: Optional[str] = None
+
+        # 대상 배열 추적
+        self._array_depth: Optional[int] = None
+        self._item_start: Optional[int] = None
+
+        # 부분 결과 보정용: 마지막 ',' 위치와 그 시점의 스택
+        self._last_comma: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+    def feed(self, text: str) -> List[dict]:
+        """Append a chunk and return array items completed by it."""
+        self.buffer += text
+        completed = []
+
+        while self._pos < len(self.buffer) and not self._root_closed:
+            ch = self.buffer[self._pos]
+            pos = self._pos
+            self._pos += 1
+
+            if self._root_start is None:
+                if ch == "{":
+                    self._root_start = pos
+                    self._stack.append(ch)
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._last_string = self.buffer[self._string_start:pos]
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = pos + 1
+            elif ch == ":":
+                if self._stack and self._stack[-1] == "{":
+                    self._current_key = self._last_string
+            elif ch == ",":
+                self._last_comma = (pos, tuple(self._stack))
+            elif ch in "{[":
+                if (
+                    ch == "["
+                    and self._array_depth is None
+                    and len(self._stack) == 1
+                    and self.array_key is not None
+                    and self._current_key == self.array_key
+                ):
+                    self._array_depth = len(self._stack) + 1
+                elif (
+                    ch == "{"
+                    and self._array_depth is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    self._item_start = pos
+                self._stack.append(ch)
+            elif ch in "}]":
+                if not self._stack:
+                    continue
+                self._stack.pop()
+                if (
+                    ch == "}"
+                    and self._item_start is not None
+                    and self._array_depth is not None
+                    and len(self._stack) == self._array_depth
+                ):
+                    item = self._load_item(self.buffer[self._item_start:pos + 1])
+                    self._item_start = None
+                    if item is not None:
+                        completed.append(item)
+                elif (
+                    ch == "]"
+                    and self._array_depth is not None
+                    and len(self._stack) == self._array_depth - 1
+                ):
+                    self._array_depth = None
+                if not self._stack:
+                    self._root_closed = True
+
+        return completed
+
+    @staticmethod
+    def _load_item(text: str) -> Optional[dict]:
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
+
+    def partial(self) -> Optional[dict]:
+        """Best-effort parse of the document received so far.
+
+        열린 문자열/객체/배열을 닫아 파싱을 시도하고, 실패하면 마지막 ','
+        이전까지만 사용합니다 (값이 없는 키나 미완성 리터럴 제거).
+        """
+        if self._root_start is None:
+            return None
+        if self._root_closed:
+            return self.result()
+
+        text = self.buffer[self._root_start:self._pos]
+        stack: Tuple[str, ...] = tuple(self._stack)
+        if self._in_string:
+            if self._escape:
+                text = text[:-1]
+            text += '"'
+
+        candidate = _try_close(text, stack)
+        if candidate is None and self._last_comma is not None:
+            comma_pos, comma_stack = self._last_comma
+            candidate = _try_close(self.buffer[self._root_start:comma_pos], comma_stack)
+        return candidate
+
+    def result(self) -> dict:
+        """Parse the complete response (raises on invalid JSON)."""
+        return parse_json_response(self.buffer)
+
+
+def _try_close(text: str, stack: Tuple[str, ...]) -> Optional[dict]:
+    closing = "".join(_CLOSERS[c] for c in reversed(stack))
+    try:
+        value = json.loads(text + closing)
+    except json.JSONDecodeError:
+        return None
+    return value if isinstance(value, dict) else None
@@ -7,15 +7,87 @@ Temperature Settings:
 사용 지침:
 - 콘텐츠 생성: 0.7 사용 (다양성 필요)
 - 분석/분류: 0.5 사용 (일관성 필요)
+
+Prompt families:
+- 모델, max_tokens, 타임아웃, 기본 온도, 캐시 사용 여부는 패밀리별로 정합니다
+  (app.ai.prompt_families.get_family_spec). temperature 인자를 넘기면 패밀리 기본 온도 대신 사용합니다.
+- 같은 설정의 ChatAnthropic 인스턴스는 재사용합니다 (HTTP 연결 풀 공유).
+
+Structured output:
+- settings.llm_structured_output이 켜져 있고 호출 측이 schema를 넘기면
+  tool calling으로 응답을 받아 Pydantic 모델로 검증합니다.
+- 검증에 실패하면 누락/오류 필드만 다시 요청합니다 (부분 복구 재시도).
+- 패밀리별 호출 수, 파싱 실패 수, 복구 재시도 수를 app.core.metrics에 기록합니다.
+
+Compact output:
+- 패밀리 설정에서 compact가 켜져 있고 응답 스키마에 축약 형식이 있으면 (app.ai.compact)
+  축약 형식으로 응답을 받아 기존 dict 형태로 펼쳐서 반환합니다. 지표의 mode는 "compact".
+
+Single-flight:
+- 동일한 요청(모델, 온도, 응답 모드, 프롬프트)이 동시에 들어오면 하나의 API 호출을 공유합니다.
+
+Prompt caching:
+- CachedPrompt로 만든 프롬프트(PromptParts)는 고정 지침을 cache_control이 붙은 system 블록으로,
+  요청별 정보를 user 메시지로 보냅니다. 일반 문자열 프롬프트는 기존처럼 user 메시지 하나로 보냅니다.
+- 응답의 캐시 쓰기/읽기 토큰 수를 패밀리별로 기록합니다 (스트리밍 응답은 SDK가 제공하지 않아 제외).
+
+Resilience:
+- 모든 API 호출은 app.ai.resilience를 거칩니다 (패밀리별 타임아웃, 지터 백오프 재시도,
+  서킷 브레이커). SDK 자체 재시도는 끄고(max_retries=0) 여기서 일괄 관리합니다.
+
+Batch requests:
+- build_batch_params()는 같은 패밀리 설정으로 Messages API 요청 본문을 만들어
+  배치 API(app.ai.batch)로 보낼 수 있게 하고, parse_batch_text()가 응답 텍스트를 해석합니다.
+  배치 요청은 항상 JSON 텍스트(또는 축약) 형식을 사용합니다 (tool calling 미사용).
+
+Fake backend / cassettes:
+- settings.llm_backend="fake"이면 ChatAnthropic 대신 app.ai.fake_llm.FakeChatModel을 씁니다.
+  응답 스키마를 함께 넘겨 스키마에 맞는 응답을 만들고, 지연/오류/잘림을 설정대로 주입합니다.
+  재시도, single-flight, 축약/구조화 출력, 지표 등 이 모듈의 나머지 경로는 그대로 실행됩니다.
+- "record"는 실제 호출의 요청/응답을 카세트에 기록하고, "replay"는 기록된 응답을 재생합니다
+  (app.ai.cassettes).
+
+Lazy imports:
+- langchain_anthropic/langchain_core(anthropic SDK 포함)는 첫 LLM 호출 시 import합니다.
+  인증/CRUD만 처리하는 워커의 기동 시간을 줄이기 위함이며, 이 모듈 자체는 가볍게 유지합니다.
 """
+import asyncio
+import hashlib
 import json
 import logging
-import os
+import time
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List, Optional, Type, Union, get_args
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage
+from pydantic import BaseModel, Field, ValidationError, create_model
 
+from app.ai.cancellation import CancellationToken
+from app.ai.compact import CompactFormat, get_compact_format
+from app.ai.prompt_families import (
+    DEFAULT_MODELS,
+    DEV_MODE,
+    FamilySpec,
+    ModelTier,
+    PromptFamily,
+    get_family_spec,
+    model_for_tier,
+)
+from app.ai.prompts.cached import PromptParts
+from app.ai.prompts.repair_prompts import REPAIR_PROMPT, format_validation_errors
+from app.ai.resilience import (
+    LLM_RETRIES,
+    anthropic_breaker,
+    call_with_resilience,
+    is_retryable,
+)
+from app.ai.singleflight import SingleFlight
 from app.config import settings
+from app.core import metrics
+
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+    from langchain_core.messages import BaseMessage
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +95,129 @@ logger = logging.getLogger(__name__)
 DEFAULT_CREATIVE_TEMP = 0.7   # 로드맵 생성, 질문 생성 등
 DEFAULT_ANALYTICAL_TEMP = 0.5  # 답변 분석, 분류 작업 등
 
-DEV_MODE = os.getenv("DEV_MODE", "true").lower() == "true"
-CLAUDE_MODEL = "claude-3-5-haiku-20241022" if DEV_MODE else "claude-sonnet-4-5-20250929"
+# 기본(large) 모델 - 패밀리별 모델은 FamilySpec.model
+CLAUDE_MODEL = DEFAULT_MODELS[ModelTier.LARGE]
+
+logger.info(
+    f"[AI] Claude models: large={DEFAULT_MODELS[ModelTier.LARGE]}, "
+    f"fast={DEFAULT_MODELS[ModelTier.FAST]} (DEV_MODE={DEV_MODE})"
+)
+
+LLM_CALLS = metrics.counter(
+    "llm_calls_total", "LLM JSON calls by prompt family", ("family", "mode")
+)
+LLM_PARSE_FAILURES = metrics.counter(
+    "llm_parse_failures_total",
+    "LLM responses that failed JSON parsing or schema validation on the first attempt",
+    ("family", "mode"),
+)
+LLM_REPAIR_RETRIES = metrics.counter(
+    "llm_repair_retries_total", "Partial-repair retries for invalid structured outputs", ("family",)
+)
+LLM_INVALID_OUTPUTS = metrics.counter(
+    "llm_invalid_outputs_total",
+    "LLM responses still invalid after repair (caller falls back)",
+    ("family", "mode"),
+)
+
+LLM_COALESCED = metrics.counter(
+    "llm_coalesced_calls_total", "Calls served by an identical in-flight request", ("family",)
+)
 
-logger.info(f"[AI] Claude model: {CLAUDE_MODEL} (DEV_MODE={DEV_MODE})")
+LLM_CACHE_WRITE_TOKENS = metrics.counter(
+    "llm_cache_write_tokens_total", "Input tokens written to the prompt cache", ("family",)
+)
+LLM_CACHE_READ_TOKENS = metrics.counter(
+    "llm_cache_read_tokens_total", "Input tokens served from the prompt cache", ("family",)
+)
+LLM_INPUT_TOKENS = metrics.counter(
+    "llm_input_tokens_total", "Uncached input tokens billed", ("family",)
+)
+LLM_OUTPUT_TOKENS = metrics.counter(
+    "llm_output_tokens_total", "Output tokens generated", ("family",)
+)
 
+# 재시도/백오프를 포함한 호출 시간 (stream은 마지막 청크까지)
+LLM_LATENCY = metrics.histogram(
+    "llm_request_duration_seconds", "LLM call latency including retries", ("family", "mode"),
+    buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0),
+)
+LLM_FIRST_TOKEN = metrics.histogram(
+    "llm_first_token_seconds", "Time to the first streamed chunk", ("family",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0),
+)
+LLM_FALLBACKS = metrics.counter(
+    "llm_fallbacks_total", "Calls that ended in the caller's default content", ("family",)
+)
+
+FamilyLike = Union[PromptFamily, str, None]
+Prompt = Union[str, PromptParts]
+
+# 동일 요청 병합용 (프로세스 단위)
+_llm_flight = SingleFlight()
+
+
+def create_llm(
+    temperature: float = 0.7,
+    timeout: Optional[float] = None,
+    model: Optional[str] = None,
+    max_tokens: int = 8192,
+) -> "ChatAnthropic":
+    """Create (or reuse) a Claude LLM instance.
+
+    Args:
+        timeout: 요청 타임아웃 (초). None이면 settings.llm_timeout_seconds
+        model: 모델 이름. None이면 large 등급 모델
+    """
+    return _cached_llm(
+        model or model_for_tier(ModelTier.LARGE),
+        temperature,
+        max_tokens,
+        timeout or settings.llm_timeout_seconds,
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_llm(model: str, temperature: float, max_tokens: int, timeout: float) -> "ChatAnthropic":
+    from langchain_anthropic import ChatAnthropic
 
-def create_llm(temperature: float = 0.7) -> ChatAnthropic:
-    """Create a Claude LLM instance."""
     return ChatAnthropic(
-        model=CLAUDE_MODEL,
+        model=model,
         anthropic_api_key=settings.anthropic_api_key,
         temperature=temperature,
-        max_tokens=8192,
+        max_tokens=max_tokens,
+        default_request_timeout=timeout,
+        max_retries=0,  # 재시도는 resilience.call_with_resilience에서 관리
+    )
+
+
+def _family_llm(
+    spec: FamilySpec,
+    temperature: float,
+    label: str = "unknown",
+    schema: Optional[Type[BaseModel]] = None,
+    compact: Optional[CompactFormat] = None,
+) -> "ChatAnthropic":
+    """Chat model for a family call (schema/compact는 가짜 백엔드, 카세트의 응답 형식용)."""
+    if settings.llm_backend == "fake":
+        from app.ai.fake_llm import FakeChatModel
+
+        return FakeChatModel(label, schema, compact)
+    if settings.llm_backend == "replay":
+        from app.ai.cassettes import cassette_llm
+
+        return cassette_llm(None, label, schema, compact is not None)
+    llm = create_llm(
+        temperature,
+        timeout=spec.timeout,
+        model=spec.model,
+        max_tokens=spec.max_tokens,
     )
+    if settings.llm_backend == "record":
+        from app.ai.cassettes import cassette_llm
+
+        return cassette_llm(llm, label, schema, compact is not None)
+    return llm
 
 
 def parse_json_response(content: str) -> dict:
@@ -48,8 +229,501 @@ def parse_json_response(content: str) -> dict:
     return json.loads(content.strip())
 
 
-def invoke_llm_json(prompt: str, temperature: float = 0.7) -> dict:
-    """Invoke LLM and parse JSON response."""
-    llm = create_llm(temperature)
-    response = llm.invoke([HumanMessage(content=prompt)])
-    return parse_json_response(response.content)
+def build_messages(prompt: Prompt, cache: bool = True) -> List["BaseMessage"]:
+    """Build chat messages for a prompt.
+
+    PromptParts의 system 부분은 cache_control(ephemeral)을 붙여 캐시 대상으로 지정합니다.
+
+    Args:
+        cache: 패밀리 캐시 정책 (settings.llm_prompt_cache가 꺼져 있으면 무시)
+    """
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    if isinstance(prompt, PromptParts):
+        system: Dict[str, Any] = {"type": "text", "text": prompt.system}
+        if cache and settings.llm_prompt_cache:
+            system["cache_control"] = {"type": "ephemeral"}
+        return [SystemMessage(content=[system]), HumanMessage(content=prompt.user)]
+    return [HumanMessage(content=prompt)]
+
+
+def _append_to_prompt(prompt: Prompt, text: str) -> Prompt:
+    """Append text to the variable part so the cached prefix stays intact."""
+    if isinstance(prompt, PromptParts):
+        return prompt._replace(user=prompt.user + text)
+    return prompt + text
+
+
+def _record_usage(response, label: str) -> None:
+    metadata = getattr(response, "response_metadata", None)
+    usage = metadata.get("usage") if isinstance(metadata, dict) else None
+    if isinstance(usage, dict):
+        _record_token_usage(usage, label)
+
+
+def _record_token_usage(usage: Dict[str, Any], label: str) -> None:
+    if usage.get("input_tokens"):
+        LLM_INPUT_TOKENS.inc(usage["input_tokens"], family=label)
+    if usage.get("output_tokens"):
+        LLM_OUTPUT_TOKENS.inc(usage["output_tokens"], family=label)
+    written = usage.get("cache_creation_input_tokens") or 0
+    read = usage.get("cache_read_input_tokens") or 0
+    if written:
+        LLM_CACHE_WRITE_TOKENS.inc(written, family=label)
+    if read:
+        LLM_CACHE_READ_TOKENS.inc(read, family=label)
+
+
+def _family_label(family: FamilyLike) -> str:
+    if family is None:
+        return "unknown"
+    return family.value if isinstance(family, PromptFamily) else str(family)
+
+
+def record_fallback(family: FamilyLike) -> None:
+    """Count a call whose result was replaced by default content (호출 측 except 블록에서)."""
+    LLM_FALLBACKS.inc(family=_family_label(family))
+
+
+def get_family_stats() -> Dict[str, dict]:
+    """Per-family call counts with parse-failure and repair-retry rates."""
+    stats: Dict[str, dict] = {}
+    for (family, mode), calls in LLM_CALLS.samples().items():
+        entry = stats.setdefault(family, {
+            "calls": 0, "parse_failures": 0, "repair_retries": 0, "invalid_outputs": 0,
+        })
+        entry["calls"] += int(calls)
+        entry["parse_failures"] += int(LLM_PARSE_FAILURES.value(family=family, mode=mode))
+        entry["invalid_outputs"] += int(LLM_INVALID_OUTPUTS.value(family=family, mode=mode))
+    for family, entry in stats.items():
+        entry["repair_retries"] = int(LLM_REPAIR_RETRIES.value(family=family))
+        entry["request_retries"] = int(LLM_RETRIES.value(family=family))
+        entry["coalesced"] = int(LLM_COALESCED.value(family=family))
+        entry["cache_write_tokens"] = int(LLM_CACHE_WRITE_TOKENS.value(family=family))
+        entry["cache_read_tokens"] = int(LLM_CACHE_READ_TOKENS.value(family=family))
+        entry["input_tokens"] = int(LLM_INPUT_TOKENS.value(family=family))
+        entry["output_tokens"] = int(LLM_OUTPUT_TOKENS.value(family=family))
+        entry["fallbacks"] = int(LLM_FALLBACKS.value(family=family))
+        entry["parse_failure_rate"] = round(entry["parse_failures"] / entry["calls"], 4)
+        entry["repair_retry_rate"] = round(entry["repair_retries"] / entry["calls"], 4)
+    return stats
+
+
+def invoke_llm_json(
+    prompt: Prompt,
+    temperature: Optional[float] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    family: FamilyLike = None,
+    schema: Optional[Type[BaseModel]] = None,
+) -> dict:
+    """Invoke LLM and parse JSON response.
+
+    cancel_token이 주어지면 스트리밍으로 호출하고 청크마다 취소 여부를 확인합니다.
+    취소되면 스트림을 닫아 남은 토큰 생성을 중단하고 GenerationCancelled를 발생시킵니다.
+
+    settings.llm_singleflight가 켜져 있으면 동시에 진행 중인 동일 요청의 결과를 공유합니다.
+
+    Args:
+        temperature: None이면 패밀리 기본 온도
+        family: 프롬프트 패밀리 (호출 설정 및 지표 집계용)
+        schema: 응답 형식 모델. 구조화 출력 모드에서 tool 스키마 및 검증에 사용
+    """
+    spec = get_family_spec(_family_label(family))
+    if temperature is None:
+        temperature = spec.temperature
+    if not settings.llm_singleflight:
+        return _invoke_llm_json(prompt, temperature, cancel_token, family, schema)
+
+    key = _request_key(prompt, temperature, schema, spec)
+    result, shared = _llm_flight.do(
+        key,
+        lambda: _invoke_llm_json(prompt, temperature, cancel_token, family, schema),
+        cancel_token,
+    )
+    if shared:
+        LLM_COALESCED.inc(family=_family_label(family))
+    return result
+
+
+def _request_key(
+    prompt: Prompt,
+    temperature: float,
+    schema: Optional[Type[BaseModel]],
+    spec: FamilySpec,
+) -> tuple:
+    """Key identifying an upstream request for single-flight coalescing."""
+    if schema is not None and settings.llm_structured_output:
+        mode = schema.__name__
+    else:
+        mode = "compact" if _compact_format(spec, schema) is not None else "json"
+    digest = hashlib.sha256(str(prompt).encode("utf-8")).hexdigest()
+    return (spec.model, spec.max_tokens, temperature, mode, digest)
+
+
+def _compact_format(spec: FamilySpec, schema: Optional[Type[BaseModel]]) -> Optional[CompactFormat]:
+    """Compact layout for this call, if the family opted in and the schema has one."""
+    if not spec.compact or (schema is not None and settings.llm_structured_output):
+        return None
+    return get_compact_format(schema)
+
+
+def _invoke_llm_json(
+    prompt: Prompt,
+    temperature: float,
+    cancel_token: Optional[CancellationToken],
+    family: FamilyLike,
+    schema: Optional[Type[BaseModel]],
+) -> dict:
+    if schema is not None and settings.llm_structured_output:
+        return invoke_llm_structured(prompt, schema, temperature, cancel_token, family)
+
+    label = _family_label(family)
+    spec = get_family_spec(label)
+    compact = _compact_format(spec, schema)
+    mode = "compact" if compact is not None else "json"
+    if compact is not None:
+        prompt = _append_to_prompt(prompt, compact.instructions)
+    LLM_CALLS.inc(family=label, mode=mode)
+
+    if cancel_token is None:
+        llm = _family_llm(spec, temperature, label, schema, compact)
+        messages = build_messages(prompt, cache=spec.cache)
+        started = time.perf_counter()
+        response = call_with_resilience(lambda: llm.invoke(messages), label)
+        LLM_LATENCY.observe(time.perf_counter() - started, family=label, mode=mode)
+        _record_usage(response, label)
+        content = response.content
+    else:
+        content = "".join(stream_llm_text(prompt, temperature, cancel_token, family, schema, compact))
+        cancel_token.raise_if_cancelled()
+
+    try:
+        data = parse_json_response(content)
+        return compact.expand(data) if compact is not None else data
+    except ValueError:
+        LLM_PARSE_FAILURES.inc(family=label, mode=mode)
+        LLM_INVALID_OUTPUTS.inc(family=label, mode=mode)
+        logger.warning(f"[AI] Failed to parse {mode} JSON response (family={label})")
+        raise
+
+
+def invoke_llm_structured(
+    prompt: Prompt,
+    schema: Type[BaseModel],
+    temperature: Optional[float] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    family: FamilyLike = None,
+) -> dict:
+    """Invoke LLM with a forced tool call and validate the arguments against schema.
+
+    검증에 실패하면 최대 settings.llm_repair_max_attempts번까지 오류가 있는
+    필드(배열이면 해당 항목)만 다시 요청하여 병합합니다.
+    끝내 유효하지 않으면 ValidationError를 발생시키며, 호출 측의 폴백이 처리합니다.
+
+    Returns:
+        dict: 검증된 응답 (None 필드 제외, 기존 JSON 응답과 같은 형태)
+    """
+    label = _family_label(family)
+    if temperature is None:
+        temperature = get_family_spec(label).temperature
+    LLM_CALLS.inc(family=label, mode="tool")
+
+    data = _invoke_tool(prompt, schema, temperature, cancel_token, label)
+    attempt = 0
+    while True:
+        try:
+            return schema.model_validate(data).model_dump(exclude_none=True)
+        except ValidationError as e:
+            if attempt == 0:
+                LLM_PARSE_FAILURES.inc(family=label, mode="tool")
+            if attempt >= settings.llm_repair_max_attempts:
+                LLM_INVALID_OUTPUTS.inc(family=label, mode="tool")
+                logger.warning(
+                    f"[AI] Structured output still invalid after {attempt} repair(s) "
+                    f"(family={label}): {e.error_count()} error(s)"
+                )
+                raise
+            attempt += 1
+            LLM_REPAIR_RETRIES.inc(family=label)
+            logger.info(f"[AI] Repairing {e.error_count()} invalid field(s) (family={label})")
+            data = _repair_structured(prompt, schema, data, e, temperature, cancel_token, label)
+
+
+def _invoke_tool(
+    prompt: Prompt,
+    schema: Type[BaseModel],
+    temperature: float,
+    cancel_token: Optional[CancellationToken],
+    label: str = "unknown",
+) -> Dict[str, Any]:
+    """Call the model with tool_choice forced to schema and return the tool arguments."""
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
+
+    spec = get_family_spec(label)
+    llm = _family_llm(spec, temperature, label).bind_tools([schema], tool_choice=schema.__name__)
+    messages = build_messages(prompt, cache=spec.cache)
+    started = time.perf_counter()
+    response = call_with_resilience(lambda: llm.invoke(messages), label, cancel_token)
+    LLM_LATENCY.observe(time.perf_counter() - started, family=label, mode="tool")
+    _record_usage(response, label)
+
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
+
+    if response.tool_calls:
+        return response.tool_calls[0]["args"]
+
+    # max_tokens 도달 등으로 잘린 tool 입력: 완성된 부분만 살려서 복구 대상 축소
+    invalid = getattr(response, "invalid_tool_calls", None)
+    if invalid and invalid[0].get("args"):
+        from app.ai.json_stream import IncrementalJSONParser
+
+        parser = IncrementalJSONParser()
+        parser.feed(invalid[0]["args"])
+        return parser.partial() or {}
+
+    # tool 호출 없이 텍스트로 응답한 경우
+    if isinstance(response.content, str) and response.content.strip():
+        try:
+            return parse_json_response(response.content)
+        except ValueError:
+            pass
+    return {}
+
+
+def _repair_structured(
+    prompt: Prompt,
+    schema: Type[BaseModel],
+    data: Dict[str, Any],
+    error: ValidationError,
+    temperature: float,
+    cancel_token: Optional[CancellationToken],
+    label: str = "unknown",
+) -> Dict[str, Any]:
+    """Ask the model again for only the invalid fields and merge them into data."""
+    repair_schema, targets = _build_repair_schema(schema, data, error)
+    repair_prompt = _append_to_prompt(prompt, REPAIR_PROMPT.format(
+        previous_output=json.dumps(data, ensure_ascii=False),
+        errors=format_validation_errors(error.errors()),
+    ))
+    if repair_schema is None:
+        # 모델 단위 오류 등 필드를 특정할 수 없으면 전체 재요청
+        return _invoke_tool(repair_prompt, schema, temperature, cancel_token, label)
+
+    fixes = _invoke_tool(repair_prompt, repair_schema, temperature, cancel_token, label)
+
+    merged = dict(data)
+    for field_name, (key, index) in targets.items():
+        if field_name not in fixes:
+            continue
+        if index is None:
+            merged[key] = fixes[field_name]
+            continue
+        items = list(merged.get(key) or [])
+        if index < len(items):
+            items[index] = fixes[field_name]
+        else:
+            items.append(fixes[field_name])
+        merged[key] = items
+    return merged
+
+
+def _build_repair_schema(schema: Type[BaseModel], data: Dict[str, Any], error: ValidationError):
+    """Build a model containing only the fields (or list items) that failed validation.
+
+    Returns:
+        (repair_schema, targets): targets는 {필드명: (원래 키, 배열 인덱스 또는 None)}
+    """
+    fields: Dict[str, Any] = {}
+    targets: Dict[str, tuple] = {}
+
+    for err in error.errors():
+        loc = err["loc"]
+        if not loc or loc[0] not in schema.model_fields:
+            return None, {}
+        key = loc[0]
+        field = schema.model_fields[key]
+        item_type = _list_item_type(field.annotation)
+        value = data.get(key)
+        if (key, None) in targets.values():
+            continue
+
+        if (
+            len(loc) > 1
+            and isinstance(loc[1], int)
+            and item_type is not None
+            and isinstance(value, list)
+        ):
+            name = f"{key}_{loc[1]}"
+            targets[name] = (key, loc[1])
+            fields[name] = (item_type, Field(description=f"'{key}' 배열의 {loc[1]}번째 항목 (0부터 시작)"))
+        else:
+            # 배열 전체 또는 스칼라 필드를 다시 요청 (해당 키의 항목 단위 요청은 제거)
+            for name in [n for n, (k, _) in targets.items() if k == key]:
+                targets.pop(name)
+                fields.pop(name)
+            targets[key] = (key, None)
+            fields[key] = (field.annotation, Field(description=field.description or key))
+
+    repair_schema = create_model(f"{schema.__name__}Repair", **fields)
+    return repair_schema, targets
+
+
+def _list_item_type(annotation) -> Optional[type]:
+    """Return T for List[T] annotations."""
+    if getattr(annotation, "__origin__", None) in (list, List):
+        args = get_args(annotation)
+        return args[0] if args else None
+    return None
+
+
+def build_batch_params(
+    prompt: Prompt,
+    family: FamilyLike = None,
+    temperature: Optional[float] = None,
+    schema: Optional[Type[BaseModel]] = None,
+) -> Dict[str, Any]:
+    """Messages API request body for one batch entry (JSON text mode)."""
+    spec = get_family_spec(_family_label(family))
+    compact = get_compact_format(schema) if spec.compact else None
+    if compact is not None:
+        prompt = _append_to_prompt(prompt, compact.instructions)
+
+    params: Dict[str, Any] = {
+        "model": spec.model,
+        "max_tokens": spec.max_tokens,
+        "temperature": spec.temperature if temperature is None else temperature,
+    }
+    if isinstance(prompt, PromptParts):
+        system: Dict[str, Any] = {"type": "text", "text": prompt.system}
+        if spec.cache and settings.llm_prompt_cache:
+            system["cache_control"] = {"type": "ephemeral"}
+        params["system"] = [system]
+        params["messages"] = [{"role": "user", "content": prompt.user}]
+    else:
+        params["messages"] = [{"role": "user", "content": prompt}]
+    return params
+
+
+def parse_batch_text(
+    text: str,
+    family: FamilyLike = None,
+    schema: Optional[Type[BaseModel]] = None,
+) -> dict:
+    """Parse a batch response built with build_batch_params."""
+    label = _family_label(family)
+    compact = get_compact_format(schema) if get_family_spec(label).compact else None
+    LLM_CALLS.inc(family=label, mode="batch")
+    try:
+        data = parse_json_response(text)
+        return compact.expand(data) if compact is not None else data
+    except ValueError:
+        LLM_PARSE_FAILURES.inc(family=label, mode="batch")
+        LLM_INVALID_OUTPUTS.inc(family=label, mode="batch")
+        logger.warning(f"[AI] Failed to parse batch JSON response (family={label})")
+        raise
+
+
+def stream_llm_text(
+    prompt: Prompt,
+    temperature: Optional[float] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    family: FamilyLike = None,
+    schema: Optional[Type[BaseModel]] = None,
+    compact: Optional[CompactFormat] = None,
+) -> Iterator[str]:
+    """Stream LLM output text chunk by chunk (blocking).
+
+    청크마다 cancel_token을 확인하고, 취소되거나 호출 측이 중단하면 스트림을 닫습니다.
+    첫 청크를 받기 전의 일시적 오류만 재시도합니다 (이미 전달한 출력은 되돌릴 수 없음).
+
+    Args:
+        schema, compact: 기대하는 응답 형식 (가짜 백엔드만 사용, 실제 요청에는 영향 없음)
+    """
+    label = _family_label(family)
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
+    spec = get_family_spec(label)
+    llm = _family_llm(spec, spec.temperature if temperature is None else temperature, label, schema, compact)
+    messages = build_messages(prompt, cache=spec.cache)
+
+    def open_stream():
+        stream = llm.stream(messages)
+        try:
+            return stream, next(stream, None)
+        except BaseException:
+            stream.close()
+            raise
+
+    started = time.perf_counter()
+    stream, chunk = call_with_resilience(open_stream, label, cancel_token)
+    LLM_FIRST_TOKEN.observe(time.perf_counter() - started, family=label)
+    usage: Dict[str, int] = {}
+    try:
+        while chunk is not None:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            for name, value in (getattr(chunk, "usage_metadata", None) or {}).items():
+                if isinstance(value, int):
+                    usage[name] = usage.get(name, 0) + value
+            if chunk.content:
+                yield chunk.content
+            chunk = next(stream, None)
+        LLM_LATENCY.observe(time.perf_counter() - started, family=label, mode="stream")
+    except Exception as e:
+        # 스트리밍 도중 끊긴 경우도 업스트림 장애로 집계
+        if is_retryable(e):
+            anthropic_breaker.record_failure()
+        raise
+    finally:
+        stream.close()
+        _record_token_usage(usage, label)
+
+
+async def astream_llm_text(
+    prompt: Prompt,
+    temperature: Optional[float] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    executor: Optional[Executor] = None,
+    family: FamilyLike = None,
+) -> AsyncIterator[str]:
+    """Async wrapper around stream_llm_text.
+
+    LLM 스트림은 executor 스레드에서 소비하고, 청크를 이벤트 루프의 큐로 전달합니다.
+    소비자가 중간에 반복을 멈추면 하위 토큰을 취소하여 스레드의 스트림도 닫습니다.
+    (부모 cancel_token은 건드리지 않음)
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    token = cancel_token.child() if cancel_token is not None else CancellationToken()
+    done = object()
+
+    def put(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료됨
+            token.cancel("event loop closed")
+
+    def pump() -> None:
+        try:
+            for text in stream_llm_text(prompt, temperature, token, family):
+                put(text)
+        except BaseException as e:
+            put(e)
+        finally:
+            put(done)
+
+    future = loop.run_in_executor(executor, pump)
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        if not future.done():
+            token.cancel("stream consumer closed")
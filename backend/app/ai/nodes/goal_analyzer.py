@@ -1,5 +1,7 @@
 """Goal analyzer node - generates title and description."""
-from app.ai.llm import invoke_llm_json
+from app.ai.llm import invoke_llm_json, record_fallback
+from app.ai.output_schemas import RoadmapTitleOutput
+from app.ai.prompt_families import PromptFamily
 from app.ai.state import RoadmapGenerationState
 from app.ai.prompts.templates import ROADMAP_TITLE_PROMPT, build_interview_section
 
@@ -15,11 +17,15 @@ def goal_analyzer(state: RoadmapGenerationState) -> RoadmapGenerationState:
     )
 
     try:
-        result = invoke_llm_json(prompt, temperature=0.7)
+        result = invoke_llm_json(
+            prompt,
+            family=PromptFamily.TITLE, schema=RoadmapTitleOutput,
+        )
         state["title"] = result["title"]
         state["description"] = result["description"]
     except Exception as e:
         # Fallback
+        record_fallback(PromptFamily.TITLE)
         state["title"] = f"{state['topic']} 학습 로드맵"
         state["description"] = f"{state['duration_months']}개월 동안 {state['topic']}을(를) 체계적으로 학습합니다."
         state["error_message"] = str(e)
@@ -2,7 +2,9 @@
 import logging
 
 from app.ai.interview_state import InterviewState
-from app.ai.llm import invoke_llm_json
+from app.ai.llm import invoke_llm_json, record_fallback
+from app.ai.output_schemas import AnswerAnalysisOutput, InterviewQuestionsOutput
+from app.ai.prompt_families import PromptFamily
 from app.ai.prompts.interview_prompts import (
     SMART_QUESTIONS_PROMPT,
     ANSWER_ANALYSIS_PROMPT,
@@ -20,13 +22,17 @@ def question_generator(state: InterviewState) -> InterviewState:
     )
 
     try:
-        result = invoke_llm_json(prompt, temperature=0.7)
+        result = invoke_llm_json(
+            prompt,
+            family=PromptFamily.INTERVIEW, schema=InterviewQuestionsOutput,
+        )
         state["questions"] = result.get("questions", [])
         state["round"] = 1
         state["needs_followup"] = False
         logger.info(f"[Interview] Generated {len(state['questions'])} questions")
     except Exception as e:
         logger.error(f"[Interview] Failed to generate questions: {e}")
+        record_fallback(PromptFamily.INTERVIEW)
         state["questions"] = _get_default_questions(state["topic"])
         state["round"] = 1
         state["needs_followup"] = False
@@ -54,8 +60,11 @@ def answer_analyzer(state: InterviewState) -> InterviewState:
     )
 
     try:
-        # 분석 작업이므로 낮은 온도(0.5) 사용 - 일관성 중요
-        result = invoke_llm_json(prompt, temperature=0.5)
+        # 분석 작업이므로 낮은 온도(0.5) 사용 - 일관성 중요 (ANALYSIS 패밀리 기본값)
+        result = invoke_llm_json(
+            prompt,
+            family=PromptFamily.ANALYSIS, schema=AnswerAnalysisOutput,
+        )
 
         if state["round"] >= 3:
             state["needs_followup"] = False
@@ -72,6 +81,7 @@ def answer_analyzer(state: InterviewState) -> InterviewState:
 
     except Exception as e:
         logger.error(f"[Interview] Failed to analyze answers: {e}")
+        record_fallback(PromptFamily.ANALYSIS)
         state["needs_followup"] = False
         state["interview_context"] = _build_fallback_context(state)
         state["error_message"] = str(e)
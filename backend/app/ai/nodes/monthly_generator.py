@@ -1,5 +1,7 @@
 """Monthly generator node - generates all monthly goals in 1 LLM call."""
-from app.ai.llm import invoke_llm_json
+from app.ai.llm import invoke_llm_json, record_fallback
+from app.ai.output_schemas import MonthlyGoalsOutput
+from app.ai.prompt_families import PromptFamily
 from app.ai.state import RoadmapGenerationState
 from app.ai.prompts.templates import MONTHLY_GOALS_PROMPT, build_interview_section
 
@@ -17,7 +19,10 @@ def monthly_generator(state: RoadmapGenerationState) -> RoadmapGenerationState:
     )
 
     try:
-        result = invoke_llm_json(prompt, temperature=0.7)
+        result = invoke_llm_json(
+            prompt,
+            family=PromptFamily.MONTH, schema=MonthlyGoalsOutput,
+        )
         monthly_goals = result["monthly_goals"]
 
         # Validate: filter to only include requested months
@@ -33,6 +38,7 @@ def monthly_generator(state: RoadmapGenerationState) -> RoadmapGenerationState:
         state["monthly_goals"] = monthly_goals
     except Exception as e:
         # Fallback: generate basic monthly goals
+        record_fallback(PromptFamily.MONTH)
         state["monthly_goals"] = [
             {
                 "month_number": i + 1,
@@ -1,5 +1,7 @@
 """Weekly generator node - generates ALL weekly tasks in 1 LLM call."""
-from app.ai.llm import invoke_llm_json
+from app.ai.llm import invoke_llm_json, record_fallback
+from app.ai.output_schemas import WeeklyTasksOutput
+from app.ai.prompt_families import PromptFamily
 from app.ai.state import RoadmapGenerationState
 from app.ai.prompts.templates import WEEKLY_TASKS_PROMPT, build_interview_section
 
@@ -23,7 +25,10 @@ def weekly_generator(state: RoadmapGenerationState) -> RoadmapGenerationState:
     )
 
     try:
-        result = invoke_llm_json(prompt, temperature=0.7)
+        result = invoke_llm_json(
+            prompt,
+            family=PromptFamily.WEEKS, schema=WeeklyTasksOutput,
+        )
         weekly_tasks = result["weekly_tasks"]
 
         # Validate: filter to only include requested months
@@ -39,6 +44,7 @@ def weekly_generator(state: RoadmapGenerationState) -> RoadmapGenerationState:
         state["weekly_tasks"] = weekly_tasks
     except Exception as e:
         # Fallback: generate basic weekly tasks
+        record_fallback(PromptFamily.WEEKS)
         state["weekly_tasks"] = [
             {
                 "month_number": month["month_number"],
@@ -0,0 +1,174 @@
+"""Pydantic models for LLM outputs, one per prompt response format.
+
+구조화 출력 모드(settings.llm_structured_output)에서 tool 스키마로 전달되고,
+응답 검증에 사용됩니다. 각 모델은 프롬프트의 <output_format>과 같은 형태이며,
+호출 측이 `.get(key, 기본값)`으로 처리하던 필드는 기본값을 둡니다.
+"""
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LLMOutput(BaseModel):
+    """Base model: keeps unknown keys and accepts numbers for string fields."""
+
+    model_config = ConfigDict(extra="allow", coerce_numbers_to_str=True)
+
+
+# ============ Roadmap ============
+
+class RoadmapTitleOutput(LLMOutput):
+    title: str = Field(description="동기부여되는 로드맵 제목 (30자 이내)")
+    description: str = Field(description="학습 여정과 최종 달성 목표를 포함한 설명")
+
+
+class MonthGoalOutput(LLMOutput):
+    title: str = Field(description="월간 학습 목표 제목")
+    description: str = Field(description="핵심 기술, 주요 개념, 완료 시 역량")
+
+
+class MonthlyGoalItem(LLMOutput):
+    month_number: int
+    title: str
+    description: str
+
+
+class MonthlyGoalsOutput(LLMOutput):
+    monthly_goals: List[MonthlyGoalItem] = Field(min_length=1)
+
+
+class WeekItem(LLMOutput):
+    week_number: int
+    title: str
+    description: str
+
+
+class MonthWeeksOutput(LLMOutput):
+    weeks: List[WeekItem] = Field(min_length=1)
+
+
+class MonthlyWeeksItem(LLMOutput):
+    month_number: int
+    weeks: List[WeekItem]
+
+
+class WeeklyTasksOutput(LLMOutput):
+    weekly_tasks: List[MonthlyWeeksItem] = Field(min_length=1)
+
+
+# ============ Daily (PLANNING) ============
+
+class DailyGoal(LLMOutput):
+    title: str
+    description: str = ""
+
+
+class DailyTaskItem(LLMOutput):
+    title: str
+    description: str = ""
+
+
+class DayPlan(LLMOutput):
+    day_number: int
+    goal: DailyGoal
+    tasks: List[DailyTaskItem] = []
+
+
+class DailyTasksOutput(LLMOutput):
+    days: List[DayPlan] = Field(min_length=1)
+
+
+# ============ Learning ============
+
+class CurriculumDay(LLMOutput):
+    day: int
+    topic: str
+    focus: List[str] = []
+    difficulty: str = "기초"
+
+
+class CurriculumOutput(LLMOutput):
+    daily_curriculum: List[CurriculumDay] = Field(min_length=1)
+
+
+class QuestionItem(LLMOutput):
+    question_type: Literal["MULTIPLE_CHOICE", "ESSAY", "SHORT_ANSWER"]
+    question_text: str
+    choices: Optional[List[str]] = Field(default=None, description="객관식만 (4지선다)")
+    correct_answer: str = Field(description="정답 (객관식: 0-based 인덱스 문자열)")
+    hint: Optional[str] = None
+    explanation: Optional[str] = None
+
+
+class QuestionsOutput(LLMOutput):
+    questions: List[QuestionItem] = Field(min_length=1)
+
+
+class ReviewQuestionItem(QuestionItem):
+    original_question_id: Optional[str] = None
+    review_focus: Optional[str] = None
+
+
+class ReviewQuestionsOutput(LLMOutput):
+    review_questions: List[ReviewQuestionItem] = Field(min_length=1)
+
+
+class GradingOutput(LLMOutput):
+    is_correct: bool
+    score: Optional[int] = Field(default=None, ge=0, le=100)
+    feedback: str
+    key_points_matched: List[str] = []
+    key_points_missed: List[str] = []
+
+
+class DailyFeedbackOutput(LLMOutput):
+    summary: str
+    strengths: List[str] = []
+    improvements: List[str] = []
+    tomorrow_focus: str = ""
+
+
+# ============ Feedback chat ============
+
+class MonthlyGoalModification(LLMOutput):
+    month_number: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class WeeklyTaskModification(LLMOutput):
+    month_number: int
+    week_number: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class FeedbackModifications(LLMOutput):
+    monthly_goals: List[MonthlyGoalModification] = []
+    weekly_tasks: List[WeeklyTaskModification] = []
+
+
+class FeedbackAnalysisOutput(LLMOutput):
+    response: str
+    modification_type: Literal["none", "weekly", "monthly", "both"] = "none"
+    modifications: FeedbackModifications = FeedbackModifications()
+
+
+# ============ Interview ============
+
+class InterviewQuestion(LLMOutput):
+    id: str
+    category: str
+    question: str
+    type: Literal["text", "select", "multiselect"] = "text"
+    options: List[str] = []
+
+
+class InterviewQuestionsOutput(LLMOutput):
+    questions: List[InterviewQuestion] = Field(min_length=1)
+
+
+class AnswerAnalysisOutput(LLMOutput):
+    needs_followup: bool = False
+    followup_questions: List[InterviewQuestion] = []
+    interview_context: Dict[str, Any] = {}
@@ -0,0 +1,115 @@
+"""Prompt families - groups of prompts that share an output shape and call profile.
+
+프롬프트 패밀리는 호출 지점별 지표(파싱 실패율, 재시도율)를 집계하는 단위이자,
+모델 등급, 출력 토큰 한도, 타임아웃, 온도, 캐시/축약 출력 사용 여부를 정하는 단위입니다.
+
+| 패밀리      | 프롬프트                                             |
+|------------|-----------------------------------------------------|
+| title      | ROADMAP_TITLE_PROMPT                                |
+| month      | MONTHLY_GOALS_PROMPT, SINGLE_MONTH_GOAL_PROMPT       |
+| weeks      | WEEKLY_TASKS_PROMPT, SINGLE_MONTH_WEEKS_PROMPT       |
+| daily      | SINGLE_WEEK_DAILY_TASKS_PROMPT                      |
+| curriculum | LEARNING_DAILY_CURRICULUM_PROMPT                    |
+| questions  | LEARNING_DAILY_QUESTIONS_PROMPT, REVIEW_QUESTIONS_PROMPT |
+| grading    | GRADING_PROMPT                                      |
+| feedback   | FEEDBACK_ANALYSIS_PROMPT, DAILY_FEEDBACK_PROMPT     |
+| interview  | SMART_QUESTIONS_PROMPT                              |
+| analysis   | ANSWER_ANALYSIS_PROMPT                              |
+
+기본 설정은 FAMILY_SPECS에 있고, settings.llm_families로 패밀리별 항목을 덮어쓸 수 있습니다.
+    LLM_FAMILIES='{"grading": {"tier": "large"}, "questions": {"max_tokens": 6000}}'
+짧고 지연에 민감한 호출(제목, 채점, 답변 분석)은 fast 모델을, 콘텐츠 생성은 large 모델을 씁니다.
+"""
+import enum
+import os
+from typing import Dict, Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+
+from app.config import settings
+
+
+class PromptFamily(str, enum.Enum):
+    TITLE = "title"
+    MONTH = "month"
+    WEEKS = "weeks"
+    DAILY = "daily"
+    CURRICULUM = "curriculum"
+    QUESTIONS = "questions"
+    GRADING = "grading"
+    FEEDBACK = "feedback"
+    INTERVIEW = "interview"
+    ANALYSIS = "analysis"
+
+
+class ModelTier(str, enum.Enum):
+    LARGE = "large"
+    FAST = "fast"
+
+
+DEV_MODE = os.getenv("DEV_MODE", "true").lower() == "true"
+
+# 등급별 기본 모델 (settings.llm_model_large / llm_model_fast로 덮어쓰기)
+DEFAULT_MODELS = {
+    ModelTier.LARGE: "claude-3-5-haiku-20241022" if DEV_MODE else "claude-sonnet-4-5-20250929",
+    ModelTier.FAST: "claude-3-5-haiku-20241022" if DEV_MODE else "claude-haiku-4-5-20251001",
+}
+
+
+class FamilySpec(BaseModel):
+    """Call profile of a prompt family."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    tier: ModelTier = ModelTier.LARGE
+    max_tokens: int = 8192
+    timeout: Optional[float] = None  # None이면 settings.llm_timeout_seconds
+    temperature: float = 0.7
+    cache: bool = True  # 고정 system 블록에 cache_control 부착
+    compact: bool = False  # 축약 출력 형식 사용 (app.ai.compact, 지원하는 스키마만)
+
+    @property
+    def model(self) -> str:
+        return model_for_tier(self.tier)
+
+
+# 출력 길이에 맞춘 토큰 한도와 타임아웃
+FAMILY_SPECS: Dict[PromptFamily, FamilySpec] = {
+    PromptFamily.TITLE: FamilySpec(tier=ModelTier.FAST, max_tokens=512, timeout=20.0),
+    PromptFamily.MONTH: FamilySpec(max_tokens=2048, timeout=45.0),
+    PromptFamily.WEEKS: FamilySpec(max_tokens=8192, timeout=90.0),
+    PromptFamily.DAILY: FamilySpec(max_tokens=4096, timeout=90.0),
+    PromptFamily.CURRICULUM: FamilySpec(max_tokens=2048, timeout=60.0),
+    PromptFamily.QUESTIONS: FamilySpec(max_tokens=8192, timeout=120.0),
+    PromptFamily.GRADING: FamilySpec(tier=ModelTier.FAST, max_tokens=1024, timeout=30.0, temperature=0.5),
+    PromptFamily.FEEDBACK: FamilySpec(max_tokens=4096, timeout=60.0, temperature=0.5),
+    PromptFamily.INTERVIEW: FamilySpec(max_tokens=2048, timeout=45.0),
+    PromptFamily.ANALYSIS: FamilySpec(tier=ModelTier.FAST, max_tokens=2048, timeout=45.0, temperature=0.5),
+}
+
+DEFAULT_SPEC = FamilySpec()
+
+
+def model_for_tier(tier: ModelTier) -> str:
+    if tier == ModelTier.FAST and settings.llm_model_fast:
+        return settings.llm_model_fast
+    if tier == ModelTier.LARGE and settings.llm_model_large:
+        return settings.llm_model_large
+    return DEFAULT_MODELS[tier]
+
+
+def get_family_spec(family: Union[PromptFamily, str, None]) -> FamilySpec:
+    """Family spec with settings.llm_families overrides applied.
+
+    Raises:
+        pydantic.ValidationError: 덮어쓰기 항목이 잘못된 경우 (알 수 없는 키, 잘못된 등급 등)
+    """
+    key = family.value if isinstance(family, PromptFamily) else family
+    try:
+        spec = FAMILY_SPECS[PromptFamily(key)]
+    except ValueError:
+        spec = DEFAULT_SPEC
+    override = settings.llm_families.get(key) if key else None
+    if not override:
+        return spec
+    return FamilySpec.model_validate({**spec.model_dump(), **override})
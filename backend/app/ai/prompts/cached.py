@@ -0,0 +1,37 @@
+"""Cacheable prompt templates.
+
+Anthropic 프롬프트 캐싱을 위해 프롬프트를 두 부분으로 나눕니다.
+- system: 고정 지침, 예시, 출력 형식. 요청마다 바이트 단위로 동일해야 캐시가 적중하므로
+  플레이스홀더를 두지 않으며 .format()도 하지 않습니다 (JSON 예시의 중괄호를 그대로 씀).
+- user: 요청마다 달라지는 정보. 기존 템플릿처럼 .format()으로 채웁니다.
+
+llm.py의 build_messages()가 system 부분에 cache_control을 붙여 SystemMessage로 보냅니다.
+"""
+import re
+from typing import NamedTuple
+
+_PLACEHOLDER = re.compile(r"\{[a-z_]+\}")
+
+
+class PromptParts(NamedTuple):
+    """A formatted prompt: static system block + per-request user block."""
+
+    system: str
+    user: str
+
+    def __str__(self) -> str:
+        return f"{self.system}\n\n{self.user}"
+
+
+class CachedPrompt:
+    """Prompt template whose static part is sent as a cacheable system block."""
+
+    def __init__(self, system: str, user: str):
+        if _PLACEHOLDER.search(system):
+            # 요청별 값이 system에 섞이면 캐시가 매번 새로 쓰이므로 정의 시점에 막음
+            raise ValueError(f"system block must be static: {_PLACEHOLDER.search(system).group()}")
+        self.system = system.strip()
+        self.user = user.strip()
+
+    def format(self, **kwargs) -> PromptParts:
+        return PromptParts(self.system, self.user.format(**kwargs))
@@ -1,6 +1,6 @@
 """Feedback prompts for roadmap refinement chat."""
 import json
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 
 FEEDBACK_ANALYSIS_PROMPT = """당신은 학습 로드맵 개선 전문가입니다.
@@ -31,6 +31,8 @@ FEEDBACK_ANALYSIS_PROMPT = """당신은 학습 로드맵 개선 전문가입니
    - 최소한의 변경으로 요구사항 반영
    - monthly 수정 시 해당 월의 weekly도 일관성 있게 조정
    - 기존 구조와 난이도 흐름 유지
+   - <current_roadmap>에서 제목만 있는 월/주는 이번 요청과 관련이 적은 부분입니다.
+     꼭 필요한 경우가 아니면 수정하지 마세요
 4. 응답 스타일:
    - 친근하고 격려하는 톤
    - 어떤 변경을 했는지 명확히 설명
@@ -71,8 +73,21 @@ WELCOME_MESSAGE = """안녕하세요! 로드맵이 생성되었어요.
 마음에 드시면 '확정' 버튼을 눌러주세요!"""
 
 
-def format_roadmap_compact(roadmap_data: dict) -> str:
-    """컴팩트한 로드맵 JSON 생성 (토큰 절약)."""
+def format_roadmap_compact(
+    roadmap_data: dict,
+    detail_months: Optional[Set[int]] = None,
+    detail_weeks: Optional[Set[Tuple[int, int]]] = None,
+    month_desc_limit: int = 100,
+    week_desc_limit: int = 80,
+) -> str:
+    """컴팩트한 로드맵 JSON 생성 (토큰 절약).
+
+    Args:
+        detail_months: 상세 정보를 포함할 월. None이면 전체, 나머지 월은 제목만 (skeleton)
+        detail_weeks: skeleton 월이라도 상세 정보를 포함할 (월, 주)
+        month_desc_limit: 월 설명 최대 길이
+        week_desc_limit: 주 설명 최대 길이 (0이면 상세 월의 주차도 제목만)
+    """
     compact = {
         "title": roadmap_data.get("title", ""),
         "topic": roadmap_data.get("topic", ""),
@@ -82,27 +97,38 @@ def format_roadmap_compact(roadmap_data: dict) -> str:
 
     monthly_goals = roadmap_data.get("monthly_goals", [])
     weekly_tasks = roadmap_data.get("weekly_tasks", [])
+    detail_weeks = detail_weeks or set()
 
     for goal in monthly_goals:
         month_num = goal.get("month_number")
+        detailed = detail_months is None or month_num in detail_months
         month_data = {
             "m": month_num,
             "title": goal.get("title", ""),
-            "desc": goal.get("description", "")[:100],  # 설명 축약
-            "weeks": []
         }
+        if detailed:
+            month_data["desc"] = goal.get("description", "")[:month_desc_limit]  # 설명 축약
 
         # 해당 월의 주간 과제 찾기
+        weeks_data = []
         for wt in weekly_tasks:
             if wt.get("month_number") == month_num:
                 weeks = wt.get("weeks", [])
                 for w in weeks:
-                    month_data["weeks"].append({
-                        "w": w.get("week_number"),
-                        "title": w.get("title", ""),
-                        "desc": w.get("description", "")[:80]
-                    })
+                    week_num = w.get("week_number")
+                    referenced = (month_num, week_num) in detail_weeks
+                    if not detailed and not referenced:
+                        continue
+                    week_data = {"w": week_num, "title": w.get("title", "")}
+                    if referenced:
+                        # 사용자가 직접 언급한 주차는 항상 상세 포함
+                        week_data["desc"] = w.get("description", "")[:max(week_desc_limit, 80)]
+                    elif week_desc_limit:
+                        week_data["desc"] = w.get("description", "")[:week_desc_limit]
+                    weeks_data.append(week_data)
                 break
+        if detailed or weeks_data:
+            month_data["weeks"] = weeks_data
 
         compact["months"].append(month_data)
 
@@ -0,0 +1,32 @@
+"""Partial-repair prompt for structured outputs.
+
+구조화 출력 검증에 실패했을 때, 문서 전체가 아닌 누락/오류 필드만 다시 요청합니다.
+원래 프롬프트 뒤에 붙여서 사용하며, 응답은 오류 필드만 담은 tool 호출로 받습니다.
+"""
+
+REPAIR_PROMPT = """
+
+<previous_output>
+{previous_output}
+</previous_output>
+
+<validation_errors>
+{errors}
+</validation_errors>
+
+<repair_instructions>
+위 previous_output은 이 요청에 대한 이전 응답입니다. 일부 필드가 누락되었거나 형식이 올바르지 않습니다.
+validation_errors에 나온 필드만 다시 작성하세요.
+• 나머지 필드는 이미 유효하므로 다시 작성하지 마세요.
+• "배열명_번호" 형식의 필드는 해당 배열의 그 번호(0부터 시작) 항목 전체를 의미합니다.
+• 원래 요청의 규칙과 형식을 그대로 따르세요.
+</repair_instructions>"""
+
+
+def format_validation_errors(errors: list) -> str:
+    """Format pydantic validation errors for the repair prompt."""
+    lines = []
+    for error in errors:
+        location = ".".join(str(part) for part in error["loc"]) or "(전체)"
+        lines.append(f"- {location}: {error['msg']}")
+    return "\n".join(lines)
@@ -0,0 +1,246 @@
+"""Timeouts, jittered retries and a circuit breaker for Anthropic calls.
+
+- 요청 타임아웃: 프롬프트 패밀리별 (prompt_families.get_family_spec, 기본 settings.llm_timeout_seconds)
+- 재시도: 일시적 오류(타임아웃, 연결 오류, 429, 5xx)만 full-jitter 지수 백오프로 재시도
+- 서킷 브레이커: 연속 실패가 임계치를 넘으면 일정 시간 호출을 차단
+
+브레이커가 열려 있으면 CircuitOpenError(Exception)를 즉시 발생시키므로,
+roadmap_stream.py와 노드들의 기존 `except Exception` 폴백이 곧바로 실행됩니다.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+from app.ai.cancellation import CancellationToken, GenerationCancelled
+from app.ai.prompt_families import get_family_spec
+from app.config import settings
+from app.core import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_RETRIES = metrics.counter(
+    "llm_retries_total", "Retried LLM requests after transient errors", ("family",)
+)
+LLM_REQUEST_ERRORS = metrics.counter(
+    "llm_request_errors_total", "Failed LLM request attempts", ("family", "kind")
+)
+CIRCUIT_STATE = metrics.gauge(
+    "llm_circuit_state", "Circuit breaker state (0=closed, 1=half_open, 2=open)", ("breaker",)
+)
+CIRCUIT_TRANSITIONS = metrics.counter(
+    "llm_circuit_transitions_total", "Circuit breaker state transitions", ("breaker", "state")
+)
+CIRCUIT_REJECTIONS = metrics.counter(
+    "llm_circuit_rejections_total", "Calls rejected while the breaker was open", ("breaker",)
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the breaker is open."""
+
+
+def family_timeout(family: Optional[str]) -> float:
+    """Request timeout for a prompt family (settings override > family spec)."""
+    return get_family_spec(family).timeout or settings.llm_timeout_seconds
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Transient upstream errors worth retrying (and counting against the breaker)."""
+    import anthropic  # 기동 시간 단축을 위해 지연 import (app.ai.llm 참고)
+
+    if isinstance(error, (anthropic.APITimeoutError, anthropic.APIConnectionError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return isinstance(error, TimeoutError)
+
+
+def _error_kind(error: BaseException) -> str:
+    import anthropic
+
+    if isinstance(error, (anthropic.APITimeoutError, TimeoutError)):
+        return "timeout"
+    if isinstance(error, anthropic.APIConnectionError):
+        return "connection"
+    if isinstance(error, anthropic.APIStatusError):
+        return str(error.status_code)
+    return type(error).__name__
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff."""
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        return cls(
+            max_attempts=settings.llm_retry_max_attempts,
+            base_delay=settings.llm_retry_base_delay,
+            max_delay=settings.llm_retry_max_delay,
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1부터 시작)."""
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    """Thread-safe consecutive-failure circuit breaker.
+
+    closed → (연속 실패 failure_threshold회) → open → (recovery_timeout 경과) → half_open
+    half_open에서는 시험 호출 1건만 허용하고, 성공하면 closed, 실패하면 다시 open.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        CIRCUIT_STATE.set(0, breaker=name)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _set_state(self, state: str) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        CIRCUIT_STATE.set(self._STATE_VALUES[state], breaker=self.name)
+        CIRCUIT_TRANSITIONS.inc(breaker=self.name, state=state)
+        logger.warning(f"[AI] Circuit breaker '{self.name}' -> {state}")
+
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._set_state(self.HALF_OPEN)
+            self._trial_in_flight = False
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call is currently allowed."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+        CIRCUIT_REJECTIONS.inc(breaker=self.name)
+        raise CircuitOpenError(f"LLM circuit '{self.name}' is open")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._set_state(self.OPEN)
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed upstream (e.g. cancelled)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._set_state(self.CLOSED)
+
+
+anthropic_breaker = CircuitBreaker(
+    "anthropic",
+    failure_threshold=settings.llm_breaker_failure_threshold,
+    recovery_timeout=settings.llm_breaker_recovery_seconds,
+)
+
+
+def call_with_resilience(
+    fn: Callable[[], T],
+    family: str = "unknown",
+    cancel_token: Optional[CancellationToken] = None,
+    breaker: Optional[CircuitBreaker] = None,
+    policy: Optional[RetryPolicy] = None,
+) -> T:
+    """Run an upstream call through the circuit breaker with jittered retries.
+
+    Args:
+        fn: 실제 API 호출 (재시도 시 다시 호출됨)
+        family: 지표 라벨용 프롬프트 패밀리
+        cancel_token: 백오프 대기 중 취소 확인용
+    """
+    breaker = breaker or anthropic_breaker
+    policy = policy or RetryPolicy.from_settings()
+
+    attempt = 1
+    while True:
+        breaker.before_call()
+        try:
+            result = fn()
+        except GenerationCancelled:
+            breaker.release()
+            raise
+        except Exception as e:
+            if not is_retryable(e):
+                # 요청 자체의 문제 (4xx 등) - 업스트림은 정상 응답
+                breaker.release()
+                raise
+            LLM_REQUEST_ERRORS.inc(family=family, kind=_error_kind(e))
+            breaker.record_failure()
+            if attempt >= policy.max_attempts:
+                raise
+            delay = policy.backoff(attempt)
+            logger.info(
+                f"[AI] Retrying {family} request in {delay:.2f}s "
+                f"(attempt {attempt}/{policy.max_attempts}): {e}"
+            )
+            LLM_RETRIES.inc(family=family)
+            _sleep(delay, cancel_token)
+            attempt += 1
+            continue
+        breaker.record_success()
+        return result
+
+
+def _sleep(delay: float, cancel_token: Optional[CancellationToken]) -> None:
+    """Sleep for the backoff delay, waking up early if cancelled."""
+    deadline = time.monotonic() + delay
+    while True:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, 0.1))
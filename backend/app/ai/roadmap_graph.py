@@ -3,10 +3,12 @@
 Flow: goal_analyzer → monthly_generator → weekly_generator → saver
 
 Daily tasks are generated lazily via DailyGenerationService.
+
+컴파일된 그래프는 상태를 갖지 않으므로 한 번만 만들어 요청 간에 공유합니다
+(get_roadmap_graph). langgraph는 첫 컴파일 시 import합니다.
 """
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from langgraph.graph import StateGraph, END
+from functools import lru_cache
 from sqlalchemy.orm import Session
 
 from app.ai.state import RoadmapGenerationState
@@ -14,10 +16,13 @@ from app.ai.nodes.goal_analyzer import goal_analyzer
 from app.ai.nodes.monthly_generator import monthly_generator
 from app.ai.nodes.weekly_generator import weekly_generator
 from app.ai.nodes.saver import save_roadmap
+from app.ai.scheduler import LLMPriority, llm_executor
 
 
 def create_roadmap_graph():
     """Create LangGraph workflow for roadmap generation."""
+    from langgraph.graph import StateGraph, END
+
     workflow = StateGraph(RoadmapGenerationState)
 
     workflow.add_node("goal_analyzer", goal_analyzer)
@@ -32,8 +37,10 @@ def create_roadmap_graph():
     return workflow.compile()
 
 
-# Thread pool for running sync graph in async context
-_executor = ThreadPoolExecutor(max_workers=4)
+@lru_cache(maxsize=None)
+def get_roadmap_graph():
+    """Shared compiled roadmap graph (built on first use)."""
+    return create_roadmap_graph()
 
 
 async def generate_roadmap(
@@ -75,10 +82,10 @@ async def generate_roadmap(
         "roadmap_id": None,
     }
 
-    graph = create_roadmap_graph()
+    graph = get_roadmap_graph()
     loop = asyncio.get_event_loop()
     final_state = await loop.run_in_executor(
-        _executor,
+        llm_executor(LLMPriority.GENERATION, user_id),
         graph.invoke,
         initial_state
     )
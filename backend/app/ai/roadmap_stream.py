@@ -5,31 +5,50 @@ SSE 스트리밍을 통해 로드맵 생성 과정을 실시간으로 전송합
 
 생성 순서:
 1. 제목/설명 생성 → title_ready
-2. 1월 목표 생성 → month_ready
-3. 1월 주간 과제 생성 → weeks_ready
-4. 2월 목표 생성 → month_ready
+2. 1월 목표 생성 → month_delta (토큰 스트리밍 중 반복) → month_ready
+3. 1월 주간 과제 생성 → week_ready (주차 객체 완성 시마다) → weeks_ready
+4. 2월 목표 생성 → month_delta ... → month_ready
 ... (반복)
 N. DB 저장 → complete
+
+월 목표와 주간 과제는 LLM 토큰 스트림을 IncrementalJSONParser로 해석하여
+전체 응답을 기다리지 않고 부분 결과를 먼저 보냅니다.
+month_ready/weeks_ready는 최종 결과(폴백 포함)이며, 앞선 부분 이벤트를 대체합니다.
+
+cancel_token이 취소되면(예: SSE 클라이언트 연결 끊김) 진행 중인 LLM 호출을 중단하고
+DB 저장 없이 이벤트 발송을 종료합니다.
+
+피드백 채팅에서 월 목표를 수정한 뒤에는 regenerate_weeks_streaming으로 해당 월의
+주간 과제만 다시 생성합니다 (전체 재생성 대신 월당 LLM 호출 1회).
 """
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import AsyncGenerator
+import logging
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, AsyncGenerator, Dict, List, Optional
 from uuid import UUID
 
 from dateutil.relativedelta import relativedelta
 from sqlalchemy.orm import Session
 
-from app.ai.llm import invoke_llm_json
+from app.ai.cancellation import CancellationToken, GenerationCancelled
+from app.ai.feedback_node import merge_regenerated_weeks
+from app.ai.json_stream import IncrementalJSONParser
+from app.ai.llm import astream_llm_text, invoke_llm_json, record_fallback
+from app.ai.output_schemas import MonthGoalOutput, MonthWeeksOutput, RoadmapTitleOutput
+from app.ai.prompt_families import PromptFamily
 from app.ai.prompts.templates import ROADMAP_TITLE_PROMPT, build_interview_section
 from app.ai.prompts.streaming_templates import (
     SINGLE_MONTH_GOAL_PROMPT,
     SINGLE_MONTH_WEEKS_PROMPT,
 )
+from app.ai.scheduler import LLMPriority, llm_executor
 from app.models import Roadmap, MonthlyGoal, WeeklyTask
 from app.models.roadmap import RoadmapMode
 
-# Thread pool for running sync LLM calls in async context
-_executor = ThreadPoolExecutor(max_workers=4)
+if TYPE_CHECKING:
+    from app.ai.speculative import SpeculativeRun
+
+logger = logging.getLogger(__name__)
 
 
 async def generate_roadmap_streaming(
@@ -41,6 +60,8 @@ async def generate_roadmap_streaming(
     db: Session,
     interview_context: dict = None,
     skip_save: bool = False,
+    cancel_token: Optional[CancellationToken] = None,
+    speculation: Optional["SpeculativeRun"] = None,
 ) -> AsyncGenerator[dict, None]:
     """Generate roadmap with streaming events.
 
@@ -53,12 +74,16 @@ async def generate_roadmap_streaming(
         db: DB 세션
         interview_context: SMART 인터뷰 컨텍스트 (선택)
         skip_save: True이면 DB 저장 없이 preview_ready 이벤트 발송
+        cancel_token: 취소 토큰 (선택). 취소되면 LLM 호출을 중단하고 저장하지 않음
+        speculation: 인터뷰 완료 시 미리 시작한 제목/월 목표 생성 (선택, app.ai.speculative)
 
     Yields:
         dict: SSE 이벤트 {"type": "event_name", "data": {...}}
     """
     interview_section = build_interview_section(interview_context)
     loop = asyncio.get_event_loop()
+    cancel_token = cancel_token or CancellationToken()
+    executor = llm_executor(LLMPriority.GENERATION, user_id)
 
     # 진행률 계산: 1(제목) + 2*개월수(월+주)
     total_steps = 1 + (2 * duration_months)
@@ -73,13 +98,18 @@ async def generate_roadmap_streaming(
     try:
         # Step 1: 제목 생성
         current_step += 1
-        title_result = await loop.run_in_executor(
-            _executor,
-            _generate_title,
-            topic,
-            duration_months,
-            interview_section,
-        )
+        title_result = None
+        if speculation is not None:
+            title_result = await speculation.get_title(cancel_token)
+        if title_result is None:
+            title_result = await loop.run_in_executor(
+                executor,
+                _generate_title,
+                topic,
+                duration_months,
+                interview_section,
+                cancel_token,
+            )
         title = title_result["title"]
         description = title_result["description"]
 
@@ -91,48 +121,50 @@ async def generate_roadmap_streaming(
 
         # 각 월별로 목표 → 주간 순서로 생성
         for month_num in range(1, duration_months + 1):
-            # Step N: 월별 목표 생성
+            # Step N: 월별 목표 생성 (month_delta → month_ready)
             current_step += 1
-            month_result = await loop.run_in_executor(
-                _executor,
-                _generate_single_month,
-                topic,
-                title,
-                month_num,
-                duration_months,
-                monthly_goals,
-                interview_section,
-            )
+            month_result = None
+            if speculation is not None:
+                # 미리 생성된 이벤트 재생 (진행 중이면 이어서 대기)
+                async for event in speculation.stream_month(month_num, cancel_token):
+                    yield event
+                    if event["type"] == "month_ready":
+                        month_result = event["data"]
+            if month_result is None:
+                async for event in _stream_single_month(
+                    topic,
+                    title,
+                    month_num,
+                    duration_months,
+                    monthly_goals,
+                    interview_section,
+                    cancel_token,
+                    executor,
+                ):
+                    yield event
+                    if event["type"] == "month_ready":
+                        month_result = event["data"]
             monthly_goals.append(month_result)
-
-            yield {
-                "type": "month_ready",
-                "data": month_result
-            }
             yield _progress_event(current_step, total_steps, f"{month_num}월 목표 생성 완료")
 
-            # Step N+1: 해당 월의 주간 과제 생성
+            # Step N+1: 해당 월의 주간 과제 생성 (week_ready → weeks_ready)
             current_step += 1
-            weeks_result = await loop.run_in_executor(
-                _executor,
-                _generate_single_month_weeks,
+            weeks_result = []
+            async for event in _stream_single_month_weeks(
                 topic,
                 month_result,
                 month_num,
                 interview_section,
-            )
+                cancel_token,
+                executor,
+            ):
+                yield event
+                if event["type"] == "weeks_ready":
+                    weeks_result = event["data"]["weeks"]
             weekly_tasks.append({
                 "month_number": month_num,
                 "weeks": weeks_result
             })
-
-            yield {
-                "type": "weeks_ready",
-                "data": {
-                    "month_number": month_num,
-                    "weeks": weeks_result
-                }
-            }
             yield _progress_event(current_step, total_steps, f"{month_num}월 주간 과제 생성 완료")
 
         # skip_save가 True면 preview_ready 이벤트만 발송 (피드백 채팅용)
@@ -152,6 +184,9 @@ async def generate_roadmap_streaming(
                 }
             }
         else:
+            # 연결이 끊긴 상태라면 저장하지 않음
+            cancel_token.raise_if_cancelled()
+
             # DB 저장
             roadmap_id = _save_roadmap(
                 topic=topic,
@@ -166,17 +201,18 @@ async def generate_roadmap_streaming(
                 db=db,
             )
 
-            # 첫 주 일일 태스크 생성
-            try:
-                await _generate_first_week_daily_tasks(
-                    roadmap_id, user_id, db, interview_context
-                )
-            except Exception as e:
-                # 일일 태스크 생성 실패는 경고만 (전체 실패 아님)
-                yield {
-                    "type": "warning",
-                    "data": {"message": f"첫 주 일일 태스크 생성 실패: {str(e)}"}
-                }
+            # 첫 주 일일 태스크 생성 (저장 직후 취소된 경우 지연 생성에 맡김)
+            if not cancel_token.cancelled:
+                try:
+                    await _generate_first_week_daily_tasks(
+                        roadmap_id, user_id, db, interview_context
+                    )
+                except Exception as e:
+                    # 일일 태스크 생성 실패는 경고만 (전체 실패 아님)
+                    yield {
+                        "type": "warning",
+                        "data": {"message": f"첫 주 일일 태스크 생성 실패: {str(e)}"}
+                    }
 
             yield {
                 "type": "complete",
@@ -187,6 +223,8 @@ async def generate_roadmap_streaming(
                 }
             }
 
+    except GenerationCancelled as e:
+        logger.info(f"[Stream] Roadmap generation cancelled ({e}), skipping save")
     except Exception as e:
         yield {
             "type": "error",
@@ -195,6 +233,86 @@ async def generate_roadmap_streaming(
                 "recoverable": False
             }
         }
+    finally:
+        if speculation is not None:
+            speculation.cancel("stream finished")
+
+
+async def regenerate_weeks_streaming(
+    topic: str,
+    monthly_goals: List[dict],
+    weekly_tasks: List[dict],
+    stale: Dict[int, List[int]],
+    interview_context: dict = None,
+    cancel_token: Optional[CancellationToken] = None,
+    user_id: Optional[str] = None,
+) -> AsyncGenerator[dict, None]:
+    """Regenerate only the stale weeks after feedback-chat edits.
+
+    월 목표가 바뀐 월만 _generate_single_month_weeks로 동시에 재생성하고,
+    끝나는 순서대로 weeks_ready를 보냅니다. stale로 지정된 주차만 교체하고
+    피드백으로 직접 수정한 주차는 유지합니다.
+
+    Args:
+        stale: {월 번호: [재생성할 주 번호, ...]} (feedback_node.find_stale_weeks)
+        user_id: 사용자 ID (LLM 스케줄러의 사용자별 공정 큐잉에 사용)
+
+    Yields:
+        dict: weeks_ready / progress / regenerate_complete 이벤트
+    """
+    interview_section = build_interview_section(interview_context)
+    loop = asyncio.get_event_loop()
+    cancel_token = cancel_token or CancellationToken()
+    goals = {g["month_number"]: g for g in monthly_goals}
+    months = [m for m in sorted(stale) if m in goals]
+
+    executor = llm_executor(LLMPriority.GENERATION, user_id)
+    pending = {
+        loop.run_in_executor(
+            executor,
+            _generate_single_month_weeks,
+            topic,
+            goals[month_num],
+            month_num,
+            interview_section,
+            cancel_token,
+        ): month_num
+        for month_num in months
+    }
+    done_count = 0
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                month_num = pending.pop(future)
+                cancel_token.raise_if_cancelled()
+                weekly_tasks = merge_regenerated_weeks(
+                    weekly_tasks, month_num, future.result(), stale[month_num]
+                )
+                month_tasks = next(mt for mt in weekly_tasks if mt["month_number"] == month_num)
+                done_count += 1
+                yield {
+                    "type": "weeks_ready",
+                    "data": {
+                        "month_number": month_num,
+                        "weeks": month_tasks["weeks"],
+                        "regenerated": stale[month_num],
+                    }
+                }
+                yield _progress_event(done_count, len(months), f"{month_num}월 주간 과제 재생성 완료")
+
+        yield {
+            "type": "regenerate_complete",
+            "data": {
+                "weekly_tasks": weekly_tasks,
+                "regenerated": {m: stale[m] for m in months},
+            }
+        }
+    except GenerationCancelled as e:
+        logger.info(f"[Stream] Week regeneration cancelled ({e})")
+    finally:
+        for future in pending:
+            future.cancel()
 
 
 def _progress_event(current: int, total: int, message: str) -> dict:
@@ -210,7 +328,12 @@ def _progress_event(current: int, total: int, message: str) -> dict:
     }
 
 
-def _generate_title(topic: str, duration_months: int, interview_section: str) -> dict:
+def _generate_title(
+    topic: str,
+    duration_months: int,
+    interview_section: str,
+    cancel_token: Optional[CancellationToken] = None,
+) -> dict:
     """Generate title and description."""
     prompt = ROADMAP_TITLE_PROMPT.format(
         topic=topic,
@@ -218,9 +341,13 @@ def _generate_title(topic: str, duration_months: int, interview_section: str) ->
         interview_section=interview_section,
     )
     try:
-        return invoke_llm_json(prompt, temperature=0.7)
+        return invoke_llm_json(
+            prompt, cancel_token=cancel_token,
+            family=PromptFamily.TITLE, schema=RoadmapTitleOutput,
+        )
     except Exception:
         # Fallback
+        record_fallback(PromptFamily.TITLE)
         return {
             "title": f"{topic} 학습 로드맵",
             "description": f"{duration_months}개월 동안 {topic}을(를) 체계적으로 학습합니다."
@@ -234,6 +361,7 @@ def _generate_single_month(
     duration_months: int,
     previous_months: list,
     interview_section: str,
+    cancel_token: Optional[CancellationToken] = None,
 ) -> dict:
     """Generate a single month's goal."""
     prompt = SINGLE_MONTH_GOAL_PROMPT.format(
@@ -245,26 +373,89 @@ def _generate_single_month(
         interview_section=interview_section,
     )
     try:
-        result = invoke_llm_json(prompt, temperature=0.7)
+        result = invoke_llm_json(
+            prompt, cancel_token=cancel_token,
+            family=PromptFamily.MONTH, schema=MonthGoalOutput,
+        )
         result["month_number"] = month_number
         return result
     except Exception:
-        # Fallback with more specific content based on month
-        if month_number == 1:
-            phase = "기초 개념과 핵심 원리"
-            phase_desc = "핵심 개념을 이해하고 기본기를 다지며 실습 환경을 구축합니다."
-        elif month_number == duration_months:
-            phase = "실전 프로젝트와 종합 활용"
-            phase_desc = "학습한 내용을 종합하여 실전 프로젝트를 완성하고 포트폴리오를 구축합니다."
-        else:
-            phase = "심화 학습과 응용"
-            phase_desc = "기초를 바탕으로 심화 내용을 학습하고 다양한 응용 사례를 실습합니다."
+        record_fallback(PromptFamily.MONTH)
+        return _fallback_month(topic, month_number, duration_months)
+
+
+def _fallback_month(topic: str, month_number: int, duration_months: int) -> dict:
+    """Fallback month goal with more specific content based on month."""
+    if month_number == 1:
+        phase = "기초 개념과 핵심 원리"
+        phase_desc = "핵심 개념을 이해하고 기본기를 다지며 실습 환경을 구축합니다."
+    elif month_number == duration_months:
+        phase = "실전 프로젝트와 종합 활용"
+        phase_desc = "학습한 내용을 종합하여 실전 프로젝트를 완성하고 포트폴리오를 구축합니다."
+    else:
+        phase = "심화 학습과 응용"
+        phase_desc = "기초를 바탕으로 심화 내용을 학습하고 다양한 응용 사례를 실습합니다."
 
-        return {
-            "month_number": month_number,
-            "title": f"{topic} {phase}",
-            "description": phase_desc
-        }
+    return {
+        "month_number": month_number,
+        "title": f"{topic} {phase}",
+        "description": phase_desc
+    }
+
+
+async def _stream_single_month(
+    topic: str,
+    roadmap_title: str,
+    month_number: int,
+    duration_months: int,
+    previous_months: list,
+    interview_section: str,
+    cancel_token: CancellationToken,
+    executor: Optional[Executor] = None,
+) -> AsyncGenerator[dict, None]:
+    """Stream a single month's goal.
+
+    토큰이 들어올 때마다 현재까지의 title/description을 month_delta로 보내고,
+    마지막에 최종 결과(실패 시 폴백)를 month_ready로 보냅니다.
+    executor를 생략하면 사용자 구분 없이 GENERATION 클래스로 실행합니다.
+    """
+    prompt = SINGLE_MONTH_GOAL_PROMPT.format(
+        topic=topic,
+        roadmap_title=roadmap_title,
+        month_number=month_number,
+        duration_months=duration_months,
+        previous_months_summary=_format_previous_months(previous_months),
+        interview_section=interview_section,
+    )
+    parser = IncrementalJSONParser()
+    sent = {}
+    executor = executor or llm_executor(LLMPriority.GENERATION)
+    try:
+        async for text in astream_llm_text(
+            prompt, cancel_token=cancel_token, executor=executor, family=PromptFamily.MONTH
+        ):
+            parser.feed(text)
+            partial = parser.partial() or {}
+            snapshot = {
+                key: partial[key]
+                for key in ("title", "description")
+                if isinstance(partial.get(key), str)
+            }
+            if snapshot and snapshot != sent:
+                sent = snapshot
+                yield {
+                    "type": "month_delta",
+                    "data": {"month_number": month_number, **snapshot}
+                }
+        result = parser.result()
+        if not isinstance(result.get("title"), str) or not isinstance(result.get("description"), str):
+            raise ValueError("month goal is missing title/description")
+        result["month_number"] = month_number
+    except Exception:
+        record_fallback(PromptFamily.MONTH)
+        result = _fallback_month(topic, month_number, duration_months)
+
+    yield {"type": "month_ready", "data": result}
 
 
 def _generate_single_month_weeks(
@@ -272,6 +463,7 @@ def _generate_single_month_weeks(
     month_goal: dict,
     month_number: int,
     interview_section: str,
+    cancel_token: Optional[CancellationToken] = None,
 ) -> list:
     """Generate weekly tasks for a single month."""
     prompt = SINGLE_MONTH_WEEKS_PROMPT.format(
@@ -282,7 +474,10 @@ def _generate_single_month_weeks(
         interview_section=interview_section,
     )
     try:
-        result = invoke_llm_json(prompt, temperature=0.7)
+        result = invoke_llm_json(
+            prompt, cancel_token=cancel_token,
+            family=PromptFamily.WEEKS, schema=MonthWeeksOutput,
+        )
         weeks = result.get("weeks", [])
         # week_number 확인 및 보정
         for i, week in enumerate(weeks):
@@ -290,21 +485,80 @@ def _generate_single_month_weeks(
                 week["week_number"] = i + 1
         return weeks[:4]  # 최대 4주
     except Exception:
-        # Fallback with more meaningful weekly structure
-        week_templates = [
-            ("개념 이해와 환경 설정", "기본 개념을 학습하고 실습 환경을 구축합니다. 핵심 용어와 기초 원리를 이해합니다."),
-            ("핵심 기능 학습", "주요 기능을 단계별로 학습하고 간단한 예제를 통해 실습합니다."),
-            ("심화 학습과 실습", "고급 기능을 학습하고 실제 사례를 분석하며 응용 실습을 진행합니다."),
-            ("종합 프로젝트와 복습", "학습한 내용을 종합하여 미니 프로젝트를 완성하고 전체 내용을 복습합니다."),
-        ]
-        return [
-            {
-                "week_number": w + 1,
-                "title": f"{month_goal['title']} - {week_templates[w][0]}",
-                "description": week_templates[w][1]
-            }
-            for w in range(4)
-        ]
+        record_fallback(PromptFamily.WEEKS)
+        return _fallback_weeks(month_goal)
+
+
+def _fallback_weeks(month_goal: dict) -> list:
+    """Fallback weekly tasks with more meaningful weekly structure."""
+    week_templates = [
+        ("개념 이해와 환경 설정", "기본 개념을 학습하고 실습 환경을 구축합니다. 핵심 용어와 기초 원리를 이해합니다."),
+        ("핵심 기능 학습", "주요 기능을 단계별로 학습하고 간단한 예제를 통해 실습합니다."),
+        ("심화 학습과 실습", "고급 기능을 학습하고 실제 사례를 분석하며 응용 실습을 진행합니다."),
+        ("종합 프로젝트와 복습", "학습한 내용을 종합하여 미니 프로젝트를 완성하고 전체 내용을 복습합니다."),
+    ]
+    return [
+        {
+            "week_number": w + 1,
+            "title": f"{month_goal['title']} - {week_templates[w][0]}",
+            "description": week_templates[w][1]
+        }
+        for w in range(4)
+    ]
+
+
+async def _stream_single_month_weeks(
+    topic: str,
+    month_goal: dict,
+    month_number: int,
+    interview_section: str,
+    cancel_token: CancellationToken,
+    executor: Optional[Executor] = None,
+) -> AsyncGenerator[dict, None]:
+    """Stream weekly tasks for a single month.
+
+    "weeks" 배열의 주차 객체가 완성될 때마다 week_ready를 보내고,
+    마지막에 전체 주차(실패 시 폴백)를 weeks_ready로 보냅니다.
+    """
+    prompt = SINGLE_MONTH_WEEKS_PROMPT.format(
+        topic=topic,
+        month_number=month_number,
+        month_title=month_goal["title"],
+        month_description=month_goal["description"],
+        interview_section=interview_section,
+    )
+    parser = IncrementalJSONParser(array_key="weeks")
+    weeks = []
+    executor = executor or llm_executor(LLMPriority.GENERATION)
+    try:
+        async for text in astream_llm_text(
+            prompt, cancel_token=cancel_token, executor=executor, family=PromptFamily.WEEKS
+        ):
+            for week in parser.feed(text):
+                if len(weeks) >= 4:  # 최대 4주
+                    continue
+                if not isinstance(week.get("title"), str) or not isinstance(week.get("description"), str):
+                    continue
+                # week_number 확인 및 보정
+                week.setdefault("week_number", len(weeks) + 1)
+                weeks.append(week)
+                yield {
+                    "type": "week_ready",
+                    "data": {"month_number": month_number, "week": week}
+                }
+        if not weeks:
+            raise ValueError("no weekly tasks in response")
+    except Exception:
+        record_fallback(PromptFamily.WEEKS)
+        weeks = _fallback_weeks(month_goal)
+
+    yield {
+        "type": "weeks_ready",
+        "data": {
+            "month_number": month_number,
+            "weeks": weeks
+        }
+    }
 
 
 def _format_previous_months(months: list) -> str:
@@ -0,0 +1,356 @@
+"""Priority scheduler shared by all synchronous LLM work.
+
+모듈마다 따로 두던 작은 ThreadPoolExecutor 대신 하나의 워커 풀에서 LLM 호출을 실행합니다.
+한 사용자의 LEARNING 일일 채점(15문항)이나 주차 미리 생성이 다른 사용자의
+인터뷰 응답을 밀어내지 않도록 다음 순서로 작업을 고릅니다.
+
+- 우선순위 클래스: INTERACTIVE(인터뷰, 피드백 채팅) > GENERATION(로드맵/일일 태스크 생성,
+  채점) > BACKGROUND(미리 생성)
+- 같은 클래스 안에서는 사용자별 가중 공정 큐잉 (start-time fair queuing)
+- 오래 기다린 작업은 llm_scheduler_aging_seconds마다 한 클래스씩 올려서 기아 방지
+- 워커 중 llm_scheduler_reserved_interactive개는 INTERACTIVE 작업 전용으로 남겨 둠
+
+호출 측은 executor(priority, user_id)가 돌려주는 Executor를 loop.run_in_executor나
+astream_llm_text(executor=...)에 그대로 넘깁니다.
+클래스별 대기 작업 수와 대기 시간은 llm_scheduler_* 메트릭과 stats()로 확인합니다.
+"""
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from app.config import settings
+from app.core import metrics
+
+
+class LLMPriority(IntEnum):
+    """Priority classes, lower value runs first."""
+
+    INTERACTIVE = 0
+    GENERATION = 1
+    BACKGROUND = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+LLM_QUEUED = metrics.gauge(
+    "llm_scheduler_queued", "LLM calls waiting for a worker", ("priority",)
+)
+LLM_RUNNING = metrics.gauge(
+    "llm_scheduler_running", "LLM calls currently running", ("priority",)
+)
+LLM_JOBS = metrics.counter(
+    "llm_scheduler_jobs_total", "LLM calls started by the scheduler", ("priority",)
+)
+LLM_WAIT_SECONDS = metrics.counter(
+    "llm_scheduler_wait_seconds_total", "Total time LLM calls spent queued", ("priority",)
+)
+
+_ANONYMOUS = "anonymous"
+
+
+@dataclass
+class _Job:
+    future: Future
+    fn: Callable
+    args: tuple
+    kwargs: dict
+    priority: LLMPriority
+    user_key: str
+    seq: int
+    weight: float = 1.0
+    start_tag: float = 0.0
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class _FairQueue:
+    """Start-time fair queue over users for one priority class.
+
+    사용자별 FIFO를 두고, 각 작업에 가상 시작 시각(start tag)을 붙여 가장 작은 것부터 꺼냅니다.
+    가중치 w인 사용자의 연속 작업은 1/w씩 늦게 시작하므로 작업을 몰아 넣어도
+    다른 사용자와 번갈아 실행됩니다.
+    """
+
+    def __init__(self):
+        self.virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+        self._users: Dict[str, Deque[_Job]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, job: _Job, weight: float) -> None:
+        start = max(self.virtual_time, self._last_finish.get(job.user_key, 0.0))
+        job.start_tag = start
+        self._last_finish[job.user_key] = start + 1.0 / weight
+        self._users.setdefault(job.user_key, deque()).append(job)
+        self._size += 1
+
+    def oldest_enqueued_at(self) -> Optional[float]:
+        # 사용자별 FIFO의 맨 앞이 각 사용자의 가장 오래된 작업
+        if not self._users:
+            return None
+        return min(jobs[0].enqueued_at for jobs in self._users.values())
+
+    def remove(self, future: Future) -> Optional[_Job]:
+        """Take out the queued job for future (None if it is not queued here)."""
+        for user_key, jobs in self._users.items():
+            for job in jobs:
+                if job.future is future:
+                    jobs.remove(job)
+                    if not jobs:
+                        del self._users[user_key]
+                    self._size -= 1
+                    return job
+        return None
+
+    def pop(self) -> _Job:
+        user_key = min(self._users, key=lambda u: (self._users[u][0].start_tag, self._users[u][0].seq))
+        jobs = self._users[user_key]
+        job = jobs.popleft()
+        if not jobs:
+            del self._users[user_key]
+        self._size -= 1
+        self.virtual_time = job.start_tag
+        # 대기 작업이 없고 이미 가상 시각을 지난 사용자는 기록할 필요 없음
+        idle = [
+            key for key, finish in self._last_finish.items()
+            if finish <= self.virtual_time and key not in self._users
+        ]
+        for key in idle:
+            del self._last_finish[key]
+        return job
+
+
+class LLMScheduler:
+    """Worker pool that picks the next LLM call by priority class and per-user fairness."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        reserved_interactive: Optional[int] = None,
+        aging_seconds: Optional[float] = None,
+    ):
+        self.workers = max(1, workers or settings.llm_scheduler_workers)
+        reserved = (
+            reserved_interactive
+            if reserved_interactive is not None
+            else settings.llm_scheduler_reserved_interactive
+        )
+        self.reserved_interactive = min(max(0, reserved), self.workers - 1)
+        self.aging_seconds = aging_seconds if aging_seconds is not None else settings.llm_scheduler_aging_seconds
+
+        self._cond = threading.Condition()
+        self._queues: Dict[LLMPriority, _FairQueue] = {p: _FairQueue() for p in LLMPriority}
+        self._running: Dict[LLMPriority, int] = {p: 0 for p in LLMPriority}
+        self._seq = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._shutdown = False
+
+    def executor(
+        self,
+        priority: LLMPriority,
+        user_id: Optional[Any] = None,
+        weight: float = 1.0,
+    ) -> "ScheduledExecutor":
+        """Executor view that submits every call with the given class and user."""
+        return ScheduledExecutor(self, priority, user_id, weight)
+
+    def submit(
+        self,
+        priority: LLMPriority,
+        user_id: Optional[Any],
+        fn: Callable,
+        *args,
+        weight: float = 1.0,
+        **kwargs,
+    ) -> Future:
+        future: Future = Future()
+        job = _Job(
+            future=future,
+            fn=fn,
+            args=args,
+            kwargs=kwargs,
+            priority=priority,
+            user_key=str(user_id) if user_id is not None else _ANONYMOUS,
+            seq=next(self._seq),
+            weight=max(weight, 0.01),
+        )
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("LLM scheduler has been shut down")
+            self._start_workers()
+            self._queues[priority].push(job, job.weight)
+            LLM_QUEUED.set(len(self._queues[priority]), priority=priority.label)
+            self._cond.notify()
+        return future
+
+    def promote(self, future: Future, priority: LLMPriority) -> bool:
+        """Move a still-queued call up to priority (더 급한 요청이 그 결과를 기다리게 된 경우).
+
+        Returns:
+            옮겼으면 True (이미 실행 중/완료이거나 이미 같거나 높은 클래스면 False)
+        """
+        with self._cond:
+            for current, queue in self._queues.items():
+                if current <= priority:
+                    continue
+                job = queue.remove(future)
+                if job is None:
+                    continue
+                job.priority = priority
+                self._queues[priority].push(job, job.weight)
+                LLM_QUEUED.set(len(queue), priority=current.label)
+                LLM_QUEUED.set(len(self._queues[priority]), priority=priority.label)
+                self._cond.notify()
+                return True
+        return False
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def stats(self) -> Dict[str, dict]:
+        """Queue depth, running count and average wait per priority class."""
+        now = time.monotonic()
+        result = {}
+        with self._cond:
+            for priority, queue in self._queues.items():
+                jobs = LLM_JOBS.value(priority=priority.label)
+                wait_total = LLM_WAIT_SECONDS.value(priority=priority.label)
+                oldest = queue.oldest_enqueued_at()
+                result[priority.label] = {
+                    "queued": len(queue),
+                    "running": self._running[priority],
+                    "oldest_wait_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+                    "avg_wait_seconds": round(wait_total / jobs, 3) if jobs else 0.0,
+                }
+        return result
+
+    def _start_workers(self) -> None:
+        # 첫 작업이 들어올 때 시작 (import 시 스레드를 만들지 않음)
+        if self._threads:
+            return
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"llm-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _pick_locked(self) -> Optional[_Job]:
+        """Choose the next job (caller holds the lock)."""
+        busy = sum(self._running.values())
+        if busy >= self.workers:
+            return None
+        # 전용 워커를 남겨 두기 위해 INTERACTIVE 외 작업의 동시 실행 수 제한
+        non_interactive = busy - self._running[LLMPriority.INTERACTIVE]
+        allow_others = non_interactive < self.workers - self.reserved_interactive
+
+        now = time.monotonic()
+        best = None
+        for priority, queue in self._queues.items():
+            if not queue or (priority != LLMPriority.INTERACTIVE and not allow_others):
+                continue
+            oldest = queue.oldest_enqueued_at()
+            rank = int(priority)
+            if self.aging_seconds > 0:
+                rank = max(0, rank - int((now - oldest) / self.aging_seconds))
+            # 같은 단계면 더 오래 기다린 클래스 먼저
+            if best is None or (rank, oldest) < best[0]:
+                best = ((rank, oldest), priority)
+        if best is None:
+            return None
+
+        priority = best[1]
+        job = self._queues[priority].pop()
+        self._running[priority] += 1
+        LLM_QUEUED.set(len(self._queues[priority]), priority=priority.label)
+        LLM_RUNNING.set(self._running[priority], priority=priority.label)
+        return job
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._pick_locked()
+                while job is None:
+                    if self._shutdown:
+                        return
+                    self._cond.wait()
+                    job = self._pick_locked()
+            try:
+                self._run(job)
+            finally:
+                with self._cond:
+                    self._running[job.priority] -= 1
+                    LLM_RUNNING.set(self._running[job.priority], priority=job.priority.label)
+                    # 예약 워커 제한으로 대기하던 작업이 실행될 수 있으므로 모두 깨움
+                    self._cond.notify_all()
+
+    def _run(self, job: _Job) -> None:
+        # 대기 중 취소된 작업(연결 끊김 등)은 실행하지 않음
+        if not job.future.set_running_or_notify_cancel():
+            return
+        LLM_JOBS.inc(priority=job.priority.label)
+        LLM_WAIT_SECONDS.inc(time.monotonic() - job.enqueued_at, priority=job.priority.label)
+        try:
+            result = job.fn(*job.args, **job.kwargs)
+        except BaseException as e:
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+
+
+class ScheduledExecutor(Executor):
+    """concurrent.futures.Executor bound to one priority class and user."""
+
+    def __init__(
+        self,
+        scheduler: LLMScheduler,
+        priority: LLMPriority,
+        user_id: Optional[Any] = None,
+        weight: float = 1.0,
+    ):
+        self._scheduler = scheduler
+        self.priority = priority
+        self.user_id = user_id
+        self.weight = weight
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        return self._scheduler.submit(
+            self.priority, self.user_id, fn, *args, weight=self.weight, **kwargs
+        )
+
+    def shutdown(self, wait: bool = True, **kwargs) -> None:
+        # 공유 풀이므로 개별 뷰에서는 종료하지 않음
+        pass
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler()
+        return _scheduler
+
+
+def llm_executor(
+    priority: LLMPriority,
+    user_id: Optional[Any] = None,
+    weight: float = 1.0,
+) -> ScheduledExecutor:
+    """Shortcut for get_llm_scheduler().executor(...)."""
+    return get_llm_scheduler().executor(priority, user_id, weight)
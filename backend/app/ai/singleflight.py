@@ -0,0 +1,87 @@
+"""Single-flight coalescing of identical in-flight calls.
+
+같은 키로 동시에 들어온 호출은 하나의 업스트림 호출(리더)을 공유합니다.
+- 리더만 실제로 함수를 실행하고, 나머지(팔로워)는 결과를 기다렸다가 복사본을 받습니다.
+- 결과는 호출 측에서 수정될 수 있으므로 팔로워에게는 deepcopy를 반환합니다.
+- 리더가 취소(GenerationCancelled)되면 팔로워는 실패하지 않고 다시 시도합니다
+  (남은 팔로워 중 하나가 새 리더가 됨).
+
+LLM 호출은 executor 스레드에서 실행되므로 threading 기반으로 구현합니다.
+"""
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.ai.cancellation import CancellationToken, GenerationCancelled
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Group of keyed calls where duplicates wait for the first one."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._calls
+
+    def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Any],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> Tuple[Any, bool]:
+        """Run fn once per key among concurrent callers.
+
+        Args:
+            key: 요청 식별 키
+            fn: 리더가 실행할 함수
+            cancel_token: 팔로워 대기 중 취소 확인용 (리더의 fn에는 전달되지 않음)
+
+        Returns:
+            (결과, 공유 여부) - 공유 여부가 True면 다른 호출의 결과를 받은 것
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = _Call()
+                    self._calls[key] = call
+
+            if leader:
+                return self._run(key, call, fn), False
+
+            while not call.done.wait(timeout=0.1):
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+
+            if isinstance(call.error, GenerationCancelled):
+                # 리더의 요청만 취소된 것이므로 다시 시도
+                continue
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result), True
+
+    def _run(self, key: Hashable, call: _Call, fn: Callable[[], Any]) -> Any:
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            # 리더가 결과를 수정하기 전에 팔로워용 스냅샷 저장
+            call.result = copy.deepcopy(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
@@ -0,0 +1,227 @@
+"""Speculative roadmap generation started when the interview completes.
+
+인터뷰가 끝나면(POST /interview/submit → completed) 주제, 기간, interview_context를 이미
+알고 있으므로, 사용자가 /generate-stream을 호출하기 전에 제목과 월 목표를 미리 생성합니다.
+- 인터뷰 session_id를 키로 백그라운드 생성 시작 (settings.speculative_generation, 기본 꺼짐)
+- /generate-stream이 같은 interview_session_id와 같은 파라미터로 호출되면 선점(claim)하여
+  이미 끝난 이벤트는 즉시 재생하고, 진행 중인 부분은 이어서 실시간으로 전달
+- 파라미터가 다르면 폐기하고 새로 생성, TTL 안에 선점되지 않으면 취소 후 폐기
+
+주간 과제는 월 목표 결과에 따라 달라지므로 선점 이후 평소처럼 생성합니다.
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import AsyncGenerator, Dict, List, Optional, Set
+
+from app.ai import roadmap_stream
+from app.ai.cancellation import CancellationToken, GenerationCancelled
+from app.ai.prompts.templates import build_interview_section
+from app.ai.scheduler import LLMPriority, llm_executor
+from app.config import settings
+from app.core import metrics
+
+logger = logging.getLogger(__name__)
+
+SPECULATIVE_RUNS = metrics.counter(
+    "speculative_generation_total",
+    "Speculative roadmap generations by outcome",
+    ("outcome",),  # started / claimed / mismatched / expired
+)
+
+_WAIT_POLL_SECONDS = 0.5
+
+
+class SpeculativeRun:
+    """Background title + month-goal generation for one interview session.
+
+    생성된 이벤트를 월별로 기록해 두고, 선점한 스트림이 기록을 재생한 뒤
+    새 이벤트를 기다리도록 합니다. 모든 메서드는 이벤트 루프에서만 호출합니다.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        user_id: str,
+        topic: str,
+        duration_months: int,
+        interview_context: Optional[dict],
+    ):
+        self.key = key
+        self.user_id = user_id
+        self.topic = topic
+        self.duration_months = duration_months
+        self.interview_context = interview_context
+        self.cancel_token = CancellationToken()
+        self.created_at = time.monotonic()
+        self.claimed = False
+        self.finished = False
+
+        self.title: Optional[dict] = None
+        self.month_events: Dict[int, List[dict]] = defaultdict(list)
+        self._changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def matches(
+        self,
+        user_id: str,
+        topic: str,
+        duration_months: int,
+        interview_context: Optional[dict],
+    ) -> bool:
+        return (
+            self.user_id == user_id
+            and self.topic == topic
+            and self.duration_months == duration_months
+            and self.interview_context == interview_context
+        )
+
+    def cancel(self, reason: str) -> None:
+        self.cancel_token.cancel(reason)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        interview_section = build_interview_section(self.interview_context)
+        # 곧 사용자가 기다리게 될 생성이므로 BACKGROUND가 아닌 GENERATION 클래스로 실행
+        executor = llm_executor(LLMPriority.GENERATION, self.user_id)
+        try:
+            self.title = await loop.run_in_executor(
+                executor,
+                roadmap_stream._generate_title,
+                self.topic,
+                self.duration_months,
+                interview_section,
+                self.cancel_token,
+            )
+            self._notify()
+
+            monthly_goals = []
+            for month_num in range(1, self.duration_months + 1):
+                async for event in roadmap_stream._stream_single_month(
+                    self.topic,
+                    self.title["title"],
+                    month_num,
+                    self.duration_months,
+                    monthly_goals,
+                    interview_section,
+                    self.cancel_token,
+                    executor,
+                ):
+                    self.month_events[month_num].append(event)
+                    self._notify()
+                    if event["type"] == "month_ready":
+                        monthly_goals.append(event["data"])
+        except GenerationCancelled as e:
+            logger.info(f"[Speculative] Generation for {self.key} cancelled ({e})")
+        finally:
+            self.finished = True
+            self._notify()
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def _wait(self, changed: asyncio.Event, cancel_token: CancellationToken) -> None:
+        while not changed.is_set():
+            cancel_token.raise_if_cancelled()
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=_WAIT_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def get_title(self, cancel_token: CancellationToken) -> Optional[dict]:
+        """Title result, waiting for it if still generating (None if cancelled)."""
+        while True:
+            changed = self._changed
+            if self.title is not None or self.finished:
+                return self.title
+            await self._wait(changed, cancel_token)
+
+    async def stream_month(
+        self, month_number: int, cancel_token: CancellationToken
+    ) -> AsyncGenerator[dict, None]:
+        """Replay recorded events for a month, then follow live ones.
+
+        생성이 중간에 취소되면 month_ready 없이 끝나므로 호출 측이 직접 생성합니다.
+        """
+        index = 0
+        while True:
+            changed = self._changed
+            events = self.month_events[month_number]
+            while index < len(events):
+                event = events[index]
+                index += 1
+                yield event
+                if event["type"] == "month_ready":
+                    return
+            if self.finished:
+                return
+            await self._wait(changed, cancel_token)
+
+
+_runs: Dict[str, SpeculativeRun] = {}
+# 실행 중인 태스크 참조 보관 (GC 방지)
+_tasks: Set[asyncio.Task] = set()
+
+
+def start_speculation(
+    key: str,
+    user_id: str,
+    topic: str,
+    duration_months: int,
+    interview_context: Optional[dict],
+) -> Optional[SpeculativeRun]:
+    """Start background generation for a completed interview (opt-in)."""
+    if not settings.speculative_generation:
+        return None
+
+    previous = _runs.pop(key, None)
+    if previous is not None:
+        previous.cancel("superseded")
+
+    run = SpeculativeRun(key, user_id, topic, duration_months, interview_context)
+    _runs[key] = run
+    run.task = asyncio.create_task(run.run())
+    _tasks.add(run.task)
+    run.task.add_done_callback(_tasks.discard)
+    asyncio.get_running_loop().call_later(settings.speculative_ttl_seconds, _expire, run)
+    SPECULATIVE_RUNS.inc(outcome="started")
+    logger.info(f"[Speculative] Started roadmap generation for interview {key}")
+    return run
+
+
+def claim_speculation(
+    key: Optional[str],
+    user_id: str,
+    topic: str,
+    duration_months: int,
+    interview_context: Optional[dict],
+) -> Optional[SpeculativeRun]:
+    """Take over a speculative run whose parameters match the generation request."""
+    if not key:
+        return None
+    run = _runs.pop(key, None)
+    if run is None:
+        return None
+    if not run.matches(user_id, topic, duration_months, interview_context):
+        run.cancel("parameters changed")
+        SPECULATIVE_RUNS.inc(outcome="mismatched")
+        return None
+
+    run.claimed = True
+    SPECULATIVE_RUNS.inc(outcome="claimed")
+    logger.info(
+        f"[Speculative] Claimed interview {key} after {time.monotonic() - run.created_at:.1f}s "
+        f"({sum(len(e) for e in run.month_events.values())} events ready)"
+    )
+    return run
+
+
+def _expire(run: SpeculativeRun) -> None:
+    if run.claimed or _runs.get(run.key) is not run:
+        return
+    del _runs[run.key]
+    run.cancel("expired")
+    SPECULATIVE_RUNS.inc(outcome="expired")
+    logger.info(f"[Speculative] Discarded unclaimed generation for interview {run.key}")
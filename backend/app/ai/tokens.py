@@ -0,0 +1,24 @@
+"""Rough token estimates for prompts and responses.
+
+API 호출 없이 출력 형식 간 토큰 수를 비교하기 위한 근사치입니다 (정확한 값이 필요하면
+Anthropic count_tokens API 사용). Claude 토크나이저 기준으로 대략:
+- 영문/숫자: 약 4글자당 1토큰
+- 한글/일본어 등 비 ASCII 문자: 글자당 약 1토큰
+- 구두점, 따옴표, 괄호: 각각 1토큰
+- 공백/줄바꿈 연속: 1토큰
+"""
+import math
+import re
+
+_PIECES = re.compile(r"[A-Za-z]+|\d+|[^\x00-\x7f]|\s+|[^\sA-Za-z\d]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate Claude token count of text."""
+    total = 0
+    for piece in _PIECES.findall(text):
+        if piece[0].isascii() and piece[0].isalnum():
+            total += math.ceil(len(piece) / 4)
+        else:
+            total += 1
+    return total
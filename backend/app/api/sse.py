@@ -0,0 +1,98 @@
+"""Server-Sent Events helpers for streaming endpoints."""
+import asyncio
+import json
+import logging
+from typing import AsyncIterator, Set
+
+from fastapi import Request
+
+from app.ai.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
+}
+
+# 연결이 끊긴 뒤에도 끝까지 실행되는 생성 태스크 (GC 방지용 참조 보관)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def format_sse(event_type: str, data) -> str:
+    """Format a single SSE frame."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event_type}\ndata: {payload}\n\n"
+
+
+async def stream_with_disconnect(
+    request: Request,
+    events: AsyncIterator[dict],
+    cancel_token: CancellationToken,
+    finish_on_disconnect: bool = False,
+    poll_interval: float = 1.0,
+) -> AsyncIterator[str]:
+    """Relay generator events as SSE frames and react to client disconnects.
+
+    이벤트 생성은 별도 태스크에서 실행하고, 클라이언트 연결이 끊기면:
+    - finish_on_disconnect=False: cancel_token을 취소하여 LLM 호출과 저장을 중단
+    - finish_on_disconnect=True: 생성 태스크를 끝까지 실행 (결과는 저장됨)
+
+    Args:
+        request: 연결 상태 확인용 요청 객체
+        events: {"type": ..., "data": ...} 이벤트를 생성하는 비동기 제너레이터
+        cancel_token: events 생성기에 전달된 취소 토큰
+        finish_on_disconnect: 연결 끊김 시 생성을 계속할지 여부
+        poll_interval: 연결 상태 확인 주기 (초)
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def produce():
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put({
+                "type": "error",
+                "data": {"message": str(e), "recoverable": False},
+            })
+        finally:
+            await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+    finished = False
+
+    def on_disconnect():
+        if finished or producer.done():
+            return
+        if finish_on_disconnect:
+            if producer not in _background_tasks:
+                logger.info("[SSE] Client disconnected, finishing generation in background")
+                _background_tasks.add(producer)
+                producer.add_done_callback(_background_tasks.discard)
+        else:
+            logger.info("[SSE] Client disconnected, cancelling generation")
+            cancel_token.cancel("client disconnected")
+
+    async def watch_disconnect():
+        while not producer.done():
+            if await request.is_disconnected():
+                on_disconnect()
+                return
+            await asyncio.sleep(poll_interval)
+
+    watcher = asyncio.create_task(watch_disconnect())
+
+    try:
+        while True:
+            event = await queue.get()
+            if event is done:
+                finished = True
+                break
+            yield format_sse(event["type"], event["data"])
+    finally:
+        # 정상 종료가 아니면 (서버가 응답 스트림을 취소한 경우 포함) 연결 끊김으로 처리
+        watcher.cancel()
+        on_disconnect()
@@ -5,9 +5,9 @@ import logging
 from datetime import datetime, date
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from dateutil.relativedelta import relativedelta
 
@@ -16,26 +16,34 @@ from app.models.user import User
 from app.models import Roadmap, MonthlyGoal, WeeklyTask
 from app.models.roadmap import RoadmapMode
 from app.api.deps import get_current_user
+from app.api.sse import SSE_HEADERS, stream_with_disconnect
+from app.config import settings
 from app.schemas.feedback import (
     FeedbackStartRequest,
     FeedbackStartResponse,
     FeedbackMessageRequest,
     FeedbackMessageResponse,
+    FeedbackRegenerateRequest,
     FeedbackFinalizeRequest,
     FeedbackFinalizeResponse,
     RoadmapPreviewData,
     RoadmapModifications,
 )
-from app.ai.feedback_node import analyze_and_modify_roadmap, apply_modifications
+from app.ai.cancellation import CancellationToken, GenerationCancelled
+from app.ai.feedback_node import (
+    analyze_and_modify_roadmap,
+    apply_modifications,
+    find_stale_weeks,
+    stream_feedback_analysis,
+)
+from app.ai.roadmap_stream import regenerate_weeks_streaming
+from app.ai.scheduler import LLMPriority, llm_executor
 from app.ai.prompts.feedback_prompts import WELCOME_MESSAGE
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Thread pool for async LLM calls
-_executor = ThreadPoolExecutor(max_workers=4)
-
 
 @dataclass
 class FeedbackSession:
@@ -57,6 +65,9 @@ class FeedbackSession:
     # Chat history
     messages: List[dict] = field(default_factory=list)
 
+    # 월 목표 수정으로 재생성이 필요한 주차 {월 번호: [주 번호, ...]}
+    stale_weeks: Dict[int, List[int]] = field(default_factory=dict)
+
     # Metadata
     created_at: datetime = field(default_factory=datetime.utcnow)
 
@@ -137,66 +148,20 @@ async def send_feedback_message(
         "content": data.message,
     })
 
-    # 현재 로드맵 데이터 구성
-    current_roadmap = {
-        "topic": session.topic,
-        "duration_months": session.duration_months,
-        "start_date": session.start_date,
-        "mode": session.mode,
-        "title": session.title,
-        "description": session.description,
-        "monthly_goals": session.monthly_goals,
-        "weekly_tasks": session.weekly_tasks,
-    }
+    current_roadmap = _current_roadmap(session)
 
     try:
         # AI 분석 (비동기로 실행)
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(
-            _executor,
+            llm_executor(LLMPriority.INTERACTIVE, session.user_id),
             analyze_and_modify_roadmap,
             data.message,
             current_roadmap,
             session.messages,
             session.interview_context,
         )
-
-        # 수정 사항 적용
-        modifications = result.get("modifications", {})
-        if result.get("modification_type") != "none":
-            updated_roadmap = apply_modifications(current_roadmap, modifications)
-            # 세션 상태 업데이트
-            session.title = updated_roadmap.get("title", session.title)
-            session.description = updated_roadmap.get("description", session.description)
-            session.monthly_goals = updated_roadmap.get("monthly_goals", session.monthly_goals)
-            session.weekly_tasks = updated_roadmap.get("weekly_tasks", session.weekly_tasks)
-        else:
-            updated_roadmap = current_roadmap
-
-        # AI 응답 추가
-        session.messages.append({
-            "role": "assistant",
-            "content": result.get("response", ""),
-        })
-
-        # 응답 구성
-        return FeedbackMessageResponse(
-            response=result.get("response", ""),
-            modifications=RoadmapModifications(
-                monthly_goals=modifications.get("monthly_goals"),
-                weekly_tasks=modifications.get("weekly_tasks"),
-            ) if modifications.get("monthly_goals") or modifications.get("weekly_tasks") else None,
-            updated_roadmap=RoadmapPreviewData(
-                topic=updated_roadmap["topic"],
-                duration_months=updated_roadmap["duration_months"],
-                start_date=updated_roadmap["start_date"],
-                mode=updated_roadmap["mode"],
-                title=updated_roadmap["title"],
-                description=updated_roadmap["description"],
-                monthly_goals=updated_roadmap["monthly_goals"],
-                weekly_tasks=updated_roadmap["weekly_tasks"],
-            ),
-        )
+        return _apply_feedback_result(session, current_roadmap, result)
 
     except Exception as e:
         logger.error(f"Feedback processing error: {e}")
@@ -206,6 +171,214 @@ async def send_feedback_message(
         )
 
 
+@router.post("/{session_id}/message/stream")
+async def stream_feedback_message(
+    session_id: str,
+    data: FeedbackMessageRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+):
+    """피드백 메시지를 전송하고 AI 응답을 SSE로 스트리밍합니다.
+
+    SSE Events:
+    - response_delta: AI 응답 문장 조각 (delta: 새로 생성된 부분, text: 지금까지의 전체)
+    - modifications: 최종 결과 (/message 응답과 같은 형태, 세션에 반영됨)
+    - error: 에러 발생
+
+    클라이언트 연결이 끊기면 LLM 호출을 중단하고 세션을 바꾸지 않습니다.
+    """
+    session = feedback_sessions.get(session_id)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="피드백 세션을 찾을 수 없습니다. 새로 시작해주세요.",
+        )
+
+    if session.user_id != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="접근 권한이 없습니다.",
+        )
+
+    current_roadmap = _current_roadmap(session)
+    history = session.messages + [{"role": "user", "content": data.message}]
+    cancel_token = CancellationToken()
+
+    async def events():
+        try:
+            async for event in stream_feedback_analysis(
+                data.message,
+                current_roadmap,
+                history,
+                session.interview_context,
+                cancel_token=cancel_token,
+                executor=llm_executor(LLMPriority.INTERACTIVE, session.user_id),
+            ):
+                if event["type"] != "analysis_ready":
+                    yield event
+                    continue
+                # 응답이 끝까지 생성된 경우에만 대화/로드맵에 반영
+                cancel_token.raise_if_cancelled()
+                session.messages.append({"role": "user", "content": data.message})
+                response = _apply_feedback_result(session, current_roadmap, event["data"])
+                yield {"type": "modifications", "data": response.model_dump()}
+        except GenerationCancelled as e:
+            logger.info(f"[Feedback] Streaming reply cancelled ({e})")
+
+    return StreamingResponse(
+        stream_with_disconnect(
+            request,
+            events(),
+            cancel_token,
+            poll_interval=settings.stream_disconnect_poll_seconds,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+def _current_roadmap(session: FeedbackSession) -> dict:
+    """현재 로드맵 데이터 구성."""
+    return {
+        "topic": session.topic,
+        "duration_months": session.duration_months,
+        "start_date": session.start_date,
+        "mode": session.mode,
+        "title": session.title,
+        "description": session.description,
+        "monthly_goals": session.monthly_goals,
+        "weekly_tasks": session.weekly_tasks,
+    }
+
+
+def _apply_feedback_result(
+    session: FeedbackSession,
+    current_roadmap: dict,
+    result: dict,
+) -> FeedbackMessageResponse:
+    """분석 결과를 세션에 반영하고 메시지 응답을 구성합니다."""
+    # 수정 사항 적용
+    modifications = result.get("modifications", {})
+    if result.get("modification_type") != "none":
+        updated_roadmap = apply_modifications(current_roadmap, modifications)
+        # 세션 상태 업데이트
+        session.title = updated_roadmap.get("title", session.title)
+        session.description = updated_roadmap.get("description", session.description)
+        session.monthly_goals = updated_roadmap.get("monthly_goals", session.monthly_goals)
+        session.weekly_tasks = updated_roadmap.get("weekly_tasks", session.weekly_tasks)
+        _update_stale_weeks(session, current_roadmap, updated_roadmap, modifications)
+    else:
+        updated_roadmap = current_roadmap
+
+    # AI 응답 추가
+    session.messages.append({
+        "role": "assistant",
+        "content": result.get("response", ""),
+    })
+
+    # 응답 구성
+    return FeedbackMessageResponse(
+        response=result.get("response", ""),
+        modifications=RoadmapModifications(
+            monthly_goals=modifications.get("monthly_goals"),
+            weekly_tasks=modifications.get("weekly_tasks"),
+        ) if modifications.get("monthly_goals") or modifications.get("weekly_tasks") else None,
+        updated_roadmap=RoadmapPreviewData(
+            topic=updated_roadmap["topic"],
+            duration_months=updated_roadmap["duration_months"],
+            start_date=updated_roadmap["start_date"],
+            mode=updated_roadmap["mode"],
+            title=updated_roadmap["title"],
+            description=updated_roadmap["description"],
+            monthly_goals=updated_roadmap["monthly_goals"],
+            weekly_tasks=updated_roadmap["weekly_tasks"],
+        ),
+        stale_months=sorted(session.stale_weeks),
+    )
+
+
+def _update_stale_weeks(
+    session: FeedbackSession,
+    before: dict,
+    after: dict,
+    modifications: dict,
+) -> None:
+    """수정 diff를 세션의 stale 주차 목록에 누적합니다."""
+    for month_num, weeks in find_stale_weeks(before, after, modifications).items():
+        session.stale_weeks[month_num] = sorted(set(session.stale_weeks.get(month_num, [])) | set(weeks))
+
+    # 이후 메시지에서 직접 수정한 주차는 더 이상 stale이 아님
+    for week in modifications.get("weekly_tasks") or []:
+        month_num = week.get("month_number")
+        if week.get("week_number") in session.stale_weeks.get(month_num, []):
+            session.stale_weeks[month_num].remove(week.get("week_number"))
+            if not session.stale_weeks[month_num]:
+                del session.stale_weeks[month_num]
+
+
+@router.post("/{session_id}/regenerate")
+async def regenerate_stale_weeks(
+    session_id: str,
+    request: Request,
+    data: Optional[FeedbackRegenerateRequest] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """월 목표가 바뀐 월의 주간 과제만 다시 생성합니다 (SSE).
+
+    SSE Events:
+    - weeks_ready: 해당 월의 주간 과제 재생성 완료 (regenerated: 교체된 주 번호)
+    - progress: 진행률 업데이트
+    - regenerate_complete: 전체 완료 (weekly_tasks: 갱신된 전체 주간 과제)
+    - error: 에러 발생
+
+    재생성 대상은 메시지 응답의 stale_months이며, month_numbers로 일부만 지정할 수 있습니다.
+    """
+    session = feedback_sessions.get(session_id)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="피드백 세션을 찾을 수 없습니다. 새로 시작해주세요.",
+        )
+
+    if session.user_id != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="접근 권한이 없습니다.",
+        )
+
+    months = data.month_numbers if data and data.month_numbers else list(session.stale_weeks)
+    stale = {m: session.stale_weeks.get(m) or [1, 2, 3, 4] for m in months}
+    cancel_token = CancellationToken()
+
+    async def events():
+        async for event in regenerate_weeks_streaming(
+            topic=session.topic,
+            monthly_goals=session.monthly_goals,
+            weekly_tasks=session.weekly_tasks,
+            stale=stale,
+            interview_context=session.interview_context,
+            cancel_token=cancel_token,
+            user_id=session.user_id,
+        ):
+            if event["type"] == "regenerate_complete":
+                # 세션 상태 업데이트
+                session.weekly_tasks = event["data"]["weekly_tasks"]
+                for month_num in stale:
+                    session.stale_weeks.pop(month_num, None)
+            yield event
+
+    return StreamingResponse(
+        stream_with_disconnect(
+            request,
+            events(),
+            cancel_token,
+            poll_interval=settings.stream_disconnect_poll_seconds,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.post("/{session_id}/finalize", response_model=FeedbackFinalizeResponse)
 async def finalize_roadmap(
     session_id: str,
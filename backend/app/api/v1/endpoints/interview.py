@@ -15,6 +15,7 @@ from app.schemas.interview import (
     InterviewContext,
 )
 from app.ai.interview_graph import generate_questions, analyze_answers
+from app.ai.speculative import start_speculation
 
 
 router = APIRouter()
@@ -45,6 +46,7 @@ async def start_interview(
         result = await generate_questions(
             topic=data.topic,
             duration_months=data.duration_months,
+            user_id=str(current_user.id),
         )
 
         # Store session
@@ -96,6 +98,7 @@ async def submit_answers(
             questions=session.all_questions,  # Pass ALL questions from all rounds
             answers=session.answers,
             current_round=session.round,
+            user_id=str(current_user.id),
         )
 
         if result["status"] == "followup_needed":
@@ -113,12 +116,22 @@ async def submit_answers(
         else:
             # Interview completed - clean up session
             del interview_sessions[data.session_id]
+            interview_context = InterviewContext(**result["interview_context"])
+
+            # 사용자가 생성 화면으로 넘어오기 전에 제목/월 목표 생성 시작 (opt-in)
+            start_speculation(
+                data.session_id,
+                str(current_user.id),
+                session.topic,
+                session.duration_months,
+                interview_context.model_dump(),
+            )
 
             return InterviewSubmitResponse(
                 status="completed",
                 round=result["round"],
                 followup_questions=None,
-                interview_context=InterviewContext(**result["interview_context"]),
+                interview_context=interview_context,
             )
     except Exception as e:
         raise HTTPException(
@@ -1,4 +1,6 @@
 """Learning mode API endpoints for questions, grading, and feedback."""
+import logging
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import List, Optional
@@ -8,6 +10,7 @@ from app.db import get_db
 from app.models.user import User
 from app.api.deps import get_current_user
 from app.services.learning_service import LearningService
+from app.services.daily_prefetch_service import DailyPrefetchService
 from app.schemas.learning import (
     QuestionResponse,
     QuestionWithAnswer,
@@ -22,6 +25,7 @@ from app.schemas.learning import (
     LearningWeekInfoResponse,
 )
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -139,6 +143,12 @@ async def complete_day(
     week_info = service.get_week_info(feedback.weekly_task_id, current_user.id)
     week_completed = week_info["is_completed"]
 
+    # 진행률이 올라갔으므로 다음 주 미리 생성 여부 확인
+    try:
+        DailyPrefetchService(db).maybe_prefetch_next_week(feedback.weekly_task_id, current_user.id)
+    except Exception as e:
+        logger.warning(f"[Prefetch] Check failed for week {feedback.weekly_task_id}: {e}")
+
     return CompleteDayResponse(
         feedback=DailyFeedbackResponse(
             id=feedback.id,
@@ -1,9 +1,10 @@
-import json
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 from datetime import date
@@ -36,11 +37,17 @@ from app.services.daily_task_service import DailyTaskService
 from app.services.monthly_goal_service import MonthlyGoalService
 from app.services.weekly_task_service import WeeklyTaskService
 from app.services.daily_generation_service import DailyGenerationService
+from app.services.daily_prefetch_service import DailyPrefetchService
 from app.services.unified_view_service import UnifiedViewService
 from app.schemas.unified_view import TodayDailyTask, WeeklyTaskSummary, UnifiedViewResponse
 from app.api.deps import get_current_user
+from app.core.exceptions import ServiceBusyException
+from app.api.sse import SSE_HEADERS, stream_with_disconnect
+from app.ai.admission import AdmissionTicket, GenerationQueueFull, get_admission_controller
+from app.ai.cancellation import CancellationToken, GenerationCancelled
 from app.ai.roadmap_graph import generate_roadmap
 from app.ai.roadmap_stream import generate_roadmap_streaming
+from app.ai.speculative import claim_speculation
 
 
 # ============ Request/Response Models ============
@@ -52,6 +59,7 @@ class RoadmapGenerateRequest(BaseModel):
     mode: RoadmapMode = RoadmapMode.PLANNING
     interview_context: Optional[dict] = None
     skip_save: bool = False  # True면 DB 저장 없이 preview_ready 이벤트 발송 (피드백 채팅용)
+    interview_session_id: Optional[str] = None  # 인터뷰 완료 시 미리 시작한 생성을 이어받기 위한 키
 
 
 class RoadmapGenerateResponse(BaseModel):
@@ -70,6 +78,7 @@ class DailyTasksGenerateResponse(BaseModel):
     daily_tasks_count: int
 
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -241,7 +250,10 @@ async def get_roadmap_full(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get full roadmap with all hierarchy (monthly -> weekly -> daily)."""
+    """Get full roadmap with all hierarchy (monthly -> weekly -> daily).
+
+    다음 주 시작일이 가까우면 일일 태스크를 백그라운드에서 미리 생성합니다.
+    """
     service = RoadmapService(db)
     roadmap = service.get_roadmap_full(roadmap_id, current_user.id)
     if not roadmap:
@@ -249,6 +261,10 @@ async def get_roadmap_full(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Roadmap not found",
         )
+    try:
+        DailyPrefetchService(db).maybe_prefetch_roadmap(roadmap, current_user.id)
+    except Exception as e:
+        logger.warning(f"[Prefetch] Check failed for roadmap {roadmap_id}: {e}")
     return roadmap
 
 
@@ -290,7 +306,8 @@ async def toggle_daily_task(
     """Toggle daily task check status.
 
     If the weekly task reaches 100% completion, automatically generates
-    daily tasks for the next week.
+    daily tasks for the next week. Before that, the next week may be
+    pre-generated in the background (app.services.daily_prefetch_service).
     """
     service = DailyTaskService(db)
     task = service.toggle_daily_task(task_id, current_user.id)
@@ -313,6 +330,11 @@ async def toggle_daily_task(
         except Exception:
             # Silently fail - next week can be generated manually
             pass
+    else:
+        try:
+            DailyPrefetchService(db).maybe_prefetch_next_week(weekly_task.id, current_user.id)
+        except Exception as e:
+            logger.warning(f"[Prefetch] Check failed for week {weekly_task.id}: {e}")
 
     # Build response
     response_data = {
@@ -358,6 +380,25 @@ async def check_can_generate_roadmap(
     }
 
 
+GENERATION_BUSY_DETAIL = "로드맵 생성 요청이 많습니다. 잠시 후 다시 시도해주세요."
+
+
+def _enter_generation_queue() -> AdmissionTicket:
+    """Take a generation slot or queue place, refusing with 503 when full."""
+    try:
+        return get_admission_controller().enter()
+    except GenerationQueueFull as e:
+        raise ServiceBusyException(retry_after=e.retry_after, detail=GENERATION_BUSY_DETAIL)
+
+
+def _check_generation_queue() -> None:
+    """Refuse with 503 when the generation queue is full, without taking a place."""
+    try:
+        get_admission_controller().check()
+    except GenerationQueueFull as e:
+        raise ServiceBusyException(retry_after=e.retry_after, detail=GENERATION_BUSY_DETAIL)
+
+
 @router.post("/generate", response_model=RoadmapGenerateResponse)
 async def generate_roadmap_endpoint(
     data: RoadmapGenerateRequest,
@@ -379,6 +420,10 @@ async def generate_roadmap_endpoint(
                 detail=f"일일 로드맵 생성 한도를 초과했습니다. (오늘 {today_count}개 생성, 제한: {limit}개)",
             )
 
+    # 동시 생성 수 제한 (대기열까지 가득 차면 503 + Retry-After)
+    ticket = _enter_generation_queue()
+    await ticket.acquire()
+
     try:
         result = await generate_roadmap(
             topic=data.topic,
@@ -400,11 +445,14 @@ async def generate_roadmap_endpoint(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"로드맵 생성 중 오류가 발생했습니다: {str(e)}",
         )
+    finally:
+        ticket.release()
 
 
 @router.post("/generate-stream")
 async def generate_roadmap_stream(
     data: RoadmapGenerateRequest,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -414,6 +462,7 @@ async def generate_roadmap_stream(
     월별 → 해당 월의 주간 순서로 생성하여 각 단계마다 이벤트를 발송합니다.
 
     SSE Events:
+    - queued: 동시 생성 상한으로 대기 중 (position: 순번, estimated_wait_seconds: 예상 대기 시간)
     - title_ready: 제목/설명 생성 완료
     - month_ready: 월별 목표 생성 완료
     - weeks_ready: 해당 월의 주간 과제 생성 완료
@@ -423,6 +472,11 @@ async def generate_roadmap_stream(
     - preview_ready: 생성 완료 (DB 저장 없음, skip_save=True 시)
     - complete: 전체 완료 (DB 저장 완료)
 
+    대기열까지 가득 차 있으면 스트림을 열지 않고 503과 Retry-After 헤더로 거절합니다.
+
+    클라이언트 연결이 끊기면 settings.stream_disconnect_policy에 따라
+    생성을 중단(cancel)하거나 백그라운드에서 끝까지 생성해 저장(finish)합니다.
+
     Args:
         skip_save: True면 DB 저장 없이 preview_ready 이벤트 발송 (피드백 채팅용)
 
@@ -443,40 +497,77 @@ async def generate_roadmap_stream(
                 detail=f"일일 로드맵 생성 한도를 초과했습니다. (오늘 {today_count}개 생성, 제한: {limit}개)",
             )
 
-    async def event_generator():
-        """SSE 이벤트 생성기."""
-        try:
-            async for event in generate_roadmap_streaming(
-                topic=data.topic,
-                duration_months=data.duration_months,
-                start_date=data.start_date,
-                mode=data.mode,
-                user_id=str(current_user.id),
-                db=db,
-                interview_context=data.interview_context,
-                skip_save=data.skip_save,
-            ):
-                event_type = event["type"]
-                event_data = json.dumps(event["data"], ensure_ascii=False, default=str)
-                yield f"event: {event_type}\ndata: {event_data}\n\n"
-        except Exception as e:
-            error_data = json.dumps({
-                "message": str(e),
-                "recoverable": False
-            }, ensure_ascii=False)
-            yield f"event: error\ndata: {error_data}\n\n"
+    # 연결이 끊겼을 때 끝까지 생성해 저장할지 (미리보기는 저장할 것이 없으므로 항상 취소)
+    cancel_token = CancellationToken()
+    finish_on_disconnect = (
+        settings.stream_disconnect_policy == "finish" and not data.skip_save
+    )
+
+    # 대기열이 가득 찼으면 여기서 503 (슬롯은 스트림 본문이 시작될 때 잡음)
+    _check_generation_queue()
+
+    # 인터뷰 완료 시 미리 시작한 제목/월 목표 생성이 있으면 이어받기
+    speculation = claim_speculation(
+        data.interview_session_id,
+        str(current_user.id),
+        data.topic,
+        data.duration_months,
+        data.interview_context,
+    )
+
+    events = generate_roadmap_streaming(
+        topic=data.topic,
+        duration_months=data.duration_months,
+        start_date=data.start_date,
+        mode=data.mode,
+        user_id=str(current_user.id),
+        db=db,
+        interview_context=data.interview_context,
+        skip_save=data.skip_save,
+        cancel_token=cancel_token,
+        speculation=speculation,
+    )
 
     return StreamingResponse(
-        event_generator(),
+        stream_with_disconnect(
+            request,
+            _admitted_events(events, cancel_token),
+            cancel_token,
+            finish_on_disconnect=finish_on_disconnect,
+            poll_interval=settings.stream_disconnect_poll_seconds,
+        ),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
-        }
+        headers=SSE_HEADERS,
     )
 
 
+async def _admitted_events(
+    events: AsyncIterator[dict],
+    cancel_token: CancellationToken,
+) -> AsyncIterator[dict]:
+    """Take a queue place, send queued events until a slot frees up, then relay the generation.
+
+    슬롯은 본문이 실제로 시작된 뒤에 잡으므로, 응답 전송 전에 연결이 끊겨
+    본문이 실행되지 않으면 잡은 슬롯도 없습니다.
+    """
+    ticket: Optional[AdmissionTicket] = None
+    try:
+        ticket = get_admission_controller().enter()
+        async for queue_status in ticket.wait(cancel_token):
+            yield {"type": "queued", "data": queue_status}
+        async for event in events:
+            yield event
+    except GenerationQueueFull:
+        # 사전 검사 이후 다른 요청이 대기열을 채운 경우 (이미 200 응답 중)
+        yield {"type": "error", "data": {"message": GENERATION_BUSY_DETAIL, "recoverable": True}}
+    except GenerationCancelled as e:
+        logger.info(f"[Stream] Client left the generation queue ({e})")
+    finally:
+        if ticket is not None:
+            ticket.release()
+        await events.aclose()
+
+
 # ============ Roadmap Finalization & Schedule ============
 
 @router.post("/{roadmap_id}/finalize", response_model=RoadmapFinalizeResponse)
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
 from functools import lru_cache
+from typing import Any, Dict, Literal
 
 
 class Settings(BaseSettings):
@@ -33,9 +34,91 @@ class Settings(BaseSettings):
     # Anthropic
     anthropic_api_key: str = ""
 
+    # 프롬프트 패밀리별 호출 설정 (app.ai.prompt_families.FAMILY_SPECS 덮어쓰기)
+    # 예: {"grading": {"tier": "large", "max_tokens": 2048, "timeout": 20, "temperature": 0.3}}
+    llm_families: Dict[str, Dict[str, Any]] = {}
+    llm_model_large: str = ""  # 비어 있으면 DEV_MODE에 따른 기본 모델
+    llm_model_fast: str = ""
+
+    # LLM 구조화 출력 (tool calling + Pydantic 검증)
+    # 켜면 schema가 지정된 호출은 JSON 텍스트 대신 tool 입력으로 응답을 받습니다
+    llm_structured_output: bool = False
+    llm_repair_max_attempts: int = 1  # 검증 실패 시 오류 필드만 재요청하는 최대 횟수
+
+    # 프롬프트 캐싱 - 고정 지침(system 블록)에 cache_control을 붙여 재사용
+    llm_prompt_cache: bool = True
+
+    # LLM 백엔드 - fake는 토큰 비용 없이 부하 테스트/벤치마크용 가짜 응답 (app.ai.fake_llm)
+    # record/replay는 실제 응답을 카세트에 기록/재생 (app.ai.cassettes)
+    llm_backend: Literal["anthropic", "fake", "record", "replay"] = "anthropic"
+    llm_cassette_dir: str = ".cassettes"
+    llm_cassette_replay_latency: bool = True  # 재생 시 기록된 지연 시간만큼 대기
+    fake_llm_seed: int = 0
+    fake_llm_latency_median_ms: float = 800.0  # 첫 토큰까지 지연의 중앙값 (로그정규 분포)
+    fake_llm_latency_p99_ms: float = 4000.0
+    fake_llm_tokens_per_second: float = 80.0  # 출력 속도 (0=지연 없음)
+    fake_llm_failure_rate: float = 0.0  # 일시적 오류(타임아웃) 비율
+    fake_llm_truncation_rate: float = 0.0  # 출력이 중간에 잘리는 비율
+
+    # 피드백 채팅 - 로드맵/대화 기록 컨텍스트의 추정 토큰 예산 (app.ai.feedback_context)
+    feedback_context_token_budget: int = 1500
+
+    # LLM 타임아웃/재시도/서킷 브레이커
+    llm_timeout_seconds: float = 60.0  # 패밀리별 기본값이 없을 때의 요청 타임아웃
+    llm_retry_max_attempts: int = 3  # 일시적 오류(타임아웃, 429, 5xx) 포함 최대 시도 횟수
+    llm_retry_base_delay: float = 0.5
+    llm_retry_max_delay: float = 8.0
+    llm_breaker_failure_threshold: int = 5  # 연속 실패 횟수 도달 시 차단
+    llm_breaker_recovery_seconds: float = 30.0  # 차단 후 시험 호출까지 대기 시간
+
+    # 동일한 LLM 요청이 동시에 들어오면 하나의 호출 결과를 공유
+    llm_singleflight: bool = True
+    # 다른 워커에서 생성 중인 일일 태스크를 기다리는 최대 시간 (초, 넘으면 409)
+    daily_generation_wait_seconds: float = 10.0
+    # 이보다 오래된 GENERATING 상태는 중단된 워커가 남긴 것으로 보고 새 요청이 이어받음 (초)
+    daily_generation_stale_seconds: float = 600.0
+
+    # 다음 주 일일 태스크 미리 생성 (app.services.daily_prefetch_service)
+    daily_prefetch_enabled: bool = False
+    daily_prefetch_progress_threshold: int = 70  # 현재 주 진행률이 이 값(%) 이상이면 미리 생성 (0=끔)
+    daily_prefetch_days_ahead: int = 2  # 다음 주 시작일까지 이 일수 이하면 미리 생성 (0=끔)
+    daily_prefetch_max_concurrent: int = 2  # 전역 동시 미리 생성 수
+    daily_prefetch_per_minute: int = 10  # 전역 분당 미리 생성 시작 수
+
+    # 배치 미리 생성 (app.ai.batch, scripts/run_batch_generation.py)
+    llm_batch_backend: Literal["anthropic", "local"] = "anthropic"
+    llm_batch_local_dir: str = ".batches"  # local 백엔드의 요청/결과 파일 위치
+    llm_batch_poll_seconds: float = 30.0
+    llm_batch_timeout_seconds: float = 86400.0  # Message Batches는 24시간 안에 처리됨
+    llm_batch_days_ahead: int = 7  # 시작일이 이 일수 안인 다음 주를 배치로 미리 생성
+
+    # 기동 직후 백그라운드 warm-up (DB 연결 풀, LLM 클라이언트, LangGraph 컴파일)
+    # 꺼져 있으면 AI 모듈은 첫 사용 시 로드됨 (app.core.warmup)
+    startup_warmup: bool = False
+    startup_warmup_db_connections: int = 2
+
     # URLs
     frontend_url: str = "http://localhost:3000"
 
+    # SSE 스트리밍 - 클라이언트 연결 끊김 처리 정책
+    # cancel: 진행 중인 LLM 호출을 중단하고 저장하지 않음
+    # finish: 백그라운드에서 끝까지 생성하여 저장 (재접속 시 이어보기용)
+    stream_disconnect_policy: Literal["cancel", "finish"] = "cancel"
+    stream_disconnect_poll_seconds: float = 1.0
+
+    # 인터뷰 완료 시 제목/월 목표를 미리 생성 (app.ai.speculative)
+    speculative_generation: bool = False
+    speculative_ttl_seconds: float = 120.0  # 이 시간 안에 /generate-stream이 없으면 폐기
+
+    # 로드맵 생성 동시 실행 제한 (app.ai.admission)
+    generation_max_concurrent: int = 4  # 동시에 실행되는 생성 수 (LLM 스케줄러 워커 수보다 작게)
+    generation_queue_size: int = 20  # 대기열 크기, 가득 차면 503 + Retry-After
+
+    # LLM 호출 스케줄러 (app.ai.scheduler)
+    llm_scheduler_workers: int = 12  # 모든 동기 LLM 호출이 공유하는 워커 스레드 수
+    llm_scheduler_reserved_interactive: int = 2  # 인터뷰/피드백 채팅 전용으로 남겨 둘 워커 수
+    llm_scheduler_aging_seconds: float = 15.0  # 이만큼 기다릴 때마다 우선순위 한 단계 상승 (0=끔)
+
     # Beta limits (베타 기간 제한)
     beta_daily_roadmap_limit: int = 1  # 하루 로드맵 생성 제한 (0=무제한)
 
@@ -55,6 +138,20 @@ class Settings(BaseSettings):
     # Sentry (에러 모니터링)
     sentry_dsn: str = ""  # 프로덕션에서 설정
 
+    # Prometheus 메트릭 (/metrics)과 DB 통계 (/health/db) - 인증 없이 노출되므로 기본 꺼짐
+    # 켤 때는 리버스 프록시에서 외부 접근을 차단하고 내부 수집기만 허용
+    metrics_enabled: bool = False
+
+    # 요청별 SQL 실행 수/시간 (app.db.stats.track_queries) - debug 모드에서는 응답 헤더에도 표시
+    db_query_headers: bool = False  # debug가 아니어도 X-DB-Query-Count/X-DB-Query-Time-Ms 헤더 추가
+    db_repeated_query_threshold: int = 5  # 한 요청에서 같은 형태의 쿼리가 이 횟수 이상이면 N+1 의심 로그 (0=끔)
+
+    # 이벤트 루프 지연 모니터 (app.core.loop_monitor)
+    loop_monitor_enabled: bool = False
+    loop_monitor_interval_seconds: float = 0.1  # 샘플링 주기
+    loop_monitor_threshold_seconds: float = 0.1  # 이 시간 이상 막히면 스택과 라우트를 로그로 남김
+    loop_monitor_stack_depth: int = 12
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
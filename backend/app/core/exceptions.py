@@ -85,6 +85,18 @@ class AIServiceException(AppException):
         )
 
 
+class ServiceBusyException(AppException):
+    """Too many requests in progress; retry after the hinted delay."""
+
+    def __init__(self, retry_after: int, detail: str = "요청이 많아 잠시 후 다시 시도해주세요."):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            error_code="SERVICE_BUSY",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
 class ValidationException(AppException):
     """Validation error exception."""
 
@@ -0,0 +1,129 @@
+"""Per-route HTTP metrics middleware.
+
+라우트 템플릿(/api/v1/roadmaps/{roadmap_id}) 단위로 요청 지연 시간을 기록합니다.
+SSE 응답(text/event-stream)은 스트림 전체 시간이 일반 요청 분포를 왜곡하므로
+별도 히스토그램과 진행 중인 스트림 게이지로 집계합니다.
+
+QueryCountMiddleware는 요청마다 SQL 실행 수/시간을 집계하여 라우트별 분포로 기록하고,
+같은 형태의 쿼리가 반복되면(N+1 의심) 경고 로그를 남깁니다.
+
+순수 ASGI 미들웨어라 응답 본문을 버퍼링하지 않습니다 (스트리밍 응답에 영향 없음).
+"""
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+
+from app.config import settings
+from app.core import metrics
+from app.db.stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+HTTP_REQUEST_SECONDS = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route", "status")
+)
+HTTP_IN_FLIGHT = metrics.gauge("http_requests_in_flight", "HTTP requests currently being handled")
+SSE_STREAMS = metrics.gauge(
+    "http_sse_streams_in_flight", "Open server-sent event streams by route", ("route",)
+)
+SSE_STREAM_SECONDS = metrics.histogram(
+    "http_sse_stream_duration_seconds", "Server-sent event stream duration by route", ("route",),
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
+REQUEST_DB_QUERIES = metrics.histogram(
+    "http_request_db_queries", "SQL statements per request by route", ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100, 200),
+)
+REQUEST_DB_SECONDS = metrics.histogram(
+    "http_request_db_seconds", "Time spent in SQL per request by route", ("route",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+REPEATED_QUERIES = metrics.counter(
+    "http_request_repeated_queries_total",
+    "Requests that repeated one statement shape past the threshold (N+1 suspects)", ("route",),
+)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+# 매칭되는 라우트가 없는 요청 (404 스캔 등) - 경로를 라벨로 쓰면 카디널리티가 폭증함
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route(scope) -> str:
+    route = scope.get("route")  # FastAPI APIRoute가 매칭 시 scope에 기록
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        stream_route = None
+
+        async def send_wrapper(message):
+            nonlocal status, stream_route
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = dict(message.get("headers") or [])
+                if headers.get(b"content-type", b"").startswith(b"text/event-stream"):
+                    stream_route = _route(scope)
+                    SSE_STREAMS.inc(route=stream_route)
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            elapsed = time.perf_counter() - started
+            if stream_route is not None:
+                SSE_STREAMS.dec(route=stream_route)
+                SSE_STREAM_SECONDS.observe(elapsed, route=stream_route)
+            else:
+                HTTP_REQUEST_SECONDS.observe(
+                    elapsed, method=scope["method"], route=_route(scope), status=str(status)
+                )
+
+
+class QueryCountMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_wrapper(message):
+                # 헤더 시점까지의 쿼리만 반영 (스트리밍 본문에서 실행되는 쿼리는 제외)
+                if message["type"] == "http.response.start" and (settings.debug or settings.db_query_headers):
+                    headers = MutableHeaders(scope=message)
+                    headers.append(QUERY_COUNT_HEADER, str(stats.queries))
+                    headers.append(QUERY_TIME_HEADER, f"{stats.seconds * 1000:.1f}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = _route(scope)
+                REQUEST_DB_QUERIES.observe(stats.queries, route=route)
+                REQUEST_DB_SECONDS.observe(stats.seconds, route=route)
+                repeated = stats.repeated(settings.db_repeated_query_threshold)
+                if repeated:
+                    REPEATED_QUERIES.inc(route=route)
+                    shape, count = repeated[0]
+                    logger.warning(
+                        f"[DB] Possible N+1 on {scope['method']} {route}: "
+                        f"{count}x {shape[:300]} ({stats.queries} queries total)"
+                    )
@@ -0,0 +1,166 @@
+"""Event-loop lag monitor (settings.loop_monitor_enabled).
+
+async 엔드포인트 안의 동기 DB 조회, bcrypt 같은 CPU 작업은 그동안 이벤트 루프 전체를 멈춥니다.
+이 모니터는 두 부분으로 동작합니다:
+1. 샘플러 코루틴 - interval마다 잠들었다 깨어난 시각의 지연(lag)을 히스토그램에 기록
+2. 감시 스레드 - 샘플러가 threshold 이상 깨어나지 못하면, 루프가 아직 막혀 있는 동안
+   루프 스레드의 현재 프레임 스택과 실행 중인 태스크의 라우트를 캡처
+
+루프가 풀린 뒤 샘플러가 지연 시간과 캡처한 스택/라우트를 경고 로그로 남깁니다.
+라우트는 RequestTaskMiddleware가 요청 태스크별로 기록한 ASGI scope에서 읽습니다.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+import weakref
+from typing import Optional
+
+from app.config import settings
+from app.core import metrics
+from app.core.http_metrics import _route
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_SECONDS = metrics.histogram(
+    "event_loop_lag_seconds", "Delay between a scheduled wake-up and the loop running it",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+LOOP_BLOCKED = metrics.counter(
+    "event_loop_blocked_total", "Times the loop was blocked longer than the threshold", ("route",)
+)
+
+# 요청을 처리 중인 태스크 → ASGI scope (태스크가 끝나면 자동 삭제)
+_task_scopes: "weakref.WeakKeyDictionary[asyncio.Task, dict]" = weakref.WeakKeyDictionary()
+
+NO_ROUTE = "background"  # 요청과 무관한 태스크 (백그라운드 생성 등)
+UNKNOWN_ROUTE = "unknown"  # 감시 스레드가 캡처하기 전에 풀린 경우
+
+
+class RequestTaskMiddleware:
+    """Remember which request each task is serving, for blocked-loop reports."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            task = asyncio.current_task()
+            if task is not None:
+                _task_scopes[task] = scope
+        await self.app(scope, receive, send)
+
+
+def _task_route(task: Optional[asyncio.Task]) -> str:
+    scope = _task_scopes.get(task) if task is not None else None
+    if scope is None:
+        return NO_ROUTE
+    # 라우팅 전이거나 매칭되지 않은 요청은 unmatched (경로를 라벨로 쓰지 않음)
+    return _route(scope)
+
+
+class LoopLagMonitor:
+    def __init__(
+        self,
+        interval: float = 0.1,
+        threshold: float = 0.1,
+        stack_depth: int = 12,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_depth = stack_depth
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._beat = 0  # 샘플러가 깨어날 때마다 증가
+        self._last_beat = time.monotonic()
+        self._capture: Optional[tuple] = None  # (beat, route, stack)
+
+    @classmethod
+    def from_settings(cls) -> "LoopLagMonitor":
+        return cls(
+            interval=settings.loop_monitor_interval_seconds,
+            threshold=settings.loop_monitor_threshold_seconds,
+            stack_depth=settings.loop_monitor_stack_depth,
+        )
+
+    def start(self) -> None:
+        """Start sampling the running loop (이벤트 루프 안에서 호출)."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stopped.clear()
+        self._last_beat = time.monotonic()
+        self._task = self._loop.create_task(self._sample())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+
+    async def _sample(self) -> None:
+        while True:
+            scheduled = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - scheduled - self.interval)
+            with self._lock:
+                beat = self._beat
+                capture = self._capture if self._capture and self._capture[0] == beat else None
+                self._beat += 1
+                self._last_beat = now
+                self._capture = None
+            LOOP_LAG_SECONDS.observe(lag)
+            if lag >= self.threshold:
+                self._report(lag, capture)
+
+    def _watch(self) -> None:
+        """Watchdog thread: capture the loop thread's stack while it is still blocked."""
+        poll = max(min(self.threshold, self.interval) / 2, 0.005)
+        while not self._stopped.wait(poll):
+            with self._lock:
+                beat = self._beat
+                overdue = time.monotonic() - self._last_beat - self.interval
+                captured = self._capture is not None and self._capture[0] == beat
+            if overdue < self.threshold or captured:
+                continue
+            capture = (beat, self._current_route(), self._loop_stack())
+            with self._lock:
+                if self._beat == beat:  # 그 사이 루프가 풀렸으면 버림
+                    self._capture = capture
+
+    def _current_route(self) -> str:
+        try:
+            return _task_route(asyncio.current_task(self._loop))
+        except RuntimeError:
+            return NO_ROUTE
+
+    def _loop_stack(self) -> str:
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return ""
+        return "".join(traceback.format_stack(frame, limit=self.stack_depth))
+
+    def _report(self, lag: float, capture: Optional[tuple]) -> None:
+        if capture is None:
+            # 감시 스레드가 확인하기 전에 풀린 짧은 블로킹
+            LOOP_BLOCKED.inc(route=UNKNOWN_ROUTE)
+            logger.warning(f"[LoopMonitor] Event loop blocked for {lag * 1000:.0f}ms")
+            return
+        _, route, stack = capture
+        LOOP_BLOCKED.inc(route=route)
+        logger.warning(
+            f"[LoopMonitor] Event loop blocked for {lag * 1000:.0f}ms (route={route})\n{stack}"
+        )
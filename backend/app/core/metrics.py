@@ -0,0 +1,223 @@
+"""Lightweight in-process metrics.
+
+외부 의존성 없이 프로세스 내 카운터/게이지/히스토그램을 기록합니다.
+메트릭은 이름으로 등록되며, 같은 이름으로 다시 요청하면 기존 객체를 반환합니다.
+render_prometheus()는 등록된 전체 메트릭을 Prometheus 텍스트 형식으로 직렬화합니다 (/metrics).
+"""
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple, Type
+
+LabelValues = Tuple[str, ...]
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, description: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+# 초 단위 지연 시간용 기본 버킷 (5ms ~ 60s)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets.
+
+    라벨 조합마다 [버킷별 개수..., +Inf 개수] 리스트와 합계를 저장합니다.
+    value()는 관측 횟수를 반환합니다.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._buckets: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._buckets.get(key)
+            if counts is None:
+                counts = self._buckets[key] = [0] * (len(self.buckets) + 1)
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+            self._values[key] = self._values.get(key, 0.0) + 1
+
+    def sum(self, **labels) -> float:
+        with self._lock:
+            return self._sums.get(self._key(labels), 0.0)
+
+    def snapshot(self) -> Dict[LabelValues, Tuple[List[int], float, float]]:
+        with self._lock:
+            return {
+                key: (list(counts), self._sums[key], self._values[key])
+                for key, counts in self._buckets.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._buckets.clear()
+            self._sums.clear()
+
+
+_registry: Dict[str, _Metric] = {}
+_registry_lock = threading.Lock()
+_collectors: List[Callable[[], None]] = []
+
+
+def _get_or_create(cls: Type[_Metric], name: str, description: str, labelnames: Tuple[str, ...], **kwargs):
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = cls(name, description, labelnames, **kwargs)
+            _registry[name] = metric
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} already registered as {metric.kind}")
+        return metric
+
+
+def counter(name: str, description: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+    return _get_or_create(Counter, name, description, labelnames)
+
+
+def gauge(name: str, description: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+    return _get_or_create(Gauge, name, description, labelnames)
+
+
+def histogram(
+    name: str,
+    description: str,
+    labelnames: Tuple[str, ...] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return _get_or_create(Histogram, name, description, labelnames, buckets=buckets)
+
+
+def register_collector(collect: Callable[[], None]) -> None:
+    """Run collect before each exposition (풀 사용량처럼 조회 시점에 읽는 게이지 갱신용)."""
+    with _registry_lock:
+        if collect not in _collectors:
+            _collectors.append(collect)
+
+
+def get_metric(name: str) -> _Metric:
+    return _registry[name]
+
+
+def all_metrics() -> list:
+    with _registry_lock:
+        return list(_registry.values())
+
+
+# ==================== Prometheus exposition ====================
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus() -> str:
+    """All registered metrics in the Prometheus text exposition format (0.0.4)."""
+    with _registry_lock:
+        collectors = list(_collectors)
+    for collect in collectors:
+        collect()
+
+    lines = []
+    for metric in sorted(all_metrics(), key=lambda m: m.name):
+        lines.append(f"# HELP {metric.name} {_escape(metric.description)}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        if isinstance(metric, Histogram):
+            for key, (counts, total, count) in sorted(metric.snapshot().items()):
+                cumulative = 0
+                for bound, bucket_count in zip(metric.buckets + (math.inf,), counts):
+                    cumulative += bucket_count
+                    labels = _labels(metric.labelnames + ("le",), key + (_number(bound),))
+                    lines.append(f"{metric.name}_bucket{labels} {cumulative}")
+                labels = _labels(metric.labelnames, key)
+                lines.append(f"{metric.name}_sum{labels} {_number(total)}")
+                lines.append(f"{metric.name}_count{labels} {_number(count)}")
+        else:
+            for key, value in sorted(metric.samples().items()):
+                lines.append(f"{metric.name}{_labels(metric.labelnames, key)} {_number(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,69 @@
+"""Optional startup warm-up (settings.startup_warmup).
+
+AI 모듈(langchain, langgraph, anthropic SDK)은 첫 사용 시 import되므로 프로세스 기동은 빠르지만,
+첫 AI 요청이 import/컴파일/클라이언트 생성 비용을 부담합니다. warm-up을 켜면 서버가 뜬 직후
+백그라운드 스레드에서 다음을 미리 수행합니다 (/health 통과를 늦추지 않음):
+1. DB 연결 풀에 연결을 미리 열어 둠
+2. 패밀리별 LLM 클라이언트(ChatAnthropic, HTTP 클라이언트) 생성
+3. LangGraph 워크플로 컴파일
+
+각 단계의 실패는 경고만 남기며, 해당 작업은 첫 요청 시 다시 시도됩니다.
+"""
+import logging
+import time
+
+from sqlalchemy import text
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _open_db_connections(count: int) -> None:
+    from app.db import engine
+
+    connections = []
+    try:
+        for _ in range(count):
+            conn = engine.connect()
+            conn.execute(text("SELECT 1"))
+            connections.append(conn)
+    finally:
+        # 반환된 연결은 풀에 남아 다음 요청이 재사용
+        for conn in connections:
+            conn.close()
+
+
+def _create_llm_clients() -> None:
+    from app.ai.llm import _family_llm
+    from app.ai.prompt_families import PromptFamily, get_family_spec
+
+    for family in PromptFamily:
+        spec = get_family_spec(family)
+        _family_llm(spec, spec.temperature)
+
+
+def _compile_graphs() -> None:
+    from app.ai.interview_graph import get_analysis_graph, get_question_graph
+    from app.ai.roadmap_graph import get_roadmap_graph
+
+    get_roadmap_graph()
+    get_question_graph()
+    get_analysis_graph()
+
+
+def warm_up() -> None:
+    """Run all warm-up steps, logging how long each took."""
+    steps = [
+        ("db pool", lambda: _open_db_connections(settings.startup_warmup_db_connections)),
+        ("llm clients", _create_llm_clients),
+        ("graphs", _compile_graphs),
+    ]
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning(f"[Warmup] {name} failed: {e}")
+            continue
+        logger.info(f"[Warmup] {name} ready in {(time.perf_counter() - start) * 1000:.0f}ms")
@@ -6,6 +6,7 @@ from sqlalchemy.exc import OperationalError
 from typing import Generator
 
 from app.config import settings
+from app.db.stats import TimedQueuePool, install_pool_gauges, install_query_stats
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ else:
     # Session mode에서는 pool_size 제한이 있으므로 보수적으로 설정
     engine = create_engine(
         settings.database_url,
+        poolclass=TimedQueuePool,  # 연결 대기 시간 집계 (app.db.stats)
         pool_pre_ping=True,  # 연결 유효성 검사
         pool_size=5,  # 기본 연결 수 (Supabase free tier 고려)
         max_overflow=5,  # 추가 연결 허용 수
@@ -30,6 +32,9 @@ else:
         pool_recycle=1800,  # 30분마다 연결 재활용
     )
 
+install_query_stats(engine)
+install_pool_gauges(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -0,0 +1,147 @@
+"""Process-wide DB statistics - SQL statement counts and pool checkout waits.
+
+- 쿼리 수/시간: 엔진의 before/after_cursor_execute 이벤트로 집계
+- 풀 대기: TimedQueuePool이 연결을 받을 때까지 걸린 시간을 집계
+  (빈 연결이 없어 기다린 시간과 새 연결을 여는 시간 포함)
+
+/health/db(METRICS_ENABLED=true일 때)로 현재 값을 노출하며, scripts/load_test.py가 실행 전후 값을 비교합니다.
+/metrics에는 히스토그램과 스크레이프 시점의 풀 사용량 게이지로 노출됩니다.
+
+요청 단위 집계는 track_queries()가 contextvar에 QueryStats를 걸어 두면 같은 이벤트 훅이
+함께 기록합니다 (app.core.http_metrics.QueryCountMiddleware, 테스트의 max_queries fixture).
+run_in_threadpool로 실행되는 의존성/동기 엔드포인트도 컨텍스트를 복사하므로 같은 객체에 집계됩니다.
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.core import metrics
+
+DB_QUERY_SECONDS = metrics.histogram(
+    "db_query_duration_seconds", "SQL statement execution time",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+DB_POOL_WAIT_SECONDS = metrics.histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled connection",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CONNECTIONS = metrics.gauge(
+    "db_pool_connections", "Pooled connections at scrape time", ("state",)
+)
+
+
+_PARAMS = re.compile(r"%\(\w+\)s|\?")  # psycopg2 pyformat, sqlite qmark
+_IN_LISTS = re.compile(r"\bIN \(\?(\s*,\s*\?)*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with parameters (and IN lists) normalised, for spotting repeats."""
+    shape = _PARAMS.sub("?", statement)
+    shape = _IN_LISTS.sub("IN (?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """Statements executed inside one track_queries() block."""
+
+    queries: int = 0
+    seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.queries += 1
+        self.seconds += seconds
+        self.shapes[statement] += 1  # 정규화는 repeated()에서 (핫 패스 비용 최소화)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed at least threshold times (N+1 의심), most frequent first."""
+        if threshold <= 0:
+            return []
+        counts: Counter = Counter()
+        for statement, count in self.shapes.items():
+            counts[statement_shape(statement)] += count
+        return [(shape, count) for shape, count in counts.most_common() if count >= threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements executed in the current context until the block exits."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - start)
+
+
+def install_query_stats(engine: Engine) -> None:
+    """Count statements and their execution time on engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop("query_started", None)
+        elapsed = time.perf_counter() - started if started is not None else 0.0
+        DB_QUERY_SECONDS.observe(elapsed)
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+
+def db_stats(engine: Engine) -> dict:
+    """Current counters plus pool occupancy (QueuePool일 때만)."""
+    stats = {
+        "queries": int(DB_QUERY_SECONDS.value()),
+        "query_seconds": round(DB_QUERY_SECONDS.sum(), 4),
+        "pool_checkouts": int(DB_POOL_WAIT_SECONDS.value()),
+        "pool_wait_seconds": round(DB_POOL_WAIT_SECONDS.sum(), 4),
+    }
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        stats["pool"] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    return stats
+
+
+def install_pool_gauges(engine: Engine) -> None:
+    """Publish pool occupancy on every /metrics scrape."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+
+    def collect() -> None:
+        DB_POOL_CONNECTIONS.set(pool.checkedout(), state="checked_out")
+        DB_POOL_CONNECTIONS.set(pool.checkedin(), state="idle")
+        DB_POOL_CONNECTIONS.set(max(pool.overflow(), 0), state="overflow")
+
+    metrics.register_collector(collect)
@@ -1,8 +1,9 @@
+import asyncio
 from contextlib import asynccontextmanager
 import logging
 from fastapi import FastAPI, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.orm import Session
@@ -12,8 +13,17 @@ import sentry_sdk
 
 from app.config import settings
 from app.api.v1.router import api_router
-from app.db import get_db, DatabaseConnectionError
+from app.db import get_db, engine, DatabaseConnectionError
+from app.db.stats import db_stats
+from app.core import metrics
 from app.core.exceptions import AppException
+from app.core.http_metrics import MetricsMiddleware, QueryCountMiddleware
+from app.core.loop_monitor import LoopLagMonitor, RequestTaskMiddleware
+from app.core.warmup import warm_up
+from app.ai.llm import get_family_stats
+from app.ai.prompt_families import PromptFamily, get_family_spec
+from app.ai.resilience import anthropic_breaker
+from app.ai.scheduler import get_llm_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +42,20 @@ if settings.sentry_dsn:
 async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting {settings.app_name}...")
+    warmup_task = None
+    if settings.startup_warmup:
+        # 헬스체크를 늦추지 않도록 백그라운드 스레드에서 실행
+        warmup_task = asyncio.create_task(asyncio.to_thread(warm_up))
+    loop_monitor = None
+    if settings.loop_monitor_enabled:
+        loop_monitor = LoopLagMonitor.from_settings()
+        loop_monitor.start()
     yield
     # Shutdown
+    if warmup_task is not None:
+        warmup_task.cancel()
+    if loop_monitor is not None:
+        await loop_monitor.stop()
     logger.info(f"Shutting down {settings.app_name}...")
 
 
@@ -59,6 +81,17 @@ app.add_middleware(
     ],
 )
 
+# 요청별 SQL 실행 수/시간 집계와 N+1 의심 로그 (debug 모드에서는 응답 헤더로도 표시)
+app.add_middleware(QueryCountMiddleware)
+
+# 라우트별 지연 시간/진행 중인 SSE 스트림 집계 (가장 바깥에서 전체 처리 시간 측정)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+# 루프를 막은 태스크가 처리 중이던 요청을 알 수 있도록 기록
+if settings.loop_monitor_enabled:
+    app.add_middleware(RequestTaskMiddleware)
+
 
 @app.get("/")
 async def root():
@@ -83,6 +116,32 @@ async def health_check(db: Session = Depends(get_db)):
     }
 
 
+@app.get("/health/llm")
+async def llm_health():
+    """프롬프트 패밀리별 LLM 호출 수, 파싱 실패율, 복구 재시도율, 사용 모델과 서킷 브레이커 상태,
+    우선순위 클래스별 스케줄러 대기열."""
+    return {
+        "backend": settings.llm_backend,
+        "structured_output": settings.llm_structured_output,
+        "circuit": anthropic_breaker.state,
+        "scheduler": get_llm_scheduler().stats(),
+        "families": get_family_stats(),
+        "models": {family.value: get_family_spec(family).model for family in PromptFamily},
+    }
+
+
+if settings.metrics_enabled:
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics():
+        """Prometheus 스크레이프용 전체 메트릭 (요청, DB, LLM, 스케줄러)."""
+        return Response(metrics.render_prometheus(), media_type=metrics.PROMETHEUS_CONTENT_TYPE)
+
+    @app.get("/health/db", include_in_schema=False)
+    async def db_health():
+        """누적 SQL 실행 수/시간, 연결 풀 대기 시간과 현재 풀 사용량."""
+        return db_stats(engine)
+
+
 # API v1 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
@@ -132,6 +191,7 @@ async def app_exception_handler(request: Request, exc: AppException):
                 "message": exc.detail,
             },
         },
+        headers=exc.headers,
     )
 
 
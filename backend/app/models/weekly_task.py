@@ -1,6 +1,6 @@
 import uuid
 import enum
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -37,6 +37,8 @@ class WeeklyTask(Base, TimestampMixin):
         default=DailyGenerationStatus.NONE,
         nullable=False
     )
+    # GENERATING으로 바꾼 시각 (오래된 GENERATING은 중단된 워커가 남긴 것으로 보고 이어받음)
+    daily_generation_started_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     monthly_goal = relationship("MonthlyGoal", back_populates="weekly_tasks")
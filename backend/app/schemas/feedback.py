@@ -55,6 +55,11 @@ class FeedbackMessageRequest(BaseModel):
     message: str = Field(..., min_length=1, max_length=2000)
 
 
+class FeedbackRegenerateRequest(BaseModel):
+    """주간 과제 부분 재생성 요청."""
+    month_numbers: Optional[List[int]] = None  # 비어 있으면 세션의 stale 월 전체
+
+
 class FeedbackFinalizeRequest(BaseModel):
     """로드맵 확정 요청."""
     roadmap_data: RoadmapPreviewData
@@ -72,6 +77,7 @@ class FeedbackMessageResponse(BaseModel):
     response: str  # AI 응답 메시지
     modifications: Optional[RoadmapModifications] = None
     updated_roadmap: RoadmapPreviewData
+    stale_months: List[int] = []  # 월 목표가 바뀌어 주간 과제 재생성이 필요한 월
 
 
 class FeedbackFinalizeResponse(BaseModel):
@@ -0,0 +1,319 @@
+"""Offline batch pre-generation of daily tasks and review questions.
+
+미리 생성은 지연 시간이 중요하지 않으므로, 대기 중인 작업을 모아 배치 API(app.ai.batch)로
+한 번에 제출해 비용과 처리량을 줄입니다. scripts/run_batch_generation.py에서 주기적으로 실행합니다.
+
+수집 대상:
+- 일일 태스크: 활성 로드맵에서 오늘이 속한 주(생성 완료)의 다음 주 중
+  시작일이 오늘부터 llm_batch_days_ahead일 안이거나 현재 주 진행률이 미리 생성 기준 이상인 주
+- 복습 문제: 진행률 100%인 LEARNING 주차 중 오답이 있고 복습이 아직 생성되지 않은 주
+
+LEARNING 모드는 커리큘럼 결과로 일자별 문제 프롬프트를 만들므로 두 번의 배치로 나눕니다
+(1차: PLANNING 일일 태스크 + LEARNING 커리큘럼 + 복습, 2차: LEARNING 일자별 문제).
+결과를 저장하기 직전에 상태를 다시 확인하여, 그 사이 사용자 요청으로 생성된 주는 건너뜁니다.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.ai.batch import BatchBackend, BatchRequest, BatchResult, get_batch_backend, run_batch
+from app.ai.llm import build_batch_params, parse_batch_text
+from app.ai.output_schemas import (
+    CurriculumOutput,
+    DailyTasksOutput,
+    QuestionsOutput,
+    ReviewQuestionsOutput,
+)
+from app.ai.prompt_families import PromptFamily
+from app.ai.prompts.templates import build_interview_section
+from app.config import settings
+from app.core import metrics
+from app.models import DailyGenerationStatus, DailyTask, MonthlyGoal, Roadmap, RoadmapMode, WeeklyTask
+from app.models.roadmap import RoadmapStatus
+from app.services.daily_generation_service import DailyGenerationService
+from app.services.daily_prefetch_service import calendar_next_week, prefetch_reason
+from app.services.learning_service import LearningService
+from app.services.unified_view_service import UnifiedViewService
+
+logger = logging.getLogger(__name__)
+
+BATCH_GENERATIONS = metrics.counter(
+    "batch_generation_total",
+    "Batch pre-generation jobs by kind and outcome",
+    ("kind", "outcome"),  # kind: daily / review, outcome: saved / skipped / failed
+)
+
+
+@dataclass
+class _WeekJob:
+    weekly_task: WeeklyTask
+    roadmap: Roadmap
+    interview_section: str = ""
+    # LEARNING 2차 배치용 (일차 → day_info)
+    day_infos: Dict[int, dict] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return self.weekly_task.id.hex
+
+
+@dataclass
+class _ReviewJob:
+    weekly_task: WeeklyTask
+    wrong_questions: List[dict]
+
+    @property
+    def key(self) -> str:
+        return self.weekly_task.id.hex
+
+
+class BatchGenerationService:
+    """Collects pending generation jobs, runs them as batches and saves the results."""
+
+    def __init__(self, db: Session, backend: Optional[BatchBackend] = None):
+        self.db = db
+        self._backend = backend
+        self.daily = DailyGenerationService(db)
+        self.learning = LearningService(db)
+
+    @property
+    def backend(self) -> BatchBackend:
+        # 수집만 할 때(pending_job_counts)는 백엔드를 만들지 않음
+        if self._backend is None:
+            self._backend = get_batch_backend()
+        return self._backend
+
+    # ==================== Collection ====================
+
+    def collect_daily_jobs(self, limit: int, today: Optional[date] = None) -> List[_WeekJob]:
+        """Next weeks of active roadmaps that should be ready soon.
+
+        오늘이 속한 주가 생성되어 있을 때 그다음 주만 대상으로 합니다 (방치된 로드맵은
+        실행할 때마다 한 주씩 더 생성되지 않음). 진행 중인 로드맵을 limit개씩 나눠 조회하고
+        작업이 limit개 모이면 멈춥니다.
+        """
+        today = today or date.today()
+        calendar = UnifiedViewService(self.db)
+        jobs: List[_WeekJob] = []
+        offset = 0
+        while len(jobs) < limit:
+            roadmaps = (
+                self.db.query(Roadmap)
+                .options(joinedload(Roadmap.monthly_goals).joinedload(MonthlyGoal.weekly_tasks))
+                .filter(
+                    Roadmap.status == RoadmapStatus.ACTIVE,
+                    Roadmap.start_date <= today,
+                    Roadmap.end_date >= today,
+                )
+                .order_by(Roadmap.start_date, Roadmap.id)
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
+            if not roadmaps:
+                break
+            offset += len(roadmaps)
+
+            candidates = []
+            for roadmap in roadmaps:
+                found = calendar_next_week(roadmap, today, calendar)
+                if found is None:
+                    continue
+                current, next_week, next_start = found
+                if next_week.daily_generation_status != DailyGenerationStatus.NONE:
+                    continue
+                if prefetch_reason(current.progress, next_start, today, days_ahead=settings.llm_batch_days_ahead):
+                    candidates.append((roadmap, current, next_week))
+            if not candidates:
+                continue
+
+            week_ids = [week.id for _, current, next_week in candidates for week in (current, next_week)]
+            generated = {
+                row[0]
+                for row in self.db.query(DailyTask.weekly_task_id)
+                .filter(DailyTask.weekly_task_id.in_(week_ids))
+                .distinct()
+            }
+            for roadmap, current, next_week in candidates:
+                if current.id in generated and next_week.id not in generated:
+                    jobs.append(_WeekJob(next_week, roadmap, build_interview_section({})))
+                    if len(jobs) >= limit:
+                        break
+        return jobs
+
+    def collect_review_jobs(self, limit: int) -> List[_ReviewJob]:
+        """Completed LEARNING weeks with wrong answers and no review yet."""
+        weeks = (
+            self.db.query(WeeklyTask)
+            .options(joinedload(WeeklyTask.monthly_goal).joinedload(MonthlyGoal.roadmap))
+            .join(MonthlyGoal)
+            .join(Roadmap)
+            .filter(
+                Roadmap.mode == RoadmapMode.LEARNING,
+                Roadmap.status == RoadmapStatus.ACTIVE,
+                WeeklyTask.review_generated.is_(False),
+                WeeklyTask.progress == 100,
+            )
+            .limit(limit)
+            .all()
+        )
+        jobs = []
+        for week in weeks:
+            wrong = self.learning.get_wrong_questions(week.id, week.monthly_goal.roadmap.user_id)
+            if wrong:
+                jobs.append(_ReviewJob(week, wrong))
+        return jobs
+
+    # ==================== Batch Run ====================
+
+    def run(
+        self,
+        limit: int = 50,
+        poll_interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """Collect, submit, poll and ingest. Returns counts per outcome."""
+        daily_jobs = self.collect_daily_jobs(limit)
+        review_jobs = self.collect_review_jobs(limit)
+        summary = {"daily_saved": 0, "review_saved": 0, "skipped": 0, "failed": 0}
+        if not daily_jobs and not review_jobs:
+            return summary
+
+        planning = [job for job in daily_jobs if job.roadmap.mode != RoadmapMode.LEARNING]
+        learning = [job for job in daily_jobs if job.roadmap.mode == RoadmapMode.LEARNING]
+
+        # 1차 배치: PLANNING 일일 태스크, LEARNING 커리큘럼, 복습 문제
+        requests = [
+            BatchRequest(f"daily-{job.key}", build_batch_params(
+                self.daily._planning_prompt(job.weekly_task, job.roadmap, job.interview_section),
+                PromptFamily.DAILY, schema=DailyTasksOutput,
+            ))
+            for job in planning
+        ] + [
+            BatchRequest(f"curriculum-{job.key}", build_batch_params(
+                self.daily._curriculum_prompt(job.weekly_task, job.roadmap, job.interview_section),
+                PromptFamily.CURRICULUM, schema=CurriculumOutput,
+            ))
+            for job in learning
+        ] + [
+            BatchRequest(f"review-{job.key}", build_batch_params(
+                self.learning._review_prompt(self.learning._build_wrong_list(job.wrong_questions)),
+                PromptFamily.QUESTIONS, schema=ReviewQuestionsOutput,
+            ))
+            for job in review_jobs
+        ]
+        results = run_batch(self.backend, requests, poll_interval, timeout)
+
+        for job in planning:
+            data = self._parse(results, f"daily-{job.key}", PromptFamily.DAILY, DailyTasksOutput)
+            days = data.get("days") if data else None
+            self._count(summary, "daily", self._ingest_days(job.weekly_task, days) if days else "failed")
+
+        for job in review_jobs:
+            data = self._parse(results, f"review-{job.key}", PromptFamily.QUESTIONS, ReviewQuestionsOutput)
+            self._count(summary, "review", self._ingest_review(job, data) if data else "failed")
+
+        # 2차 배치: 커리큘럼이 성공한 LEARNING 주의 일자별 문제
+        question_requests = []
+        ready = []
+        for job in learning:
+            data = self._parse(results, f"curriculum-{job.key}", PromptFamily.CURRICULUM, CurriculumOutput)
+            try:
+                curriculum = self.daily._validate_curriculum(data or {})
+            except ValueError:
+                self._count(summary, "daily", "failed")
+                continue
+            for day_number in range(1, 8):
+                prompt, job.day_infos[day_number] = self.daily._day_questions_prompt(
+                    job.weekly_task, job.roadmap, day_number, job.interview_section, curriculum[day_number - 1]
+                )
+                question_requests.append(BatchRequest(
+                    f"questions-{job.key}-{day_number}",
+                    build_batch_params(prompt, PromptFamily.QUESTIONS, schema=QuestionsOutput),
+                ))
+            ready.append(job)
+        results = run_batch(self.backend, question_requests, poll_interval, timeout)
+
+        for job in ready:
+            days = []
+            for day_number, day_info in sorted(job.day_infos.items()):
+                data = self._parse(
+                    results, f"questions-{job.key}-{day_number}", PromptFamily.QUESTIONS, QuestionsOutput
+                )
+                # 일자별 실패는 온라인 생성과 같이 기본 문제로 대체
+                days.append(
+                    self.daily._day_with_questions(day_info, data.get("questions", []))
+                    if data else self.daily._fallback_day_questions(day_info)
+                )
+            self._count(summary, "daily", self._ingest_days(job.weekly_task, days))
+
+        logger.info(f"[Batch] Generation finished: {summary}")
+        return summary
+
+    # ==================== Ingestion ====================
+
+    def _parse(
+        self, results: Dict[str, BatchResult], custom_id: str, family: PromptFamily, schema
+    ) -> Optional[dict]:
+        result = results.get(custom_id)
+        if result is None or not result.succeeded:
+            logger.warning(f"[Batch] {custom_id} failed: {result.error if result else 'missing'}")
+            return None
+        try:
+            return parse_batch_text(result.text, family, schema)
+        except ValueError:
+            return None
+
+    def _ingest_days(self, weekly_task: WeeklyTask, days: List[dict]) -> str:
+        """Save generated days unless the week was generated in the meantime."""
+        self.db.refresh(weekly_task)
+        if (
+            weekly_task.daily_generation_status != DailyGenerationStatus.NONE
+            or self.daily.has_daily_tasks(weekly_task.id)
+        ):
+            return "skipped"
+
+        # 저장 중 사용자 요청이 새로 생성하지 않도록 먼저 GENERATING으로 표시
+        weekly_task.daily_generation_status = DailyGenerationStatus.GENERATING
+        weekly_task.daily_generation_started_at = datetime.now(timezone.utc)
+        self.db.commit()
+        try:
+            self.daily._save_daily_tasks(weekly_task.id, days)
+            weekly_task.daily_generation_status = DailyGenerationStatus.COMPLETED
+            self.db.commit()
+        except Exception as e:
+            logger.warning(f"[Batch] Failed to save week {weekly_task.id}: {e}")
+            self.db.rollback()
+            weekly_task.daily_generation_status = DailyGenerationStatus.NONE
+            self.db.commit()
+            return "failed"
+        return "saved"
+
+    def _ingest_review(self, job: _ReviewJob, review_data: dict) -> str:
+        """Save the review session unless it was generated in the meantime."""
+        self.db.refresh(job.weekly_task)
+        if job.weekly_task.review_generated:
+            return "skipped"
+        try:
+            self.learning._save_review_session(job.weekly_task, job.wrong_questions, review_data)
+        except Exception as e:
+            # 잘못된 문제 형식 등 - 한 주의 실패가 나머지 저장을 막지 않도록
+            logger.warning(f"[Batch] Failed to save review for week {job.weekly_task.id}: {e}")
+            self.db.rollback()
+            return "failed"
+        return "saved"
+
+    @staticmethod
+    def _count(summary: Dict[str, int], kind: str, outcome: str) -> None:
+        BATCH_GENERATIONS.inc(kind=kind, outcome=outcome)
+        key = f"{kind}_saved" if outcome == "saved" else outcome
+        summary[key] += 1
+
+
+def pending_job_counts(db: Session, limit: int) -> Tuple[int, int]:
+    """(일일 태스크 작업 수, 복습 작업 수) - 배치를 제출하지 않고 확인만 할 때."""
+    service = BatchGenerationService(db, backend=None)
+    return len(service.collect_daily_jobs(limit)), len(service.collect_review_jobs(limit))
@@ -1,13 +1,20 @@
 """Service for generating daily tasks for a specific week (lazy generation)."""
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException, status
 from uuid import UUID
 
+from app.config import settings
 from app.models import Roadmap, MonthlyGoal, WeeklyTask, DailyGoal, DailyTask, RoadmapMode, DailyGenerationStatus
 from app.models.question import Question, QuestionType
-from app.ai.llm import invoke_llm_json
+from app.ai.llm import invoke_llm_json, record_fallback
+from app.ai.output_schemas import CurriculumOutput, DailyTasksOutput, QuestionsOutput
+from app.ai.prompt_families import PromptFamily
+from app.ai.scheduler import LLMPriority, get_llm_scheduler, llm_executor
 from app.ai.prompts.templates import SINGLE_WEEK_DAILY_TASKS_PROMPT, build_interview_section
 from app.ai.prompts.learning_templates import (
     LEARNING_DAILY_CURRICULUM_PROMPT,
@@ -19,7 +26,13 @@ from app.ai.prompts.learning_templates import (
 )
 
 
-_executor = ThreadPoolExecutor(max_workers=2)
+logger = logging.getLogger(__name__)
+
+# 진행 중인 일일 태스크 생성 (weekly_task_id → 완료 시 에러 또는 None)
+# 같은 주차에 대한 중복 요청은 409 대신 진행 중인 생성에 합류합니다.
+_inflight_generations: dict[UUID, asyncio.Future] = {}
+# 진행 중인 생성의 LLM 스케줄러 작업 (더 높은 우선순위의 요청이 합류하면 끌어올림)
+_inflight_jobs: dict[UUID, Future] = {}
 
 
 class DailyGenerationService:
@@ -162,8 +175,21 @@ class DailyGenerationService:
     ) -> list[dict]:
         """Generate PLANNING mode daily tasks (checklist-style)."""
         interview_section = build_interview_section(interview_context or {})
+        prompt = self._planning_prompt(weekly_task, roadmap, interview_section)
 
-        prompt = SINGLE_WEEK_DAILY_TASKS_PROMPT.format(
+        try:
+            result = invoke_llm_json(
+                prompt,
+                family=PromptFamily.DAILY, schema=DailyTasksOutput,
+            )
+            return result.get("days", [])
+        except Exception:
+            record_fallback(PromptFamily.DAILY)
+            return self._fallback_planning_days(weekly_task)
+
+    def _planning_prompt(self, weekly_task: WeeklyTask, roadmap: Roadmap, interview_section: str):
+        """PLANNING 모드 일일 태스크 프롬프트 (배치 생성과 공유)."""
+        return SINGLE_WEEK_DAILY_TASKS_PROMPT.format(
             topic=roadmap.topic,
             interview_section=interview_section,
             week_title=weekly_task.title,
@@ -172,27 +198,24 @@ class DailyGenerationService:
             week_number=weekly_task.week_number,
         )
 
-        try:
-            result = invoke_llm_json(prompt, temperature=0.7)
-            return result.get("days", [])
-        except Exception:
-            # Fallback: generate basic daily tasks
-            return [
-                {
-                    "day_number": d + 1,
-                    "goal": {
-                        "title": f"{d + 1}일차 학습",
-                        "description": f"{weekly_task.title} 관련 학습"
-                    },
-                    "tasks": [
-                        {"title": "이론 학습", "description": f"{weekly_task.title} 개념 학습"},
-                        {"title": "실습", "description": f"{weekly_task.title} 실습 과제"},
-                    ] if d < 5 else [
-                        {"title": "복습", "description": "이번 주 학습 내용 복습"},
-                    ]
-                }
-                for d in range(7)
-            ]
+    def _fallback_planning_days(self, weekly_task: WeeklyTask) -> list[dict]:
+        """Fallback: generate basic daily tasks."""
+        return [
+            {
+                "day_number": d + 1,
+                "goal": {
+                    "title": f"{d + 1}일차 학습",
+                    "description": f"{weekly_task.title} 관련 학습"
+                },
+                "tasks": [
+                    {"title": "이론 학습", "description": f"{weekly_task.title} 개념 학습"},
+                    {"title": "실습", "description": f"{weekly_task.title} 실습 과제"},
+                ] if d < 5 else [
+                    {"title": "복습", "description": "이번 주 학습 내용 복습"},
+                ]
+            }
+            for d in range(7)
+        ]
 
     def _generate_learning_days_sync(
         self,
@@ -243,7 +266,15 @@ class DailyGenerationService:
         주간 학습 목표를 각 일자별로 구체적인 학습 주제로 분해합니다.
         예: "토익 기초 문법" → Day1: "8품사 개념", Day2: "시제 기초", ...
         """
-        prompt = LEARNING_DAILY_CURRICULUM_PROMPT.format(
+        result = invoke_llm_json(
+            self._curriculum_prompt(weekly_task, roadmap, interview_section),
+            family=PromptFamily.CURRICULUM, schema=CurriculumOutput,
+        )
+        return self._validate_curriculum(result)
+
+    def _curriculum_prompt(self, weekly_task: WeeklyTask, roadmap: Roadmap, interview_section: str):
+        """LEARNING 모드 주간 커리큘럼 프롬프트 (배치 생성과 공유)."""
+        return LEARNING_DAILY_CURRICULUM_PROMPT.format(
             topic=roadmap.topic,
             month_number=weekly_task.monthly_goal.month_number,
             week_number=weekly_task.week_number,
@@ -253,7 +284,7 @@ class DailyGenerationService:
             interview_section=interview_section,
         )
 
-        result = invoke_llm_json(prompt, temperature=0.7)
+    def _validate_curriculum(self, result: dict) -> list[dict]:
         curriculum = result.get("daily_curriculum", [])
 
         # 검증: 7일치가 있는지 확인
@@ -281,6 +312,33 @@ class DailyGenerationService:
             interview_section: 인터뷰 정보 섹션
             day_curriculum: 해당 일자의 구체적인 커리큘럼 (2단계 생성에서 전달)
         """
+        prompt, day_info = self._day_questions_prompt(
+            weekly_task, roadmap, day_number, interview_section, day_curriculum
+        )
+
+        try:
+            result = invoke_llm_json(
+                prompt,
+                family=PromptFamily.QUESTIONS, schema=QuestionsOutput,
+            )
+            return self._day_with_questions(day_info, result.get("questions", []))
+        except Exception:
+            record_fallback(PromptFamily.QUESTIONS)
+            return self._fallback_day_questions(day_info)
+
+    def _day_questions_prompt(
+        self,
+        weekly_task: WeeklyTask,
+        roadmap: Roadmap,
+        day_number: int,
+        interview_section: str,
+        day_curriculum: dict | None = None,
+    ) -> tuple:
+        """일자별 문제 프롬프트와 일일 정보 (배치 생성과 공유).
+
+        Returns:
+            (prompt, day_info) - day_info는 _day_with_questions/_fallback_day_questions에 전달
+        """
         # Calculate intensity based on topic and duration
         base_intensity, base_question_count = calculate_intensity(
             roadmap.topic, roadmap.duration_months
@@ -324,60 +382,69 @@ class DailyGenerationService:
             daily_focus=daily_focus,
             daily_difficulty=daily_difficulty,
         )
-
-        try:
-            result = invoke_llm_json(prompt, temperature=0.7)
-            questions = result.get("questions", [])
-
-            return {
-                "day_number": day_number,
-                "goal": {
-                    "title": daily_title,
-                    "description": daily_description,
-                },
-                "tasks": [],  # No traditional tasks in LEARNING mode
-                "questions": questions,  # Questions instead
-                # 커리큘럼 정보도 함께 저장 (디버깅/로깅용)
-                "_curriculum": {
-                    "topic": daily_topic,
-                    "focus": daily_focus,
-                    "difficulty": daily_difficulty,
-                }
+        day_info = {
+            "day_number": day_number,
+            "title": daily_title,
+            "description": daily_description,
+            "topic": daily_topic,
+            "focus": daily_focus,
+            "difficulty": daily_difficulty,
+        }
+        return prompt, day_info
+
+    def _day_with_questions(self, day_info: dict, questions: list) -> dict:
+        return {
+            "day_number": day_info["day_number"],
+            "goal": {
+                "title": day_info["title"],
+                "description": day_info["description"],
+            },
+            "tasks": [],  # No traditional tasks in LEARNING mode
+            "questions": questions,  # Questions instead
+            # 커리큘럼 정보도 함께 저장 (디버깅/로깅용)
+            "_curriculum": {
+                "topic": day_info["topic"],
+                "focus": day_info["focus"],
+                "difficulty": day_info["difficulty"],
             }
-        except Exception:
-            # Fallback: generate basic questions based on curriculum
-            return {
-                "day_number": day_number,
-                "goal": {
-                    "title": daily_title,
-                    "description": daily_description,
+        }
+
+    def _fallback_day_questions(self, day_info: dict) -> dict:
+        """Fallback: generate basic questions based on curriculum."""
+        daily_topic = day_info["topic"]
+        daily_focus = day_info["focus"]
+        return {
+            "day_number": day_info["day_number"],
+            "goal": {
+                "title": day_info["title"],
+                "description": day_info["description"],
+            },
+            "tasks": [],
+            "questions": [
+                {
+                    "question_type": "MULTIPLE_CHOICE",
+                    "question_text": f"[{daily_topic}] 다음 중 올바른 설명은 무엇인가요?",
+                    "choices": ["선택지 A", "선택지 B", "선택지 C", "선택지 D"],
+                    "correct_answer": "0",
+                    "hint": f"{daily_topic}의 기본 개념을 떠올려보세요.",
+                    "explanation": "정답 해설입니다.",
                 },
-                "tasks": [],
-                "questions": [
-                    {
-                        "question_type": "MULTIPLE_CHOICE",
-                        "question_text": f"[{daily_topic}] 다음 중 올바른 설명은 무엇인가요?",
-                        "choices": ["선택지 A", "선택지 B", "선택지 C", "선택지 D"],
-                        "correct_answer": "0",
-                        "hint": f"{daily_topic}의 기본 개념을 떠올려보세요.",
-                        "explanation": "정답 해설입니다.",
-                    },
-                    {
-                        "question_type": "SHORT_ANSWER",
-                        "question_text": f"[{daily_topic}] 오늘 배운 핵심 용어를 작성하세요.",
-                        "correct_answer": "핵심 용어",
-                        "hint": f"{daily_focus}와 관련된 중요한 용어입니다.",
-                        "explanation": "해당 용어는 학습 내용의 핵심입니다.",
-                    },
-                    {
-                        "question_type": "ESSAY",
-                        "question_text": f"[{daily_topic}] 오늘 배운 내용의 주요 개념을 설명하세요.",
-                        "correct_answer": "주요 개념에 대한 설명으로 핵심 키워드들이 포함되어야 합니다.",
-                        "hint": f"핵심 포인트: {daily_focus}",
-                        "explanation": "개념 이해도를 확인하는 문제입니다.",
-                    },
-                ],
-            }
+                {
+                    "question_type": "SHORT_ANSWER",
+                    "question_text": f"[{daily_topic}] 오늘 배운 핵심 용어를 작성하세요.",
+                    "correct_answer": "핵심 용어",
+                    "hint": f"{daily_focus}와 관련된 중요한 용어입니다.",
+                    "explanation": "해당 용어는 학습 내용의 핵심입니다.",
+                },
+                {
+                    "question_type": "ESSAY",
+                    "question_text": f"[{daily_topic}] 오늘 배운 내용의 주요 개념을 설명하세요.",
+                    "correct_answer": "주요 개념에 대한 설명으로 핵심 키워드들이 포함되어야 합니다.",
+                    "hint": f"핵심 포인트: {daily_focus}",
+                    "explanation": "개념 이해도를 확인하는 문제입니다.",
+                },
+            ],
+        }
 
     def _save_daily_tasks(self, weekly_task_id: UUID, days: list[dict]):
         """Save generated daily tasks to database.
@@ -445,26 +512,30 @@ class DailyGenerationService:
         user_id: UUID,
         force: bool = False,
         interview_context: dict | None = None,
+        priority: LLMPriority = LLMPriority.GENERATION,
     ) -> WeeklyTask:
         """Generate daily tasks for a specific week.
 
+        같은 주차의 생성이 이미 진행 중이면 새로 생성하지 않고 그 결과를 기다려 반환합니다
+        (더블 클릭, 토글 자동 생성과의 경합 등).
+
         Args:
             weekly_task_id: The weekly task ID
             user_id: The user ID for ownership verification
             force: If True, skip previous week completion check
             interview_context: Optional interview context for personalization
+            priority: LLM scheduler class (미리 생성은 BACKGROUND)
 
         Returns:
             The updated weekly task with daily tasks
         """
         weekly_task, roadmap = self.get_weekly_task_with_context(weekly_task_id, user_id)
 
-        # Check generation status (중복 생성 방지)
+        # 이미 생성 중이면 진행 중인 생성에 합류하여 같은 결과를 반환
         if weekly_task.daily_generation_status == DailyGenerationStatus.GENERATING:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="이미 일일 태스크를 생성 중입니다. 잠시 후 다시 시도해주세요.",
-            )
+            if await self._wait_for_inflight_generation(weekly_task, priority):
+                return weekly_task
+            # 앞선 생성이 실패하여 상태가 초기화된 경우 이어서 직접 생성
 
         if weekly_task.daily_generation_status == DailyGenerationStatus.COMPLETED:
             raise HTTPException(
@@ -486,20 +557,26 @@ class DailyGenerationService:
                 detail="이전 주차를 먼저 완료해야 합니다.",
             )
 
-        # Set status to GENERATING (중복 요청 방지)
+        # Set status to GENERATING (다른 워커의 중복 요청 방지)
+        # await 없이 등록하므로 같은 프로세스의 중복 요청은 반드시 이 future에 합류함
+        loop = asyncio.get_event_loop()
+        inflight = loop.create_future()
+        _inflight_generations[weekly_task_id] = inflight
         weekly_task.daily_generation_status = DailyGenerationStatus.GENERATING
+        weekly_task.daily_generation_started_at = datetime.now(timezone.utc)
         self.db.commit()
 
+        error = None
         try:
             # Generate daily tasks in thread pool
-            loop = asyncio.get_event_loop()
-            days = await loop.run_in_executor(
-                _executor,
+            job = llm_executor(priority, user_id).submit(
                 self._generate_daily_tasks_sync,
                 weekly_task,
                 roadmap,
                 interview_context,
             )
+            _inflight_jobs[weekly_task_id] = job
+            days = await asyncio.wrap_future(job)
 
             # Save to database
             self._save_daily_tasks(weekly_task_id, days)
@@ -508,16 +585,105 @@ class DailyGenerationService:
             weekly_task.daily_generation_status = DailyGenerationStatus.COMPLETED
             self.db.commit()
 
-        except Exception as e:
-            # 에러 발생 시 상태 롤백
+        except BaseException as e:
+            # 에러(요청 취소 포함) 발생 시 상태 롤백
+            error = e
             weekly_task.daily_generation_status = DailyGenerationStatus.NONE
             self.db.commit()
             raise e
+        finally:
+            _inflight_generations.pop(weekly_task_id, None)
+            _inflight_jobs.pop(weekly_task_id, None)
+            inflight.set_result(error)
 
         # Refresh and return
         self.db.refresh(weekly_task)
         return weekly_task
 
+    async def _wait_for_inflight_generation(
+        self, weekly_task: WeeklyTask, priority: LLMPriority = LLMPriority.GENERATION
+    ) -> bool:
+        """Wait for a generation already running for this week.
+
+        같은 프로세스의 생성은 future를 기다리고, 다른 워커의 생성은 DB 상태를 폴링합니다.
+        앞선 생성이 미리 생성(BACKGROUND)이라 아직 대기열에 있으면 합류한 요청의 우선순위로
+        끌어올려, 사용자 요청이 다른 백그라운드 작업 뒤에서 기다리지 않게 합니다.
+
+        Returns:
+            True면 생성 완료 (weekly_task 갱신됨), False면 앞선 생성이 실패하여 상태가 초기화됨
+        """
+        inflight = _inflight_generations.get(weekly_task.id)
+        if inflight is not None:
+            logger.info(f"[DailyGen] Joining in-flight generation for week {weekly_task.id}")
+            job = _inflight_jobs.get(weekly_task.id)
+            if job is not None and get_llm_scheduler().promote(job, priority):
+                logger.info(f"[DailyGen] Raised queued generation for week {weekly_task.id} to {priority.label}")
+            # shield: 합류한 요청이 취소되어도 리더의 생성은 계속됨
+            error = await asyncio.shield(inflight)
+            if isinstance(error, HTTPException):
+                raise error
+            self.db.refresh(weekly_task)
+            if error is not None or weekly_task.daily_generation_status != DailyGenerationStatus.COMPLETED:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="일일 태스크 생성에 실패했습니다. 잠시 후 다시 시도해주세요.",
+                )
+            return True
+
+        # 중단된 워커가 남긴 상태면 이어서 직접 생성
+        if self._take_over_stale_generation(weekly_task):
+            return False
+
+        # 다른 워커에서 생성 중: 상태가 바뀔 때까지 잠시 대기 (넘으면 409)
+        deadline = time.monotonic() + settings.daily_generation_wait_seconds
+        while weekly_task.daily_generation_status == DailyGenerationStatus.GENERATING:
+            if time.monotonic() >= deadline:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="이미 일일 태스크를 생성 중입니다. 잠시 후 다시 시도해주세요.",
+                )
+            self.db.commit()  # 대기하는 동안 커넥션을 풀에 반환
+            await asyncio.sleep(1.0)
+            self.db.refresh(weekly_task)
+
+        return weekly_task.daily_generation_status == DailyGenerationStatus.COMPLETED
+
+    def _take_over_stale_generation(self, weekly_task: WeeklyTask) -> bool:
+        """Reset a GENERATING status older than daily_generation_stale_seconds.
+
+        여러 요청이 동시에 발견해도 조건부 UPDATE로 하나만 이어받습니다.
+
+        Returns:
+            True면 상태를 NONE으로 되돌림 (호출 측이 직접 생성)
+        """
+        started = weekly_task.daily_generation_started_at
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=settings.daily_generation_stale_seconds)
+        if started is not None and started > stale_before:
+            return False
+
+        same_run = (
+            WeeklyTask.daily_generation_started_at.is_(None)
+            if started is None
+            else WeeklyTask.daily_generation_started_at == started
+        )
+        taken = (
+            self.db.query(WeeklyTask)
+            .filter(
+                WeeklyTask.id == weekly_task.id,
+                WeeklyTask.daily_generation_status == DailyGenerationStatus.GENERATING,
+                same_run,
+            )
+            .update(
+                {WeeklyTask.daily_generation_status: DailyGenerationStatus.NONE},
+                synchronize_session=False,
+            )
+        )
+        self.db.commit()
+        self.db.refresh(weekly_task)
+        if taken:
+            logger.warning(f"[DailyGen] Taking over stale generation for week {weekly_task.id} (started {started})")
+        return bool(taken)
+
     async def try_generate_next_week(
         self,
         current_weekly_task_id: UUID,
@@ -0,0 +1,226 @@
+"""Background pre-generation of the next week's daily tasks.
+
+일일 태스크는 지연 생성되므로, 주차 진행률이 100%가 된 뒤에 다음 주 생성이 시작되면
+사용자가 생성 시간을 그대로 기다려야 합니다. 다음 조건 중 하나를 만족하면
+다음 주(N+1)를 미리 백그라운드에서 생성합니다 (settings.daily_prefetch_enabled).
+- 현재 주(N)의 진행률이 daily_prefetch_progress_threshold% 이상
+- 다음 주의 달력상 시작일이 오늘부터 daily_prefetch_days_ahead일 안 (이미 시작한 주는 제외)
+
+로드맵 조회 시의 현재 주는 오늘이 속한 주입니다. 일정보다 뒤처졌거나 방치된 로드맵을
+조회할 때마다 한 주씩 더 생성되지 않도록, 오늘 이후에 시작하는 바로 다음 주만 대상으로 합니다.
+
+미리 생성은 LLM 스케줄러의 BACKGROUND 클래스로 실행하며, 전역 동시 실행 수와
+분당 시작 횟수를 제한합니다. 제한에 걸린 요청은 대기열에 넣지 않고 버립니다
+(다음 체크 또는 진행률 100% 시의 일반 생성이 처리).
+진행 중인 미리 생성은 generate_daily_tasks_for_week의 in-flight 합류로 공유되므로,
+사용자가 먼저 도착하면 새로 생성하지 않고 그 결과를 기다립니다. 미리 생성이 아직 스케줄러
+대기열에 있으면 사용자 요청의 우선순위로 끌어올립니다.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import date
+from typing import Deque, List, Optional, Set, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.ai.scheduler import LLMPriority
+from app.config import settings
+from app.core import metrics
+from app.db import SessionLocal
+from app.models import Roadmap, WeeklyTask, DailyGenerationStatus
+from app.services.daily_generation_service import DailyGenerationService
+from app.services.unified_view_service import UnifiedViewService
+
+logger = logging.getLogger(__name__)
+
+DAILY_PREFETCH = metrics.counter(
+    "daily_prefetch_total",
+    "Background next-week daily task generations by outcome",
+    ("outcome",),  # started / throttled / completed / skipped / failed
+)
+
+
+def prefetch_reason(
+    progress: int,
+    next_week_start: date,
+    today: date,
+    progress_threshold: Optional[int] = None,
+    days_ahead: Optional[int] = None,
+) -> Optional[str]:
+    """Which look-ahead condition (if any) says the next week should be prepared.
+
+    Returns:
+        "progress", "calendar" 또는 None (0 이하로 설정된 조건은 사용하지 않음)
+    """
+    if progress_threshold is None:
+        progress_threshold = settings.daily_prefetch_progress_threshold
+    if days_ahead is None:
+        days_ahead = settings.daily_prefetch_days_ahead
+
+    if progress_threshold > 0 and progress >= progress_threshold:
+        return "progress"
+    if days_ahead > 0 and 0 <= (next_week_start - today).days <= days_ahead:
+        return "calendar"
+    return None
+
+
+def calendar_next_week(
+    roadmap: Roadmap, today: date, calendar: UnifiedViewService
+) -> Optional[Tuple[WeeklyTask, WeeklyTask, date]]:
+    """(현재 주, 다음 주, 다음 주 시작일) - 현재 주는 오늘이 속한 주 (주차/월 목표가 로드된 로드맵).
+
+    Returns:
+        로드맵이 아직 시작하지 않았거나 마지막 주이면 None
+    """
+    weeks = ordered_weeks(roadmap)
+    starts = [
+        calendar.calculate_task_date(roadmap.start_date, week.monthly_goal.month_number, week.week_number, 1)
+        for week in weeks
+    ]
+    current = None
+    for i, start in enumerate(starts):
+        if start > today:
+            break
+        current = i
+    if current is None or current + 1 >= len(weeks):
+        return None
+    return weeks[current], weeks[current + 1], starts[current + 1]
+
+
+class PrefetchLimiter:
+    """Global bound on running prefetches and prefetch starts per minute."""
+
+    def __init__(self, max_concurrent: Optional[int] = None, per_minute: Optional[int] = None):
+        self._max_concurrent = max_concurrent
+        self._per_minute = per_minute
+        self.running: Set[UUID] = set()
+        self._started: Deque[float] = deque()
+
+    @property
+    def max_concurrent(self) -> int:
+        return self._max_concurrent if self._max_concurrent is not None else settings.daily_prefetch_max_concurrent
+
+    @property
+    def per_minute(self) -> int:
+        return self._per_minute if self._per_minute is not None else settings.daily_prefetch_per_minute
+
+    def try_acquire(self, weekly_task_id: UUID) -> bool:
+        now = time.monotonic()
+        while self._started and now - self._started[0] >= 60.0:
+            self._started.popleft()
+        if weekly_task_id in self.running:
+            return False
+        if len(self.running) >= self.max_concurrent or len(self._started) >= self.per_minute:
+            return False
+        self.running.add(weekly_task_id)
+        self._started.append(now)
+        return True
+
+    def release(self, weekly_task_id: UUID) -> None:
+        self.running.discard(weekly_task_id)
+
+
+_limiter = PrefetchLimiter()
+# 실행 중인 태스크 참조 보관 (GC 방지)
+_tasks: Set[asyncio.Task] = set()
+
+
+class DailyPrefetchService:
+    """Decides when to pre-generate the next week and starts it in the background."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.generation = DailyGenerationService(db)
+
+    def maybe_prefetch_next_week(self, weekly_task_id: UUID, user_id: UUID) -> Optional[UUID]:
+        """Check the week after weekly_task_id (after a toggle or a completed day).
+
+        Returns:
+            미리 생성을 시작한 다음 주 ID (시작하지 않았으면 None)
+        """
+        if not settings.daily_prefetch_enabled:
+            return None
+        weekly_task, roadmap = self.generation.get_weekly_task_with_context(weekly_task_id, user_id)
+        next_week = self.generation.get_next_week(weekly_task)
+        if next_week is None or self.generation.has_daily_tasks(next_week.id):
+            return None
+        return self._maybe_start(roadmap, weekly_task, next_week, user_id)
+
+    def maybe_prefetch_roadmap(self, roadmap: Roadmap, user_id: UUID) -> Optional[UUID]:
+        """Check a fully loaded roadmap (weeks and daily tasks already in memory).
+
+        오늘이 속한 주를 현재 주로 보고, 그 주가 생성되어 있을 때만 바로 다음 주를 확인합니다.
+        """
+        if not settings.daily_prefetch_enabled:
+            return None
+        found = calendar_next_week(roadmap, date.today(), UnifiedViewService(self.db))
+        if found is None:
+            return None
+        current, next_week, _ = found
+        if not current.daily_tasks or next_week.daily_tasks:
+            return None
+        return self._maybe_start(roadmap, current, next_week, user_id)
+
+    def _maybe_start(
+        self,
+        roadmap: Roadmap,
+        current: WeeklyTask,
+        next_week: WeeklyTask,
+        user_id: UUID,
+    ) -> Optional[UUID]:
+        if next_week.daily_generation_status != DailyGenerationStatus.NONE:
+            return None
+        next_start = UnifiedViewService(self.db).calculate_task_date(
+            roadmap.start_date, next_week.monthly_goal.month_number, next_week.week_number, 1
+        )
+        reason = prefetch_reason(current.progress, next_start, date.today())
+        if reason is None:
+            return None
+        if not schedule_prefetch(next_week.id, user_id):
+            return None
+        logger.info(f"[Prefetch] Pre-generating week {next_week.id} ({reason})")
+        return next_week.id
+
+
+def schedule_prefetch(weekly_task_id: UUID, user_id: UUID) -> bool:
+    """Start a background generation if the global limits allow it."""
+    if not _limiter.try_acquire(weekly_task_id):
+        DAILY_PREFETCH.inc(outcome="throttled")
+        return False
+    task = asyncio.create_task(_run_prefetch(weekly_task_id, user_id))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    DAILY_PREFETCH.inc(outcome="started")
+    return True
+
+
+async def _run_prefetch(weekly_task_id: UUID, user_id: UUID) -> None:
+    # 요청 세션은 응답과 함께 닫히므로 별도 세션 사용
+    db = SessionLocal()
+    try:
+        await DailyGenerationService(db).generate_daily_tasks_for_week(
+            weekly_task_id, user_id, force=True, priority=LLMPriority.BACKGROUND
+        )
+        DAILY_PREFETCH.inc(outcome="completed")
+    except HTTPException as e:
+        # 이미 생성됨, 주차 삭제 등
+        DAILY_PREFETCH.inc(outcome="skipped")
+        logger.info(f"[Prefetch] Skipped week {weekly_task_id}: {e.detail}")
+    except Exception as e:
+        DAILY_PREFETCH.inc(outcome="failed")
+        logger.warning(f"[Prefetch] Failed to pre-generate week {weekly_task_id}: {e}")
+    finally:
+        _limiter.release(weekly_task_id)
+        db.close()
+
+
+def ordered_weeks(roadmap: Roadmap) -> List[WeeklyTask]:
+    return [
+        week
+        for goal in sorted(roadmap.monthly_goals, key=lambda g: g.month_number)
+        for week in sorted(goal.weekly_tasks, key=lambda w: w.week_number)
+    ]
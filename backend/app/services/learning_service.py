@@ -1,6 +1,5 @@
 """Service for Learning mode - question management, grading, and feedback."""
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
@@ -14,7 +13,10 @@ from app.models import (
 from app.models.question import Question, QuestionType
 from app.models.user_answer import UserAnswer
 from app.models.daily_feedback import DailyFeedback
-from app.ai.llm import invoke_llm_json, DEFAULT_ANALYTICAL_TEMP, DEFAULT_CREATIVE_TEMP
+from app.ai.llm import invoke_llm_json, record_fallback, DEFAULT_CREATIVE_TEMP
+from app.ai.output_schemas import DailyFeedbackOutput, GradingOutput, ReviewQuestionsOutput
+from app.ai.prompt_families import PromptFamily
+from app.ai.scheduler import LLMPriority, llm_executor
 from app.ai.prompts.learning_templates import (
     GRADING_PROMPT,
     DAILY_FEEDBACK_PROMPT,
@@ -24,9 +26,6 @@ from app.ai.prompts.learning_templates import (
 )
 
 
-_executor = ThreadPoolExecutor(max_workers=2)
-
-
 class LearningService:
     """Service for managing learning mode questions and grading."""
 
@@ -220,11 +219,12 @@ class LearningService:
 
         # Grade all answers
         loop = asyncio.get_event_loop()
+        executor = llm_executor(LLMPriority.GENERATION, user_id)
         grading_results = []
 
         for question in questions:
             result = await loop.run_in_executor(
-                _executor,
+                executor,
                 self._grade_answer_sync,
                 question,
                 question.user_answer.answer_text,
@@ -253,7 +253,7 @@ class LearningService:
 
         # Generate daily feedback
         feedback_data = await loop.run_in_executor(
-            _executor,
+            executor,
             self._generate_daily_feedback_sync,
             roadmap.topic,
             daily_task.weekly_task.monthly_goal.month_number,
@@ -303,7 +303,10 @@ class LearningService:
         )
 
         try:
-            result = invoke_llm_json(prompt, temperature=DEFAULT_ANALYTICAL_TEMP)
+            result = invoke_llm_json(
+                prompt,
+                family=PromptFamily.GRADING, schema=GradingOutput,
+            )
             return {
                 "is_correct": result.get("is_correct", False),
                 "score": result.get("score"),
@@ -313,6 +316,7 @@ class LearningService:
             }
         except Exception:
             # Fallback: simple string matching for non-essay
+            record_fallback(PromptFamily.GRADING)
             is_correct = False
             if question.question_type == QuestionType.MULTIPLE_CHOICE:
                 is_correct = user_answer.strip() == question.correct_answer.strip()
@@ -365,7 +369,11 @@ class LearningService:
         )
 
         try:
-            result = invoke_llm_json(prompt, temperature=DEFAULT_CREATIVE_TEMP)
+            # 코칭 문구는 FEEDBACK 패밀리 기본 온도(0.5)보다 다양하게
+            result = invoke_llm_json(
+                prompt, temperature=DEFAULT_CREATIVE_TEMP,
+                family=PromptFamily.FEEDBACK, schema=DailyFeedbackOutput,
+            )
             return {
                 "summary": result.get("summary", ""),
                 "strengths": result.get("strengths", []),
@@ -374,6 +382,7 @@ class LearningService:
             }
         except Exception:
             # Fallback feedback
+            record_fallback(PromptFamily.FEEDBACK)
             if accuracy_rate >= 0.8:
                 return {
                     "summary": f"훌륭합니다! {round(accuracy_rate * 100)}%의 정답률로 오늘 학습을 잘 마무리했습니다.",
@@ -486,8 +495,19 @@ class LearningService:
                 detail="No wrong questions to review",
             )
 
-        # Build wrong questions list for prompt
-        wrong_list = [
+        # Generate review questions using AI
+        loop = asyncio.get_event_loop()
+        review_data = await loop.run_in_executor(
+            llm_executor(LLMPriority.GENERATION, user_id),
+            self._generate_review_questions_sync,
+            self._build_wrong_list(wrong_questions),
+        )
+
+        return self._save_review_session(weekly_task, wrong_questions, review_data)
+
+    def _build_wrong_list(self, wrong_questions: List[dict]) -> List[dict]:
+        """Build wrong questions list for prompt."""
+        return [
             {
                 "question_id": str(wq["question"].id),
                 "question_type": wq["question"].question_type.value,
@@ -499,17 +519,12 @@ class LearningService:
             for wq in wrong_questions
         ]
 
-        # Generate review questions using AI
-        loop = asyncio.get_event_loop()
-        review_data = await loop.run_in_executor(
-            _executor,
-            self._generate_review_questions_sync,
-            wrong_list,
-        )
-
-        # Create review daily task
+    def _save_review_session(
+        self, weekly_task: WeeklyTask, wrong_questions: List[dict], review_data: dict
+    ) -> DailyTask:
+        """Create the review daily task and its questions (배치 생성과 공유)."""
         review_task = DailyTask(
-            weekly_task_id=weekly_task_id,
+            weekly_task_id=weekly_task.id,
             day_number=8,  # Special day number for review
             order=0,
             title="틀린 문제 복습",
@@ -545,31 +560,37 @@ class LearningService:
 
     def _generate_review_questions_sync(self, wrong_questions: list) -> dict:
         """Synchronously generate review questions using AI."""
-        wrong_list_str = build_wrong_questions_list(wrong_questions)
-
-        prompt = REVIEW_QUESTIONS_PROMPT.format(
-            wrong_questions_list=wrong_list_str
-        )
-
         try:
-            result = invoke_llm_json(prompt, temperature=DEFAULT_CREATIVE_TEMP)
+            result = invoke_llm_json(
+                self._review_prompt(wrong_questions),
+                family=PromptFamily.QUESTIONS, schema=ReviewQuestionsOutput,
+            )
             return result
         except Exception:
-            # Fallback: create simple review questions from wrong ones
-            return {
-                "review_questions": [
-                    {
-                        "original_question_id": wq["question_id"],
-                        "question_type": wq["question_type"],
-                        "question_text": f"[복습] {wq['question_text']}",
-                        "correct_answer": wq["correct_answer"],
-                        "hint": "이전에 틀린 문제입니다. 다시 한번 생각해보세요.",
-                        "explanation": wq["explanation"],
-                        "review_focus": "이전 오답 복습",
-                    }
-                    for wq in wrong_questions[:5]  # Limit to 5 questions
-                ]
-            }
+            record_fallback(PromptFamily.QUESTIONS)
+            return self._fallback_review(wrong_questions)
+
+    def _review_prompt(self, wrong_questions: list):
+        return REVIEW_QUESTIONS_PROMPT.format(
+            wrong_questions_list=build_wrong_questions_list(wrong_questions)
+        )
+
+    def _fallback_review(self, wrong_questions: list) -> dict:
+        """Fallback: create simple review questions from wrong ones."""
+        return {
+            "review_questions": [
+                {
+                    "original_question_id": wq["question_id"],
+                    "question_type": wq["question_type"],
+                    "question_text": f"[복습] {wq['question_text']}",
+                    "correct_answer": wq["correct_answer"],
+                    "hint": "이전에 틀린 문제입니다. 다시 한번 생각해보세요.",
+                    "explanation": wq["explanation"],
+                    "review_focus": "이전 오답 복습",
+                }
+                for wq in wrong_questions[:5]  # Limit to 5 questions
+            ]
+        }
 
     # ==================== Learning Info ====================
 
@@ -0,0 +1,149 @@
+"""
+Benchmark verbose vs compact LLM output formats
+녹화된 응답을 기존(verbose) 형식과 축약(compact) 형식으로 같은 방식(들여쓰기 없음)으로 직렬화하여
+패밀리별 출력 토큰 수, 예상 생성 시간, 디코딩 시간을 비교합니다.
+
+예상 생성 시간은 출력 토큰 ÷ 생성 속도입니다. --cassettes를 주면 카세트(app.ai.cassettes)에
+기록된 패밀리별 출력 토큰/지연으로 속도를 계산하고, 기록이 없는 패밀리는 --tokens-per-second를 씁니다.
+
+Usage (backend 디렉터리에서):
+    python -m scripts.benchmark_compact_outputs
+    python -m scripts.benchmark_compact_outputs --responses path/to/recorded --tokens-per-second 50
+    python -m scripts.benchmark_compact_outputs --cassettes .cassettes/before
+    python -m scripts.benchmark_compact_outputs --count-with-api   # ANTHROPIC_API_KEY 필요
+
+응답 파일 형식 (JSON): {"family": "questions", "schema": "QuestionsOutput", "response": {...}}
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from app.ai import output_schemas
+from app.ai.cassettes import CassetteStore
+from app.ai.compact import get_compact_format
+from app.ai.llm import parse_json_response
+from app.ai.tokens import estimate_tokens
+
+DEFAULT_RESPONSES = Path(__file__).resolve().parent.parent / "tests" / "ai" / "fixtures" / "responses"
+
+
+def count_tokens(text: str, client=None, model: str = "") -> int:
+    if client is None:
+        return estimate_tokens(text)
+    result = client.messages.count_tokens(model=model, messages=[{"role": "user", "content": text}])
+    return result.input_tokens
+
+
+def recorded_rates(cassette_dir: Path) -> dict[str, float]:
+    """Output tokens per second per family from recorded cassette latencies."""
+    tokens: dict[str, int] = {}
+    seconds: dict[str, float] = {}
+    for entry in CassetteStore(str(cassette_dir)).entries():
+        # 첫 토큰까지의 대기는 출력 길이와 무관하므로 제외
+        generating = entry.latency_seconds - (entry.first_token_seconds or 0.0)
+        if entry.output_tokens <= 0 or generating <= 0:
+            continue
+        tokens[entry.family] = tokens.get(entry.family, 0) + entry.output_tokens
+        seconds[entry.family] = seconds.get(entry.family, 0.0) + generating
+    return {family: tokens[family] / seconds[family] for family in tokens}
+
+
+def decode_ms(text: str, expand=None, repeat: int = 200) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        data = parse_json_response(text)
+        if expand is not None:
+            expand(data)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def benchmark(
+    responses_dir: Path,
+    tokens_per_second: float,
+    client=None,
+    model: str = "",
+    rates: dict[str, float] | None = None,
+) -> list[dict]:
+    rows = []
+    rates = rates or {}
+    for path in sorted(responses_dir.glob("*.json")):
+        recorded = json.loads(path.read_text(encoding="utf-8"))
+        schema = getattr(output_schemas, recorded["schema"])
+        fmt = get_compact_format(schema)
+        if fmt is None:
+            continue
+
+        response = recorded["response"]
+        verbose = json.dumps(response, ensure_ascii=False)
+        compact = json.dumps(fmt.compact(response), ensure_ascii=False)
+        if fmt.expand(json.loads(compact)) != response:
+            raise SystemExit(f"{path.name}: compact round-trip does not match the recorded response")
+
+        verbose_tokens = count_tokens(verbose, client, model)
+        compact_tokens = count_tokens(compact, client, model)
+        rate = rates.get(recorded["family"], tokens_per_second)
+        rows.append({
+            "family": recorded["family"],
+            "schema": recorded["schema"],
+            "verbose_tokens": verbose_tokens,
+            "compact_tokens": compact_tokens,
+            "reduction": 1 - compact_tokens / verbose_tokens,
+            "tokens_per_second": rate,
+            "rate_source": "cassette" if recorded["family"] in rates else "assumed",
+            "est_verbose_seconds": verbose_tokens / rate,
+            "est_compact_seconds": compact_tokens / rate,
+            "verbose_decode_ms": decode_ms(verbose),
+            "compact_decode_ms": decode_ms(compact, fmt.expand),
+        })
+    return rows
+
+
+def print_table(rows: list[dict]) -> None:
+    print("est. gen(s) = 출력 토큰 ÷ tok/s (cassette: 기록된 지연 기준, assumed: --tokens-per-second)")
+    print(
+        f"{'family':<12}{'verbose':>10}{'compact':>10}{'saved':>8}"
+        f"{'est. gen(s)':>16}{'tok/s':>16}{'decode(ms)':>18}"
+    )
+    for row in rows:
+        rate = f"{row['tokens_per_second']:.0f} ({row['rate_source']})"
+        print(
+            f"{row['family']:<12}"
+            f"{row['verbose_tokens']:>10}"
+            f"{row['compact_tokens']:>10}"
+            f"{row['reduction']:>8.0%}"
+            f"{row['est_verbose_seconds']:>8.1f} → {row['est_compact_seconds']:<5.1f}"
+            f"{rate:>16}"
+            f"{row['verbose_decode_ms']:>9.3f} → {row['compact_decode_ms']:<6.3f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--responses", type=Path, default=DEFAULT_RESPONSES)
+    parser.add_argument("--tokens-per-second", type=float, default=60.0, help="카세트 기록이 없을 때 가정하는 생성 속도")
+    parser.add_argument("--cassettes", type=Path, help="생성 속도를 계산할 카세트 디렉터리")
+    parser.add_argument("--count-with-api", action="store_true", help="Anthropic count_tokens API로 정확히 계산")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    client, model = None, ""
+    if args.count_with_api:
+        import anthropic
+
+        from app.ai.prompt_families import ModelTier, model_for_tier
+        from app.config import settings
+
+        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        model = model_for_tier(ModelTier.LARGE)
+
+    rates = recorded_rates(args.cassettes) if args.cassettes else None
+    rows = benchmark(args.responses, args.tokens_per_second, client, model, rates)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
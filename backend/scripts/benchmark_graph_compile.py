@@ -0,0 +1,49 @@
+"""
+Benchmark per-request LangGraph overhead - compile per request vs shared graph
+요청마다 StateGraph를 만들고 compile() 하던 방식(before)과 한 번 컴파일한 그래프를
+재사용하는 방식(after)의 요청당 오버헤드를 비교합니다. LLM은 호출하지 않습니다.
+
+Usage (backend 디렉터리에서):
+    python -m scripts.benchmark_graph_compile
+    python -m scripts.benchmark_graph_compile --iterations 500
+"""
+import argparse
+import time
+
+from app.ai.interview_graph import (
+    create_analysis_graph,
+    create_question_graph,
+    get_analysis_graph,
+    get_question_graph,
+)
+from app.ai.roadmap_graph import create_roadmap_graph, get_roadmap_graph
+
+GRAPHS = [
+    ("roadmap", create_roadmap_graph, get_roadmap_graph),
+    ("question", create_question_graph, get_question_graph),
+    ("analysis", create_analysis_graph, get_analysis_graph),
+]
+
+
+def per_call_ms(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'graph':<10}{'before(ms)':>12}{'after(ms)':>12}{'speedup':>10}")
+    for name, create, get_shared in GRAPHS:
+        get_shared()  # 서버 시작 시 warm-up과 동일
+        before = per_call_ms(create, args.iterations)
+        after = per_call_ms(get_shared, args.iterations)
+        print(f"{name:<10}{before:>12.3f}{after:>12.5f}{before / after:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark prompt families from recorded LLM cassettes
+카세트(app.ai.cassettes)에 기록된 요청/응답으로 패밀리별 평균 입력/출력 토큰, 현재 파서 기준
+파싱 성공률, 재생 지연(p50/p95)을 보고합니다. --baseline을 주면 두 카세트 디렉터리를 비교하여
+app/ai/prompts/* 변경 전후의 비용과 속도 차이를 배포 전에 확인할 수 있습니다.
+
+카세트 기록 (실제 API 호출, 평소처럼 서버나 시나리오를 실행):
+    LLM_BACKEND=record LLM_CASSETTE_DIR=.cassettes/before uvicorn app.main:app
+
+Usage (backend 디렉터리에서):
+    python -m scripts.benchmark_prompt_families --dir .cassettes/before
+    python -m scripts.benchmark_prompt_families --dir .cassettes/after --baseline .cassettes/before
+    python -m scripts.benchmark_prompt_families --family questions --json
+"""
+import argparse
+import json
+
+from app.ai.cassettes import CassetteStore, summarize
+from app.config import settings
+
+COLUMNS = (
+    ("calls", "calls", "{:>7}"),
+    ("input_tokens_avg", "in tok", "{:>9.0f}"),
+    ("output_tokens_avg", "out tok", "{:>9.0f}"),
+    ("parse_success_rate", "parse", "{:>8.0%}"),
+    ("latency_p50", "p50(s)", "{:>8.2f}"),
+    ("latency_p95", "p95(s)", "{:>8.2f}"),
+)
+
+
+def load_report(directory: str, family: str | None = None) -> dict:
+    return summarize(CassetteStore(directory).entries(family))
+
+
+def compare(report: dict, baseline: dict) -> dict:
+    """Relative change per family and metric (after / before - 1)."""
+    deltas = {}
+    for family, row in report.items():
+        before = baseline.get(family)
+        if before is None:
+            continue
+        deltas[family] = {
+            key: (row[key] / before[key] - 1) if before[key] else None
+            for key, _, _ in COLUMNS
+            if key != "calls"
+        }
+    return deltas
+
+
+def print_table(report: dict, deltas: dict | None = None) -> None:
+    print(f"{'family':<12}" + "".join(f"{label:>{len(fmt.format(0))}}" for _, label, fmt in COLUMNS))
+    for family, row in report.items():
+        print(f"{family:<12}" + "".join(fmt.format(row[key]) for key, _, fmt in COLUMNS))
+        if deltas and family in deltas:
+            changes = ", ".join(
+                f"{key} {delta:+.0%}" for key, delta in deltas[family].items() if delta is not None
+            )
+            print(f"{'':<12}vs baseline: {changes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dir", default=settings.llm_cassette_dir, help="카세트 디렉터리")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 카세트 디렉터리")
+    parser.add_argument("--family", default=None, help="특정 패밀리만")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    report = load_report(args.dir, args.family)
+    if not report:
+        raise SystemExit(f"{args.dir}: 기록된 카세트가 없습니다")
+    deltas = compare(report, load_report(args.baseline, args.family)) if args.baseline else None
+
+    if args.json:
+        print(json.dumps({"report": report, "vs_baseline": deltas}, indent=2))
+    else:
+        print_table(report, deltas)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark API process cold start with python -X importtime
+새 인터프리터에서 app.main을 import하여 전체 import 시간, 누적 시간이 큰 모듈,
+무거운 AI 패키지가 기동 시점에 로드되는지를 보고합니다 (AI 모듈은 첫 사용 시 로드되어야 함).
+
+Usage (backend 디렉터리에서):
+    python -m scripts.benchmark_startup
+    python -m scripts.benchmark_startup --repeat 5 --top 20
+    python -m scripts.benchmark_startup --module app.ai.llm --json
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+HEAVY_PACKAGES = ("langchain_anthropic", "langchain_core", "langgraph", "anthropic")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(module: str) -> list[dict]:
+    """Import module in a fresh interpreter and parse the -X importtime report."""
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    env.setdefault("SECRET_KEY", "x" * 40)  # Settings 검증용 (벤치마크 전용)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append({
+                "module": match.group(4),
+                "self_us": int(match.group(1)),
+                "cumulative_us": int(match.group(2)),
+                "depth": len(match.group(3)) // 2,
+            })
+    return rows
+
+
+def summarize(rows: list[dict], module: str, top: int) -> dict:
+    root = next(r for r in rows if r["module"] == module)
+    loaded = {r["module"].split(".")[0] for r in rows}
+    return {
+        "module": module,
+        "total_ms": root["cumulative_us"] / 1000,
+        "heavy_loaded": [p for p in HEAVY_PACKAGES if p in loaded],
+        "top": [
+            {"module": r["module"], "self_ms": r["self_us"] / 1000, "cumulative_ms": r["cumulative_us"] / 1000}
+            for r in sorted(rows, key=lambda r: r["self_us"], reverse=True)[:top]
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="self 시간 기준 상위 모듈 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    runs = [summarize(measure(args.module), args.module, args.top) for _ in range(args.repeat)]
+    result = runs[-1]
+    result["total_ms"] = statistics.median(r["total_ms"] for r in runs)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    print(f"import {args.module}: {result['total_ms']:.0f}ms (중앙값, {args.repeat}회)")
+    heavy = ", ".join(result["heavy_loaded"]) or "없음"
+    print(f"기동 시 로드된 AI 패키지: {heavy}")
+    print(f"\n{'module':<50}{'self(ms)':>10}{'cumulative(ms)':>16}")
+    for row in result["top"]:
+        print(f"{row['module']:<50}{row['self_ms']:>10.1f}{row['cumulative_ms']:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""
+Generate high-volume synthetic users and roadmaps for scale testing
+수천 명 규모의 사용자와 로드맵 전체 트리(월/주/일 태스크, 문제, 답안, 일일 피드백)를 만들어
+운영 규모의 쿼리 플랜을 로컬에서 재현합니다. ORM 대신 PostgreSQL COPY(기본) 또는 다중 행
+INSERT로 적재하며, 기간/진행률/모드/상태 분포를 인자로 조정할 수 있습니다.
+데모 계정 한 개를 손으로 채우는 seed_mock_data.py와 달리 부하/플랜 측정용입니다.
+
+분포 인자는 "값:가중치" 목록입니다 (예: --durations 1:2,3:5,6:3).
+진행률은 Beta(alpha, beta)에서 뽑은 경과 비율로 시작일을 정하고, 경과한 날은
+--completion-rate 확률로 완료 처리합니다. 일일 태스크는 운영처럼 현재 주 +1주까지만 생성됩니다
+(--daily-weeks all이면 전체).
+
+사용자 이메일은 synthetic+*@loadmap.test이며 --cleanup으로 한 번에 지울 수 있습니다.
+
+Usage (backend 디렉터리에서):
+    python -m scripts.generate_synthetic_data --users 5000
+    python -m scripts.generate_synthetic_data --users 20000 --learning-ratio 0.7 --durations 3:1,6:1
+    python -m scripts.generate_synthetic_data --users 1000 --method insert --seed 7
+    python -m scripts.generate_synthetic_data --cleanup
+"""
+import argparse
+import io
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import date, datetime, time as dtime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+from app.core.security import get_password_hash
+from app.db import engine
+from app.models import (
+    DailyFeedback, DailyGenerationStatus, DailyTask, MonthlyGoal, Question, QuestionType, Roadmap,
+    RoadmapMode, RoadmapStatus, TaskStatus, User, UserAnswer, WeeklyTask,
+)
+
+EMAIL_PREFIX = "synthetic+"
+EMAIL_DOMAIN = "@loadmap.test"
+WEEKS_PER_MONTH = 4
+DAYS_PER_WEEK = 7
+PASS_ACCURACY = 0.7  # learning_service와 같은 통과 기준
+
+# 외래 키 순서 (적재 순서)
+TABLES = [User, Roadmap, MonthlyGoal, WeeklyTask, DailyTask, Question, UserAnswer, DailyFeedback]
+
+TOPICS = [
+    "React 프론트엔드", "Python 백엔드", "데이터 분석", "머신러닝 기초", "Kubernetes 운영",
+    "알고리즘 코딩 테스트", "Spring Boot", "iOS 앱 개발", "SQL 튜닝", "영어 회화",
+]
+QUESTION_TYPES = [QuestionType.MULTIPLE_CHOICE, QuestionType.SHORT_ANSWER, QuestionType.ESSAY]
+FILLER = (
+    "핵심 개념을 정리하고 예제를 직접 구현하며 이해도를 점검합니다. "
+    "공식 문서와 실습 과제를 통해 실제 프로젝트에 적용할 수 있도록 연습합니다. "
+)
+
+
+def parse_weights(spec: str, cast=str) -> Tuple[list, list]:
+    """'1:2,3:5' → ([1, 3], [2.0, 5.0])"""
+    values, weights = [], []
+    for part in spec.split(","):
+        value, _, weight = part.partition(":")
+        values.append(cast(value.strip()))
+        weights.append(float(weight or 1))
+    return values, weights
+
+
+# ==================== Row generation ====================
+
+class Generator:
+    """Builds rows (dicts keyed by column name) for a chunk of users."""
+
+    def __init__(self, args, run_id: str):
+        self.args = args
+        self.run_id = run_id
+        self.rng = random.Random(args.seed)
+        self.today = date.today()
+        self.password = get_password_hash("synthetic-password")  # 로그인 테스트용 공통 비밀번호
+        self.durations = parse_weights(args.durations, int)
+        self.roadmap_counts = parse_weights(args.roadmaps, int)
+        self.statuses = parse_weights(args.statuses, RoadmapStatus)
+        self.defaults = {table: _scalar_defaults(table) for table in TABLES}
+
+    def chunk(self, first: int, count: int) -> Dict[type, List[dict]]:
+        self.rows = {table: [] for table in TABLES}
+        for i in range(first, first + count):
+            self._user(i)
+        return {table: [{**self.defaults[table], **row} for row in rows] for table, rows in self.rows.items()}
+
+    def _add(self, table, **row) -> dict:
+        row.setdefault("id", uuid.uuid4())
+        self.rows[table].append(row)
+        return row
+
+    def _text(self, length: int) -> str:
+        return (FILLER * (length // len(FILLER) + 1))[:length]
+
+    def _user(self, index: int) -> None:
+        rng = self.rng
+        count = rng.choices(*self.roadmap_counts)[0]
+        starts = [self._start(rng.choices(*self.durations)[0]) for _ in range(count)]
+        joined = _at(min([s for s, _, _ in starts], default=self.today) - timedelta(days=rng.randint(0, 30)))
+        user_id = self._add(
+            User, email=f"{EMAIL_PREFIX}{self.run_id}-{index}{EMAIL_DOMAIN}", name=f"사용자 {index}",
+            hashed_password=self.password, is_verified=True, created_at=joined, updated_at=joined,
+        )["id"]
+        for start, months, status in starts:
+            mode = RoadmapMode.LEARNING if rng.random() < self.args.learning_ratio else RoadmapMode.PLANNING
+            self._roadmap(user_id, mode, start, months, status)
+
+    def _start(self, months: int) -> Tuple[date, int, RoadmapStatus]:
+        status = self.rng.choices(*self.statuses)[0]
+        total = months * WEEKS_PER_MONTH * DAYS_PER_WEEK
+        if status == RoadmapStatus.COMPLETED:
+            elapsed = total
+        else:
+            elapsed = int(self.rng.betavariate(self.args.progress_alpha, self.args.progress_beta) * total)
+        return self.today - timedelta(days=elapsed), months, status
+
+    def _roadmap(self, user_id, mode: RoadmapMode, start: date, months: int, status: RoadmapStatus) -> None:
+        rng, args = self.rng, self.args
+        topic = rng.choice(TOPICS)
+        created = _at(start)
+        roadmap = self._add(
+            Roadmap, user_id=user_id, title=f"{months}개월 {topic} 로드맵",
+            description=self._text(rng.randint(80, 300)), topic=topic, duration_months=months,
+            start_date=start, end_date=start + relativedelta(months=months), mode=mode, status=status,
+            is_finalized=True, finalized_at=created, created_at=created, updated_at=created,
+        )
+        elapsed_days = (self.today - start).days
+        current_week = elapsed_days // DAYS_PER_WEEK
+        totals = [0, 0]  # 전체/완료 일수
+        for month in range(1, months + 1):
+            goal_id = uuid.uuid4()
+            month_totals = [0, 0]
+            for week in range(1, WEEKS_PER_MONTH + 1):
+                index = (month - 1) * WEEKS_PER_MONTH + (week - 1)
+                generated = args.daily_weeks == "all" or index <= current_week + 1
+                week_id = uuid.uuid4()
+                done = self._days(week_id, user_id, mode, topic, index, elapsed_days, created) if generated else 0
+                self._add(
+                    WeeklyTask, id=week_id, monthly_goal_id=goal_id, week_number=week,
+                    title=f"{topic} {month}개월 {week}주차", description=self._text(rng.randint(60, 200)),
+                    **_progress(done, DAYS_PER_WEEK),
+                    daily_generation_status=DailyGenerationStatus.COMPLETED if generated else DailyGenerationStatus.NONE,
+                    created_at=created, updated_at=created,
+                )
+                month_totals[0] += DAYS_PER_WEEK
+                month_totals[1] += done
+            self._add(
+                MonthlyGoal, id=goal_id, roadmap_id=roadmap["id"], month_number=month,
+                title=f"{topic} {month}개월차 목표", description=self._text(rng.randint(60, 200)),
+                **_progress(month_totals[1], month_totals[0]), created_at=created, updated_at=created,
+            )
+            totals[0] += month_totals[0]
+            totals[1] += month_totals[1]
+        roadmap["progress"] = round(totals[1] * 100 / totals[0]) if totals[0] else 0
+
+    def _days(self, week_id, user_id, mode, topic, week_index, elapsed_days, created) -> int:
+        """Create daily tasks for one week; returns the number of completed days."""
+        rng, args = self.rng, self.args
+        completed_days = 0
+        for day in range(1, DAYS_PER_WEEK + 1):
+            day_index = week_index * DAYS_PER_WEEK + (day - 1)
+            checked = day_index < elapsed_days and rng.random() < args.completion_rate
+            completed_days += checked
+            task_ids = []
+            for order in range(args.tasks_per_day):
+                task_ids.append(self._add(
+                    DailyTask, weekly_task_id=week_id, day_number=day, order=order,
+                    title=f"{topic} {day}일차 학습 {order + 1}", description=self._text(rng.randint(40, 160)),
+                    status=TaskStatus.COMPLETED if checked else TaskStatus.PENDING, is_checked=checked,
+                    created_at=created, updated_at=created,
+                )["id"])
+            if mode == RoadmapMode.LEARNING:
+                self._questions(task_ids[0], week_id, day, user_id, checked, _at(created.date() + timedelta(days=day_index)))
+        return completed_days
+
+    def _questions(self, task_id, week_id, day, user_id, answered: bool, when: datetime) -> None:
+        rng, args = self.rng, self.args
+        correct = 0
+        for order in range(args.questions_per_day):
+            kind = QUESTION_TYPES[order % len(QUESTION_TYPES)]
+            multiple = kind == QuestionType.MULTIPLE_CHOICE
+            question_id = self._add(
+                Question, daily_task_id=task_id, question_type=kind, order=order,
+                question_text=self._text(rng.randint(40, 200)),
+                choices=[f"보기 {n}" for n in range(1, 5)] if multiple else None,
+                correct_answer="0" if multiple else self._text(rng.randint(10, 80)),
+                hint=self._text(40), explanation=self._text(rng.randint(60, 200)),
+                created_at=when, updated_at=when,
+            )["id"]
+            if not answered:
+                continue
+            is_correct = rng.random() < args.correct_rate
+            correct += is_correct
+            self._add(
+                UserAnswer, question_id=question_id, user_id=user_id,
+                answer_text="0" if multiple else self._text(rng.randint(10, 300)),
+                is_correct=is_correct, score=(rng.randint(70, 100) if is_correct else rng.randint(0, 69)),
+                feedback=self._text(rng.randint(40, 160)), submitted_at=when, graded_at=when,
+                created_at=when, updated_at=when,
+            )
+        if answered and args.questions_per_day:
+            accuracy = correct / args.questions_per_day
+            self._add(
+                DailyFeedback, weekly_task_id=week_id, day_number=day, user_id=user_id,
+                total_questions=args.questions_per_day, correct_count=correct, accuracy_rate=accuracy,
+                is_passed=accuracy >= PASS_ACCURACY, summary=self._text(rng.randint(60, 200)),
+                strengths=["개념 이해"], improvements=["응용 연습"], created_at=when, updated_at=when,
+            )
+
+
+def _progress(done: int, total: int) -> dict:
+    if total and done == total:
+        return {"status": TaskStatus.COMPLETED, "progress": 100}
+    return {
+        "status": TaskStatus.IN_PROGRESS if done else TaskStatus.PENDING,
+        "progress": round(done * 100 / total) if total else 0,
+    }
+
+
+def _at(day: date) -> datetime:
+    return datetime.combine(day, dtime(9, 0), tzinfo=timezone.utc)
+
+
+def _scalar_defaults(table) -> dict:
+    """Python-side column defaults (COPY는 ORM 기본값을 적용하지 않으므로 직접 채움)."""
+    defaults = {}
+    for column in table.__table__.columns:
+        if column.default is not None and column.default.is_scalar:
+            defaults[column.name] = column.default.arg
+        elif column.nullable and column.server_default is None:
+            defaults[column.name] = None
+    return defaults
+
+
+# ==================== Loading ====================
+
+def _copy_value(column, value) -> str:
+    """One CSV field for COPY (NULL은 따옴표 없는 빈 값)."""
+    if value is None:
+        return ""
+    if isinstance(column.type, ARRAY):
+        value = "{" + ",".join(str(v) for v in value) + "}"
+    elif isinstance(column.type, JSONB):
+        value = json.dumps(value, ensure_ascii=False)
+    elif isinstance(value, bool):
+        value = "t" if value else "f"
+    elif hasattr(value, "value"):  # Enum
+        value = value.value
+    elif isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def load_copy(conn, table, rows: List[dict]) -> None:
+    columns = [c for c in table.__table__.columns if c.name in rows[0]]
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(_copy_value(c, row[c.name]) for c in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    names = ", ".join(f'"{c.name}"' for c in columns)
+    cursor = conn.connection.cursor()  # psycopg2 copy_expert
+    cursor.copy_expert(f"COPY {table.__tablename__} ({names}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def load_insert(conn, table, rows: List[dict]) -> None:
+    # SQLAlchemy 2 + psycopg2는 executemany를 다중 행 VALUES 배치로 보냄 (insertmanyvalues)
+    conn.execute(table.__table__.insert(), rows)
+
+
+def generate(args) -> dict:
+    run_id = uuid.uuid4().hex[:8]
+    generator = Generator(args, run_id)
+    loader = load_copy if args.method == "copy" else load_insert
+    counts: Counter = Counter()
+    seconds: Counter = Counter()
+    started = time.perf_counter()
+    for first in range(0, args.users, args.batch_users):
+        chunk = generator.chunk(first, min(args.batch_users, args.users - first))
+        with engine.begin() as conn:
+            for table in TABLES:
+                rows = chunk[table]
+                if not rows:
+                    continue
+                load_started = time.perf_counter()
+                loader(conn, table, rows)
+                seconds[table.__tablename__] += time.perf_counter() - load_started
+                counts[table.__tablename__] += len(rows)
+        done = min(first + args.batch_users, args.users)
+        print(f"{done}/{args.users} users ({time.perf_counter() - started:.0f}s)", file=sys.stderr)
+
+    if not args.no_analyze:
+        with engine.begin() as conn:
+            for table in TABLES:
+                conn.execute(text(f"ANALYZE {table.__tablename__}"))
+
+    elapsed = time.perf_counter() - started
+    return {
+        "run_id": run_id,
+        "method": args.method,
+        "elapsed_seconds": round(elapsed, 1),
+        "rows": dict(counts),
+        "rows_per_second": {
+            name: round(counts[name] / seconds[name]) for name in counts if seconds[name]
+        },
+    }
+
+
+def cleanup() -> int:
+    """Delete every synthetic user (로드맵 등은 CASCADE로 삭제)."""
+    with engine.begin() as conn:
+        result = conn.execute(
+            delete(User.__table__).where(User.email.like(f"{EMAIL_PREFIX}%{EMAIL_DOMAIN}"))
+        )
+        return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--roadmaps", default="0:1,1:6,2:2,3:1", help="사용자당 로드맵 수 분포")
+    parser.add_argument("--durations", default="1:2,2:2,3:3,6:3", help="로드맵 기간(개월) 분포")
+    parser.add_argument("--statuses", default="ACTIVE:8,COMPLETED:1,PAUSED:1", help="로드맵 상태 분포")
+    parser.add_argument("--learning-ratio", type=float, default=0.5, help="LEARNING 모드 비율")
+    parser.add_argument("--progress-alpha", type=float, default=1.5, help="경과 비율 Beta 분포 alpha")
+    parser.add_argument("--progress-beta", type=float, default=3.0, help="경과 비율 Beta 분포 beta")
+    parser.add_argument("--completion-rate", type=float, default=0.8, help="경과한 날 중 완료 비율")
+    parser.add_argument("--correct-rate", type=float, default=0.7, help="답안 정답 비율")
+    parser.add_argument("--tasks-per-day", type=int, default=1)
+    parser.add_argument("--questions-per-day", type=int, default=3)
+    parser.add_argument("--daily-weeks", choices=["elapsed", "all"], default="elapsed",
+                        help="일일 태스크를 만들 주 (elapsed=현재 주 +1주까지)")
+    parser.add_argument("--method", choices=["copy", "insert"], default="copy")
+    parser.add_argument("--batch-users", type=int, default=500, help="트랜잭션당 사용자 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-analyze", action="store_true", help="적재 후 ANALYZE 생략")
+    parser.add_argument("--cleanup", action="store_true", help="합성 사용자만 삭제")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        print(json.dumps({"deleted_users": cleanup()}))
+        return
+    print(json.dumps(generate(args), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,435 @@
+"""
+End-to-end HTTP load test with synthetic users
+로컬 스택(API 서버 + DB)에 가상 사용자를 만들고, 시나리오 비율에 따라 요청을 보내
+엔드포인트별 처리량, p50/p95/p99 지연, DB 쿼리 수와 연결 풀 대기 시간을 JSON으로 보고합니다.
+커밋 간 비교를 위해 보고서에 git 커밋을 함께 기록합니다.
+
+서버는 가짜 LLM과 생성 제한 해제로 실행합니다 (같은 .env/DATABASE_URL 사용).
+DB 쿼리 수/풀 대기 시간은 /health/db에서 읽으므로 METRICS_ENABLED=true가 필요합니다:
+    LLM_BACKEND=fake BETA_DAILY_ROADMAP_LIMIT=0 METRICS_ENABLED=true uvicorn app.main:app --workers 1
+
+시나리오:
+    dashboard  GET   /roadmaps/unified/today
+    toggle     PATCH /roadmaps/daily-tasks/{id}/toggle        (PLANNING 로드맵)
+    learning   GET questions → POST submit × N → POST complete-day (LEARNING 로드맵)
+    generate   POST  /roadmaps/generate-stream (SSE 끝까지 수신, 첫 이벤트 지연 별도 집계)
+
+사용자는 DB에 직접 만들고(이메일 loadtest+*@loadmap.test), 토큰은 같은 SECRET_KEY로 발급합니다.
+
+Usage (backend 디렉터리에서):
+    python -m scripts.load_test --users 20 --roadmaps 2 --duration 60
+    python -m scripts.load_test --mix dashboard=70,toggle=20,learning=10 --out before.json
+    python -m scripts.load_test --cleanup
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.core.security import create_access_token, get_password_hash
+from app.db import SessionLocal
+from app.models import (
+    DailyTask, MonthlyGoal, Question, QuestionType, Roadmap, RoadmapMode, RoadmapStatus,
+    TaskStatus, User, WeeklyTask,
+)
+
+EMAIL_PREFIX = "loadtest+"
+EMAIL_DOMAIN = "@loadmap.test"
+DEFAULT_MIX = "dashboard=60,toggle=20,learning=15,generate=5"
+API = "/api/v1"
+
+
+# ==================== Seeding ====================
+
+@dataclass
+class VirtualUser:
+    user_id: uuid.UUID
+    token: str
+    planning_tasks: List[str] = field(default_factory=list)
+    learning_days: List[str] = field(default_factory=list)
+
+
+def seed_users(count: int, roadmaps_per_user: int, token_ttl: timedelta) -> List[VirtualUser]:
+    """Create verified users with active roadmaps (PLANNING/LEARNING 번갈아) and mint tokens.
+
+    로드맵은 3개월 × 4주, 첫 주에 7일치 일일 태스크가 있고 LEARNING은 일자마다 3문제를 가집니다.
+    """
+    db = SessionLocal()
+    password = get_password_hash("loadtest-password")  # 로그인하지 않으므로 한 번만 계산
+    run = uuid.uuid4().hex[:8]
+    users = []
+    try:
+        for i in range(count):
+            user = User(
+                id=uuid.uuid4(), email=f"{EMAIL_PREFIX}{run}-{i}{EMAIL_DOMAIN}", name=f"Load {i}",
+                hashed_password=password, is_verified=True,
+            )
+            db.add(user)
+            virtual = VirtualUser(user.id, create_access_token(user.id, expires_delta=token_ttl))
+            for r in range(roadmaps_per_user):
+                mode = RoadmapMode.LEARNING if r % 2 else RoadmapMode.PLANNING
+                _seed_roadmap(db, user, mode, virtual)
+            db.commit()
+            users.append(virtual)
+    finally:
+        db.close()
+    return users
+
+
+def _seed_roadmap(db, user: User, mode: RoadmapMode, virtual: VirtualUser) -> None:
+    start = date.today() - timedelta(days=date.today().weekday())
+    roadmap = Roadmap(
+        id=uuid.uuid4(), user_id=user.id, title=f"부하 테스트 {mode.value}", topic="부하 테스트",
+        duration_months=3, start_date=start, end_date=start + timedelta(days=90),
+        mode=mode, status=RoadmapStatus.ACTIVE,
+    )
+    db.add(roadmap)
+    for month in range(1, 4):
+        goal = MonthlyGoal(id=uuid.uuid4(), roadmap_id=roadmap.id, month_number=month, title=f"{month}개월차")
+        db.add(goal)
+        for week in range(1, 5):
+            weekly = WeeklyTask(
+                id=uuid.uuid4(), monthly_goal_id=goal.id, week_number=week, title=f"{month}-{week}주차",
+            )
+            db.add(weekly)
+            if month == 1 and week == 1:
+                _seed_days(db, weekly, mode, virtual)
+
+
+def _seed_days(db, weekly: WeeklyTask, mode: RoadmapMode, virtual: VirtualUser) -> None:
+    for day in range(1, 8):
+        task = DailyTask(
+            id=uuid.uuid4(), weekly_task_id=weekly.id, day_number=day, title=f"{day}일차",
+            status=TaskStatus.PENDING,
+        )
+        db.add(task)
+        if mode == RoadmapMode.PLANNING:
+            virtual.planning_tasks.append(str(task.id))
+            continue
+        virtual.learning_days.append(str(task.id))
+        for order in range(3):
+            multiple = order == 0
+            db.add(Question(
+                id=uuid.uuid4(), daily_task_id=task.id, order=order,
+                question_type=QuestionType.MULTIPLE_CHOICE if multiple else QuestionType.SHORT_ANSWER,
+                question_text=f"{day}일차 문제 {order + 1}",
+                choices=["A", "B", "C", "D"] if multiple else None,
+                correct_answer="0" if multiple else "정답",
+            ))
+
+
+def cleanup() -> int:
+    """Delete every load-test user (로드맵 등은 CASCADE로 삭제)."""
+    db = SessionLocal()
+    try:
+        deleted = db.query(User).filter(
+            User.email.like(f"{EMAIL_PREFIX}%{EMAIL_DOMAIN}")
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+    finally:
+        db.close()
+
+
+# ==================== Scenarios ====================
+
+class Recorder:
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+
+    def add(self, name: str, seconds: float, status: int) -> None:
+        self.samples.setdefault(name, []).append(seconds)
+        counts = self.statuses.setdefault(name, {})
+        counts[str(status)] = counts.get(str(status), 0) + 1
+
+
+async def _timed(client: httpx.AsyncClient, recorder: Recorder, name: str, method: str, url: str, **kwargs):
+    start = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+        status = response.status_code
+    except httpx.HTTPError:
+        response, status = None, 0
+    recorder.add(name, time.perf_counter() - start, status)
+    return response
+
+
+async def dashboard(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    await _timed(client, recorder, "GET /roadmaps/unified/today", "GET", f"{API}/roadmaps/unified/today")
+
+
+async def toggle(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    if not user.planning_tasks:
+        return await dashboard(client, recorder, user, rng)
+    task_id = rng.choice(user.planning_tasks)
+    await _timed(
+        client, recorder, "PATCH /roadmaps/daily-tasks/{id}/toggle",
+        "PATCH", f"{API}/roadmaps/daily-tasks/{task_id}/toggle",
+    )
+
+
+async def learning(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    if not user.learning_days:
+        return await dashboard(client, recorder, user, rng)
+    task_id = rng.choice(user.learning_days)
+    response = await _timed(
+        client, recorder, "GET /learning/daily-tasks/{id}/questions",
+        "GET", f"{API}/learning/daily-tasks/{task_id}/questions",
+    )
+    if response is None or response.status_code != 200:
+        return
+    for question in response.json():
+        answer = "0" if question["question_type"] == "MULTIPLE_CHOICE" else "답안"
+        await _timed(
+            client, recorder, "POST /learning/questions/{id}/submit",
+            "POST", f"{API}/learning/questions/{question['id']}/submit", json={"answer_text": answer},
+        )
+    await _timed(
+        client, recorder, "POST /learning/daily-tasks/{id}/complete-day",
+        "POST", f"{API}/learning/daily-tasks/{task_id}/complete-day",
+    )
+
+
+async def generate(client, recorder, user: VirtualUser, rng: random.Random) -> None:
+    name = "POST /roadmaps/generate-stream"
+    body = {
+        "topic": "부하 테스트 주제",
+        "duration_months": rng.randint(1, 3),
+        "start_date": date.today().isoformat(),
+        "mode": rng.choice(["PLANNING", "LEARNING"]),
+    }
+    start = time.perf_counter()
+    status = 0
+    try:
+        async with client.stream("POST", f"{API}/roadmaps/generate-stream", json=body) as response:
+            status = response.status_code
+            first = None
+            async for line in response.aiter_lines():
+                if first is None and line.startswith("event:"):
+                    first = time.perf_counter() - start
+                    recorder.add(f"{name} (first event)", first, status)
+    except httpx.HTTPError:
+        pass
+    recorder.add(name, time.perf_counter() - start, status)
+
+
+SCENARIOS = {"dashboard": dashboard, "toggle": toggle, "learning": learning, "generate": generate}
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise SystemExit(f"알 수 없는 시나리오: {name} (사용 가능: {', '.join(SCENARIOS)})")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+# ==================== Run ====================
+
+def _client(base_url: str, user: VirtualUser, timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=base_url, timeout=timeout, headers={"Authorization": f"Bearer {user.token}"},
+    )
+
+
+async def _db_snapshot(client: httpx.AsyncClient) -> dict:
+    response = await client.get("/health/db")
+    if response.status_code == 404:
+        sys.exit("/health/db is disabled; start the server with METRICS_ENABLED=true")
+    response.raise_for_status()
+    return response.json()
+
+
+def _db_delta(before: dict, after: dict) -> dict:
+    return {
+        key: round(after[key] - before[key], 4)
+        for key in ("queries", "query_seconds", "pool_checkouts", "pool_wait_seconds")
+    }
+
+
+async def probe_queries(base_url: str, user: VirtualUser, timeout: float) -> Dict[str, dict]:
+    """DB statements per endpoint, measured one request at a time before the load phase."""
+    per_endpoint: Dict[str, dict] = {}
+    async with _client(base_url, user, timeout) as client:
+        for name, scenario in SCENARIOS.items():
+            if name == "generate":
+                continue  # 생성은 백그라운드 저장이 섞여 요청 단위로 나눌 수 없음
+            recorder = Recorder()
+            before = await _db_snapshot(client)
+            await scenario(client, recorder, user, random.Random(0))
+            delta = _db_delta(before, await _db_snapshot(client))
+            requests = sum(len(v) for v in recorder.samples.values())
+            per_endpoint[name] = {
+                "requests": requests,
+                "queries_per_request": round(delta["queries"] / max(requests, 1), 1),
+                "query_seconds_per_request": round(delta["query_seconds"] / max(requests, 1), 4),
+            }
+    return per_endpoint
+
+
+async def run_load(
+    base_url: str,
+    users: List[VirtualUser],
+    mix: Dict[str, float],
+    duration: float,
+    think: float,
+    timeout: float,
+    seed: int,
+) -> tuple:
+    recorder = Recorder()
+    names, weights = list(mix), list(mix.values())
+    deadline = time.monotonic() + duration
+
+    async def virtual_user(index: int, user: VirtualUser) -> None:
+        rng = random.Random(seed + index)
+        async with _client(base_url, user, timeout) as client:
+            while time.monotonic() < deadline:
+                scenario = SCENARIOS[rng.choices(names, weights)[0]]
+                await scenario(client, recorder, user, rng)
+                if think > 0:
+                    await asyncio.sleep(rng.expovariate(1 / think))
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as monitor:
+        before = await _db_snapshot(monitor)
+        started = time.monotonic()
+        await asyncio.gather(*(virtual_user(i, user) for i, user in enumerate(users)))
+        elapsed = time.monotonic() - started
+        after = await _db_snapshot(monitor)
+    return recorder, elapsed, _db_delta(before, after), after.get("pool")
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def build_report(recorder: Recorder, elapsed: float, db: dict, pool: Optional[dict], probe: dict, meta: dict) -> dict:
+    endpoints = {}
+    for name, samples in sorted(recorder.samples.items()):
+        statuses = recorder.statuses[name]
+        errors = sum(count for status, count in statuses.items() if not status.startswith("2"))
+        endpoints[name] = {
+            "requests": len(samples),
+            "errors": errors,
+            "statuses": statuses,
+            "throughput_rps": round(len(samples) / elapsed, 2),
+            "p50_ms": round(_percentile(samples, 0.50) * 1000, 1),
+            "p95_ms": round(_percentile(samples, 0.95) * 1000, 1),
+            "p99_ms": round(_percentile(samples, 0.99) * 1000, 1),
+            "max_ms": round(max(samples) * 1000, 1),
+        }
+    total = sum(e["requests"] for n, e in endpoints.items() if not n.endswith("(first event)"))
+    return {
+        "meta": {**meta, "elapsed_seconds": round(elapsed, 2), "requests": total},
+        "endpoints": endpoints,
+        "db": {
+            **db,
+            "queries_per_request": round(db["queries"] / max(total, 1), 2),
+            "pool_wait_ms_per_checkout": round(db["pool_wait_seconds"] * 1000 / max(db["pool_checkouts"], 1), 3),
+            "pool_at_end": pool,
+        },
+        "db_per_scenario": probe,
+    }
+
+
+def print_summary(report: dict) -> None:
+    print(f"{'endpoint':<48}{'req':>7}{'err':>6}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}", file=sys.stderr)
+    for name, row in report["endpoints"].items():
+        print(
+            f"{name:<48}{row['requests']:>7}{row['errors']:>6}{row['throughput_rps']:>8.1f}"
+            f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}",
+            file=sys.stderr,
+        )
+    db = report["db"]
+    print(
+        f"DB: {db['queries']} queries ({db['queries_per_request']}/req), "
+        f"pool wait {db['pool_wait_seconds']}s over {db['pool_checkouts']} checkouts",
+        file=sys.stderr,
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _check_server(base_url: str, mix: Dict[str, float], allow_real_llm: bool) -> None:
+    async with httpx.AsyncClient(base_url=base_url, timeout=10) as client:
+        backend = (await client.get("/health/llm")).json().get("backend")
+    if backend != "fake" and mix.get("generate") and not allow_real_llm:
+        raise SystemExit(
+            f"서버 LLM 백엔드가 {backend}입니다. LLM_BACKEND=fake로 실행하거나 --allow-real-llm을 지정하세요"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=10, help="가상 사용자 수 (= 동시 실행 수)")
+    parser.add_argument("--roadmaps", type=int, default=2, help="사용자당 로드맵 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="부하 시간 (초)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="시나리오=비율, 쉼표 구분")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="요청 간 평균 대기 (지수 분포)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-probe", action="store_true", help="시나리오별 쿼리 수 측정 생략")
+    parser.add_argument("--allow-real-llm", action="store_true", help="가짜 LLM이 아닌 서버에도 생성 요청")
+    parser.add_argument("--keep", action="store_true", help="끝난 뒤 가상 사용자를 지우지 않음")
+    parser.add_argument("--cleanup", action="store_true", help="이전 실행의 가상 사용자만 삭제")
+    parser.add_argument("--out", default=None, help="JSON 보고서 파일 (기본: 표준 출력)")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        print(json.dumps({"deleted_users": cleanup()}))
+        return
+
+    mix = parse_mix(args.mix)
+    asyncio.run(_check_server(args.base_url, mix, args.allow_real_llm))
+    users = seed_users(args.users, args.roadmaps, timedelta(seconds=args.duration) + timedelta(hours=1))
+    try:
+        probe = {} if args.no_probe else asyncio.run(probe_queries(args.base_url, users[0], args.timeout))
+        recorder, elapsed, db, pool = asyncio.run(run_load(
+            args.base_url, users, mix, args.duration, args.think_ms / 1000, args.timeout, args.seed,
+        ))
+    finally:
+        if not args.keep:
+            cleanup()
+
+    report = build_report(recorder, elapsed, db, pool, probe, {
+        "commit": _git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "base_url": args.base_url,
+        "users": args.users,
+        "roadmaps_per_user": args.roadmaps,
+        "duration_seconds": args.duration,
+        "mix": mix,
+        "think_ms": args.think_ms,
+        "seed": args.seed,
+    })
+    print_summary(report)
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Run batch pre-generation of daily tasks and review questions
+곧 필요한 다음 주 일일 태스크와 복습 문제를 모아 배치 API로 한 번에 생성하고 저장합니다.
+cron 등으로 주기적으로 실행합니다 (app.services.batch_generation_service).
+
+Usage (backend 디렉터리에서):
+    python -m scripts.run_batch_generation --dry-run
+    python -m scripts.run_batch_generation --limit 100
+    python -m scripts.run_batch_generation --backend local --dir .batches --poll-interval 1
+"""
+import argparse
+import json
+import logging
+
+from app.ai.batch import AnthropicBatchBackend, LocalBatchBackend, anthropic_responder
+from app.config import settings
+from app.db import SessionLocal
+from app.services.batch_generation_service import BatchGenerationService, pending_job_counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backend", choices=("anthropic", "local"), default=settings.llm_batch_backend)
+    parser.add_argument("--limit", type=int, default=50, help="종류별 최대 작업 수")
+    parser.add_argument("--dir", default=None, help="local 백엔드의 배치 디렉터리")
+    parser.add_argument("--poll-interval", type=float, default=None, help="결과 확인 간격 (초)")
+    parser.add_argument("--timeout", type=float, default=None, help="배치 완료 대기 최대 시간 (초)")
+    parser.add_argument("--dry-run", action="store_true", help="대상 작업 수만 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    db = SessionLocal()
+    try:
+        if args.dry_run:
+            daily, review = pending_job_counts(db, args.limit)
+            print(json.dumps({"daily": daily, "review": review}))
+            return
+
+        if args.backend == "local":
+            backend = LocalBatchBackend(args.dir, responder=anthropic_responder)
+        else:
+            backend = AnthropicBatchBackend()
+        summary = BatchGenerationService(db, backend).run(
+            limit=args.limit, poll_interval=args.poll_interval, timeout=args.timeout
+        )
+        print(json.dumps(summary))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
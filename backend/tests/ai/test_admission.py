@@ -0,0 +1,121 @@
+"""Tests for roadmap generation admission control."""
+
+import asyncio
+
+import pytest
+from fastapi.responses import StreamingResponse
+
+from app.ai.admission import GENERATION_REJECTED, AdmissionController, GenerationQueueFull
+from app.ai.cancellation import CancellationToken, GenerationCancelled
+from app.api.v1.endpoints import roadmaps
+
+
+class TestAdmissionController:
+    """Test the concurrency cap, FIFO queue and rejection."""
+
+    async def test_runs_up_to_cap_then_queues_in_order(self):
+        controller = AdmissionController(max_concurrent=2, max_queue=5)
+        running = [controller.enter(), controller.enter()]
+        first, second = controller.enter(), controller.enter()
+
+        assert all(t.granted.is_set() for t in running)
+        assert (first.position, second.position) == (1, 2)
+
+        running[0].release()
+        assert first.granted.is_set() and not second.granted.is_set()
+        assert second.position == 1
+
+    async def test_full_queue_is_rejected_with_retry_after(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=1, initial_duration=30)
+        controller.enter()
+        controller.enter()
+        before = GENERATION_REJECTED.value()
+
+        with pytest.raises(GenerationQueueFull) as exc:
+            controller.enter()
+
+        assert exc.value.retry_after == 60
+        assert GENERATION_REJECTED.value() == before + 1
+
+    async def test_wait_reports_position_until_granted(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=5, initial_duration=10)
+        running = controller.enter()
+        ahead = controller.enter()
+        ticket = controller.enter()
+        statuses = []
+
+        async def consume():
+            async for status in ticket.wait():
+                statuses.append(status)
+
+        waiter = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        running.release()
+        await asyncio.sleep(0.01)
+        ahead.release()
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert statuses[0] == {"position": 2, "estimated_wait_seconds": 20}
+        assert [s["position"] for s in statuses] == [2, 1]
+        assert ticket.granted.is_set()
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=5)
+        controller.enter()
+        ticket = controller.enter()
+        token = CancellationToken()
+        token.cancel("client disconnected")
+
+        with pytest.raises(GenerationCancelled):
+            await ticket.acquire(token)
+
+        assert controller.queued == 0
+
+    async def test_check_does_not_take_a_place(self):
+        controller = AdmissionController(max_concurrent=1, max_queue=1)
+        controller.check()
+        assert (controller.active, controller.queued) == (0, 0)
+
+        controller.enter()
+        controller.enter()
+        with pytest.raises(GenerationQueueFull):
+            controller.check()
+
+
+class TestAdmittedStream:
+    """Test the streaming endpoint only holds a slot while its body runs."""
+
+    async def test_disconnect_before_body_starts_holds_no_slot(self, monkeypatch):
+        controller = AdmissionController(max_concurrent=1, max_queue=1)
+        monkeypatch.setattr(roadmaps, "get_admission_controller", lambda: controller)
+
+        async def events():
+            yield {"type": "complete", "data": {}}
+
+        roadmaps._check_generation_queue()
+        response = StreamingResponse(
+            roadmaps._admitted_events(events(), CancellationToken()), media_type="text/event-stream"
+        )
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            await asyncio.Event().wait()  # 헤더를 보내기 전에 연결이 끊김
+
+        await asyncio.wait_for(response({"type": "http"}, receive, send), timeout=1)
+
+        assert (controller.active, controller.queued) == (0, 0)
+
+    async def test_slot_released_after_stream(self, monkeypatch):
+        controller = AdmissionController(max_concurrent=1, max_queue=1)
+        monkeypatch.setattr(roadmaps, "get_admission_controller", lambda: controller)
+
+        async def events():
+            assert controller.active == 1
+            yield {"type": "complete", "data": {}}
+
+        received = [e async for e in roadmaps._admitted_events(events(), CancellationToken())]
+
+        assert [e["type"] for e in received] == ["complete"]
+        assert controller.active == 0
@@ -0,0 +1,78 @@
+"""Tests for batch request backends and batch request bodies."""
+
+import json
+
+import pytest
+
+from app.ai.batch import BatchBackend, BatchRequest, LocalBatchBackend, run_batch
+from app.ai.llm import build_batch_params, parse_batch_text
+from app.ai.prompt_families import PromptFamily
+from app.ai.prompts.cached import PromptParts
+
+
+def _echo_responder(params):
+    content = params["messages"][0]["content"]
+    if content == "boom":
+        raise RuntimeError("boom")
+    return json.dumps({"echo": content})
+
+
+class TestLocalBatchBackend:
+    """Test the file-based batch stand-in."""
+
+    def test_round_trip(self, tmp_path):
+        backend = LocalBatchBackend(str(tmp_path), responder=_echo_responder)
+        requests = [
+            BatchRequest("a", {"messages": [{"role": "user", "content": "hello"}]}),
+            BatchRequest("b", {"messages": [{"role": "user", "content": "boom"}]}),
+        ]
+
+        results = run_batch(backend, requests, poll_interval=0, timeout=1)
+
+        assert json.loads(results["a"].text) == {"echo": "hello"}
+        assert results["a"].succeeded
+        assert not results["b"].succeeded
+        assert "boom" in results["b"].error
+
+    def test_waits_for_external_results(self, tmp_path):
+        backend = LocalBatchBackend(str(tmp_path))
+        batch_id = backend.submit([BatchRequest("a", {"messages": []})])
+        assert not backend.is_done(batch_id)
+
+        (tmp_path / batch_id / "results.jsonl").write_text(
+            json.dumps({"custom_id": "a", "text": "{}"}) + "\n", encoding="utf-8"
+        )
+        assert backend.is_done(batch_id)
+        assert backend.results(batch_id)["a"].text == "{}"
+
+    def test_timeout(self, tmp_path):
+        backend = LocalBatchBackend(str(tmp_path))
+
+        with pytest.raises(TimeoutError):
+            run_batch(backend, [BatchRequest("a", {})], poll_interval=0, timeout=0, sleep=lambda s: None)
+
+    def test_base_backend_is_abstract(self):
+        with pytest.raises(TypeError):
+            BatchBackend()
+
+
+class TestBatchParams:
+    """Test batch request bodies and response parsing."""
+
+    def test_prompt_parts_use_system_blocks(self):
+        params = build_batch_params(PromptParts("지침", "입력"), PromptFamily.DAILY)
+
+        assert params["system"][0]["text"] == "지침"
+        assert params["messages"] == [{"role": "user", "content": "입력"}]
+        assert {"model", "max_tokens", "temperature"} <= params.keys()
+
+    def test_plain_prompt(self):
+        params = build_batch_params("질문", PromptFamily.QUESTIONS, temperature=0.1)
+
+        assert "system" not in params
+        assert params["temperature"] == 0.1
+
+    def test_parse_batch_text(self):
+        assert parse_batch_text('```json\n{"a": 1}\n```', PromptFamily.DAILY) == {"a": 1}
+        with pytest.raises(ValueError):
+            parse_batch_text("not json", PromptFamily.DAILY)
@@ -0,0 +1,163 @@
+"""Tests for cancellation of streaming roadmap generation."""
+
+import asyncio
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.ai.cancellation import CancellationToken, GenerationCancelled
+from app.ai.llm import invoke_llm_json
+from app.ai.roadmap_stream import generate_roadmap_streaming
+from app.api.sse import stream_with_disconnect
+from app.models.roadmap import RoadmapMode
+
+
+class _FakeStream:
+    """Iterator standing in for ChatAnthropic.stream()."""
+
+    def __init__(self, chunks, on_chunk=None):
+        self._chunks = iter(chunks)
+        self._on_chunk = on_chunk
+        self.closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = next(self._chunks)
+        if self._on_chunk:
+            self._on_chunk()
+        return MagicMock(content=chunk)
+
+    def close(self):
+        self.closed = True
+
+
+class TestInvokeLLMJsonCancellation:
+    """Test cancellation inside invoke_llm_json."""
+
+    def test_streams_and_parses_when_not_cancelled(self):
+        """Test streamed chunks are joined and parsed."""
+        token = CancellationToken()
+        stream = _FakeStream(['{"title": ', '"A", "description": "B"}'])
+        llm = MagicMock()
+        llm.stream.return_value = stream
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            result = invoke_llm_json("prompt", cancel_token=token)
+
+        assert result == {"title": "A", "description": "B"}
+        assert stream.closed
+
+    def test_cancel_mid_stream_closes_stream(self):
+        """Test cancelling while streaming aborts and closes the stream."""
+        token = CancellationToken()
+        stream = _FakeStream(
+            ['{"title": ', '"A"', "}"],
+            on_chunk=lambda: token.cancel("client disconnected"),
+        )
+        llm = MagicMock()
+        llm.stream.return_value = stream
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            with pytest.raises(GenerationCancelled):
+                invoke_llm_json("prompt", cancel_token=token)
+
+        assert stream.closed
+
+    def test_cancelled_token_skips_call(self):
+        """Test an already-cancelled token never reaches the model."""
+        token = CancellationToken()
+        token.cancel()
+        llm = MagicMock()
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            with pytest.raises(GenerationCancelled):
+                invoke_llm_json("prompt", cancel_token=token)
+
+        llm.stream.assert_not_called()
+
+    def test_cancellation_is_not_caught_by_fallbacks(self):
+        """Test GenerationCancelled bypasses `except Exception` fallbacks."""
+        assert not issubclass(GenerationCancelled, Exception)
+
+
+class TestStreamingGenerationCancellation:
+    """Test generate_roadmap_streaming honours the cancel token."""
+
+    async def test_cancel_after_title_skips_save(self):
+        """Test cancelling mid-generation stops events and skips persistence."""
+        token = CancellationToken()
+
+        def fake_invoke(prompt, temperature=0.7, cancel_token=None, **kwargs):
+            cancel_token.raise_if_cancelled()
+            return {"title": "제목", "description": "설명", "weeks": []}
+
+        with patch("app.ai.roadmap_stream.invoke_llm_json", side_effect=fake_invoke), \
+                patch("app.ai.roadmap_stream._save_roadmap") as save:
+            event_types = []
+            async for event in generate_roadmap_streaming(
+                topic="Python",
+                duration_months=2,
+                start_date=date(2026, 1, 1),
+                mode=RoadmapMode.PLANNING,
+                user_id="00000000-0000-0000-0000-000000000000",
+                db=MagicMock(),
+                cancel_token=token,
+            ):
+                event_types.append(event["type"])
+                if event["type"] == "title_ready":
+                    token.cancel("client disconnected")
+
+        save.assert_not_called()
+        assert "month_ready" not in event_types
+        assert "error" not in event_types
+
+
+class TestStreamWithDisconnect:
+    """Test the SSE relay reacts to client disconnects."""
+
+    @staticmethod
+    def _request(disconnected: bool):
+        request = MagicMock()
+
+        async def is_disconnected():
+            return disconnected
+
+        request.is_disconnected = is_disconnected
+        return request
+
+    async def test_disconnect_cancels_token(self):
+        """Test the cancel policy triggers the token when the client leaves."""
+        token = CancellationToken()
+
+        async def events():
+            yield {"type": "title_ready", "data": {}}
+            while not token.cancelled:
+                await asyncio.sleep(0.01)
+
+        frames = [
+            frame async for frame in stream_with_disconnect(
+                self._request(True), events(), token, poll_interval=0.01
+            )
+        ]
+
+        assert token.cancelled
+        assert frames[0].startswith("event: title_ready")
+
+    async def test_finish_policy_keeps_generating(self):
+        """Test the finish policy leaves the token untouched on disconnect."""
+        token = CancellationToken()
+
+        async def events():
+            yield {"type": "complete", "data": {"roadmap_id": "r1"}}
+
+        relay = stream_with_disconnect(
+            self._request(True), events(), token,
+            finish_on_disconnect=True, poll_interval=0.01,
+        )
+        frames = [frame async for frame in relay]
+
+        assert not token.cancelled
+        assert frames == ['event: complete\ndata: {"roadmap_id": "r1"}\n\n']
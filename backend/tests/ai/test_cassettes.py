@@ -0,0 +1,110 @@
+"""Tests for LLM cassette record/replay and the per-family summary."""
+
+from dataclasses import replace
+
+import pytest
+
+from app.ai import llm as llm_module
+from app.ai.cassettes import CassetteEntry, CassetteMiss, get_cassette_store, summarize
+from app.ai.fake_llm import FakeChatModel
+from app.ai.llm import invoke_llm_json, stream_llm_text
+from app.ai.output_schemas import DailyTasksOutput, MonthWeeksOutput
+from app.ai.prompt_families import PromptFamily
+from app.ai.resilience import anthropic_breaker
+from app.config import settings
+
+
+@pytest.fixture(autouse=True)
+def cassette_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "llm_cassette_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "llm_cassette_replay_latency", False)
+    monkeypatch.setattr(settings, "llm_singleflight", False)
+    monkeypatch.setattr(settings, "llm_structured_output", False)
+    monkeypatch.setattr(settings, "fake_llm_latency_median_ms", 0)
+    monkeypatch.setattr(settings, "fake_llm_tokens_per_second", 0)
+    get_cassette_store.cache_clear()
+    anthropic_breaker.reset()
+    yield
+    get_cassette_store.cache_clear()
+    anthropic_breaker.reset()
+
+
+def _upstream(monkeypatch, family: str, schema=None):
+    """Use the fake model as the 'real' API while recording."""
+    monkeypatch.setattr(llm_module, "create_llm", lambda *args, **kwargs: FakeChatModel(family, schema))
+
+
+def _no_upstream(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("replay must not call the API")
+
+    monkeypatch.setattr(llm_module, "create_llm", fail)
+
+
+class TestRecordReplay:
+    """Test responses recorded once are replayed without API calls."""
+
+    @pytest.mark.parametrize("structured", [False, True])
+    def test_json_and_tool_modes(self, monkeypatch, structured):
+        monkeypatch.setattr(settings, "llm_structured_output", structured)
+        _upstream(monkeypatch, "daily", DailyTasksOutput)
+        monkeypatch.setattr(settings, "llm_backend", "record")
+        recorded = invoke_llm_json("일일 태스크", family=PromptFamily.DAILY, schema=DailyTasksOutput)
+
+        (entry,) = get_cassette_store().entries()
+        assert entry.family == "daily"
+        assert entry.mode == ("tool" if structured else "json")
+        assert entry.input_tokens > 0 and entry.output_tokens > 0
+
+        _no_upstream(monkeypatch)
+        monkeypatch.setattr(settings, "llm_backend", "replay")
+        assert invoke_llm_json("일일 태스크", family=PromptFamily.DAILY, schema=DailyTasksOutput) == recorded
+
+    def test_changed_prompt_misses(self, monkeypatch):
+        _upstream(monkeypatch, "daily", DailyTasksOutput)
+        monkeypatch.setattr(settings, "llm_backend", "record")
+        invoke_llm_json("v1 프롬프트", family=PromptFamily.DAILY, schema=DailyTasksOutput)
+
+        _no_upstream(monkeypatch)
+        monkeypatch.setattr(settings, "llm_backend", "replay")
+        with pytest.raises(CassetteMiss):
+            invoke_llm_json("v2 프롬프트", family=PromptFamily.DAILY, schema=DailyTasksOutput)
+
+    def test_stream(self, monkeypatch):
+        _upstream(monkeypatch, "weeks")
+        monkeypatch.setattr(settings, "llm_backend", "record")
+        recorded = "".join(stream_llm_text("주차", family=PromptFamily.WEEKS))
+
+        (entry,) = get_cassette_store().entries("weeks")
+        assert entry.mode == "stream"
+        assert entry.first_token_seconds is not None
+
+        _no_upstream(monkeypatch)
+        monkeypatch.setattr(settings, "llm_backend", "replay")
+        assert "".join(stream_llm_text("주차", family=PromptFamily.WEEKS)) == recorded
+
+
+class TestSummary:
+    """Test the per-family benchmark summary."""
+
+    def test_parse_success_and_tokens(self, monkeypatch):
+        _upstream(monkeypatch, "daily", DailyTasksOutput)
+        monkeypatch.setattr(settings, "llm_backend", "record")
+        invoke_llm_json("일일 태스크", family=PromptFamily.DAILY, schema=DailyTasksOutput)
+        (entry,) = get_cassette_store().entries()
+        broken = replace(entry, key="broken", output=entry.output[:20], latency_seconds=2.0)
+
+        report = summarize([entry, broken])
+
+        assert report["daily"]["calls"] == 2
+        assert report["daily"]["parse_success_rate"] == 0.5
+        assert report["daily"]["latency_p95"] == 2.0
+
+    def test_schema_validation_counts(self):
+        """Test valid JSON that fails the recorded schema counts as a parse failure."""
+        entry = CassetteEntry(
+            key="k", family="weeks", mode="json", schema=MonthWeeksOutput.__name__, compact=False,
+            system="", user="", output='{"weeks": []}',
+        )
+
+        assert summarize([entry])["weeks"]["parse_success_rate"] == 0.0
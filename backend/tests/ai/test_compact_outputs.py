@@ -0,0 +1,90 @@
+"""Tests for compact output formats and their expansion."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.ai import output_schemas
+from app.ai.compact import CompactFormatError, expand_questions, get_compact_format
+from app.ai.llm import LLM_PARSE_FAILURES, invoke_llm_json
+from app.ai.output_schemas import QuestionsOutput, ReviewQuestionsOutput
+from app.ai.tokens import estimate_tokens
+from app.config import settings
+
+RESPONSES = Path(__file__).parent / "fixtures" / "responses"
+
+
+@pytest.fixture
+def compact_questions(monkeypatch):
+    monkeypatch.setattr(settings, "llm_families", {"questions": {"compact": True}})
+    monkeypatch.setattr(settings, "llm_structured_output", False)
+
+
+def _llm(content: str) -> MagicMock:
+    llm = MagicMock()
+    llm.invoke.return_value = AIMessage(content=content)
+    return llm
+
+
+class TestCompactFormats:
+    """Test encoders/decoders against recorded responses."""
+
+    @pytest.mark.parametrize("path", sorted(RESPONSES.glob("*.json")), ids=lambda p: p.stem)
+    def test_round_trip(self, path):
+        """Test expand(compact(x)) reproduces the recorded verbose response."""
+        recorded = json.loads(path.read_text(encoding="utf-8"))
+        fmt = get_compact_format(getattr(output_schemas, recorded["schema"]))
+        compact = json.dumps(fmt.compact(recorded["response"]), ensure_ascii=False)
+
+        assert fmt.expand(json.loads(compact)) == recorded["response"]
+        assert estimate_tokens(compact) < estimate_tokens(json.dumps(recorded["response"], ensure_ascii=False))
+
+    def test_invalid_row_rejected(self):
+        """Test an unknown question type code is a format error."""
+        with pytest.raises(CompactFormatError):
+            expand_questions({"q": [["X", "문제", None, "답"]]})
+
+
+class TestCompactInvoke:
+    """Test invoke_llm_json with compact output enabled."""
+
+    def test_expands_compact_response(self, compact_questions):
+        """Test the prompt asks for the compact layout and callers get the verbose shape."""
+        llm = _llm('{"q": [["M", "문제", ["a", "b", "c", "d"], "2", "힌트", "해설"], ["E", "서술", null, "답"]]}')
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            result = invoke_llm_json("프롬프트", family="questions", schema=QuestionsOutput)
+
+        assert "<compact_output>" in llm.invoke.call_args.args[0][-1].content
+        assert result["questions"][0] == {
+            "question_type": "MULTIPLE_CHOICE",
+            "question_text": "문제",
+            "choices": ["a", "b", "c", "d"],
+            "correct_answer": "2",
+            "hint": "힌트",
+            "explanation": "해설",
+        }
+        assert "choices" not in result["questions"][1]
+
+    def test_schema_without_compact_layout(self, compact_questions):
+        """Test review questions in the same family keep the verbose format."""
+        llm = _llm('{"review_questions": []}')
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            result = invoke_llm_json("프롬프트", family="questions", schema=ReviewQuestionsOutput)
+
+        assert "<compact_output>" not in llm.invoke.call_args.args[0][-1].content
+        assert result == {"review_questions": []}
+
+    def test_malformed_compact_counts_as_parse_failure(self, compact_questions):
+        """Test a verbose answer to a compact request raises for the caller's fallback."""
+        before = LLM_PARSE_FAILURES.value(family="questions", mode="compact")
+
+        with patch("app.ai.llm.create_llm", return_value=_llm('{"questions": []}')):
+            with pytest.raises(ValueError):
+                invoke_llm_json("프롬프트", family="questions", schema=QuestionsOutput)
+
+        assert LLM_PARSE_FAILURES.value(family="questions", mode="compact") == before + 1
@@ -0,0 +1,140 @@
+"""Tests for the next-week daily task prefetch policy."""
+
+import uuid
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from app.config import settings
+from app.models import DailyGenerationStatus, DailyTask, MonthlyGoal, Roadmap, WeeklyTask
+from app.services import daily_prefetch_service
+from app.services.daily_prefetch_service import (
+    DailyPrefetchService,
+    PrefetchLimiter,
+    calendar_next_week,
+    prefetch_reason,
+)
+from app.services.unified_view_service import UnifiedViewService
+
+
+def _roadmap(start: date, generated_weeks: int) -> Roadmap:
+    """One-month roadmap (4 weeks) held in memory, first weeks already generated."""
+    goal = MonthlyGoal(month_number=1, title="기초")
+    goal.weekly_tasks = [
+        WeeklyTask(
+            id=uuid.uuid4(), week_number=n, title=f"{n}주차", progress=0,
+            daily_generation_status=DailyGenerationStatus.NONE,
+        )
+        for n in range(1, 5)
+    ]
+    for week in goal.weekly_tasks[:generated_weeks]:
+        week.daily_tasks = [DailyTask(day_number=1, title="1일차")]
+    roadmap = Roadmap(start_date=start, duration_months=1)
+    roadmap.monthly_goals = [goal]
+    return roadmap
+
+
+class TestPrefetchReason:
+    """Test the progress and calendar look-ahead conditions."""
+
+    def test_progress_threshold(self):
+        today = date(2026, 3, 2)
+        far = date(2026, 3, 20)
+
+        assert prefetch_reason(70, far, today, progress_threshold=70, days_ahead=2) == "progress"
+        assert prefetch_reason(69, far, today, progress_threshold=70, days_ahead=2) is None
+
+    def test_calendar_start_within_days(self):
+        today = date(2026, 3, 2)
+
+        assert prefetch_reason(0, date(2026, 3, 4), today, progress_threshold=70, days_ahead=2) == "calendar"
+        assert prefetch_reason(0, date(2026, 3, 5), today, progress_threshold=70, days_ahead=2) is None
+        # 시작일이 이미 지난 주는 대상이 아님 (뒤처진/방치된 로드맵)
+        assert prefetch_reason(0, date(2026, 2, 23), today, progress_threshold=70, days_ahead=2) is None
+
+    def test_zero_disables_condition(self):
+        today = date(2026, 3, 2)
+
+        assert prefetch_reason(100, today, today, progress_threshold=0, days_ahead=0) is None
+
+
+class TestCalendarWeek:
+    """Test the current week is the one containing today."""
+
+    def test_week_containing_today(self):
+        today = date(2026, 3, 10)
+        roadmap = _roadmap(date(2026, 3, 2), generated_weeks=2)
+
+        current, next_week, next_start = calendar_next_week(roadmap, today, UnifiedViewService(None))
+
+        assert (current.week_number, next_week.week_number) == (2, 3)
+        assert next_start == date(2026, 3, 16)
+
+    def test_not_started_or_last_week(self):
+        calendar = UnifiedViewService(None)
+
+        assert calendar_next_week(_roadmap(date(2026, 3, 2), 1), date(2026, 3, 1), calendar) is None
+        assert calendar_next_week(_roadmap(date(2026, 3, 2), 4), date(2026, 3, 25), calendar) is None
+
+    def test_stale_roadmap_view_does_not_prefetch(self, monkeypatch):
+        """Test viewing a roadmap that fell behind never generates past the calendar week."""
+        monkeypatch.setattr(settings, "daily_prefetch_enabled", True)
+        monkeypatch.setattr(settings, "daily_prefetch_days_ahead", 2)
+        # 2주차까지만 생성했는데 달력상으로는 4주차 (방치된 로드맵)
+        stale = _roadmap(date.today() - timedelta(days=22), generated_weeks=2)
+        # 달력상 1주차 마지막 날, 1주차 생성됨 → 내일 시작하는 2주차만 대상
+        on_time = _roadmap(date.today() - timedelta(days=6), generated_weeks=1)
+        service = DailyPrefetchService(None)
+
+        with patch.object(daily_prefetch_service, "schedule_prefetch", return_value=True) as schedule:
+            assert service.maybe_prefetch_roadmap(stale, uuid.uuid4()) is None
+            assert service.maybe_prefetch_roadmap(on_time, uuid.uuid4()) == on_time.monthly_goals[0].weekly_tasks[1].id
+
+        assert schedule.call_count == 1
+
+
+class TestPrefetchLimiter:
+    """Test the global concurrency and per-minute bounds."""
+
+    def test_concurrency_and_duplicates(self):
+        limiter = PrefetchLimiter(max_concurrent=1, per_minute=10)
+        first, second = uuid.uuid4(), uuid.uuid4()
+
+        assert limiter.try_acquire(first)
+        assert not limiter.try_acquire(first)
+        assert not limiter.try_acquire(second)
+
+        limiter.release(first)
+        assert limiter.try_acquire(second)
+
+    def test_per_minute_rate(self):
+        limiter = PrefetchLimiter(max_concurrent=5, per_minute=2)
+        weeks = [uuid.uuid4() for _ in range(3)]
+
+        assert limiter.try_acquire(weeks[0])
+        limiter.release(weeks[0])
+        assert limiter.try_acquire(weeks[1])
+        limiter.release(weeks[1])
+        assert not limiter.try_acquire(weeks[2])
+
+    async def test_schedule_runs_in_background_at_background_priority(self):
+        calls = []
+
+        class FakeGeneration:
+            def __init__(self, db):
+                pass
+
+            async def generate_daily_tasks_for_week(self, weekly_task_id, user_id, force=False, priority=None):
+                calls.append((weekly_task_id, force, priority))
+
+        week_id, user_id = uuid.uuid4(), uuid.uuid4()
+        limiter = PrefetchLimiter(max_concurrent=1, per_minute=10)
+        with patch.object(daily_prefetch_service, "_limiter", limiter), \
+                patch.object(daily_prefetch_service, "DailyGenerationService", FakeGeneration), \
+                patch.object(daily_prefetch_service, "SessionLocal"):
+            assert daily_prefetch_service.schedule_prefetch(week_id, user_id)
+            assert not daily_prefetch_service.schedule_prefetch(week_id, user_id)
+            for task in list(daily_prefetch_service._tasks):
+                await task
+
+        assert calls == [(week_id, True, daily_prefetch_service.LLMPriority.BACKGROUND)]
+        assert not limiter.running
@@ -0,0 +1,88 @@
+"""Tests for DB statement and pool statistics, per process and per request."""
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.config import settings
+from app.core.http_metrics import QUERY_COUNT_HEADER, REPEATED_QUERIES, QueryCountMiddleware
+from app.db.stats import TimedQueuePool, db_stats, install_query_stats, statement_shape, track_queries
+
+
+def _engine():
+    engine = create_engine(
+        "sqlite://", poolclass=TimedQueuePool, pool_size=1, max_overflow=0,
+        connect_args={"check_same_thread": False},  # TestClient는 별도 스레드에서 요청 처리
+    )
+    install_query_stats(engine)
+    return engine
+
+
+class TestDbStats:
+    """Test statements and pool checkouts are counted."""
+
+    def test_counts_statements(self):
+        engine = _engine()
+        before = db_stats(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        after = db_stats(engine)
+        assert after["queries"] - before["queries"] == 2
+        assert after["query_seconds"] >= before["query_seconds"]
+        assert after["pool_checkouts"] - before["pool_checkouts"] == 1
+
+    def test_pool_occupancy(self):
+        engine = _engine()
+
+        with engine.connect():
+            assert db_stats(engine)["pool"]["checked_out"] == 1
+        assert db_stats(engine)["pool"]["checked_out"] == 0
+
+
+class TestRequestQueries:
+    """Test statements are counted per tracked block and repeated shapes are flagged."""
+
+    def test_track_queries(self):
+        engine = _engine()
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with track_queries() as stats:
+                for i in range(3):
+                    conn.execute(text("SELECT :value"), {"value": i})
+
+        assert stats.queries == 3
+        assert stats.repeated(3) == [("SELECT ?", 3)]
+        assert stats.repeated(4) == []
+
+    def test_shape_collapses_in_lists(self):
+        assert statement_shape("SELECT * FROM t WHERE id IN (%(id_1_1)s, %(id_1_2)s)") == (
+            statement_shape("SELECT * FROM t\n WHERE id IN (%(id_1_1)s)")
+        )
+
+    def test_middleware_headers_and_n_plus_one_log(self, monkeypatch, caplog):
+        engine = _engine()
+        monkeypatch.setattr(settings, "db_query_headers", True)
+        monkeypatch.setattr(settings, "db_repeated_query_threshold", 5)
+        app = FastAPI()
+        app.add_middleware(QueryCountMiddleware)
+
+        @app.get("/items/{count}")
+        async def items(count: int):
+            with engine.connect() as conn:
+                return [conn.execute(text("SELECT :id"), {"id": i}).scalar() for i in range(count)]
+
+        client = TestClient(app)
+        before = REPEATED_QUERIES.value(route="/items/{count}")
+
+        assert client.get("/items/2").headers[QUERY_COUNT_HEADER] == "2"
+        with caplog.at_level(logging.WARNING, logger="app.core.http_metrics"):
+            assert client.get("/items/6").headers[QUERY_COUNT_HEADER] == "6"
+
+        assert REPEATED_QUERIES.value(route="/items/{count}") == before + 1
+        assert any("Possible N+1 on GET /items/{count}: 6x SELECT ?" in r.getMessage() for r in caplog.records)
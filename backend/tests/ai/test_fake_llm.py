@@ -0,0 +1,138 @@
+"""Tests for the fake LLM backend."""
+
+import json
+
+import pytest
+
+from app.ai import fake_llm
+from app.ai.fake_llm import FakeLLMTimeout, fake_output
+from app.ai.llm import invoke_llm_json, stream_llm_text
+from app.ai.output_schemas import (
+    AnswerAnalysisOutput,
+    CurriculumOutput,
+    DailyFeedbackOutput,
+    DailyTasksOutput,
+    FeedbackAnalysisOutput,
+    GradingOutput,
+    InterviewQuestionsOutput,
+    MonthGoalOutput,
+    MonthlyGoalsOutput,
+    MonthWeeksOutput,
+    QuestionsOutput,
+    ReviewQuestionsOutput,
+    RoadmapTitleOutput,
+    WeeklyTasksOutput,
+)
+from app.ai.prompt_families import PromptFamily
+from app.ai.resilience import LLM_RETRIES, anthropic_breaker
+from app.config import settings
+
+# 코드베이스의 invoke_llm_json 호출 지점 (패밀리, 응답 스키마)
+CALL_SITES = [
+    (PromptFamily.TITLE, RoadmapTitleOutput),
+    (PromptFamily.MONTH, MonthlyGoalsOutput),
+    (PromptFamily.MONTH, MonthGoalOutput),
+    (PromptFamily.WEEKS, WeeklyTasksOutput),
+    (PromptFamily.WEEKS, MonthWeeksOutput),
+    (PromptFamily.DAILY, DailyTasksOutput),
+    (PromptFamily.CURRICULUM, CurriculumOutput),
+    (PromptFamily.QUESTIONS, QuestionsOutput),
+    (PromptFamily.QUESTIONS, ReviewQuestionsOutput),
+    (PromptFamily.GRADING, GradingOutput),
+    (PromptFamily.FEEDBACK, FeedbackAnalysisOutput),
+    (PromptFamily.FEEDBACK, DailyFeedbackOutput),
+    (PromptFamily.INTERVIEW, InterviewQuestionsOutput),
+    (PromptFamily.ANALYSIS, AnswerAnalysisOutput),
+]
+
+
+@pytest.fixture(autouse=True)
+def fake_backend(monkeypatch):
+    monkeypatch.setattr(settings, "llm_backend", "fake")
+    monkeypatch.setattr(settings, "llm_singleflight", False)
+    monkeypatch.setattr(settings, "llm_retry_base_delay", 0)
+    monkeypatch.setattr(settings, "fake_llm_latency_median_ms", 0)
+    monkeypatch.setattr(settings, "fake_llm_tokens_per_second", 0)
+    fake_llm.reseed(0)
+    anthropic_breaker.reset()
+    yield
+    anthropic_breaker.reset()
+
+
+class TestFakeResponses:
+    """Test schema-valid, deterministic responses."""
+
+    @pytest.mark.parametrize("structured", [False, True])
+    @pytest.mark.parametrize("family,schema", CALL_SITES, ids=lambda v: getattr(v, "__name__", str(v)))
+    def test_every_call_site_is_schema_valid(self, monkeypatch, family, schema, structured):
+        monkeypatch.setattr(settings, "llm_structured_output", structured)
+
+        result = invoke_llm_json("프롬프트", family=family, schema=schema)
+
+        schema.model_validate(result)
+
+    def test_deterministic_per_prompt(self):
+        first = fake_output(QuestionsOutput, "같은 프롬프트")
+
+        assert fake_output(QuestionsOutput, "같은 프롬프트") == first
+        assert fake_output(QuestionsOutput, "다른 프롬프트") != first
+
+    def test_shapes_follow_prompt(self):
+        months = fake_output(MonthlyGoalsOutput, "• 학습 기간: 5개월")["monthly_goals"]
+        days = fake_output(CurriculumOutput)["daily_curriculum"]
+
+        assert [m["month_number"] for m in months] == [1, 2, 3, 4, 5]
+        assert [d["day"] for d in days] == list(range(1, 8))
+        for question in fake_output(QuestionsOutput, "문제")["questions"]:
+            if question["question_type"] == "MULTIPLE_CHOICE":
+                assert len(question["choices"]) == 4
+                assert 0 <= int(question["correct_answer"]) < 4
+            else:
+                assert "choices" not in question
+
+    def test_compact_mode(self, monkeypatch):
+        monkeypatch.setattr(settings, "llm_families", {"questions": {"compact": True}})
+        monkeypatch.setattr(settings, "llm_structured_output", False)
+
+        result = invoke_llm_json("문제", family=PromptFamily.QUESTIONS, schema=QuestionsOutput)
+
+        assert result == fake_output(QuestionsOutput, "문제" + _compact_suffix())
+
+    def test_stream_uses_family_schema(self):
+        text = "".join(stream_llm_text("주차", family=PromptFamily.WEEKS))
+
+        assert len(MonthWeeksOutput.model_validate(json.loads(text)).weeks) == 4
+
+
+class TestFaultInjection:
+    """Test injected failures and truncation reach the resilience and fallback paths."""
+
+    def test_failures_are_retried(self, monkeypatch):
+        monkeypatch.setattr(settings, "fake_llm_failure_rate", 1.0)
+        before = LLM_RETRIES.value(family="title")
+
+        with pytest.raises(FakeLLMTimeout):
+            invoke_llm_json("제목", family=PromptFamily.TITLE, schema=RoadmapTitleOutput)
+        assert LLM_RETRIES.value(family="title") == before + settings.llm_retry_max_attempts - 1
+
+    def test_truncated_json_fails_to_parse(self, monkeypatch):
+        monkeypatch.setattr(settings, "fake_llm_truncation_rate", 1.0)
+        monkeypatch.setattr(settings, "llm_structured_output", False)
+
+        with pytest.raises(ValueError):
+            invoke_llm_json("일일", family=PromptFamily.DAILY, schema=DailyTasksOutput)
+
+    def test_latency_distribution(self, monkeypatch):
+        monkeypatch.setattr(settings, "fake_llm_latency_median_ms", 100)
+        monkeypatch.setattr(settings, "fake_llm_latency_p99_ms", 1000)
+
+        delays = sorted(fake_llm._first_token_delay() for _ in range(2000))
+
+        assert 0.08 < delays[1000] < 0.12
+        assert 0.6 < delays[1980] < 1.6
+
+
+def _compact_suffix() -> str:
+    from app.ai.compact import get_compact_format
+
+    return get_compact_format(QuestionsOutput).instructions
@@ -0,0 +1,93 @@
+"""Tests for token-budgeted feedback context assembly."""
+
+import json
+
+import pytest
+
+from app.ai.feedback_context import build_feedback_context, find_scope
+from app.ai.prompts.feedback_prompts import format_roadmap_compact
+
+
+@pytest.fixture
+def roadmap():
+    topics = ["파이썬 문법", "자료구조", "웹 크롤링", "데이터 분석", "Django 백엔드", "배포와 운영"]
+    return {
+        "title": "파이썬 로드맵",
+        "duration_months": 6,
+        "monthly_goals": [
+            {"month_number": m, "title": f"{m}개월차 {topic}", "description": f"{topic} 월간 목표 설명 " * 8}
+            for m, topic in enumerate(topics, 1)
+        ],
+        "weekly_tasks": [
+            {
+                "month_number": m,
+                "weeks": [
+                    {"week_number": w, "title": f"{topic} {w}주차 주제", "description": f"{topic} 주간 설명 " * 10}
+                    for w in range(1, 5)
+                ],
+            }
+            for m, topic in enumerate(topics, 1)
+        ],
+    }
+
+
+class TestFindScope:
+    """Test detection of the months/weeks a message refers to."""
+
+    def test_month_and_week_pair(self, roadmap):
+        scope = find_scope("2개월차 3주차가 너무 어려워요", roadmap)
+        assert scope.months == {2}
+        assert scope.weeks == {(2, 3)}
+
+    def test_global_week_index(self, roadmap):
+        """Test a week number past one month maps onto the whole roadmap."""
+        assert find_scope("7주차 내용을 줄여주세요", roadmap).weeks == {(2, 3)}
+
+    def test_last_month(self, roadmap):
+        assert find_scope("마지막 달은 복습으로 바꿔주세요", roadmap).months == {6}
+
+    def test_title_keyword(self, roadmap):
+        """Test a word unique to a couple of week titles narrows the scope."""
+        roadmap["weekly_tasks"][4]["weeks"][1]["title"] = "Django ORM 실습"
+        assert find_scope("ORM 쪽을 늘려주세요", roadmap).weeks == {(5, 2)}
+
+    def test_global_request(self, roadmap):
+        scope = find_scope("전체적으로 난이도를 낮춰주세요", roadmap)
+        assert scope.whole
+
+
+class TestBuildFeedbackContext:
+    """Test context assembly and budget enforcement."""
+
+    def test_focused_context_is_smaller(self, roadmap):
+        context = build_feedback_context("2개월차가 너무 어려워요", roadmap, [], budget=10_000)
+        data = json.loads(context.roadmap_json)
+
+        assert "desc" in data["months"][1]
+        assert set(data["months"][0]) == {"m", "title"}
+        assert context.tokens < context.full_tokens
+
+    def test_follow_up_inherits_previous_scope(self, roadmap):
+        current = "조금 더 쉽게 해주세요"
+        history = [
+            {"role": "user", "content": "4개월차 2주차를 바꿔주세요"},
+            {"role": "assistant", "content": "수정했습니다."},
+        ]
+        # 엔드포인트는 현재 메시지를 기록 끝에 추가한 뒤 넘김
+        context = build_feedback_context(
+            current, roadmap, history + [{"role": "user", "content": current}], budget=10_000
+        )
+        assert context.scope.weeks == {(4, 2)}
+        assert not context.scope.whole
+
+    def test_whole_scope_keeps_full_detail(self, roadmap):
+        context = build_feedback_context("전체 일정을 늘려주세요", roadmap, [], budget=10_000)
+        assert context.roadmap_json == format_roadmap_compact(roadmap)
+
+    def test_budget_degrades_context(self, roadmap):
+        messages = [{"role": "user", "content": "긴 메시지 " * 40}] * 6
+        roomy = build_feedback_context("전체 일정을 늘려주세요", roadmap, messages, budget=100_000)
+        tight = build_feedback_context("전체 일정을 늘려주세요", roadmap, messages, budget=400)
+
+        assert tight.tokens < roomy.tokens
+        assert tight.recent_messages.count("사용자:") < roomy.recent_messages.count("사용자:")
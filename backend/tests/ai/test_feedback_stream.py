@@ -0,0 +1,63 @@
+"""Tests for streaming feedback-chat replies."""
+
+import json
+from unittest.mock import patch
+
+from app.ai.feedback_node import stream_feedback_analysis
+from app.ai.llm import LLM_INVALID_OUTPUTS, LLM_PARSE_FAILURES
+
+ROADMAP = {
+    "monthly_goals": [{"month_number": 1, "title": "기초", "description": "설명"}],
+    "weekly_tasks": [],
+}
+
+
+def _fake_stream(chunks):
+    async def fake(prompt, **kwargs):
+        for chunk in chunks:
+            yield chunk
+    return fake
+
+
+async def _collect(chunks):
+    with patch("app.ai.feedback_node.astream_llm_text", side_effect=_fake_stream(chunks)):
+        return [event async for event in stream_feedback_analysis("1개월차를 쉽게", ROADMAP, [])]
+
+
+class TestStreamFeedbackAnalysis:
+    """Test response text is streamed before the structured result."""
+
+    async def test_streams_response_then_result(self):
+        document = json.dumps({
+            "response": "1개월차를 더 쉽게 바꿨어요!",
+            "modification_type": "monthly",
+            "modifications": {
+                "monthly_goals": [{"month_number": 1, "title": "입문", "description": "쉬운 설명"}],
+                "weekly_tasks": [],
+            },
+        }, ensure_ascii=False)
+        chunks = [document[i:i + 7] for i in range(0, len(document), 7)]
+
+        events = await _collect(chunks)
+
+        deltas = [e["data"]["delta"] for e in events if e["type"] == "response_delta"]
+        assert len(deltas) > 1
+        assert "".join(deltas) == "1개월차를 더 쉽게 바꿨어요!"
+        assert events[-1]["type"] == "analysis_ready"
+        assert events[-1]["data"]["modifications"]["monthly_goals"][0]["title"] == "입문"
+
+    async def test_invalid_response_falls_back(self):
+        """Test a malformed document still ends with a usable result and is counted."""
+        before = (
+            LLM_PARSE_FAILURES.value(family="feedback", mode="stream"),
+            LLM_INVALID_OUTPUTS.value(family="feedback", mode="stream"),
+        )
+
+        events = await _collect(['{"response": "반영', "했어요", '", "modification_type": "all"}'])
+
+        assert LLM_PARSE_FAILURES.value(family="feedback", mode="stream") == before[0] + 1
+        assert LLM_INVALID_OUTPUTS.value(family="feedback", mode="stream") == before[1] + 1
+
+        assert events[-1]["type"] == "analysis_ready"
+        assert events[-1]["data"]["modification_type"] == "none"
+        assert events[-1]["data"]["modifications"] == {"monthly_goals": [], "weekly_tasks": []}
@@ -0,0 +1,27 @@
+"""Tests for shared compiled LangGraph workflows."""
+
+from unittest.mock import patch
+
+from app.ai import interview_graph
+from app.ai.interview_graph import get_analysis_graph, get_question_graph
+from app.ai.roadmap_graph import get_roadmap_graph
+
+
+class TestGraphReuse:
+    """Test graphs are compiled once and shared between requests."""
+
+    def test_getters_return_same_graph(self):
+        assert get_roadmap_graph() is get_roadmap_graph()
+        assert get_question_graph() is get_question_graph()
+        assert get_analysis_graph() is get_analysis_graph()
+
+    async def test_requests_do_not_recompile(self):
+        get_question_graph()
+        state = {"questions": [{"id": "q1"}], "round": 1}
+
+        with patch.object(interview_graph, "create_question_graph") as create, \
+                patch.object(get_question_graph(), "invoke", return_value=state):
+            await interview_graph.generate_questions("파이썬", 3)
+            await interview_graph.generate_questions("파이썬", 3)
+
+        create.assert_not_called()
@@ -0,0 +1,93 @@
+"""Tests for incremental JSON parsing and token-level roadmap streaming."""
+
+import json
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from app.ai.json_stream import IncrementalJSONParser
+from app.ai.roadmap_stream import generate_roadmap_streaming
+from app.models.roadmap import RoadmapMode
+
+
+WEEKS_RESPONSE = "```json\n" + json.dumps({
+    "weeks": [
+        {"week_number": i, "title": f"{i}주차 {{제목}}", "description": f"설명 \"{i}\""}
+        for i in range(1, 5)
+    ]
+}, ensure_ascii=False) + "\n```"
+
+
+def _chunks(text: str, size: int = 7):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestIncrementalJSONParser:
+    """Test IncrementalJSONParser."""
+
+    def test_array_items_emitted_as_completed(self):
+        """Test each week is returned as soon as its object closes."""
+        parser = IncrementalJSONParser(array_key="weeks")
+        seen = []
+        for chunk in _chunks(WEEKS_RESPONSE):
+            seen.extend(parser.feed(chunk))
+
+        assert [w["week_number"] for w in seen] == [1, 2, 3, 4]
+        assert seen[0]["title"] == "1주차 {제목}"
+        assert parser.result()["weeks"] == seen
+
+    def test_first_item_before_document_ends(self):
+        """Test the first item is available before the rest is streamed."""
+        parser = IncrementalJSONParser(array_key="weeks")
+        cut = WEEKS_RESPONSE.index('"week_number": 2')
+
+        assert len(parser.feed(WEEKS_RESPONSE[:cut])) == 1
+
+    def test_partial_object_repair(self):
+        """Test partial() closes open strings and drops dangling keys."""
+        parser = IncrementalJSONParser()
+        parser.feed('{"title": "React 기초", "descr')
+        assert parser.partial() == {"title": "React 기초"}
+
+        parser.feed('iption": "컴포넌트와 \\"상태')
+        assert parser.partial() == {"title": "React 기초", "description": "컴포넌트와 \"상태"}
+
+    def test_partial_before_json_starts(self):
+        """Test partial() is None until the root object opens."""
+        parser = IncrementalJSONParser()
+        parser.feed("```js")
+        assert parser.partial() is None
+
+
+class TestTokenStreamingEvents:
+    """Test generate_roadmap_streaming emits partial events."""
+
+    async def test_month_delta_and_week_ready_events(self):
+        """Test month_delta/week_ready precede month_ready/weeks_ready."""
+        month_response = json.dumps({"title": "1개월 목표", "description": "기초 다지기"}, ensure_ascii=False)
+
+        def fake_stream(prompt, temperature=0.7, cancel_token=None, family=None):
+            text = WEEKS_RESPONSE if '"weeks"' in str(prompt) else month_response
+            yield from _chunks(text)
+
+        with patch("app.ai.roadmap_stream.invoke_llm_json", return_value={"title": "T", "description": "D"}), \
+                patch("app.ai.llm.stream_llm_text", side_effect=fake_stream):
+            events = [
+                event async for event in generate_roadmap_streaming(
+                    topic="Python",
+                    duration_months=1,
+                    start_date=date(2026, 1, 1),
+                    mode=RoadmapMode.PLANNING,
+                    user_id="00000000-0000-0000-0000-000000000000",
+                    db=MagicMock(),
+                    skip_save=True,
+                )
+            ]
+
+        types = [e["type"] for e in events]
+        assert types.index("month_delta") < types.index("month_ready")
+        assert types.count("week_ready") == 4
+        assert types.index("week_ready") < types.index("weeks_ready")
+        assert events[types.index("month_ready")]["data"]["title"] == "1개월 목표"
+
+        preview = events[types.index("preview_ready")]["data"]
+        assert [w["week_number"] for w in preview["weekly_tasks"][0]["weeks"]] == [1, 2, 3, 4]
@@ -0,0 +1,24 @@
+"""Tests that AI dependencies are loaded lazily."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def test_app_import_does_not_load_ai_packages():
+    """Test importing the API app leaves langchain/langgraph/anthropic unloaded."""
+    code = (
+        "import sys, app.main; "
+        "print(','.join(m for m in ('langchain_anthropic', 'langchain_core', 'langgraph', 'anthropic') "
+        "if m in sys.modules))"
+    )
+    env = {**os.environ, "SECRET_KEY": "x" * 40}
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ""
@@ -0,0 +1,71 @@
+"""Tests for the event-loop lag monitor."""
+
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+from app.core.http_metrics import UNMATCHED_ROUTE
+from app.core.loop_monitor import (
+    LOOP_BLOCKED,
+    LOOP_LAG_SECONDS,
+    LoopLagMonitor,
+    RequestTaskMiddleware,
+)
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)  # 동기 DB/CPU 작업 흉내
+
+
+async def _request(path: str, seconds: float, route: str = None) -> None:
+    """Run a blocking handler behind RequestTaskMiddleware."""
+
+    async def handler(scope, receive, send):
+        if route is not None:
+            scope["route"] = SimpleNamespace(path=route)  # 라우터가 매칭 시 기록하는 것처럼
+        await asyncio.sleep(0)
+        _block_the_loop(seconds)
+
+    await RequestTaskMiddleware(handler)({"type": "http", "path": path}, None, None)
+
+
+class TestLoopLagMonitor:
+    """Test lag is sampled and blocking calls are attributed to their route."""
+
+    async def test_records_lag(self):
+        before = LOOP_LAG_SECONDS.value()
+        monitor = LoopLagMonitor(interval=0.01, threshold=1.0)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert LOOP_LAG_SECONDS.value() > before
+
+    async def test_captures_blocking_stack_and_route(self, caplog):
+        before = LOOP_BLOCKED.value(route="/slow/{item_id}")
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+        monitor.start()
+        await asyncio.sleep(0.03)
+
+        with caplog.at_level(logging.WARNING, logger="app.core.loop_monitor"):
+            await asyncio.create_task(_request("/slow/1", 0.3, route="/slow/{item_id}"))
+            await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert LOOP_BLOCKED.value(route="/slow/{item_id}") == before + 1
+        report = next(r.getMessage() for r in caplog.records if "route=/slow/{item_id}" in r.getMessage())
+        assert "_block_the_loop" in report
+
+    async def test_unmatched_request_is_not_labelled_by_path(self):
+        before = LOOP_BLOCKED.value(route=UNMATCHED_ROUTE)
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+        monitor.start()
+        await asyncio.sleep(0.03)
+
+        await asyncio.create_task(_request("/scan/wp-login.php", 0.3))
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert LOOP_BLOCKED.value(route=UNMATCHED_ROUTE) == before + 1
+        assert LOOP_BLOCKED.value(route="/scan/wp-login.php") == 0
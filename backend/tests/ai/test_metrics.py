@@ -0,0 +1,112 @@
+"""Tests for histograms, Prometheus exposition and per-route HTTP metrics."""
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.ai.llm import invoke_llm_json, record_fallback, stream_llm_text
+from app.ai.output_schemas import DailyTasksOutput
+from app.ai.prompt_families import PromptFamily
+from app.ai.resilience import anthropic_breaker
+from app.config import settings
+from app.core import metrics
+from app.core.http_metrics import HTTP_REQUEST_SECONDS, SSE_STREAM_SECONDS, SSE_STREAMS, MetricsMiddleware
+
+
+class TestHistogram:
+    """Test bucket counts and the text exposition format."""
+
+    def test_exposition(self):
+        hist = metrics.histogram("test_latency_seconds", "Test latency", ("route",), buckets=(0.1, 1.0))
+        hist.clear()
+        for value in (0.05, 0.5, 5.0):
+            hist.observe(value, route="/a")
+
+        text = metrics.render_prometheus()
+
+        assert "# TYPE test_latency_seconds histogram" in text
+        assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'test_latency_seconds_bucket{route="/a",le="1"} 2' in text
+        assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'test_latency_seconds_count{route="/a"} 3' in text
+        assert hist.value(route="/a") == 3
+        assert hist.sum(route="/a") == 5.55
+
+    def test_collectors_run_on_render(self):
+        level = metrics.gauge("test_collected_level", "Set at scrape time")
+        metrics.register_collector(lambda: level.set(7))
+
+        assert "test_collected_level 7" in metrics.render_prometheus()
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/events")
+    async def events():
+        async def body():
+            assert SSE_STREAMS.value(route="/events") == 1
+            yield "event: done\ndata: {}\n\n"
+
+        return StreamingResponse(body(), media_type="text/event-stream")
+
+    return app
+
+
+class TestHttpMetrics:
+    """Test requests are labelled by route template and SSE streams are tracked separately."""
+
+    def test_route_template_label(self):
+        before = HTTP_REQUEST_SECONDS.value(method="GET", route="/items/{item_id}", status="200")
+        client = TestClient(_app())
+
+        client.get("/items/1")
+        client.get("/items/2")
+        client.get("/missing")
+
+        assert HTTP_REQUEST_SECONDS.value(method="GET", route="/items/{item_id}", status="200") == before + 2
+        assert HTTP_REQUEST_SECONDS.value(method="GET", route="unmatched", status="404") >= 1
+
+    def test_sse_stream(self):
+        before = SSE_STREAM_SECONDS.value(route="/events")
+
+        assert TestClient(_app()).get("/events").status_code == 200
+
+        assert SSE_STREAMS.value(route="/events") == 0
+        assert SSE_STREAM_SECONDS.value(route="/events") == before + 1
+
+
+class TestLLMMetrics:
+    """Test LLM latency, token and fallback metrics per family."""
+
+    def test_latency_tokens_and_fallbacks(self, monkeypatch):
+        monkeypatch.setattr(settings, "llm_backend", "fake")
+        monkeypatch.setattr(settings, "llm_singleflight", False)
+        monkeypatch.setattr(settings, "llm_structured_output", False)
+        monkeypatch.setattr(settings, "fake_llm_latency_median_ms", 0)
+        monkeypatch.setattr(settings, "fake_llm_tokens_per_second", 0)
+        anthropic_breaker.reset()
+        latency = metrics.get_metric("llm_request_duration_seconds")
+        first_token = metrics.get_metric("llm_first_token_seconds")
+        output_tokens = metrics.get_metric("llm_output_tokens_total")
+        fallbacks = metrics.get_metric("llm_fallbacks_total")
+        before = (
+            latency.value(family="daily", mode="json"),
+            first_token.value(family="weeks"),
+            output_tokens.value(family="daily"),
+            fallbacks.value(family="daily"),
+        )
+
+        invoke_llm_json("일일 태스크", family=PromptFamily.DAILY, schema=DailyTasksOutput)
+        "".join(stream_llm_text("주차", family=PromptFamily.WEEKS))
+        record_fallback(PromptFamily.DAILY)
+
+        assert latency.value(family="daily", mode="json") == before[0] + 1
+        assert first_token.value(family="weeks") == before[1] + 1
+        assert output_tokens.value(family="daily") > before[2]
+        assert fallbacks.value(family="daily") == before[3] + 1
@@ -0,0 +1,71 @@
+"""Tests for partial week regeneration after feedback-chat edits."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.ai.feedback_node import apply_modifications, find_stale_weeks
+from app.ai.roadmap_stream import regenerate_weeks_streaming
+
+
+@pytest.fixture
+def roadmap():
+    return {
+        "monthly_goals": [
+            {"month_number": m, "title": f"{m}월 목표", "description": f"{m}월 설명"} for m in (1, 2, 3)
+        ],
+        "weekly_tasks": [
+            {
+                "month_number": m,
+                "weeks": [
+                    {"week_number": w, "title": f"{m}-{w} 주차", "description": "설명"} for w in range(1, 5)
+                ],
+            }
+            for m in (1, 2, 3)
+        ],
+    }
+
+
+class TestFindStaleWeeks:
+    """Test stale week detection from a modification diff."""
+
+    def test_changed_month_goal_marks_its_weeks(self, roadmap):
+        modifications = {
+            "monthly_goals": [{"month_number": 2, "title": "새 목표", "description": "새 설명"}],
+            "weekly_tasks": [{"month_number": 2, "week_number": 1, "title": "직접 수정", "description": "d"}],
+        }
+        updated = apply_modifications(roadmap, modifications)
+
+        assert find_stale_weeks(roadmap, updated, modifications) == {2: [2, 3, 4]}
+
+    def test_unchanged_goal_is_not_stale(self, roadmap):
+        """Test echoing the current goal back is not a change."""
+        modifications = {"monthly_goals": [dict(roadmap["monthly_goals"][0])]}
+        updated = apply_modifications(roadmap, modifications)
+
+        assert find_stale_weeks(roadmap, updated, modifications) == {}
+
+
+class TestRegenerateWeeksStreaming:
+    """Test only stale weeks are regenerated and merged."""
+
+    async def test_regenerates_stale_months_only(self, roadmap):
+        calls = []
+
+        def fake_weeks(topic, month_goal, month_number, interview_section, cancel_token=None):
+            calls.append(month_number)
+            return [{"week_number": w, "title": f"new {month_number}-{w}", "description": "n"} for w in range(1, 5)]
+
+        with patch("app.ai.roadmap_stream._generate_single_month_weeks", side_effect=fake_weeks):
+            events = [
+                event
+                async for event in regenerate_weeks_streaming(
+                    "파이썬", roadmap["monthly_goals"], roadmap["weekly_tasks"], {2: [3, 4]}
+                )
+            ]
+
+        assert calls == [2]
+        assert [e["type"] for e in events] == ["weeks_ready", "progress", "regenerate_complete"]
+        month2 = events[-1]["data"]["weekly_tasks"][1]["weeks"]
+        assert [w["title"] for w in month2] == ["2-1 주차", "2-2 주차", "new 2-3", "new 2-4"]
+        assert events[-1]["data"]["weekly_tasks"][0] == roadmap["weekly_tasks"][0]
@@ -0,0 +1,129 @@
+"""Tests for cacheable prompt assembly and cache token accounting."""
+
+from unittest.mock import patch
+
+import pytest
+from anthropic.types import Message, TextBlock, Usage
+
+from app.ai.llm import (
+    LLM_CACHE_READ_TOKENS,
+    LLM_CACHE_WRITE_TOKENS,
+    _append_to_prompt,
+    build_messages,
+    create_llm,
+    invoke_llm_json,
+)
+from app.ai.prompts import learning_templates, streaming_templates, templates
+from app.ai.prompts.cached import CachedPrompt, PromptParts
+from app.ai.prompts.learning_templates import GRADING_PROMPT
+from app.config import settings
+
+
+def _grading_prompt(answer: str) -> PromptParts:
+    return GRADING_PROMPT.format(
+        question_type="ESSAY",
+        question_text="리스트와 튜플의 차이는?",
+        correct_answer="mutable vs immutable",
+        explanation="수정 가능 여부",
+        user_answer=answer,
+    )
+
+
+def _api_message(cache_write: int, cache_read: int) -> Message:
+    return Message(
+        id="msg_1",
+        type="message",
+        role="assistant",
+        model="test",
+        content=[TextBlock(type="text", text='{"is_correct": true}')],
+        stop_reason="end_turn",
+        stop_sequence=None,
+        usage=Usage(
+            input_tokens=50,
+            output_tokens=10,
+            cache_creation_input_tokens=cache_write,
+            cache_read_input_tokens=cache_read,
+        ),
+    )
+
+
+class TestCachedPrompt:
+    """Test CachedPrompt templates."""
+
+    @pytest.mark.parametrize("module", [templates, streaming_templates, learning_templates])
+    def test_large_templates_are_cacheable(self, module):
+        """Test the roadmap/learning templates keep per-request values out of system."""
+        prompts = [v for k, v in vars(module).items() if k.endswith("_PROMPT")]
+        assert prompts and all(isinstance(p, CachedPrompt) for p in prompts)
+
+    def test_system_block_is_identical_across_requests(self):
+        """Test only the user block changes between requests."""
+        first, second = _grading_prompt("답변 A"), _grading_prompt("답변 B")
+
+        assert first.system == second.system
+        assert "답변 A" in first.user and "답변 A" not in first.system
+        assert '"is_correct": true | false' in first.system  # 중괄호 이스케이프 해제
+
+    def test_placeholder_in_system_rejected(self):
+        """Test a template with a placeholder in the static part fails fast."""
+        with pytest.raises(ValueError):
+            CachedPrompt(system="주제: {topic}", user="")
+
+
+class TestRequestPayload:
+    """Test the Anthropic request payload built from prompts (offline)."""
+
+    def test_cache_control_on_system_block(self):
+        """Test the static block carries cache_control and the user block follows."""
+        prompt = _grading_prompt("답변")
+        payload = create_llm()._get_request_payload(build_messages(prompt))
+
+        assert payload["system"] == [{
+            "type": "text",
+            "text": prompt.system,
+            "cache_control": {"type": "ephemeral"},
+        }]
+        assert payload["messages"] == [{"role": "user", "content": prompt.user}]
+
+    def test_cache_disabled(self, monkeypatch):
+        """Test settings.llm_prompt_cache=False omits the marker."""
+        monkeypatch.setattr(settings, "llm_prompt_cache", False)
+        payload = create_llm()._get_request_payload(build_messages(_grading_prompt("답변")))
+
+        assert "cache_control" not in payload["system"][0]
+
+    def test_plain_string_prompt_unchanged(self):
+        """Test string prompts are still sent as a single user message."""
+        payload = create_llm()._get_request_payload(build_messages("질문"))
+
+        assert "system" not in payload
+        assert payload["messages"] == [{"role": "user", "content": "질문"}]
+
+    def test_repair_suffix_keeps_cached_prefix(self):
+        """Test repair instructions are appended to the user block only."""
+        prompt = _grading_prompt("답변")
+        repaired = _append_to_prompt(prompt, "\n수정 요청")
+
+        assert repaired.system == prompt.system
+        assert repaired.user.endswith("수정 요청")
+
+
+class TestCacheUsage:
+    """Test cache read/write tokens are recorded per family."""
+
+    def test_usage_recorded(self, monkeypatch):
+        """Test a cache write followed by a cache read is counted."""
+        monkeypatch.setattr(settings, "llm_singleflight", False)
+        llm = create_llm()
+        responses = [_api_message(1800, 0), _api_message(0, 1800)]
+        before_write = LLM_CACHE_WRITE_TOKENS.value(family="grading")
+        before_read = LLM_CACHE_READ_TOKENS.value(family="grading")
+
+        with patch("app.ai.llm.create_llm", return_value=llm), \
+                patch.object(type(llm._client.messages), "create", side_effect=responses) as create:
+            invoke_llm_json(_grading_prompt("답변 A"), family="grading")
+            invoke_llm_json(_grading_prompt("답변 B"), family="grading")
+
+        assert create.call_args_list[0].kwargs["system"] == create.call_args_list[1].kwargs["system"]
+        assert LLM_CACHE_WRITE_TOKENS.value(family="grading") == before_write + 1800
+        assert LLM_CACHE_READ_TOKENS.value(family="grading") == before_read + 1800
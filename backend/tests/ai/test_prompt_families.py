@@ -0,0 +1,73 @@
+"""Tests for the prompt-family registry."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.ai.llm import _family_llm, _request_key, build_messages, create_llm
+from app.ai.prompt_families import (
+    DEFAULT_MODELS,
+    ModelTier,
+    PromptFamily,
+    get_family_spec,
+)
+from app.config import settings
+
+
+class TestFamilySpec:
+    """Test default specs and settings overrides."""
+
+    def test_fast_tier_for_short_calls(self):
+        """Test titles and grading use the fast model with small budgets."""
+        for family in (PromptFamily.TITLE, PromptFamily.GRADING):
+            spec = get_family_spec(family)
+            assert spec.tier == ModelTier.FAST
+            assert spec.model == DEFAULT_MODELS[ModelTier.FAST]
+            assert spec.max_tokens <= 1024
+        assert get_family_spec(PromptFamily.QUESTIONS).tier == ModelTier.LARGE
+
+    def test_settings_override(self, monkeypatch):
+        """Test llm_families overrides individual fields and model names."""
+        monkeypatch.setattr(settings, "llm_families", {"grading": {"tier": "large", "max_tokens": 2048}})
+        monkeypatch.setattr(settings, "llm_model_large", "claude-test-large")
+        spec = get_family_spec("grading")
+
+        assert spec.model == "claude-test-large"
+        assert spec.max_tokens == 2048
+        assert spec.temperature == 0.5  # 덮어쓰지 않은 값은 유지
+
+    def test_invalid_override_rejected(self, monkeypatch):
+        """Test unknown keys in an override fail loudly."""
+        monkeypatch.setattr(settings, "llm_families", {"title": {"max_token": 100}})
+        with pytest.raises(ValidationError):
+            get_family_spec("title")
+
+    def test_unknown_family_defaults(self):
+        """Test calls without a family keep the previous profile."""
+        spec = get_family_spec("unknown")
+        assert spec.model == DEFAULT_MODELS[ModelTier.LARGE]
+        assert spec.max_tokens == 8192
+
+
+class TestFamilyLLM:
+    """Test the request built for a family."""
+
+    def test_payload_uses_family_model_and_budget(self):
+        """Test grading requests use the fast model, its max_tokens and temperature."""
+        spec = get_family_spec(PromptFamily.GRADING)
+        llm = _family_llm(spec, spec.temperature)
+        payload = llm._get_request_payload(build_messages("채점"))
+
+        assert payload["model"] == spec.model
+        assert payload["max_tokens"] == spec.max_tokens
+        assert payload["temperature"] == 0.5
+
+    def test_instances_reused(self):
+        """Test identical settings share one client instance."""
+        assert create_llm(0.5, timeout=30.0) is create_llm(0.5, timeout=30.0)
+        assert create_llm(0.5, timeout=30.0) is not create_llm(0.7, timeout=30.0)
+
+    def test_family_in_coalescing_key(self):
+        """Test identical prompts for different models are not coalesced."""
+        title = _request_key("p", 0.7, None, get_family_spec(PromptFamily.TITLE))
+        month = _request_key("p", 0.7, None, get_family_spec(PromptFamily.MONTH))
+        assert title != month
@@ -0,0 +1,174 @@
+"""Tests for LLM retries, timeouts and the circuit breaker."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import anthropic
+import httpx
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.ai.llm import invoke_llm_json
+from app.ai.resilience import (
+    LLM_RETRIES,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    anthropic_breaker,
+    call_with_resilience,
+    family_timeout,
+)
+from app.ai.roadmap_stream import generate_roadmap_streaming
+from app.config import settings
+from app.models.roadmap import RoadmapMode
+
+
+def _connection_error() -> anthropic.APIConnectionError:
+    return anthropic.APIConnectionError(request=httpx.Request("POST", "https://api.anthropic.com"))
+
+
+def _bad_request() -> anthropic.BadRequestError:
+    request = httpx.Request("POST", "https://api.anthropic.com")
+    response = httpx.Response(400, request=request)
+    return anthropic.BadRequestError("bad request", response=response, body=None)
+
+
+NO_DELAY = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset_breaker(monkeypatch):
+    monkeypatch.setattr(settings, "llm_retry_base_delay", 0)
+    anthropic_breaker.reset()
+    yield
+    anthropic_breaker.reset()
+
+
+class TestRetry:
+    """Test call_with_resilience retry behaviour."""
+
+    def test_retries_transient_errors(self):
+        """Test a transient failure is retried and counted."""
+        breaker = CircuitBreaker("test", failure_threshold=5, recovery_timeout=10)
+        fn = MagicMock(side_effect=[_connection_error(), "ok"])
+        before = LLM_RETRIES.value(family="title")
+
+        assert call_with_resilience(fn, "title", breaker=breaker, policy=NO_DELAY) == "ok"
+        assert fn.call_count == 2
+        assert LLM_RETRIES.value(family="title") == before + 1
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_does_not_retry_client_errors(self):
+        """Test 4xx errors are raised immediately and do not trip the breaker."""
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10)
+        fn = MagicMock(side_effect=_bad_request())
+
+        with pytest.raises(anthropic.BadRequestError):
+            call_with_resilience(fn, "title", breaker=breaker, policy=NO_DELAY)
+
+        assert fn.call_count == 1
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_backoff_is_bounded(self):
+        """Test full-jitter backoff stays within the exponential cap."""
+        policy = RetryPolicy(max_attempts=5, base_delay=0.5, max_delay=2.0)
+        assert all(0 <= policy.backoff(3) <= 2.0 for _ in range(100))
+        assert all(0 <= policy.backoff(1) <= 0.5 for _ in range(100))
+
+    def test_family_timeout_override(self, monkeypatch):
+        """Test settings override the default per-family timeout."""
+        monkeypatch.setattr(settings, "llm_families", {"grading": {"timeout": 5.0}})
+        assert family_timeout("grading") == 5.0
+        assert family_timeout("questions") == 120.0
+        assert family_timeout("unknown") == settings.llm_timeout_seconds
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_and_recovers(self):
+        """Test open → half_open → closed after a successful trial call."""
+        clock = _Clock()
+        breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        clock.now = 31
+        breaker.before_call()  # 시험 호출 허용
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # 동시에 두 번째 시험 호출은 차단
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        """Test a failed half-open trial opens the breaker again."""
+        clock = _Clock()
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 31
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestOpenCircuitFallbacks:
+    """Test an open breaker skips the API and reaches existing fallbacks."""
+
+    def test_invoke_skips_model(self):
+        """Test invoke_llm_json raises CircuitOpenError without calling the model."""
+        for _ in range(settings.llm_breaker_failure_threshold):
+            anthropic_breaker.record_failure()
+        llm = MagicMock()
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            with pytest.raises(CircuitOpenError):
+                invoke_llm_json("prompt", family="title")
+
+        llm.invoke.assert_not_called()
+
+    async def test_streaming_generation_uses_fallbacks(self):
+        """Test roadmap streaming completes with fallback content while open."""
+        for _ in range(settings.llm_breaker_failure_threshold):
+            anthropic_breaker.record_failure()
+        llm = MagicMock()
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            events = [
+                event async for event in generate_roadmap_streaming(
+                    topic="Python",
+                    duration_months=1,
+                    start_date=date(2026, 1, 1),
+                    mode=RoadmapMode.PLANNING,
+                    user_id="00000000-0000-0000-0000-000000000000",
+                    db=MagicMock(),
+                    skip_save=True,
+                )
+            ]
+
+        preview = events[-1]
+        assert preview["type"] == "preview_ready"
+        assert preview["data"]["title"] == "Python 학습 로드맵"
+        assert len(preview["data"]["weekly_tasks"][0]["weeks"]) == 4
+        llm.invoke.assert_not_called()
+        llm.stream.assert_not_called()
+
+    def test_retry_then_success_through_invoke(self):
+        """Test invoke_llm_json retries a dropped connection."""
+        llm = MagicMock()
+        llm.invoke.side_effect = [_connection_error(), AIMessage(content='{"title": "A"}')]
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            assert invoke_llm_json("prompt", family="title") == {"title": "A"}
+
+        assert llm.invoke.call_count == 2
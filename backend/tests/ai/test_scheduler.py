@@ -0,0 +1,123 @@
+"""Tests for the LLM priority scheduler."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.ai.scheduler import LLMPriority, LLMScheduler
+
+
+@pytest.fixture
+def make_scheduler():
+    schedulers = []
+
+    def make(**kwargs):
+        kwargs.setdefault("reserved_interactive", 0)
+        kwargs.setdefault("aging_seconds", 0)
+        scheduler = LLMScheduler(**kwargs)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.shutdown()
+
+
+def block(scheduler, priority=LLMPriority.GENERATION, user_id="blocker"):
+    """Occupy one worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def job():
+        started.set()
+        release.wait(timeout=5)
+
+    future = scheduler.submit(priority, user_id, job)
+    assert started.wait(timeout=5)
+    return release, future
+
+
+class TestLLMScheduler:
+    """Test priority classes, per-user fairness, reserved workers and aging."""
+
+    def test_higher_priority_class_runs_first(self, make_scheduler):
+        scheduler = make_scheduler(workers=1)
+        release, _ = block(scheduler)
+        order = []
+        futures = [
+            scheduler.submit(priority, "u1", order.append, priority.label)
+            for priority in (LLMPriority.BACKGROUND, LLMPriority.GENERATION, LLMPriority.INTERACTIVE)
+        ]
+
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["interactive", "generation", "background"]
+
+    def test_promote_queued_job(self, make_scheduler):
+        scheduler = make_scheduler(workers=1)
+        release, running = block(scheduler)
+        order = []
+        prefetch = scheduler.submit(LLMPriority.BACKGROUND, "u1", order.append, "prefetch")
+        other = scheduler.submit(LLMPriority.GENERATION, "u2", order.append, "other")
+
+        assert scheduler.promote(prefetch, LLMPriority.INTERACTIVE)
+        assert not scheduler.promote(prefetch, LLMPriority.BACKGROUND)  # 내리지는 않음
+        assert not scheduler.promote(running, LLMPriority.INTERACTIVE)  # 이미 실행 중
+        release.set()
+        for future in (prefetch, other):
+            future.result(timeout=5)
+
+        assert order == ["prefetch", "other"]
+        assert scheduler.stats()["background"]["queued"] == 0
+
+    def test_users_alternate_within_a_class(self, make_scheduler):
+        scheduler = make_scheduler(workers=1)
+        release, _ = block(scheduler)
+        order = []
+        futures = [scheduler.submit(LLMPriority.GENERATION, "heavy", order.append, f"heavy{i}") for i in range(3)]
+        futures.append(scheduler.submit(LLMPriority.GENERATION, "light", order.append, "light0"))
+
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["heavy0", "light0", "heavy1", "heavy2"]
+
+    def test_reserved_worker_only_runs_interactive(self, make_scheduler):
+        scheduler = make_scheduler(workers=2, reserved_interactive=1)
+        release, _ = block(scheduler, LLMPriority.BACKGROUND)
+        queued = scheduler.submit(LLMPriority.BACKGROUND, "u1", lambda: "background")
+
+        assert scheduler.submit(LLMPriority.INTERACTIVE, "u2", lambda: "chat").result(timeout=5) == "chat"
+        assert not queued.done()
+        assert scheduler.stats()["background"]["queued"] == 1
+
+        release.set()
+        assert queued.result(timeout=5) == "background"
+
+    def test_long_waiting_job_is_promoted(self, make_scheduler):
+        scheduler = make_scheduler(workers=1, aging_seconds=0.05)
+        release, _ = block(scheduler)
+        order = []
+        futures = [scheduler.submit(LLMPriority.BACKGROUND, "u1", order.append, "prefetch")]
+        time.sleep(0.12)
+        futures.append(scheduler.submit(LLMPriority.INTERACTIVE, "u2", order.append, "chat"))
+
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["prefetch", "chat"]
+
+    async def test_executor_works_with_run_in_executor(self, make_scheduler):
+        scheduler = make_scheduler(workers=2)
+        executor = scheduler.executor(LLMPriority.INTERACTIVE, "u1")
+        loop = asyncio.get_running_loop()
+
+        assert await loop.run_in_executor(executor, sum, [1, 2, 3]) == 6
+        with pytest.raises(ValueError):
+            await loop.run_in_executor(executor, int, "not a number")
@@ -0,0 +1,191 @@
+"""Tests for single-flight coalescing of LLM calls and daily generation."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from langchain_core.messages import AIMessage
+
+from app.ai.cancellation import GenerationCancelled
+from app.ai.llm import invoke_llm_json
+from app.ai.scheduler import LLMPriority
+from app.ai.singleflight import SingleFlight
+from app.config import settings
+from app.models import DailyGenerationStatus
+from app.services.daily_generation_service import DailyGenerationService
+
+
+def _run_concurrently(fn, count):
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return [f.result() for f in [pool.submit(fn) for _ in range(count)]]
+
+
+class TestSingleFlight:
+    """Test the SingleFlight primitive."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Test duplicate keys wait for the leader and get independent copies."""
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def work():
+            calls.append(1)
+            release.wait(2)
+            return {"items": [1]}
+
+        def call():
+            return flight.do("key", work)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(call) for _ in range(3)]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert sorted(shared for _, shared in results) == [False, True, True]
+        results[0][0]["items"].append(2)
+        assert results[1][0]["items"] == [1] and results[2][0]["items"] == [1]
+
+    def test_follower_retries_when_leader_cancelled(self):
+        """Test a cancelled leader does not fail its followers."""
+        flight = SingleFlight()
+        started = threading.Event()
+        attempts = []
+
+        def cancelled_work():
+            attempts.append("leader")
+            started.set()
+            time.sleep(0.05)
+            raise GenerationCancelled("client disconnected")
+
+        def follower():
+            started.wait(1)
+            attempts.append("follower")
+            return flight.do("key", lambda: "fresh")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", cancelled_work)
+            follow = pool.submit(follower)
+            with pytest.raises(GenerationCancelled):
+                leader.result()
+            assert follow.result() == ("fresh", False)
+
+
+class TestInvokeCoalescing:
+    """Test identical invoke_llm_json calls are coalesced."""
+
+    def test_identical_prompts_hit_api_once(self):
+        """Test concurrent identical prompts issue one upstream request."""
+        llm = MagicMock()
+
+        def slow_invoke(messages):
+            time.sleep(0.1)
+            return AIMessage(content='{"questions": []}')
+
+        llm.invoke.side_effect = slow_invoke
+
+        with patch("app.ai.llm.create_llm", return_value=llm):
+            results = _run_concurrently(
+                lambda: invoke_llm_json("same prompt", family="interview"), 4
+            )
+
+        assert llm.invoke.call_count == 1
+        assert all(r == {"questions": []} for r in results)
+
+
+class TestDailyGenerationCoalescing:
+    """Test generate-daily attaches to an in-flight generation instead of 409."""
+
+    async def test_second_request_joins_first(self):
+        """Test a double-click generates once and both callers get the week."""
+        week_id = uuid4()
+        weekly_task = SimpleNamespace(
+            id=week_id, daily_generation_status=DailyGenerationStatus.NONE
+        )
+        service = DailyGenerationService(MagicMock())
+        generated = []
+
+        def generate(*args):
+            generated.append(1)
+            time.sleep(0.1)
+            return [{"day_number": 1, "tasks": []}]
+
+        with patch.object(service, "get_weekly_task_with_context", return_value=(weekly_task, MagicMock())), \
+                patch.object(service, "has_daily_tasks", return_value=False), \
+                patch.object(service, "_generate_daily_tasks_sync", side_effect=generate), \
+                patch.object(service, "_save_daily_tasks"):
+            first, second = await asyncio.gather(
+                service.generate_daily_tasks_for_week(week_id, uuid4(), force=True),
+                service.generate_daily_tasks_for_week(week_id, uuid4(), force=True),
+            )
+
+        assert len(generated) == 1
+        assert first is second is weekly_task
+        assert weekly_task.daily_generation_status == DailyGenerationStatus.COMPLETED
+
+    async def test_joining_request_raises_background_priority(self):
+        """Test a user joining a queued prefetch does not wait at background priority."""
+        week_id = uuid4()
+        weekly_task = SimpleNamespace(
+            id=week_id, daily_generation_status=DailyGenerationStatus.NONE
+        )
+        service = DailyGenerationService(MagicMock())
+        scheduler = MagicMock()
+
+        def generate(*args):
+            time.sleep(0.1)
+            return [{"day_number": 1, "tasks": []}]
+
+        with patch.object(service, "get_weekly_task_with_context", return_value=(weekly_task, MagicMock())), \
+                patch.object(service, "has_daily_tasks", return_value=False), \
+                patch.object(service, "_generate_daily_tasks_sync", side_effect=generate), \
+                patch.object(service, "_save_daily_tasks"), \
+                patch("app.services.daily_generation_service.get_llm_scheduler", return_value=scheduler):
+            await asyncio.gather(
+                service.generate_daily_tasks_for_week(week_id, uuid4(), force=True, priority=LLMPriority.BACKGROUND),
+                service.generate_daily_tasks_for_week(week_id, uuid4()),
+            )
+
+        (job, priority), _ = scheduler.promote.call_args
+        assert priority == LLMPriority.GENERATION
+        assert job.done()
+
+    async def test_stale_generation_from_other_worker_is_taken_over(self):
+        """Test a GENERATING status left by a stopped worker does not block the week."""
+        weekly_task = SimpleNamespace(
+            id=uuid4(),
+            daily_generation_status=DailyGenerationStatus.GENERATING,
+            daily_generation_started_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        db = MagicMock()
+        db.query.return_value.filter.return_value.update.return_value = 1
+        service = DailyGenerationService(db)
+
+        assert await service._wait_for_inflight_generation(weekly_task) is False
+        db.query.return_value.filter.return_value.update.assert_called_once()
+
+    async def test_recent_generation_from_other_worker_returns_409(self, monkeypatch):
+        """Test a fresh GENERATING status is waited on briefly, then 409."""
+        monkeypatch.setattr(settings, "daily_generation_wait_seconds", 0)
+        weekly_task = SimpleNamespace(
+            id=uuid4(),
+            daily_generation_status=DailyGenerationStatus.GENERATING,
+            daily_generation_started_at=datetime.now(timezone.utc),
+        )
+        db = MagicMock()
+        service = DailyGenerationService(db)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service._wait_for_inflight_generation(weekly_task)
+
+        assert exc_info.value.status_code == 409
+        db.query.assert_not_called()
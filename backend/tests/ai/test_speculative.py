@@ -0,0 +1,102 @@
+"""Tests for speculative roadmap generation after the interview."""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from app.ai import speculative
+from app.ai.roadmap_stream import generate_roadmap_streaming
+from app.config import settings
+from app.models.roadmap import RoadmapMode
+
+CONTEXT = {"specific_goal": "웹 크롤러 만들기"}
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(settings, "speculative_generation", True)
+    monkeypatch.setattr(settings, "speculative_ttl_seconds", 60.0)
+    speculative._runs.clear()
+
+
+@pytest.fixture
+def fake_llm():
+    """Count title/month/week generations without calling the LLM."""
+    calls = {"title": 0, "month": [], "weeks": []}
+
+    def title(*args):
+        calls["title"] += 1
+        return {"title": "파이썬 로드맵", "description": "설명"}
+
+    async def month(topic, roadmap_title, month_number, *args):
+        calls["month"].append(month_number)
+        yield {"type": "month_delta", "data": {"month_number": month_number, "title": "목"}}
+        yield {"type": "month_ready", "data": {"month_number": month_number, "title": "목표", "description": "d"}}
+
+    async def weeks(topic, month_goal, month_number, *args):
+        calls["weeks"].append(month_number)
+        yield {"type": "weeks_ready", "data": {"month_number": month_number, "weeks": []}}
+
+    with patch("app.ai.roadmap_stream._generate_title", side_effect=title), \
+            patch("app.ai.roadmap_stream._stream_single_month", side_effect=month), \
+            patch("app.ai.roadmap_stream._stream_single_month_weeks", side_effect=weeks):
+        yield calls
+
+
+async def _generate(speculation):
+    return [
+        event
+        async for event in generate_roadmap_streaming(
+            "파이썬", 2, date(2026, 1, 1), RoadmapMode.PLANNING, "user", None,
+            interview_context=CONTEXT, skip_save=True, speculation=speculation,
+        )
+    ]
+
+
+class TestSpeculativeGeneration:
+    """Test claiming, replay and discarding of speculative runs."""
+
+    async def test_claimed_run_is_replayed(self, enabled, fake_llm):
+        run = speculative.start_speculation("s1", "user", "파이썬", 2, CONTEXT)
+        await run.task
+
+        claimed = speculative.claim_speculation("s1", "user", "파이썬", 2, CONTEXT)
+        events = await _generate(claimed)
+
+        assert claimed is run
+        assert fake_llm["title"] == 1
+        assert fake_llm["month"] == [1, 2]
+        assert fake_llm["weeks"] == [1, 2]
+        assert [e["type"] for e in events].count("month_delta") == 2
+        assert events[-1]["type"] == "preview_ready"
+
+    async def test_claim_while_running_continues_live(self, enabled, fake_llm):
+        run = speculative.start_speculation("s1", "user", "파이썬", 2, CONTEXT)
+        claimed = speculative.claim_speculation("s1", "user", "파이썬", 2, CONTEXT)
+
+        events = await _generate(claimed)
+
+        assert run.finished
+        assert fake_llm["title"] == 1 and fake_llm["month"] == [1, 2]
+        assert events[-1]["data"]["monthly_goals"][1]["month_number"] == 2
+
+    async def test_mismatched_parameters_discard_run(self, enabled, fake_llm):
+        run = speculative.start_speculation("s1", "user", "파이썬", 2, CONTEXT)
+
+        assert speculative.claim_speculation("s1", "user", "파이썬", 3, CONTEXT) is None
+        assert run.cancel_token.cancelled
+        assert "s1" not in speculative._runs
+
+    async def test_unclaimed_run_expires(self, enabled, fake_llm, monkeypatch):
+        monkeypatch.setattr(settings, "speculative_ttl_seconds", 0.01)
+        run = speculative.start_speculation("s1", "user", "파이썬", 2, CONTEXT)
+
+        await asyncio.sleep(0.05)
+
+        assert run.cancel_token.cancelled
+        assert speculative.claim_speculation("s1", "user", "파이썬", 2, CONTEXT) is None
+
+    async def test_disabled_by_default(self, fake_llm):
+        assert speculative.start_speculation("s1", "user", "파이썬", 2, CONTEXT) is None
@@ -0,0 +1,136 @@
+"""Tests for structured-output mode and partial-repair retries."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from pydantic import ValidationError
+
+from app.ai.llm import (
+    LLM_PARSE_FAILURES,
+    LLM_REPAIR_RETRIES,
+    get_family_stats,
+    invoke_llm_json,
+)
+from app.ai.output_schemas import GradingOutput, QuestionsOutput
+from app.ai.prompt_families import PromptFamily
+from app.config import settings
+
+
+def _tool_message(name: str, args: dict) -> AIMessage:
+    return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": "call_1"}])
+
+
+def _question(text: str, answer="1") -> dict:
+    return {
+        "question_type": "MULTIPLE_CHOICE",
+        "question_text": text,
+        "choices": ["a", "b", "c", "d"],
+        "correct_answer": answer,
+    }
+
+
+@pytest.fixture
+def structured_mode(monkeypatch):
+    monkeypatch.setattr(settings, "llm_structured_output", True)
+    monkeypatch.setattr(settings, "llm_repair_max_attempts", 1)
+
+
+@pytest.fixture
+def fake_llm():
+    """create_llm() replacement; responses are queued on .responses."""
+    llm = MagicMock()
+    llm.responses = []
+    llm.prompts = []
+    llm.tool_names = []
+
+    def bind_tools(tools, tool_choice=None):
+        llm.tool_names.append(tool_choice)
+        bound = MagicMock()
+
+        def invoke(messages):
+            llm.prompts.append(messages[0].content)
+            return llm.responses.pop(0)
+
+        bound.invoke.side_effect = invoke
+        return bound
+
+    llm.bind_tools.side_effect = bind_tools
+    with patch("app.ai.llm.create_llm", return_value=llm):
+        yield llm
+
+
+class TestStructuredOutput:
+    """Test invoke_llm_json in structured-output mode."""
+
+    def test_valid_tool_call(self, structured_mode, fake_llm):
+        """Test tool arguments are validated and returned as a dict."""
+        fake_llm.responses.append(_tool_message("GradingOutput", {
+            "is_correct": True, "score": 90, "feedback": "좋아요",
+        }))
+
+        result = invoke_llm_json("prompt", family=PromptFamily.GRADING, schema=GradingOutput)
+
+        assert result["is_correct"] is True
+        assert result["key_points_missed"] == []
+        assert fake_llm.tool_names == ["GradingOutput"]
+
+    def test_repairs_only_invalid_item(self, structured_mode, fake_llm):
+        """Test the repair call asks only for the broken list item and merges it."""
+        broken = {"question_type": "MULTIPLE_CHOICE", "choices": ["a", "b"]}
+        fake_llm.responses.append(_tool_message("QuestionsOutput", {
+            "questions": [_question("Q1"), broken, _question("Q3", answer=2)],
+        }))
+        fake_llm.responses.append(_tool_message("QuestionsOutputRepair", {
+            "questions_1": _question("Q2"),
+        }))
+        before = LLM_REPAIR_RETRIES.value(family="questions")
+
+        result = invoke_llm_json("prompt", family=PromptFamily.QUESTIONS, schema=QuestionsOutput)
+
+        assert [q["question_text"] for q in result["questions"]] == ["Q1", "Q2", "Q3"]
+        assert result["questions"][2]["correct_answer"] == "2"
+        assert fake_llm.tool_names == ["QuestionsOutput", "QuestionsOutputRepair"]
+        assert "questions.1.question_text" in fake_llm.prompts[1]
+        assert LLM_REPAIR_RETRIES.value(family="questions") == before + 1
+
+    def test_gives_up_after_max_attempts(self, structured_mode, fake_llm):
+        """Test a still-invalid output raises so the caller's fallback runs."""
+        fake_llm.responses.append(_tool_message("GradingOutput", {"score": 10}))
+        fake_llm.responses.append(_tool_message("GradingOutputRepair", {}))
+
+        with pytest.raises(ValidationError):
+            invoke_llm_json("prompt", family=PromptFamily.GRADING, schema=GradingOutput)
+
+    def test_truncated_tool_input_is_salvaged(self, structured_mode, fake_llm):
+        """Test a truncated tool call keeps finished items and repairs the cut one."""
+        truncated = AIMessage(content="", invalid_tool_calls=[{
+            "name": "QuestionsOutput",
+            "args": '{"questions": [{"question_type": "ESSAY", "question_text": "Q1", '
+                    '"correct_answer": "A"}, {"question_type": "ESS',
+            "id": "call_1",
+            "error": "truncated",
+        }])
+        fake_llm.responses.append(truncated)
+        fake_llm.responses.append(_tool_message("QuestionsOutputRepair", {
+            "questions_1": _question("Q2"),
+        }))
+
+        result = invoke_llm_json("prompt", family=PromptFamily.QUESTIONS, schema=QuestionsOutput)
+
+        assert [q["question_text"] for q in result["questions"]] == ["Q1", "Q2"]
+
+
+class TestJsonModeMetrics:
+    """Test parse-failure accounting in the default JSON mode."""
+
+    def test_parse_failure_is_counted(self, fake_llm):
+        """Test a JSON parse failure is recorded for the prompt family."""
+        fake_llm.invoke.return_value = AIMessage(content="죄송합니다, 다시 시도해주세요.")
+        before = LLM_PARSE_FAILURES.value(family="title", mode="json")
+
+        with pytest.raises(ValueError):
+            invoke_llm_json("prompt", family=PromptFamily.TITLE, schema=GradingOutput)
+
+        assert LLM_PARSE_FAILURES.value(family="title", mode="json") == before + 1
+        assert get_family_stats()["title"]["parse_failure_rate"] > 0
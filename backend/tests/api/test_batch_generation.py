@@ -0,0 +1,190 @@
+"""Tests for batch pre-generation (collection, batch rounds and ingestion)."""
+
+import json
+from datetime import date, timedelta
+from typing import List, Optional
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.ai import output_schemas
+from app.ai.batch import LocalBatchBackend
+from app.ai.fake_llm import fake_output
+from app.config import settings
+from app.models import DailyGenerationStatus, DailyTask, MonthlyGoal, Roadmap, RoadmapMode, WeeklyTask
+from app.models.question import Question, QuestionType
+from app.models.roadmap import RoadmapStatus
+from app.models.user import User
+from app.models.user_answer import UserAnswer
+from app.services.batch_generation_service import BatchGenerationService
+
+FALLBACK_QUESTION_DAY = 3
+
+
+def _schema_for(prompt: str):
+    """Response schema from the <output_format> key in the prompt."""
+    if '"review_questions"' in prompt:
+        return output_schemas.ReviewQuestionsOutput
+    if '"daily_curriculum"' in prompt:
+        return output_schemas.CurriculumOutput
+    if '"questions"' in prompt:
+        return output_schemas.QuestionsOutput
+    return output_schemas.DailyTasksOutput
+
+
+def _prompt_text(params: dict) -> str:
+    system = "".join(block["text"] for block in params.get("system", []))
+    return system + "".join(message["content"] for message in params["messages"])
+
+
+def _roadmap(
+    db: Session, user: User, mode: RoadmapMode, title: str, start: Optional[date] = None, weeks: int = 2
+) -> Roadmap:
+    """One-month roadmap whose first week is generated (by default today is its last day)."""
+    start = start or date.today() - timedelta(days=6)
+    roadmap = Roadmap(
+        user_id=user.id,
+        topic=f"{title} 학습",
+        title=title,
+        duration_months=1,
+        start_date=start,
+        end_date=start + timedelta(days=30),
+        mode=mode,
+        status=RoadmapStatus.ACTIVE,
+    )
+    goal = MonthlyGoal(month_number=1, title=f"{title} 기초")
+    goal.weekly_tasks = [
+        WeeklyTask(
+            week_number=1, title=f"{title} 1주차", progress=100,
+            daily_generation_status=DailyGenerationStatus.COMPLETED,
+        ),
+    ] + [WeeklyTask(week_number=n, title=f"{title} {n}주차") for n in range(2, weeks + 1)]
+    roadmap.monthly_goals = [goal]
+    db.add(roadmap)
+    db.flush()
+    db.add(DailyTask(weekly_task_id=goal.weekly_tasks[0].id, day_number=1, title="1일차"))
+    db.commit()
+    db.refresh(roadmap)
+    return roadmap
+
+
+def _weeks(roadmap: Roadmap) -> List[WeeklyTask]:
+    return sorted(roadmap.monthly_goals[0].weekly_tasks, key=lambda w: w.week_number)
+
+
+@pytest.fixture
+def roadmaps(db: Session, test_user: User, monkeypatch) -> dict:
+    """PLANNING, LEARNING (with a wrong answer in week 1) and a PLANNING roadmap to skip."""
+    monkeypatch.setattr(settings, "llm_batch_days_ahead", 7)
+    planning = _roadmap(db, test_user, RoadmapMode.PLANNING, "Python")
+    learning = _roadmap(db, test_user, RoadmapMode.LEARNING, "SQL")
+    skipped = _roadmap(db, test_user, RoadmapMode.PLANNING, "Docker")
+
+    learning_task = _weeks(learning)[0].daily_tasks[0]
+    question = Question(
+        daily_task_id=learning_task.id,
+        question_type=QuestionType.SHORT_ANSWER,
+        question_text="SELECT 문의 실행 순서는?",
+        correct_answer="FROM → WHERE → SELECT",
+    )
+    db.add(question)
+    db.flush()
+    db.add(UserAnswer(question_id=question.id, user_id=test_user.id, answer_text="SELECT 먼저", is_correct=False))
+    db.commit()
+    return {"planning": planning, "learning": learning, "skipped": skipped}
+
+
+class TestBatchGenerationService:
+    """Test the batch pipeline end to end with the local backend."""
+
+    def test_collects_next_weeks_and_reviews(self, db: Session, roadmaps: dict, tmp_path):
+        service = BatchGenerationService(db, LocalBatchBackend(str(tmp_path)))
+
+        daily_jobs = service.collect_daily_jobs(limit=10)
+        review_jobs = service.collect_review_jobs(limit=10)
+
+        assert {job.weekly_task.id for job in daily_jobs} == {
+            _weeks(roadmap)[1].id for roadmap in roadmaps.values()
+        }
+        assert [job.weekly_task.id for job in review_jobs] == [_weeks(roadmaps["learning"])[0].id]
+        assert len(review_jobs[0].wrong_questions) == 1
+
+    def test_skips_roadmaps_behind_schedule(self, db: Session, test_user: User, tmp_path):
+        """Test a roadmap left behind is not generated one more week per run."""
+        # 1주차만 생성했는데 달력상으로는 이미 3주차
+        _roadmap(
+            db, test_user, RoadmapMode.PLANNING, "Go", start=date.today() - timedelta(days=14), weeks=4
+        )
+        service = BatchGenerationService(db, LocalBatchBackend(str(tmp_path)))
+
+        assert service.collect_daily_jobs(limit=10) == []
+
+    def test_limit(self, db: Session, roadmaps: dict, tmp_path):
+        service = BatchGenerationService(db, LocalBatchBackend(str(tmp_path)))
+
+        assert len(service.collect_daily_jobs(limit=2)) == 2
+
+    def test_run(self, db: Session, roadmaps: dict, tmp_path):
+        skipped_week = _weeks(roadmaps["skipped"])[1]
+        calls = {"questions": 0}
+
+        def responder(params):
+            prompt = _prompt_text(params)
+            schema = _schema_for(prompt)
+            if not calls.get("generated"):
+                # 배치가 처리되는 동안 사용자 요청으로 생성된 주
+                calls["generated"] = True
+                skipped_week.daily_generation_status = DailyGenerationStatus.COMPLETED
+                db.commit()
+            if schema is output_schemas.QuestionsOutput:
+                calls["questions"] += 1
+                if calls["questions"] == FALLBACK_QUESTION_DAY:
+                    raise RuntimeError("overloaded")
+            return json.dumps(fake_output(schema, prompt), ensure_ascii=False)
+
+        backend = LocalBatchBackend(str(tmp_path), responder=responder)
+
+        summary = BatchGenerationService(db, backend).run(limit=10, poll_interval=0, timeout=5)
+
+        assert summary == {"daily_saved": 2, "review_saved": 1, "skipped": 1, "failed": 0}
+
+        # 1차: PLANNING 2건 + 커리큘럼 1건 + 복습 1건, 2차: LEARNING 일자별 문제 7건
+        learning_week = _weeks(roadmaps["learning"])[1]
+        batches = [
+            [json.loads(line)["custom_id"] for line in open(batch / "requests.jsonl", encoding="utf-8")]
+            for batch in tmp_path.iterdir()
+        ]
+        assert len(batches) == 2
+        first, second = sorted(batches, key=lambda ids: ids[0].startswith("questions-"))
+        assert sorted(first) == sorted([
+            f"daily-{_weeks(roadmaps['planning'])[1].id.hex}",
+            f"daily-{skipped_week.id.hex}",
+            f"curriculum-{learning_week.id.hex}",
+            f"review-{_weeks(roadmaps['learning'])[0].id.hex}",
+        ])
+        assert second == [f"questions-{learning_week.id.hex}-{day}" for day in range(1, 8)]
+
+        planning_week = _weeks(roadmaps["planning"])[1]
+        db.refresh(planning_week)
+        assert planning_week.daily_generation_status == DailyGenerationStatus.COMPLETED
+        assert db.query(DailyTask).filter(DailyTask.weekly_task_id == planning_week.id).count() > 0
+        assert db.query(DailyTask).filter(DailyTask.weekly_task_id == skipped_week.id).count() == 0
+
+        learning_days = (
+            db.query(DailyTask)
+            .filter(DailyTask.weekly_task_id == learning_week.id)
+            .order_by(DailyTask.day_number)
+            .all()
+        )
+        assert [task.day_number for task in learning_days] == list(range(1, 8))
+        fallback = learning_days[FALLBACK_QUESTION_DAY - 1]
+        # 실패한 날만 기본 문제로 대체
+        assert fallback.questions[0].question_text.endswith("다음 중 올바른 설명은 무엇인가요?")
+        assert not learning_days[0].questions[0].question_text.endswith("다음 중 올바른 설명은 무엇인가요?")
+
+        review_week = _weeks(roadmaps["learning"])[0]
+        db.refresh(review_week)
+        assert review_week.review_generated
+        assert db.query(DailyTask).filter(
+            DailyTask.weekly_task_id == review_week.id, DailyTask.is_review_task.is_(True)
+        ).count() == 1
@@ -0,0 +1,97 @@
+"""Tests for learning mode API endpoints."""
+
+import pytest
+from datetime import date, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import DailyTask, MonthlyGoal, WeeklyTask
+from app.models.question import Question, QuestionType
+from app.models.roadmap import Roadmap, RoadmapMode, RoadmapStatus
+from app.models.user import User
+from app.models.user_answer import UserAnswer
+
+DAYS = 3
+QUESTIONS_PER_DAY = 2
+
+
+@pytest.fixture
+def learning_week(db: Session, test_user: User) -> WeeklyTask:
+    """LEARNING week with every question answered (one wrong, graded answer on day 1)."""
+    start = date.today()
+    roadmap = Roadmap(
+        user_id=test_user.id,
+        topic="SQL 학습",
+        title="SQL 마스터하기",
+        duration_months=1,
+        start_date=start,
+        end_date=start + timedelta(days=30),
+        mode=RoadmapMode.LEARNING,
+        status=RoadmapStatus.ACTIVE,
+    )
+    goal = MonthlyGoal(month_number=1, title="SQL 기초")
+    week = WeeklyTask(week_number=1, title="SELECT 문")
+    week.daily_tasks = [DailyTask(day_number=day, title=f"{day}일차") for day in range(1, DAYS + 1)]
+    goal.weekly_tasks = [week]
+    roadmap.monthly_goals = [goal]
+    db.add(roadmap)
+    db.flush()
+
+    for daily_task in week.daily_tasks:
+        for order in range(QUESTIONS_PER_DAY):
+            question = Question(
+                daily_task_id=daily_task.id,
+                question_type=QuestionType.SHORT_ANSWER,
+                question_text=f"{daily_task.day_number}일차 문제 {order + 1}",
+                correct_answer="FROM",
+                order=order,
+            )
+            db.add(question)
+            db.flush()
+            wrong = daily_task.day_number == 1 and order == 0
+            db.add(UserAnswer(
+                question_id=question.id,
+                user_id=test_user.id,
+                answer_text="SELECT" if wrong else "FROM",
+                is_correct=False if wrong else None,
+            ))
+    db.commit()
+    db.refresh(week)
+    return week
+
+
+class TestLearningQueryBudget:
+    """Pin the SQL statement count of the learning endpoints."""
+
+    def test_week_info_query_budget(
+        self, authorized_client: TestClient, learning_week: WeeklyTask, max_queries
+    ):
+        response = authorized_client.get(f"/api/v1/learning/weekly-tasks/{learning_week.id}/info")
+        assert response.status_code == 200
+        assert len(response.json()["days"]) == DAYS
+        # 현재 수치 고정: 일자마다 get_day_info와 문제 조회가 반복됨 (3일 기준)
+        max_queries(response, 17)
+
+    def test_wrong_questions_query_budget(
+        self, authorized_client: TestClient, learning_week: WeeklyTask, max_queries
+    ):
+        response = authorized_client.get(
+            f"/api/v1/learning/weekly-tasks/{learning_week.id}/wrong-questions"
+        )
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        # 현재 수치 고정: 일자마다 문제를 따로 조회함 (3일 기준)
+        max_queries(response, 6)
+
+    def test_complete_day_query_budget(
+        self, authorized_client: TestClient, learning_week: WeeklyTask, max_queries, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "llm_backend", "fake")
+        day = next(task for task in learning_week.daily_tasks if task.day_number == 2)
+
+        response = authorized_client.post(f"/api/v1/learning/daily-tasks/{day.id}/complete-day")
+        assert response.status_code == 200
+        assert len(response.json()["feedback"]["question_results"]) == QUESTIONS_PER_DAY
+        # 현재 수치 고정: 채점/저장 후 주간 진행률과 주 정보(get_week_info)를 다시 조회함
+        max_queries(response, 35)
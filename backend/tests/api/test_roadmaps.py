@@ -48,6 +48,14 @@ class TestListRoadmaps:
         assert len(data) == 1
         assert data[0]["topic"] == test_roadmap.topic
 
+    def test_list_roadmaps_query_budget(
+        self, authorized_client: TestClient, test_roadmap: Roadmap, max_queries
+    ):
+        """Test listing roadmaps runs a constant number of queries (user + roadmaps)."""
+        response = authorized_client.get("/api/v1/roadmaps")
+        assert response.status_code == 200
+        max_queries(response, 3)
+
     def test_list_roadmaps_unauthorized(self, client: TestClient):
         """Test listing roadmaps without authorization."""
         response = client.get("/api/v1/roadmaps")
@@ -17,6 +17,8 @@ from app.main import app
 from app.db import Base, get_db, engine as app_engine
 from app.models.user import User, AuthProvider
 from app.core.security import get_password_hash, create_access_token
+from app.config import settings
+from app.core.http_metrics import QUERY_COUNT_HEADER
 
 # Use the actual database engine (PostgreSQL) for tests
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=app_engine)
@@ -104,6 +106,28 @@ def authorized_client(client: TestClient, test_user_token: str) -> TestClient:
     return client
 
 
+@pytest.fixture
+def max_queries(monkeypatch):
+    """Assert an endpoint stays within a SQL statement budget.
+
+    응답의 X-DB-Query-Count 헤더(QueryCountMiddleware)를 읽으므로, 테스트 본문에서
+    미리 실행한 쿼리는 세지 않습니다.
+
+    Usage:
+        response = authorized_client.get("/api/v1/roadmaps")
+        max_queries(response, 3)
+    """
+    monkeypatch.setattr(settings, "db_query_headers", True)
+
+    def check(response, limit: int) -> int:
+        count = int(response.headers[QUERY_COUNT_HEADER])
+        request = response.request
+        assert count <= limit, f"{request.method} {request.url.path}: {count} queries (max {limit})"
+        return count
+
+    return check
+
+
 @pytest.fixture
 def mock_anthropic() -> Generator[MagicMock, None, None]:
     """Mock Anthropic API calls."""
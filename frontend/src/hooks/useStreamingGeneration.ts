@@ -21,6 +21,22 @@ interface MonthReadyData {
   description: string;
 }
 
+// 월 목표 생성 중 부분 내용 (토큰 스트리밍)
+interface MonthDeltaData {
+  month_number: number;
+  title?: string;
+  description?: string;
+}
+
+interface WeekReadyData {
+  month_number: number;
+  week: {
+    week_number: number;
+    title: string;
+    description: string;
+  };
+}
+
 interface WeeksReadyData {
   month_number: number;
   weeks: Array<{
@@ -30,6 +46,12 @@ interface WeeksReadyData {
   }>;
 }
 
+// 동시 생성 상한으로 대기 중
+interface QueuedData {
+  position: number;
+  estimated_wait_seconds: number;
+}
+
 interface ProgressData {
   current_step: number;
   total_steps: number;
@@ -79,6 +101,7 @@ export interface StreamingState {
   description: string | null;
   months: MonthPreview[];
   progress: ProgressData | null;
+  queue: QueuedData | null;  // 대기 중일 때 순번/예상 대기 시간
   roadmapId: string | null;
   previewData: PreviewReadyData | null;  // preview_ready 시 전체 데이터
   error: string | null;
@@ -92,6 +115,7 @@ export interface GenerateParams {
   mode: string;
   interview_context?: Record<string, unknown>;
   skip_save?: boolean;  // true면 DB 저장 없이 preview_ready 이벤트 발송
+  interview_session_id?: string;  // 인터뷰 완료 시 서버가 미리 시작한 생성을 이어받기 위한 키
 }
 
 const initialState: StreamingState = {
@@ -100,11 +124,26 @@ const initialState: StreamingState = {
   description: null,
   months: [],
   progress: null,
+  queue: null,
   roadmapId: null,
   previewData: null,
   error: null,
 };
 
+/**
+ * 월 데이터 갱신 (없으면 추가, 주간 과제는 유지)
+ */
+function upsertMonth(
+  months: MonthPreview[],
+  monthNumber: number,
+  fields: Pick<MonthPreview, 'title' | 'description'>
+): MonthPreview[] {
+  if (!months.some((m) => m.month_number === monthNumber)) {
+    return [...months, { month_number: monthNumber, ...fields, weeks: [] }];
+  }
+  return months.map((m) => (m.month_number === monthNumber ? { ...m, ...fields } : m));
+}
+
 export function useStreamingGeneration() {
   const [state, setState] = useState<StreamingState>(initialState);
   const abortControllerRef = useRef<AbortController | null>(null);
@@ -115,23 +154,50 @@ export function useStreamingGeneration() {
    */
   const handleEvent = useCallback((eventType: string, data: unknown) => {
     switch (eventType) {
+      case 'queued': {
+        setState((prev) => ({ ...prev, queue: data as QueuedData }));
+        break;
+      }
+
       case 'title_ready': {
         const { title, description } = data as TitleReadyData;
-        setState((prev) => ({ ...prev, title, description }));
+        setState((prev) => ({ ...prev, title, description, queue: null }));
+        break;
+      }
+
+      case 'month_delta': {
+        const { month_number, title, description } = data as MonthDeltaData;
+        setState((prev) => ({
+          ...prev,
+          months: upsertMonth(prev.months, month_number, {
+            title: title ?? '',
+            description: description ?? '',
+          }),
+        }));
         break;
       }
 
       case 'month_ready': {
-        const monthData = data as MonthReadyData;
+        const { month_number, title, description } = data as MonthReadyData;
         setState((prev) => ({
           ...prev,
-          months: [
-            ...prev.months,
-            {
-              ...monthData,
-              weeks: [], // 주간은 아직 비어있음
-            },
-          ],
+          months: upsertMonth(prev.months, month_number, { title, description }),
+        }));
+        break;
+      }
+
+      case 'week_ready': {
+        const { month_number, week } = data as WeekReadyData;
+        setState((prev) => ({
+          ...prev,
+          months: prev.months.map((m) =>
+            m.month_number === month_number
+              ? {
+                  ...m,
+                  weeks: [...m.weeks.filter((w) => w.week_number !== week.week_number), week],
+                }
+              : m
+          ),
         }));
         break;
       }
@@ -272,7 +338,7 @@ export function useStreamingGeneration() {
           let errorMessage = '로드맵 생성에 실패했습니다.';
           try {
             const errorJson = JSON.parse(errorText);
-            errorMessage = errorJson.detail || errorMessage;
+            errorMessage = errorJson.detail || errorJson.error?.message || errorMessage;
           } catch {
             // JSON 파싱 실패 시 기본 메시지 사용
           }
@@ -221,8 +221,9 @@ export function RoadmapCreate() {
       start_date: formData.start_date,
       interview_context: interviewContext as unknown as Record<string, unknown>,
       skip_save: true, // 피드백 단계를 위해 DB 저장 생략
+      interview_session_id: interview.sessionId ?? undefined,
     });
-  }, [formData.topic, formData.mode, formData.duration_months, formData.start_date, streaming]);
+  }, [formData.topic, formData.mode, formData.duration_months, formData.start_date, streaming, interview.sessionId]);
 
   const canProceed = () => {
     switch (step) {
@@ -68,6 +68,7 @@ export interface FeedbackMessageResponse {
   response: string;
   modifications?: RoadmapModifications;
   updated_roadmap: RoadmapPreviewData;
+  stale_months?: number[]; // 월 목표 수정으로 주간 과제 재생성이 필요한 월 (POST /feedback/{id}/regenerate)
 }
 
 export interface FeedbackFinalizeResponse {